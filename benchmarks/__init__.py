@@ -0,0 +1 @@
+"""Benchmarks for the scorecard generator hot paths."""
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+HTML report throughput benchmark.
+
+Replays a handful of synthetic matches, then renders N report pages with
+the precompiled templates in match_report_html, in memory and written to
+disk, and prints pages per second. Charts are rendered once per match up
+front unless --charts is given, so the numbers measure the page templates
+rather than Plotly.
+
+Usage:
+    python -m benchmarks.bench_html [--pages N] [--matches N] [--format T20] [--charts]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import match_shape, write_cricsheet_match
+from cricsheet_replay.replay import replay_match
+from scorecard_generator.match_report_html import chart_renderers, generate_html_report, render_html_report
+from scorecard_generator.match_stats import MatchStats
+
+
+def replay_matches(directory, format_key, count):
+    """Replay count synthetic matches; returns (match, MatchStats, charts) per match."""
+    overs, _, format_config = match_shape(format_key, None)
+    matches = []
+    for seed in range(count):
+        info_path, ballbyball_path = write_cricsheet_match(
+            directory, format_key, overs, seed=seed, match_id=str(940000 + seed))
+        r = replay_match(info_path, ballbyball_path)
+        match = (r.team1, r.team2, r.innings1, r.innings2, r.match_result, format_config)
+        stats = MatchStats(r.innings1, r.innings2, format_config)
+        names = (r.innings1.batting_team.name, r.innings2.batting_team.name)
+        charts = {name: render(r.innings1, r.innings2, *names) for name, render in chart_renderers()}
+        matches.append((match, stats, charts))
+    return matches
+
+
+def run(pages=2000, matches=10, format_key='T20', charts=False):
+    """Render pages report pages; returns dict of pages per second for 'render' and 'write'."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='scorecard_bench_html_') as workdir:
+        replayed = replay_matches(workdir, format_key, matches)
+
+        start = time.perf_counter()
+        for i in range(pages):
+            (_, _, innings1, innings2, match_result, format_config), stats, rendered = replayed[i % matches]
+            render_html_report(innings1, innings2, match_result, format_config, stats=stats,
+                               charts=None if charts else rendered)
+        results['render'] = pages / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for i in range(pages):
+                match, stats, rendered = replayed[i % matches]
+                generate_html_report(*match, os.path.join(workdir, f"report_{i}.html"), stats=stats,
+                                     charts=None if charts else rendered)
+        results['write'] = pages / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure HTML report pages rendered per second.")
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--matches', type=int, default=10, help="Distinct matches the pages cycle through")
+    parser.add_argument('--format', default='T20', choices=['T20', 'ODI', 'TEST'])
+    parser.add_argument('--charts', action='store_true', help="Render the charts for every page")
+    args = parser.parse_args()
+
+    results = run(args.pages, args.matches, args.format, args.charts)
+
+    print("=" * 70)
+    print(f"HTML REPORTS ({args.pages} {args.format} pages)")
+    print("=" * 70)
+    print(f"{'Render in memory':<24}{results['render']:>12.0f} pages/s")
+    print(f"{'Render and write':<24}{results['write']:>12.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
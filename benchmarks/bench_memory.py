@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the slotted data model.
+
+Compares the per-delivery and per-player footprint of the current
+__slots__ models against dict-backed copies of the previous classes.
+
+Usage:
+    python -m benchmarks.bench_memory [--balls N]
+"""
+
+import argparse
+import gc
+import sys
+import os
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import Player, BallEvent
+
+
+class DictPlayer:
+    """The pre-slots Player: per-instance __dict__ plus three dicts."""
+    def __init__(self, number, name):
+        self.number = number
+        self.name = name
+        self.batting = {
+            'runs': 0, 'balls': 0, '4s': 0, '6s': 0,
+            'SR': 0.0, 'dismissal': 'not out',
+            'scoring_distribution': defaultdict(int)
+        }
+        self.bowling = {
+            'balls': 0, 'runs': 0, 'wickets': 0, 'maidens': 0,
+            'dots': 0, '4s': 0, '6s': 0, 'wides': 0, 'noballs': 0
+        }
+        self.batted = False
+        self.bowled = False
+
+
+class DictBallEvent:
+    """The pre-slots BallEvent: per-instance __dict__ and a fresh fielders list."""
+    def __init__(self, over, ball, bowler, batter, runs, event, fielders=None):
+        self.over = over
+        self.ball = ball
+        self.bowler = bowler
+        self.batter = batter
+        self.runs = runs
+        self.event = event
+        self.fielders = fielders or []
+
+
+def measure(factory, count):
+    """Return bytes allocated per object created by factory(i)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't charge the holding list to the objects
+    per_object = (after - before - sys.getsizeof(objects)) / count
+    del objects
+    return per_object
+
+
+def run(balls=100_000, players=2_000):
+    """Measure both models and return a dict of bytes-per-object results."""
+    bowler = Player(1, "Bowler")
+    batter = Player(2, "Batter")
+    events = ['normal', 'wide', 'no ball_runs', 'bye', 'leg bye']
+
+    def ball(cls):
+        return lambda i: cls(i // 6, i % 6 + 1, bowler, batter, i % 7, events[i % 5])
+
+    def player(cls):
+        def make(i):
+            p = cls(i, "Player")
+            # Touch the scoring distribution like a real innings does
+            for runs in (0, 1, 2, 4, 6):
+                p.batting['scoring_distribution'][runs] += 1
+            return p
+        return make
+
+    return {
+        'ball_dict': measure(ball(DictBallEvent), balls),
+        'ball_slots': measure(ball(BallEvent), balls),
+        'player_dict': measure(player(DictPlayer), players),
+        'player_slots': measure(player(Player), players),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-ball and per-player memory of the data model.")
+    parser.add_argument('--balls', type=int, default=100_000)
+    parser.add_argument('--players', type=int, default=2_000)
+    args = parser.parse_args()
+
+    results = run(args.balls, args.players)
+    ball_saving = results['ball_dict'] - results['ball_slots']
+    player_saving = results['player_dict'] - results['player_slots']
+
+    print("=" * 70)
+    print("DATA MODEL MEMORY")
+    print("=" * 70)
+    print(f"{'':<12}{'dict-based':>14}{'slotted':>14}{'saving':>14}")
+    print(f"{'BallEvent':<12}{results['ball_dict']:>12.0f} B{results['ball_slots']:>12.0f} B{ball_saving:>12.0f} B")
+    print(f"{'Player':<12}{results['player_dict']:>12.0f} B{results['player_slots']:>12.0f} B{player_saving:>12.0f} B")
+    print(f"\nPer 100k deliveries: {ball_saving * 100_000 / 1024 / 1024:.1f} MiB saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the scoring, replay, stats and export hot paths.
+
+Builds synthetic T20, ODI and multi-day matches (see benchmarks/synthetic.py)
+and times process_ball_event, Innings.get_score, replay_innings, export_all
+and the HTML and Markdown reports. Results are written as JSON together
+with the machine they ran on; ``compare`` flags benchmarks that got slower
+than a stored baseline.
+
+Usage:
+    python -m benchmarks.suite run [--formats T20 ODI TEST] [--overs N] [--repeat N] [--output FILE]
+    python -m benchmarks.suite compare BASELINE CURRENT [--threshold 0.10]
+"""
+
+import argparse
+import builtins
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from itertools import groupby
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import match_shape, generate_match, write_cricsheet_match
+from cricsheet_replay.replay import (
+    parse_info_csv, create_teams_from_info, parse_ball_by_ball_csv, replay_innings, replay_match
+)
+from scorecard_generator.models import BallEvent, Innings, Partnership
+from scorecard_generator.game_logic import process_ball_event
+from scorecard_generator.scorecard_export import export_all
+from scorecard_generator.match_report_html import generate_html_report
+from scorecard_generator.match_report_md import generate_markdown_report
+
+DEFAULT_FORMATS = ['T20', 'ODI', 'TEST']
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+GET_SCORE_CALLS = 10000
+
+
+def machine_info():
+    """Describe the interpreter and machine the results came from."""
+    info = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+    try:
+        import numpy
+        info['numpy'] = numpy.__version__
+    except ImportError:
+        info['numpy'] = None
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        info['commit'] = commit.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        info['commit'] = None
+    return info
+
+
+def time_benchmark(setup, run, repeat):
+    """Time run(setup()) repeat times, excluding setup. Returns the timings."""
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarise(timings, ops):
+    best = min(timings)
+    return {
+        'ops': ops,
+        'repeat': len(timings),
+        'best': best,
+        'median': statistics.median(timings),
+        'per_op_us': best / ops * 1e6 if ops else 0.0,
+        'ops_per_sec': ops / best if best > 0 else 0.0,
+    }
+
+
+def delivery_to_event(delivery, bowler):
+    """(event_type, runs, fielders, swapped) process_ball_event expects for a synthetic delivery."""
+    kind, runs = delivery.kind, delivery.runs
+    if kind == 'wicket':
+        return 'wicket', 0, [bowler.name], False
+    if kind == 'run out':
+        return 'run out', runs, ['Fielder', 0, runs], runs % 2 == 1
+    return kind, runs, [], kind in ('bye', 'leg bye') and runs % 2 == 1
+
+
+def score_innings(deliveries, batting_team, bowling_team, format_config):
+    """Drive process_ball_event over an innings of synthetic deliveries."""
+    innings = Innings(batting_team, bowling_team)
+    current_batters = [batting_team.players[1], batting_team.players[2]]
+    innings.current_partnership = Partnership(current_batters[0], current_batters[1], 1, 0)
+    batters_yet = list(range(3, 12))
+    wickets = 0
+
+    for over, over_deliveries in groupby(deliveries, key=lambda d: d.over):
+        over_runs = legal_balls = 0
+        ball_num = 1
+        for delivery in over_deliveries:
+            bowler = bowling_team.get_player_by_name(delivery.bowler)
+            batter = current_batters[0]
+            event_type, runs, fielders, swapped = delivery_to_event(delivery, bowler)
+            innings.add_ball(BallEvent(over, ball_num, bowler, batter, runs, event_type, fielders))
+            wickets, over_runs, legal_balls, ball_num, current_batters, batters_yet, _ = process_ball_event(
+                event_type, runs, fielders, swapped, innings, bowler, batter,
+                current_batters, wickets, over, ball_num, batting_team, over_runs,
+                legal_balls, ball_num, batters_yet, format_config
+            )
+        current_batters.reverse()
+    return innings
+
+
+def run_format(format_key, overs, repeat, workdir):
+    """Run every benchmark for one synthetic match format."""
+    overs, _, format_config = match_shape(format_key, overs)
+    match_dir = os.path.join(workdir, format_key)
+    info_path, ballbyball_path = write_cricsheet_match(match_dir, format_key, overs)
+    match = generate_match(format_key, overs)
+    deliveries = sum(len(d) for _, _, d in match)
+    info = parse_info_csv(info_path)
+    innings_data = parse_ball_by_ball_csv(ballbyball_path)
+    replayed = replay_match(info_path, ballbyball_path)
+    two_innings_balls = len(replayed.innings1.balls) + len(replayed.innings2.balls)
+    results = {}
+
+    def new_teams():
+        """Fresh teams for each pair of innings, as a multi-day match replays them."""
+        pairs = []
+        for _ in range(0, len(match), 2):
+            team1, team2 = create_teams_from_info(info)
+            pairs.append({team1.name: team1, team2.name: team2})
+        return pairs
+
+    def score_match(team_pairs):
+        original_input = builtins.input
+        builtins.input = lambda prompt='': '1'  # Next batter in: first in the list
+        try:
+            with redirect_stdout(io.StringIO()):
+                for i, (batting, bowling, innings_deliveries) in enumerate(match):
+                    teams = team_pairs[i // 2]
+                    score_innings(innings_deliveries, teams[batting], teams[bowling], format_config)
+        finally:
+            builtins.input = original_input
+
+    results['process_ball_event'] = summarise(
+        time_benchmark(new_teams, score_match, repeat), deliveries)
+
+    def call_get_score(innings):
+        for _ in range(GET_SCORE_CALLS):
+            innings.get_score()
+
+    results['get_score'] = summarise(
+        time_benchmark(lambda: replayed.innings1, call_get_score, repeat), GET_SCORE_CALLS)
+
+    def replay_all(team_pairs):
+        for innings_num in sorted(innings_data):
+            balls = innings_data[innings_num]
+            teams = team_pairs[(innings_num - 1) // 2]
+            replay_innings(innings_num, balls, teams[balls[0].batting_team], teams[balls[0].bowling_team],
+                           info, verbose=False)
+
+    results['replay_innings'] = summarise(
+        time_benchmark(new_teams, replay_all, repeat), deliveries)
+
+    r = replayed
+    report_base = os.path.join(match_dir, 'report')
+
+    def quiet(fn):
+        def run(_):
+            with redirect_stdout(io.StringIO()):
+                fn()
+        return run
+
+    results['export_all'] = summarise(time_benchmark(
+        lambda: None,
+        quiet(lambda: export_all(r.team1, r.team2, r.innings1, r.innings2, r.match_result)),
+        repeat), two_innings_balls)
+    results['generate_html_report'] = summarise(time_benchmark(
+        lambda: None,
+        quiet(lambda: generate_html_report(r.team1, r.team2, r.innings1, r.innings2, r.match_result,
+                                           format_config, report_base + '.html')),
+        repeat), two_innings_balls)
+    results['generate_markdown_report'] = summarise(time_benchmark(
+        lambda: None,
+        quiet(lambda: generate_markdown_report(r.team1, r.team2, r.innings1, r.innings2, r.match_result,
+                                               format_config, report_base + '.md')),
+        repeat), two_innings_balls)
+    return results
+
+
+def run_suite(formats=None, overs=None, repeat=DEFAULT_REPEAT, out=sys.stdout):
+    """
+    Run the benchmark suite.
+
+    Args:
+        formats: Format keys to benchmark (default: T20, ODI and TEST)
+        overs: Overs per innings for every format (default: each format's full length)
+        repeat: Timed runs per benchmark; the best is reported
+        out: Stream for progress output (None for silent)
+
+    Returns:
+        dict ready to be written as JSON
+    """
+    formats = formats or DEFAULT_FORMATS
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'config': {'formats': formats, 'overs': overs, 'repeat': repeat},
+        'results': {},
+    }
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='scorecard_bench_') as workdir:
+        # export_all writes to scorecard_generator/exports relative to the cwd
+        os.chdir(workdir)
+        try:
+            for format_key in formats:
+                for name, result in run_format(format_key, overs, repeat, workdir).items():
+                    key = f"{format_key}/{name}"
+                    report['results'][key] = result
+                    if out is not None:
+                        print(f"  {key:<34} {result['best'] * 1000:10.2f} ms  "
+                              f"{result['per_op_us']:9.2f} us/op", file=out)
+        finally:
+            os.chdir(original_cwd)
+    return report
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two suite reports on each benchmark's best time.
+
+    Returns:
+        list of (name, baseline seconds, current seconds, ratio, status), where
+        status is 'regression', 'improved', 'ok', 'new' or 'missing'
+    """
+    rows = []
+    base_results, cur_results = baseline['results'], current['results']
+    for name in sorted(set(base_results) | set(cur_results)):
+        base = base_results.get(name)
+        cur = cur_results.get(name)
+        if base is None or cur is None:
+            rows.append((name, base and base['best'], cur and cur['best'], None, 'new' if base is None else 'missing'))
+            continue
+        # Compare time per op so runs with different --overs still line up
+        ratio = (cur['best'] / cur['ops']) / (base['best'] / base['ops']) if base['best'] else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((name, base['best'], cur['best'], ratio, status))
+    return rows
+
+
+def print_comparison(rows, baseline, current, out=sys.stdout):
+    if baseline.get('machine', {}).get('platform') != current.get('machine', {}).get('platform'):
+        print("Warning: baseline was recorded on a different machine", file=out)
+    print(f"{'Benchmark':<36}{'Baseline':>12}{'Current':>12}{'Ratio':>8}  Status", file=out)
+    for name, base, cur, ratio, status in rows:
+        base_str = f"{base * 1000:.2f}ms" if base is not None else '-'
+        cur_str = f"{cur * 1000:.2f}ms" if cur is not None else '-'
+        ratio_str = f"{ratio:.2f}x" if ratio is not None else '-'
+        marker = '  ✗' if status == 'regression' else ''
+        print(f"{name:<36}{base_str:>12}{cur_str:>12}{ratio_str:>8}  {status}{marker}", file=out)
+
+
+def load_report(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """Command line entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark the scorecard generator hot paths.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the suite and write JSON results")
+    run_parser.add_argument('--formats', nargs='+', choices=DEFAULT_FORMATS, default=DEFAULT_FORMATS)
+    run_parser.add_argument('--overs', type=int, default=None,
+                            help="Overs per innings (default: each format's full length)")
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument('--output', default='benchmark_results.json')
+    run_parser.add_argument('--baseline', default=None, help="Compare against this results file afterwards")
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser('compare', help="Flag regressions against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help="Slowdown ratio above which a benchmark is a regression (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        print(f"Running benchmarks: {', '.join(args.formats)}")
+        current = run_suite(args.formats, args.overs, args.repeat)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+        if not args.baseline:
+            return 0
+        baseline = load_report(args.baseline)
+    else:
+        baseline, current = load_report(args.baseline), load_report(args.current)
+
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current)
+    regressions = [row for row in rows if row[4] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
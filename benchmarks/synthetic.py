@@ -0,0 +1,189 @@
+"""
+Synthetic matches for the benchmark suite.
+
+Deliveries are drawn from a fixed outcome distribution with a seeded RNG,
+so the same format, length and seed always give the same match. Each
+innings is capped at nine wickets so it runs its full length, which keeps
+benchmark sizes predictable.
+"""
+
+import csv
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import CRICKET_FORMATS
+
+# Cricsheet match_type written to the info file for each format key
+MATCH_TYPES = {'T20': 'T20', 'ODI': 'ODI', 'TEST': 'Test'}
+
+# Format key -> (overs per innings, innings per match)
+MATCH_SHAPES = {
+    'T20': (20, 2),
+    'ODI': (50, 2),
+    'TEST': (90, 4),
+}
+
+# (kind, runs, weight): kind is a key of DELIVERY_KINDS below
+OUTCOMES = [
+    ('normal', 0, 34), ('normal', 1, 30), ('normal', 2, 8), ('normal', 3, 1),
+    ('normal', 4, 11), ('normal', 6, 4),
+    ('wide', 1, 3), ('no ball', 1, 1), ('bye', 1, 1), ('leg bye', 1, 2),
+    ('wicket', 0, 4), ('run out', 1, 1),
+]
+WICKET_TYPES = ['bowled', 'caught', 'lbw', 'stumped']
+MAX_WICKETS = 9
+
+HOME, AWAY = 'Synthetic XI', 'Benchmark XI'
+
+
+class Delivery:
+    """One synthetic delivery, before it's written as CSV or scored."""
+    __slots__ = ('over', 'ball', 'striker', 'non_striker', 'bowler', 'kind', 'runs', 'wicket_type')
+
+    def __init__(self, over, ball, striker, non_striker, bowler, kind, runs, wicket_type=''):
+        self.over = over
+        self.ball = ball
+        self.striker = striker
+        self.non_striker = non_striker
+        self.bowler = bowler
+        self.kind = kind
+        self.runs = runs
+        self.wicket_type = wicket_type
+
+
+def squad(team_name):
+    """Eleven player names for a synthetic team."""
+    initial = team_name[0]
+    return [f"{initial} Player{i:02d}" for i in range(1, 12)]
+
+
+def match_shape(format_key, overs=None):
+    """(overs per innings, innings count, format config) for a format key."""
+    default_overs, innings_count = MATCH_SHAPES[format_key]
+    return overs or default_overs, innings_count, CRICKET_FORMATS[format_key]
+
+
+def generate_innings(batting_names, bowling_names, overs, rng):
+    """
+    Generate one innings of synthetic deliveries.
+
+    Returns:
+        list of Delivery
+    """
+    deliveries = []
+    kinds, weights = [(kind, runs) for kind, runs, _ in OUTCOMES], [w for _, _, w in OUTCOMES]
+    striker, non_striker = batting_names[0], batting_names[1]
+    next_batter = 2
+    wickets = 0
+    bowlers = bowling_names[-5:]
+
+    for over in range(overs):
+        bowler = bowlers[over % len(bowlers)]
+        legal = 0
+        ball = 1
+        while legal < 6:
+            kind, runs = rng.choices(kinds, weights)[0]
+            if kind in ('wicket', 'run out') and wickets >= MAX_WICKETS:
+                kind, runs = 'normal', 0
+            wicket_type = ''
+            if kind == 'wicket':
+                wicket_type = rng.choice(WICKET_TYPES)
+            elif kind == 'run out':
+                wicket_type = 'run out'
+            deliveries.append(Delivery(over, ball, striker, non_striker, bowler, kind, runs, wicket_type))
+
+            if wicket_type:
+                wickets += 1
+                striker = batting_names[next_batter]
+                next_batter += 1
+            elif runs % 2 == 1 and kind != 'no ball':
+                striker, non_striker = non_striker, striker
+            if kind not in ('wide', 'no ball'):
+                legal += 1
+                ball += 1
+        striker, non_striker = non_striker, striker
+    return deliveries
+
+
+def generate_match(format_key='T20', overs=None, seed=0):
+    """
+    Generate every innings of a synthetic match.
+
+    Args:
+        format_key: 'T20', 'ODI' or 'TEST' (multi-day, four innings)
+        overs: Overs per innings (default: the format's full length)
+        seed: RNG seed
+
+    Returns:
+        list of (batting team name, bowling team name, list of Delivery)
+    """
+    overs, innings_count, _ = match_shape(format_key, overs)
+    rng = random.Random(seed)
+    innings = []
+    for i in range(innings_count):
+        batting, bowling = (HOME, AWAY) if i % 2 == 0 else (AWAY, HOME)
+        innings.append((batting, bowling, generate_innings(squad(batting), squad(bowling), overs, rng)))
+    return innings
+
+
+def cricsheet_row(match_id, innings_num, batting, bowling, d):
+    """A Cricsheet ball-by-ball row for a synthetic delivery."""
+    runs_off_bat = extras = wides = noballs = byes = legbyes = ''
+    if d.kind in ('normal', 'wicket', 'run out'):
+        runs_off_bat, extras = d.runs, 0
+    elif d.kind == 'wide':
+        runs_off_bat, extras, wides = 0, d.runs, d.runs
+    elif d.kind == 'no ball':
+        runs_off_bat, extras, noballs = 0, d.runs, d.runs
+    elif d.kind == 'bye':
+        runs_off_bat, extras, byes = 0, d.runs, d.runs
+    elif d.kind == 'leg bye':
+        runs_off_bat, extras, legbyes = 0, d.runs, d.runs
+    return [
+        match_id, '2024', '2024-01-01', 'Benchmark Oval', innings_num, f"{d.over}.{d.ball}",
+        batting, bowling, d.striker, d.non_striker, d.bowler, runs_off_bat, extras,
+        wides, noballs, byes, legbyes, '', d.wicket_type, d.striker if d.wicket_type else '', '', ''
+    ]
+
+
+def write_cricsheet_match(directory, format_key='T20', overs=None, seed=0, match_id='900001'):
+    """
+    Write a synthetic match as a Cricsheet info/ball-by-ball CSV pair.
+
+    Returns:
+        tuple of (info_path, ballbyball_path)
+    """
+    os.makedirs(directory, exist_ok=True)
+    info_path = os.path.join(directory, f"{match_id}_info.csv")
+    ballbyball_path = os.path.join(directory, f"{match_id}.csv")
+
+    with open(info_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['version', '2.2.0'])
+        writer.writerow(['info', 'team', HOME])
+        writer.writerow(['info', 'team', AWAY])
+        writer.writerow(['info', 'match_type', MATCH_TYPES[format_key]])
+        writer.writerow(['info', 'season', '2024'])
+        writer.writerow(['info', 'date', '2024/01/01'])
+        writer.writerow(['info', 'venue', 'Benchmark Oval'])
+        for team in (HOME, AWAY):
+            for name in squad(team):
+                writer.writerow(['info', 'player', team, name])
+        writer.writerow(['info', 'winner', HOME])
+
+    with open(ballbyball_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'match_id', 'season', 'start_date', 'venue', 'innings', 'ball', 'batting_team',
+            'bowling_team', 'striker', 'non_striker', 'bowler', 'runs_off_bat', 'extras',
+            'wides', 'noballs', 'byes', 'legbyes', 'penalty', 'wicket_type', 'player_dismissed',
+            'other_wicket_type', 'other_player_dismissed'
+        ])
+        for innings_num, (batting, bowling, deliveries) in enumerate(generate_match(format_key, overs, seed), 1):
+            for d in deliveries:
+                writer.writerow(cricsheet_row(match_id, innings_num, batting, bowling, d))
+
+    return info_path, ballbyball_path
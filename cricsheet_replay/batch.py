@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Cricsheet Corpus Batch Replay
+
+Replays a whole directory or zip archive of Cricsheet "Ashwin" CSV files
+(``<match_id>_info.csv`` + ``<match_id>.csv``) into Innings objects using a
+process pool. Each match is replayed in isolation, so one malformed file is
+reported as a failure instead of stopping the run.
+
+Usage:
+    python cricsheet_replay/batch.py <directory_or_zip> [--workers N]
+    python cricsheet_replay/batch.py <directory_or_zip> --aggregate [--group-by season] [--top 10]
+"""
+
+import sys
+import os
+import time
+import shutil
+import zipfile
+import tempfile
+import argparse
+import traceback
+from pathlib import PurePosixPath
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay.replay import (
+    parse_info_csv, create_teams_from_info, iter_innings, replay_innings, format_name, limited_overs_format
+)
+from scorecard_generator.aggregate import StatsAggregate, format_batting_table, format_bowling_table
+from scorecard_generator.match_store import DEFAULT_DB_PATH, MatchStore
+
+AGGREGATE_CHUNK_SIZE = 50
+
+
+class MatchFiles:
+    """Location of one info/ball-by-ball pair, on disk or inside a zip."""
+    def __init__(self, match_id, info_ref, ballbyball_ref, archive=None):
+        self.match_id = match_id
+        self.info_ref = info_ref  # Path on disk, or member name when archive is set
+        self.ballbyball_ref = ballbyball_ref
+        self.archive = archive  # Path to zip archive, or None
+
+
+class BatchResult:
+    """Outcome of replaying one match in a worker process."""
+    def __init__(self, match_id, innings=None, info=None, error=None, elapsed=0.0):
+        self.match_id = match_id
+        self.innings = innings or []  # Innings objects in batting order
+        self.info = info
+        self.error = error  # Error summary string if the replay failed
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _pair_names(names):
+    """Pair ``<id>_info.csv`` with ``<id>.csv`` names.
+
+    Returns:
+        tuple of (pairs, unpaired) where pairs is a sorted list of
+        (match_id, info_name, ballbyball_name)
+    """
+    infos = {}
+    ballbyball = {}
+    for name in names:
+        path = PurePosixPath(name.replace('\\', '/'))
+        if path.suffix.lower() != '.csv':
+            continue
+        if path.stem.endswith('_info'):
+            infos[path.stem[:-len('_info')]] = name
+        else:
+            ballbyball[path.stem] = name
+
+    pairs = []
+    unpaired = []
+    for match_id in sorted(set(infos) | set(ballbyball)):
+        if match_id in infos and match_id in ballbyball:
+            pairs.append((match_id, infos[match_id], ballbyball[match_id]))
+        else:
+            unpaired.append(infos.get(match_id) or ballbyball.get(match_id))
+    return pairs, unpaired
+
+
+def find_match_files(source):
+    """
+    Find and pair Cricsheet info and ball-by-ball files.
+
+    Args:
+        source: Directory (searched recursively) or zip archive path
+
+    Returns:
+        tuple of (list of MatchFiles, list of unpaired file names)
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [n for n in archive.namelist() if not n.endswith('/')]
+        pairs, unpaired = _pair_names(names)
+        return [MatchFiles(mid, info, bbb, archive=source) for mid, info, bbb in pairs], unpaired
+
+    if not os.path.isdir(source):
+        raise FileNotFoundError(f"Not a directory or zip archive: {source}")
+
+    names = []
+    for root, _, files in os.walk(source):
+        for fname in files:
+            names.append(os.path.join(root, fname))
+    pairs, unpaired = _pair_names(names)
+    return [MatchFiles(mid, info, bbb) for mid, info, bbb in pairs], unpaired
+
+
+def replay_all_innings(info_path, ballbyball_path):
+    """
+    Replay every innings of one match without terminal output.
+
+    Teams are recreated for each pair of innings so a multi-day match's
+    third and fourth innings don't add to the first two's player stats.
+    Limited-overs matches only have two innings; anything after them is a
+    super over and isn't replayed, as in replay_match.
+    The ball-by-ball file is streamed, and deliveries are kept in columnar
+    stores, which are much smaller to send back from the worker processes.
+
+    Returns:
+        tuple of (list of Innings, info dict)
+    """
+    info = parse_info_csv(info_path)
+    limited_overs = limited_overs_format(info) is not None
+
+    innings_list = []
+    teams = {}
+    for innings_num, records in iter_innings(ballbyball_path):
+        if limited_overs and innings_num > 2:
+            continue  # Super overs
+        first_ball = next(records)
+        if innings_num % 2 == 1 or not teams:
+            team1, team2 = create_teams_from_info(info)
+            teams = {team1.name: team1, team2.name: team2}
+        batting_team = teams[first_ball.batting_team]
+        bowling_team = teams[first_ball.bowling_team]
+        innings_list.append(replay_innings(innings_num, chain((first_ball,), records), batting_team, bowling_team,
+                                           info, verbose=False, columnar=True))
+
+    return innings_list, info
+
+
+def _replay_worker(match_files):
+    """Process pool entry point: replay one match, never raise."""
+    start = time.perf_counter()
+    tmpdir = None
+    try:
+        if match_files.archive:
+            tmpdir = tempfile.mkdtemp(prefix='cricsheet_')
+            with zipfile.ZipFile(match_files.archive) as archive:
+                info_path = archive.extract(match_files.info_ref, tmpdir)
+                ballbyball_path = archive.extract(match_files.ballbyball_ref, tmpdir)
+        else:
+            info_path = match_files.info_ref
+            ballbyball_path = match_files.ballbyball_ref
+
+        innings_list, info = replay_all_innings(info_path, ballbyball_path)
+        return BatchResult(match_files.match_id, innings_list, info,
+                           elapsed=time.perf_counter() - start)
+    except (Exception, SystemExit) as e:
+        # create_teams_from_info exits on bad team data; isolate that too
+        error = ''.join(traceback.format_exception_only(type(e), e)).strip()
+        return BatchResult(match_files.match_id, error=error,
+                           elapsed=time.perf_counter() - start)
+    finally:
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def iter_replay_corpus(match_files, workers=None):
+    """
+    Replay matches in a process pool, yielding BatchResults as they finish.
+
+    Args:
+        match_files: List of MatchFiles (see find_match_files)
+        workers: Number of worker processes (default: os.cpu_count())
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_replay_worker, mf) for mf in match_files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def replay_corpus(source, workers=None, progress_every=100, out=sys.stdout):
+    """
+    Replay every match in a Cricsheet directory or zip archive.
+
+    Args:
+        source: Directory or zip archive of Ashwin CSV files
+        workers: Number of worker processes (default: os.cpu_count())
+        progress_every: Print a progress line every N matches (0 to disable)
+        out: Stream for progress and summary output (None for silent)
+
+    Returns:
+        dict with 'results' (successful BatchResults), 'failures',
+        'unpaired', 'elapsed' and 'matches_per_second'
+    """
+    def report(line):
+        if out is not None:
+            print(line, file=out)
+
+    match_files, unpaired = find_match_files(source)
+    workers = workers or os.cpu_count() or 1
+    report(f"Found {len(match_files)} matches in {source} ({len(unpaired)} unpaired files)")
+    report(f"Replaying with {workers} worker process(es)...")
+
+    results = []
+    failures = []
+    start = time.perf_counter()
+    for done, result in enumerate(iter_replay_corpus(match_files, workers), 1):
+        if result.ok:
+            results.append(result)
+        else:
+            failures.append(result)
+        if progress_every and (done % progress_every == 0 or done == len(match_files)):
+            rate = done / max(time.perf_counter() - start, 1e-9)
+            report(f"  [{done:>6}/{len(match_files)}] {rate:8.1f} matches/s  ({len(failures)} failed)")
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        'results': results,
+        'failures': failures,
+        'unpaired': unpaired,
+        'elapsed': elapsed,
+        'matches_per_second': (len(match_files) / elapsed) if elapsed > 0 else 0.0,
+    }
+
+    report("")
+    report("=" * 70)
+    report("BATCH REPLAY SUMMARY")
+    report("=" * 70)
+    report(f"  Replayed: {len(results)}")
+    report(f"  Failed:   {len(failures)}")
+    report(f"  Unpaired: {len(unpaired)}")
+    report(f"  Time:     {elapsed:.2f}s ({summary['matches_per_second']:.1f} matches/s)")
+    for failure in failures[:20]:
+        report(f"    ✗ {failure.match_id}: {failure.error}")
+    if len(failures) > 20:
+        report(f"    ... and {len(failures) - 20} more failures")
+
+    return summary
+
+
+def _aggregate_worker(args):
+    """Process pool entry point: replay a chunk of matches and fold them into aggregates.
+
+    Only the (small) aggregates travel back to the parent, not the innings.
+
+    Returns:
+        tuple of (dict of group -> StatsAggregate, list of failed BatchResults)
+    """
+    match_files, group_by = args
+    groups = {}
+    failures = []
+    for mf in match_files:
+        result = _replay_worker(mf)
+        if not result.ok:
+            failures.append(result)
+            continue
+        key = result.info.get(group_by, 'Unknown') if group_by else None
+        groups.setdefault(key, StatsAggregate()).add_match(result.innings)
+    return groups, failures
+
+
+def aggregate_corpus(source, workers=None, group_by=None, chunk_size=AGGREGATE_CHUNK_SIZE):
+    """
+    Replay a corpus and aggregate player stats across every match.
+
+    Each worker folds a chunk of matches into StatsAggregates; the parent
+    merges them, which gives the same totals whatever the chunking.
+
+    Args:
+        source: Directory or zip archive of Ashwin CSV files
+        workers: Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+        group_by: Info field to split the tables by (e.g. 'season'), or None
+        chunk_size: Matches per worker task
+
+    Returns:
+        tuple of (StatsAggregate, or dict of group -> StatsAggregate when
+        group_by is set; list of failed BatchResults)
+    """
+    match_files, _ = find_match_files(source)
+    chunks = [(match_files[i:i + chunk_size], group_by) for i in range(0, len(match_files), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    groups = {}
+    failures = []
+    if workers == 1 or len(chunks) <= 1:
+        outputs = map(_aggregate_worker, chunks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(chunks)))
+        outputs = executor.map(_aggregate_worker, chunks)
+    try:
+        for chunk_groups, chunk_failures in outputs:
+            for key, aggregate in chunk_groups.items():
+                if key in groups:
+                    groups[key].merge(aggregate)
+                else:
+                    groups[key] = aggregate
+            failures.extend(chunk_failures)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if group_by:
+        return groups, failures
+    return groups.get(None, StatsAggregate()), failures
+
+
+def print_aggregate(aggregate, top=10, title=None, out=sys.stdout):
+    """Print run-scorer, wicket-taker and economy leaderboards for an aggregate."""
+    if title:
+        print(f"\n{title}", file=out)
+    print(f"\nMost runs ({aggregate.matches} matches)", file=out)
+    print(format_batting_table(aggregate.top_batters(top)), file=out)
+    print("\nMost wickets", file=out)
+    print(format_bowling_table(aggregate.top_bowlers(top)), file=out)
+    print("\nBest economy (min 60 balls)", file=out)
+    print(format_bowling_table(aggregate.top_bowlers(top, 'economy', lowest=True, min_balls=60)), file=out)
+
+
+def store_results(results, path=DEFAULT_DB_PATH):
+    """
+    Save replayed matches (every innings) to the SQLite match store.
+
+    Matches already in the store under the same Cricsheet id are replaced.
+
+    Returns:
+        Number of matches stored
+    """
+    with MatchStore(path) as store:
+        for result in results:
+            first = result.innings[0]
+            store.save_match(first.batting_team, first.bowling_team, result.innings,
+                             result.info.get('match_result'), info=result.info,
+                             format_name=format_name(result.info), source='cricsheet',
+                             source_id=str(result.match_id))
+    return len(results)
+
+
+def main():
+    """Command line entry point for batch replay."""
+    parser = argparse.ArgumentParser(description="Replay a Cricsheet Ashwin CSV corpus in parallel.")
+    parser.add_argument('source', help="Directory or zip archive of *_info.csv and ball-by-ball CSV files")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: number of CPU cores)")
+    parser.add_argument('--progress-every', type=int, default=100,
+                        help="Print progress every N matches (0 to disable)")
+    parser.add_argument('--aggregate', action='store_true',
+                        help="Print career leaderboards across the corpus instead of a replay summary")
+    parser.add_argument('--group-by', default=None,
+                        help="With --aggregate, an info field to split tables by (e.g. season)")
+    parser.add_argument('--top', type=int, default=10, help="Leaderboard length for --aggregate")
+    parser.add_argument('--store', nargs='?', const=DEFAULT_DB_PATH, default=None, metavar='DB',
+                        help=f"Save replayed matches to a SQLite match store (default: {DEFAULT_DB_PATH})")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"Error: Source not found: {args.source}")
+        sys.exit(1)
+
+    if args.aggregate:
+        result, failures = aggregate_corpus(args.source, workers=args.workers, group_by=args.group_by)
+        if args.group_by:
+            for key in sorted(result, key=str):
+                print_aggregate(result[key], args.top, title=f"=== {args.group_by}: {key} ===")
+        else:
+            print_aggregate(result, args.top)
+        for failure in failures[:20]:
+            print(f"    ✗ {failure.match_id}: {failure.error}")
+        aggregated = sum(group.matches for group in result.values()) if args.group_by else result.matches
+        sys.exit(1 if failures and not aggregated else 0)
+
+    summary = replay_corpus(args.source, workers=args.workers, progress_every=args.progress_every)
+    if args.store:
+        stored = store_results(summary['results'], args.store)
+        print(f"  Stored {stored} matches in {args.store}")
+    sys.exit(1 if summary['failures'] and not summary['results'] else 0)
+
+
+if __name__ == "__main__":
+    main()
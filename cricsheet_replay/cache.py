@@ -0,0 +1,181 @@
+"""
+Cricsheet Replay Cache
+
+Stores fully replayed matches (teams, both Innings and the result) on disk
+so regenerating reports doesn't replay unchanged CSVs again. Entries are
+keyed by a SHA-256 of the info and ball-by-ball files plus a code-version
+salt, and the cache directory is kept under a size limit by evicting the
+least recently used entries.
+
+Entries are pickles: only point the cache at a directory you trust.
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay import replay
+from scorecard_generator import models
+from scorecard_generator.win_probability import TABLE_SHAPES, table_path
+
+CACHE_DIR = "scorecard_generator/exports/.cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Bump when MatchResult's pickled layout changes in a way the source hash can't see
+CACHE_FORMAT = 1
+ENTRY_SUFFIX = '.pickle'
+
+_code_salt = None
+
+
+def code_salt():
+    """Hash of the cache format and the replay/model source.
+
+    Any edit to the code that builds a MatchResult changes every key, so
+    stale replays are never served after an upgrade.
+    """
+    global _code_salt
+    if _code_salt is None:
+        digest = hashlib.sha256(f"format={CACHE_FORMAT}".encode())
+        for module in (replay, models):
+            with open(module.__file__, 'rb') as f:
+                digest.update(f.read())
+        _code_salt = digest.hexdigest()
+    return _code_salt
+
+
+def match_key(info_path, ballbyball_path):
+    """Cache key for a match: SHA-256 of the code salt and both files' contents.
+
+    Which win-probability tables have been built is part of the key too, so
+    replays cached before a table existed are redone with win probabilities.
+    """
+    digest = hashlib.sha256(code_salt().encode())
+    digest.update(repr([key for key in TABLE_SHAPES if os.path.exists(table_path(key))]).encode())
+    for path in (info_path, ballbyball_path):
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MatchCache:
+    """Directory of pickled MatchResults with size-bounded LRU eviction.
+
+    Reading an entry refreshes its modification time, which is what the
+    eviction order is based on.
+    """
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def get(self, key):
+        """Return the cached MatchResult for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or unreadable entry: drop it and replay instead
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, result):
+        """Store a MatchResult, then evict old entries if over the size limit."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def entries(self):
+        """List of (mtime, size, path) for every entry, oldest first."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def cached_replay_match(info_path, ballbyball_path, cache=None, verbose=False):
+    """
+    replay_match() through a MatchCache.
+
+    Args:
+        cache: MatchCache to use (default: one at CACHE_DIR)
+        verbose: Passed to replay_match on a cache miss
+
+    Returns:
+        tuple of (MatchResult, True if it came from the cache)
+    """
+    cache = cache or MatchCache()
+    key = match_key(info_path, ballbyball_path)
+    result = cache.get(key)
+    if result is not None:
+        # Same content, possibly at a different path; export re-streams from here
+        result.ballbyball_path = ballbyball_path
+        return result, True
+
+    result = replay.replay_match(info_path, ballbyball_path, verbose=verbose)
+    cache.put(key, result)
+    return result, False
@@ -10,30 +10,59 @@ import sys
 import os
 import csv
 from pathlib import Path
+from itertools import chain, groupby
 from collections import defaultdict
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from scorecard_generator.models import Player, Team, Innings, BallEvent
+from scorecard_generator.models import Player, Team, Innings, BallEvent, EventType, CRICKET_FORMATS
 from scorecard_generator.scorecard import print_batting_scorecard, print_bowling_scorecard
-from scorecard_generator.scorecard_export import export_all, sanitize_filename
+from scorecard_generator.scorecard_export import export_all
 from scorecard_generator.match_stats import generate_terminal_summary
-from scorecard_generator.match_report_html import generate_html_report
-from scorecard_generator.match_report_md import generate_markdown_report
-
-
-def get_csv_paths():
-    """Get paths to Cricsheet CSV files from CLI args or interactive prompts."""
-    if len(sys.argv) >= 3:
-        info_path = sys.argv[1]
-        ballbyball_path = sys.argv[2]
-        print(f"Using CSV files from command line:")
-        print(f"  Info: {info_path}")
-        print(f"  Ball-by-ball: {ballbyball_path}")
+from scorecard_generator.report_pipeline import generate_reports, print_pipeline_result
+from scorecard_generator.win_probability import chase_probability, table_available
+from scorecard_generator.match_store import store_match
+
+# Cricsheet match_type -> CRICKET_FORMATS key for matches with a second-innings chase
+LIMITED_OVERS_MATCH_TYPES = {'T20': 'T20', 'IT20': 'T20', 'ODI': 'ODI', 'ODM': 'ODI'}
+
+
+class MatchResult:
+    """A fully replayed match, ready for export or stats."""
+    def __init__(self, team1, team2, innings1, innings2, info, ballbyball_path):
+        self.team1 = team1
+        self.team2 = team2
+        self.innings1 = innings1
+        self.innings2 = innings2  # None if the match has a single innings
+        self.info = info  # Metadata dict from parse_info_csv
+        self.ballbyball_path = ballbyball_path  # Re-streamed by export_cricsheet_data
+        self.match_result = info['match_result']
+        self.format_config = {'name': 'Cricsheet Replay', 'max_overs': None, 'max_bowler_overs': None}
+
+
+def get_cli_flags():
+    """Return the set of --flags passed on the command line."""
+    return {arg for arg in sys.argv[1:] if arg.startswith('--')}
+
+
+def get_csv_paths(verbose=True):
+    """Get paths to Cricsheet CSV files from CLI args or interactive prompts.
+
+    With verbose=False only the prompts and errors are printed.
+    """
+    paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(paths) >= 2:
+        info_path = paths[0]
+        ballbyball_path = paths[1]
+        if verbose:
+            print(f"Using CSV files from command line:")
+            print(f"  Info: {info_path}")
+            print(f"  Ball-by-ball: {ballbyball_path}")
     else:
-        print("Cricsheet CSV Replay")
-        print("=" * 70)
+        if verbose:
+            print("Cricsheet CSV Replay")
+            print("=" * 70)
         info_path = input("Enter path to info CSV file: ").strip()
         ballbyball_path = input("Enter path to ball-by-ball CSV file: ").strip()
     
@@ -48,6 +77,16 @@ def get_csv_paths():
     return info_path, ballbyball_path
 
 
+def intern_name(name):
+    """Return the process-wide shared copy of a team or player name.
+
+    A corpus replay sees the same names in thousands of files; interning
+    keeps one string per name for every Player, Team and name index key.
+    Player objects themselves stay per-match since they carry match stats.
+    """
+    return sys.intern(name)
+
+
 def parse_info_csv(info_path):
     """
     Parse Cricsheet info CSV and extract match metadata.
@@ -64,6 +103,7 @@ def parse_info_csv(info_path):
         'season': 'Unknown',
         'toss_winner': 'Unknown',
         'toss_decision': 'Unknown',
+        'match_type': 'Unknown',
         'match_result': 'Unknown'
     }
     
@@ -81,7 +121,7 @@ def parse_info_csv(info_path):
                 info_value = row[2] if len(row) > 2 else ''
                 
                 if info_key == 'team':
-                    info['teams'].append(info_value)
+                    info['teams'].append(intern_name(info_value))
                 elif info_key == 'venue':
                     info['venue'] = info_value
                 elif info_key == 'date':
@@ -92,13 +132,15 @@ def parse_info_csv(info_path):
                     info['toss_winner'] = info_value
                 elif info_key == 'toss_decision':
                     info['toss_decision'] = info_value
+                elif info_key == 'match_type':
+                    info['match_type'] = info_value
                 elif info_key == 'winner':
                     winner = info_value
                     # Look for winner_runs or winner_wickets in subsequent rows
                     info['match_result'] = f"{winner} won"
                 elif info_key == 'player' and len(row) >= 4:
-                    team_name = row[2]
-                    player_name = row[3]
+                    team_name = intern_name(row[2])
+                    player_name = intern_name(row[3])
                     info['players'][team_name].append(player_name)
     
     # Extract match_id from filename if not in CSV
@@ -143,115 +185,201 @@ def create_teams_from_info(info):
     return teams[0], teams[1]
 
 
+# Cricsheet ball-by-ball columns, split by how BallRecord stores them
+BALL_TEXT_FIELDS = (
+    'match_id', 'season', 'start_date', 'venue', 'ball', 'batting_team', 'bowling_team',
+    'striker', 'non_striker', 'bowler', 'wicket_type', 'player_dismissed',
+    'other_wicket_type', 'other_player_dismissed'
+)
+BALL_INT_FIELDS = ('innings', 'runs_off_bat', 'extras', 'wides', 'noballs', 'byes', 'legbyes', 'penalty')
+REQUIRED_BALL_FIELDS = ('innings', 'ball', 'batting_team', 'bowling_team', 'striker', 'bowler')
+
+
+class BallRecord:
+    """One Cricsheet ball-by-ball row with its numeric fields parsed once.
+
+    Text fields are interned, so the repeated team, player and venue names
+    in a file share one string. ``over`` and ``ball_in_over`` are split out
+    of the ``ball`` column ("12.3"). Item access (``record['wides']``) is
+    kept for code written against the old row dicts.
+    """
+    __slots__ = BALL_TEXT_FIELDS + BALL_INT_FIELDS + ('over', 'ball_in_over')
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def iter_ball_records(ballbyball_path):
+    """
+    Stream a Cricsheet ball-by-ball CSV as BallRecords, one row at a time.
+    
+    Raises:
+        ValueError: If a required column is missing or a number won't parse
+    """
+    with open(ballbyball_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name: i for i, name in enumerate(header)}
+        missing = [name for name in REQUIRED_BALL_FIELDS if name not in columns]
+        if missing:
+            raise ValueError(f"{ballbyball_path}: missing column(s) {', '.join(missing)}")
+        text_columns = [(name, columns.get(name)) for name in BALL_TEXT_FIELDS]
+        int_columns = [(name, columns.get(name)) for name in BALL_INT_FIELDS]
+        
+        for row in reader:
+            if not row:
+                continue
+            width = len(row)
+            record = BallRecord()
+            for name, i in text_columns:
+                setattr(record, name, sys.intern(row[i]) if i is not None and i < width else '')
+            for name, i in int_columns:
+                value = row[i] if i is not None and i < width else ''
+                setattr(record, name, int(value) if value else 0)
+            over, _, ball = record.ball.partition('.')
+            record.over = int(over)
+            record.ball_in_over = int(ball) if ball else 0
+            yield record
+
+
+def iter_innings(ballbyball_path):
+    """
+    Stream a ball-by-ball CSV innings by innings.
+    
+    Cricsheet files list each innings' deliveries together, so only the
+    current row is held in memory.
+    
+    Yields:
+        (innings number, iterator of that innings' BallRecords)
+    """
+    for innings_num, records in groupby(iter_ball_records(ballbyball_path), key=lambda r: r.innings):
+        yield innings_num, records
+
+
 def parse_ball_by_ball_csv(ballbyball_path):
     """
-    Parse Cricsheet ball-by-ball CSV into innings data.
+    Parse a whole Cricsheet ball-by-ball CSV into innings data.
+    
+    Prefer iter_innings, which streams the file instead of holding it.
     
     Returns:
-        dict with innings numbers as keys, each containing list of ball dicts
+        dict with innings numbers as keys, each containing a list of BallRecords
     """
     innings_data = defaultdict(list)
-    
-    with open(ballbyball_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            innings_num = int(row['innings'])
-            innings_data[innings_num].append(row)
-    
+    for record in iter_ball_records(ballbyball_path):
+        innings_data[record.innings].append(record)
     return innings_data
 
 
-def cricsheet_to_event_type(row):
+def cricsheet_to_event_type(record):
     """
-    Convert Cricsheet ball row to internal event type and parameters.
+    Convert a Cricsheet BallRecord to internal event type and parameters.
     
     Returns:
-        tuple: (event_type, runs, fielders_info)
+        tuple: (EventType, runs, fielders_info)
     """
-    runs_off_bat = int(row['runs_off_bat']) if row['runs_off_bat'] else 0
-    extras = int(row['extras']) if row['extras'] else 0
-    wides = int(row['wides']) if row['wides'] else 0
-    noballs = int(row['noballs']) if row['noballs'] else 0
-    byes = int(row['byes']) if row['byes'] else 0
-    legbyes = int(row['legbyes']) if row['legbyes'] else 0
-    wicket_type = row['wicket_type']
-    player_dismissed = row['player_dismissed']
+    runs_off_bat = record.runs_off_bat
+    extras = record.extras
+    wides = record.wides
+    noballs = record.noballs
+    byes = record.byes
+    legbyes = record.legbyes
+    wicket_type = record.wicket_type
     
     # Determine event type
     if wicket_type:
         # Wicket occurred
         if wicket_type == 'run out':
-            return 'run out', runs_off_bat, ['Unknown', 0, runs_off_bat]  # fielder, batter_idx, runs
+            return EventType.RUN_OUT, runs_off_bat, ['Unknown', 0, runs_off_bat]  # fielder, batter_idx, runs
         else:
             # Regular wicket (caught, bowled, lbw, stumped)
-            return 'wicket', runs_off_bat, [wicket_type]
+            return EventType.WICKET, runs_off_bat, [wicket_type]
     elif wides > 0:
         # Wide
         if extras > wides:
             # Wide with extra runs (byes/legbyes)
-            return 'wide_bye', extras, []
+            return EventType.WIDE_BYE, extras, []
         else:
-            return 'wide', extras, []
+            return EventType.WIDE, extras, []
     elif noballs > 0:
         # No ball
         if runs_off_bat > 0:
-            return 'no ball_runs', noballs + runs_off_bat, []
+            return EventType.NO_BALL_RUNS, noballs + runs_off_bat, []
         elif byes > 0:
-            return 'no ball_bye', noballs + byes, []
+            return EventType.NO_BALL_BYE, noballs + byes, []
         elif legbyes > 0:
-            return 'no ball_leg_bye', noballs + legbyes, []
+            return EventType.NO_BALL_LEG_BYE, noballs + legbyes, []
         else:
-            return 'no ball', noballs, []
+            return EventType.NO_BALL, noballs, []
     elif byes > 0:
-        return 'bye', byes, []
+        return EventType.BYE, byes, []
     elif legbyes > 0:
-        return 'leg bye', legbyes, []
+        return EventType.LEG_BYE, legbyes, []
     else:
         # Normal delivery
-        return 'normal', runs_off_bat, []
+        return EventType.NORMAL, runs_off_bat, []
 
 
 def get_player_by_name(team, name):
-    """Find player in team by name (case-insensitive)."""
-    name_lower = name.lower()
-    for player in team.players.values():
-        if player.name.lower() == name_lower:
-            return player
-    return None
+    """Find player in team by name (case-insensitive), via the team's name index."""
+    return team.get_player_by_name(name)
 
 
-def replay_innings(innings_num, balls_data, batting_team, bowling_team, info):
+def replay_innings(innings_num, balls_data, batting_team, bowling_team, info, verbose=True, columnar=False,
+                   target=None, format_config=None):
     """
     Replay a single innings from Cricsheet ball data.
     
+    balls_data can be any iterable of BallRecords, such as one innings
+    from iter_innings, so the file is never held in memory.
+    
+    Args:
+        verbose: Print the innings header and per-ball commentary
+        columnar: Store deliveries in a BallColumns instead of a list
+        target: Runs to chase; with format_config, the chase win probability
+                after each delivery goes in innings.win_probabilities (if
+                the format's table has been built)
+        format_config: CRICKET_FORMATS entry for the match
+    
     Returns:
         Innings object
     """
-    innings = Innings(batting_team, bowling_team)
+    innings = Innings(batting_team, bowling_team, columnar=columnar)
     
-    print(f"\n{'='*70}")
-    print(f"Innings {innings_num}: {batting_team.name} batting")
-    print(f"{'='*70}\n")
+    if verbose:
+        print(f"\n{'='*70}")
+        print(f"Innings {innings_num}: {batting_team.name} batting")
+        print(f"{'='*70}\n")
     
     current_striker = None
     current_non_striker = None
     wickets = 0
+    track_win_probability = target is not None and format_config is not None and table_available(format_config)
     
     for ball_data in balls_data:
-        over = int(float(ball_data['ball']))
-        ball = int((float(ball_data['ball']) % 1) * 10 + 0.5)  # Extract decimal part
+        over = ball_data.over
+        ball = ball_data.ball_in_over
         
-        striker_name = ball_data['striker']
-        non_striker_name = ball_data['non_striker']
-        bowler_name = ball_data['bowler']
+        striker_name = ball_data.striker
+        non_striker_name = ball_data.non_striker
+        bowler_name = ball_data.bowler
         
         # Get player objects
-        striker = get_player_by_name(batting_team, striker_name)
-        non_striker = get_player_by_name(batting_team, non_striker_name)
-        bowler = get_player_by_name(bowling_team, bowler_name)
+        striker = batting_team.get_player_by_name(striker_name)
+        non_striker = batting_team.get_player_by_name(non_striker_name)
+        bowler = bowling_team.get_player_by_name(bowler_name)
         
         if not striker or not bowler:
-            print(f"Warning: Could not find player - Striker: {striker_name}, Bowler: {bowler_name}")
+            if verbose:
+                print(f"Warning: Could not find player - Striker: {striker_name}, Bowler: {bowler_name}")
             continue
         
         # Convert to internal event type
@@ -262,92 +390,97 @@ def replay_innings(innings_num, balls_data, batting_team, bowling_team, info):
         innings.add_ball(ball_event)
         
         # Update stats based on event type
-        update_stats_for_ball(striker, bowler, event_type, runs, innings)
+        update_stats_for_ball(striker, bowler, event_type, runs, innings, over)
         
         # Print ball information
-        print_ball_commentary(over, ball, striker_name, bowler_name, event_type, runs, ball_data)
+        if verbose:
+            print_ball_commentary(over, ball, striker_name, bowler_name, event_type, runs, ball_data)
         
         # Track wickets
-        if ball_data['wicket_type']:
+        if ball_data.wicket_type:
             wickets += 1
-            dismissed_player = get_player_by_name(batting_team, ball_data['player_dismissed'])
+            dismissed_player = batting_team.get_player_by_name(ball_data.player_dismissed)
             if dismissed_player:
-                dismissed_player.batting['dismissal'] = format_dismissal(ball_data, bowler_name)
-                innings.fall_of_wickets.append((
+                dismissed_player.batting.dismissal = format_dismissal(ball_data, bowler_name)
+                innings.record_wicket(
                     get_innings_total(innings),
                     dismissed_player.name,
                     bowler_name,
-                    float(ball_data['ball'])
-                ))
+                    float(ball_data.ball)
+                )
+        
+        if track_win_probability:
+            legal_balls = innings.legal_ball_count()
+            innings.win_probabilities.append((legal_balls, chase_probability(
+                format_config, target, get_innings_total(innings), wickets, legal_balls
+            )))
     
     return innings
 
 
-def update_stats_for_ball(striker, bowler, event_type, runs, innings):
-    """Update player and innings stats for a ball."""
+def update_stats_for_ball(striker, bowler, event_type, runs, innings, over=None):
+    """Update player and innings stats for a ball.
+
+    When ``over`` is given the innings running totals are advanced as well.
+    """
+    event_type = EventType.parse(event_type)
+    if over is not None:
+        innings.record_delivery(over, credited_runs(event_type, runs), is_legal_delivery(event_type))
+
     # Update batter stats
-    if event_type == 'normal':
-        striker.batting['runs'] += runs
-        striker.batting['balls'] += 1
+    if event_type is EventType.NORMAL:
+        striker.batting.runs += runs
+        striker.batting.balls += 1
         if runs == 4:
-            striker.batting['4s'] += 1
+            striker.batting.fours += 1
         elif runs == 6:
-            striker.batting['6s'] += 1
-        bowler.bowling['balls'] += 1
-        bowler.bowling['runs'] += runs
+            striker.batting.sixes += 1
+        bowler.bowling.balls += 1
+        bowler.bowling.runs += runs
         if runs == 0:
-            bowler.bowling['dots'] += 1
+            bowler.bowling.dots += 1
         if runs == 4:
-            bowler.bowling['4s'] += 1
+            bowler.bowling.fours += 1
         elif runs == 6:
-            bowler.bowling['6s'] += 1
-    elif event_type == 'wicket':
-        striker.batting['balls'] += 1
-        bowler.bowling['balls'] += 1
-        bowler.bowling['wickets'] += 1
-    elif event_type in ['bye', 'leg bye']:
-        striker.batting['balls'] += 1
-        bowler.bowling['balls'] += 1
-        if event_type == 'bye':
-            innings.extras['byes'] += runs
-        else:
-            innings.extras['leg byes'] += runs
-    elif event_type == 'wide':
+            bowler.bowling.sixes += 1
+    elif event_type is EventType.WICKET:
+        striker.batting.balls += 1
+        bowler.bowling.balls += 1
+        bowler.bowling.wickets += 1
+    elif event_type.is_bye:
+        striker.batting.balls += 1
+        bowler.bowling.balls += 1
+        innings.extras[event_type.extras] += runs
+    elif event_type is EventType.WIDE:
         innings.extras['wides'] += runs
-        bowler.bowling['wides'] += runs
-        bowler.bowling['runs'] += runs
-    elif 'no ball' in event_type:
-        striker.batting['balls'] += 1
+        bowler.bowling.wides += runs
+        bowler.bowling.runs += runs
+    elif event_type.is_no_ball:
+        striker.batting.balls += 1
         innings.extras['no balls'] += 1
-        bowler.bowling['noballs'] += 1
-        if event_type == 'no ball_runs':
+        bowler.bowling.noballs += 1
+        if event_type is EventType.NO_BALL_RUNS:
             bat_runs = runs - 1  # Subtract penalty
-            striker.batting['runs'] += bat_runs
-            bowler.bowling['runs'] += runs
+            striker.batting.runs += bat_runs
+            bowler.bowling.runs += runs
             if bat_runs == 4:
-                striker.batting['4s'] += 1
+                striker.batting.fours += 1
             elif bat_runs == 6:
-                striker.batting['6s'] += 1
-        elif event_type == 'no ball_bye':
-            bye_runs = runs - 1
-            innings.extras['byes'] += bye_runs
-            bowler.bowling['runs'] += 1
-        elif event_type == 'no ball_leg_bye':
-            leg_bye_runs = runs - 1
-            innings.extras['leg byes'] += leg_bye_runs
-            bowler.bowling['runs'] += 1
+                striker.batting.sixes += 1
+        elif event_type in (EventType.NO_BALL_BYE, EventType.NO_BALL_LEG_BYE):
+            innings.extras[event_type.runs_extras] += runs - 1
+            bowler.bowling.runs += 1
         else:
-            bowler.bowling['runs'] += 1
+            bowler.bowling.runs += 1
 
 
 def print_ball_commentary(over, ball, striker, bowler, event_type, runs, ball_data):
     """Print commentary for a single ball."""
     ball_ref = f"{over}.{ball}"
     
-    if ball_data['wicket_type']:
-        wicket_desc = f"{ball_data['wicket_type']}"
-        print(f"  {ball_ref} - {bowler} to {striker} - WICKET! {wicket_desc} - {ball_data['player_dismissed']}")
-    elif event_type == 'normal':
+    if ball_data.wicket_type:
+        print(f"  {ball_ref} - {bowler} to {striker} - WICKET! {ball_data.wicket_type} - {ball_data.player_dismissed}")
+    elif event_type is EventType.NORMAL:
         if runs == 0:
             print(f"  {ball_ref} - {bowler} to {striker} - dot ball")
         elif runs == 4:
@@ -356,18 +489,17 @@ def print_ball_commentary(over, ball, striker, bowler, event_type, runs, ball_da
             print(f"  {ball_ref} - {bowler} to {striker} - SIX!")
         else:
             print(f"  {ball_ref} - {bowler} to {striker} - {runs} run(s)")
-    elif 'wide' in event_type:
+    elif event_type.is_wide:
         print(f"  {ball_ref} - {bowler} to {striker} - WIDE ({runs} extra)")
-    elif 'no ball' in event_type:
+    elif event_type.is_no_ball:
         print(f"  {ball_ref} - {bowler} to {striker} - NO BALL ({runs} total)")
-    elif 'bye' in event_type or 'leg bye' in event_type:
-        extra_type = 'byes' if 'bye' in event_type else 'leg byes'
-        print(f"  {ball_ref} - {bowler} to {striker} - {runs} {extra_type}")
+    elif event_type.is_bye:
+        print(f"  {ball_ref} - {bowler} to {striker} - {runs} {event_type.extras}")
 
 
 def format_dismissal(ball_data, bowler_name):
     """Format dismissal string from Cricsheet data."""
-    wicket_type = ball_data['wicket_type']
+    wicket_type = ball_data.wicket_type
     bowler_surname = bowler_name.split()[-1] if bowler_name else 'Unknown'
     
     if wicket_type == 'caught':
@@ -385,40 +517,83 @@ def format_dismissal(ball_data, bowler_name):
 
 
 def get_innings_total(innings):
-    """Calculate current innings total from player runs and extras."""
-    total = 0
-    for player in innings.batting_team.players.values():
-        total += player.batting['runs']
-    total += sum(innings.extras.values())
-    return total
-
-def export_cricsheet_data(team1, team2, innings1, innings2, match_result, info, innings_data):
+    """Current innings total, read from the innings running counters."""
+    return innings.get_score()[0]
+
+
+# Events whose runs update_stats_for_ball adds to batter runs or extras
+CREDITED_EVENTS = frozenset([
+    EventType.NORMAL, EventType.BYE, EventType.LEG_BYE, EventType.WIDE,
+    EventType.NO_BALL_RUNS, EventType.NO_BALL_BYE, EventType.NO_BALL_LEG_BYE,
+])
+
+
+def is_legal_delivery(event_type):
+    """True if the delivery counts towards the over (not a wide or no ball)."""
+    return EventType.parse(event_type).is_legal
+
+
+def credited_runs(event_type, runs):
+    """Runs update_stats_for_ball adds to the team total for this event."""
+    event_type = EventType.parse(event_type)
+    if event_type in CREDITED_EVENTS:
+        return runs
+    if event_type is EventType.NO_BALL:
+        return 1
+    # Wickets, run outs and wide_bye don't add to batter runs or extras
+    return 0
+
+def export_cricsheet_data(team1, team2, innings1, innings2, match_result, info, ballbyball_path,
+                          per_match_dir=False, verbose=True):
     """
     Export match data using original Cricsheet data to preserve accuracy.
     This avoids issues with non-striker inference and metadata.
+    
+    The ball-by-ball rows are streamed again from ballbyball_path. Files
+    are named after the teams, match date and Cricsheet match id (see
+    reserve_export_paths), optionally in a directory per match. With
+    verbose=False the exported paths aren't printed.
+    
+    Returns:
+        ExportPaths for the match
     """
-    from scorecard_generator.scorecard_export import get_export_filename, export_scorecard_csv, export_match_info_csv
-
-    # Export scorecard (batting/bowling stats) - this works fine
-    scorecard_file = get_export_filename(team1, team2, "scorecard")
-    export_scorecard_csv(scorecard_file, team1, team2, innings1, innings2, match_result)
-    print(f"Scorecard exported to {scorecard_file}")
-
-    # Export match info CSV with actual metadata
-    info_file = get_export_filename(team1, team2, "info")
-    export_match_info_csv(info_file, team1, team2, innings1, innings2, match_result)
-    print(f"Match info exported to {info_file}")
+    from scorecard_generator.scorecard_export import reserve_export_paths
+
+    paths = reserve_export_paths(team1, team2, match_id=info['match_id'], match_date=info['date'],
+                                 per_match_dir=per_match_dir)
+
+    try:
+        _write_cricsheet_exports(paths, team1, team2, innings1, innings2, match_result, info, ballbyball_path,
+                                 verbose)
+    except BaseException:
+        # Don't leave the placeholder behind to push later exports to the next sequence number
+        paths.discard(("scorecard", "info", "ballbyball"))
+        raise
+    return paths
+
+
+def _write_cricsheet_exports(paths, team1, team2, innings1, innings2, match_result, info, ballbyball_path,
+                             verbose=True):
+    """Write export_cricsheet_data's three files to the reserved paths."""
+    from scorecard_generator.scorecard_export import atomic_write, write_exports, EXPORT_BUFFER_SIZE
+
+    # Export scorecard (batting/bowling stats) and match info in one pass
+    scorecard_file = paths.path("scorecard")
+    info_file = paths.path("info")
+    write_exports({'scorecard': scorecard_file, 'info': info_file}, team1, team2, innings1, innings2, match_result)
+    if verbose:
+        print(f"Scorecard exported to {scorecard_file}")
+        print(f"Match info exported to {info_file}")
 
     def normalize_optional(value):
-        if value is None:
-            return ''
-        if value == '' or value == '0':
+        # Blank out missing values and zero counts
+        if not value or value == '0':
             return ''
         return value
 
     # Export ball-by-ball using original Cricsheet data
-    ballbyball_file = get_export_filename(team1, team2, "ballbyball")
-    with open(ballbyball_file, 'w', newline='', encoding='utf-8') as f:
+    ballbyball_file = paths.path("ballbyball")
+    with atomic_write(ballbyball_file, newline='', buffering=EXPORT_BUFFER_SIZE) as f:
         writer = csv.writer(f)
 
         # Header
@@ -430,102 +605,181 @@ def export_cricsheet_data(team1, team2, innings1, innings2, match_result, info,
         ])
 
         # Write all balls from both innings using original Cricsheet data
-        for innings_num in sorted(innings_data.keys()):
-            for ball_data in innings_data[innings_num]:
-                match_id = ball_data.get('match_id') or info['match_id']
-                season = ball_data.get('season') or info['season']
-                start_date = ball_data.get('start_date') or info['date']
-                venue = ball_data.get('venue') or info['venue']
-
-                writer.writerow([
-                    match_id,
-                    season,
-                    start_date,
-                    venue,
-                    ball_data['innings'],
-                    ball_data['ball'],
-                    ball_data['batting_team'],
-                    ball_data['bowling_team'],
-                    ball_data['striker'],
-                    ball_data['non_striker'],  # Preserved from Cricsheet
-                    ball_data['bowler'],
-                    ball_data['runs_off_bat'],
-                    ball_data['extras'],
-                    normalize_optional(ball_data.get('wides')),
-                    normalize_optional(ball_data.get('noballs')),
-                    normalize_optional(ball_data.get('byes')),
-                    normalize_optional(ball_data.get('legbyes')),
-                    normalize_optional(ball_data.get('penalty')),
-                    normalize_optional(ball_data.get('wicket_type')),
-                    normalize_optional(ball_data.get('player_dismissed')),
-                    normalize_optional(ball_data.get('other_wicket_type')),
-                    normalize_optional(ball_data.get('other_player_dismissed'))
-                ])
-
-    print(f"Ball-by-ball data exported to {ballbyball_file}")
-
-    print("\nAll exports completed successfully!")
-    print(f"  - Scorecard: {scorecard_file}")
-    print(f"  - Match Info: {info_file}")
-    print(f"  - Ball-by-ball: {ballbyball_file}")
-
-
-def main():
-    """Main entry point for Cricsheet replay."""
-    print("\n" + "="*70)
-    print("CRICSHEET CSV REPLAY")
-    print("="*70 + "\n")
+        for ball_data in iter_ball_records(ballbyball_path):
+            writer.writerow([
+                ball_data.match_id or info['match_id'],
+                ball_data.season or info['season'],
+                ball_data.start_date or info['date'],
+                ball_data.venue or info['venue'],
+                ball_data.innings,
+                ball_data.ball,
+                ball_data.batting_team,
+                ball_data.bowling_team,
+                ball_data.striker,
+                ball_data.non_striker,  # Preserved from Cricsheet
+                ball_data.bowler,
+                ball_data.runs_off_bat,
+                ball_data.extras,
+                normalize_optional(ball_data.wides),
+                normalize_optional(ball_data.noballs),
+                normalize_optional(ball_data.byes),
+                normalize_optional(ball_data.legbyes),
+                normalize_optional(ball_data.penalty),
+                normalize_optional(ball_data.wicket_type),
+                normalize_optional(ball_data.player_dismissed),
+                normalize_optional(ball_data.other_wicket_type),
+                normalize_optional(ball_data.other_player_dismissed)
+            ])
+
+    if verbose:
+        print(f"Ball-by-ball data exported to {ballbyball_file}")
+
+        print("\nAll exports completed successfully!")
+        print(f"  - Scorecard: {scorecard_file}")
+        print(f"  - Match Info: {info_file}")
+        print(f"  - Ball-by-ball: {ballbyball_file}")
+
+
+def limited_overs_format(info):
+    """CRICKET_FORMATS entry for a limited-overs match_type, or None (Tests and unknown types)."""
+    key = LIMITED_OVERS_MATCH_TYPES.get(info.get('match_type'))
+    return CRICKET_FORMATS[key] if key else None
+
+
+def format_name(info):
+    """CRICKET_FORMATS name for a match (e.g. 'One Day' for ODI), else its raw match_type."""
+    format_config = limited_overs_format(info)
+    return format_config['name'] if format_config else info.get('match_type')
+
+
+def replay_match(info_path, ballbyball_path, *, verbose=False, columnar=False):
+    """
+    Replay a Cricsheet match from its info and ball-by-ball CSV files.
     
-    # Get CSV paths
-    info_path, ballbyball_path = get_csv_paths()
+    With verbose=False nothing is printed and nothing is prompted for, so
+    batch jobs can go straight from the CSVs to export or stats.
+    columnar=True keeps each innings' deliveries in a BallColumns store.
     
+    Returns:
+        MatchResult
+    """
     # Parse info CSV
-    print("\nParsing match info...")
+    if verbose:
+        print("\nParsing match info...")
     info = parse_info_csv(info_path)
-    print(f"  Match: {info['teams'][0]} vs {info['teams'][1]}")
-    print(f"  Venue: {info['venue']}")
-    print(f"  Date: {info['date']}")
+    if verbose:
+        print(f"  Match: {info['teams'][0]} vs {info['teams'][1]}")
+        print(f"  Venue: {info['venue']}")
+        print(f"  Date: {info['date']}")
     
     # Create teams
-    print("\nCreating teams...")
     team1, team2 = create_teams_from_info(info)
-    print(f"  {team1.name}: {len(team1.players)} players")
-    print(f"  {team2.name}: {len(team2.players)} players")
-    
-    # Parse ball-by-ball data
-    print("\nParsing ball-by-ball data...")
-    innings_data = parse_ball_by_ball_csv(ballbyball_path)
-    print(f"  Found {len(innings_data)} innings")
-    
-    # Determine which team bats first from ball-by-ball data
-    first_innings_batting = innings_data[1][0]['batting_team']
-    if first_innings_batting == team1.name:
-        first_batting, first_bowling = team1, team2
+    if verbose:
+        print("\nCreating teams...")
+        print(f"  {team1.name}: {len(team1.players)} players")
+        print(f"  {team2.name}: {len(team2.players)} players")
+    
+    # Stream ball-by-ball data, one innings at a time
+    if verbose:
+        print("\nStreaming ball-by-ball data...")
+    
+    replayed = {}
+    for innings_num, records in iter_innings(ballbyball_path):
+        if innings_num not in (1, 2) or innings_num in replayed:
+            continue  # Super overs and later innings aren't replayed
+        first_ball = next(records)
+        if first_ball.batting_team == team1.name:
+            batting, bowling = team1, team2
+        else:
+            batting, bowling = team2, team1
+        target = format_config = None
+        if innings_num == 2:
+            format_config = limited_overs_format(info)
+            if format_config is not None:
+                target = get_innings_total(replayed[1]) + 1 if 1 in replayed else None
+        innings = replay_innings(innings_num, chain((first_ball,), records), batting, bowling, info,
+                                 verbose=verbose, columnar=columnar, target=target, format_config=format_config)
+        if verbose:
+            print_batting_scorecard(innings)
+            print_bowling_scorecard(innings)
+        replayed[innings_num] = innings
+    
+    if 1 not in replayed:
+        raise ValueError(f"No first innings deliveries in {ballbyball_path}")
+    innings1 = replayed[1]
+    innings2 = replayed.get(2)  # None if the match has a single innings
+    
+    return MatchResult(team1, team2, innings1, innings2, info, ballbyball_path)
+
+
+def main():
+    """Main entry point for Cricsheet replay.
+    
+    Pass --headless to skip commentary, scorecards and the post-match menu,
+    --no-cache to replay even if the match is in the replay cache, and
+    --no-store to skip saving the match to the SQLite match store,
+    --per-match-dir to write the match's exports into their own directory,
+    --svg-charts to draw the report charts as inline SVG instead of Plotly, and
+    --local-plotly to load Plotly from one copy of plotly.js in the export
+    directory instead of the CDN.
+    """
+    from cricsheet_replay.cache import cached_replay_match
+
+    flags = get_cli_flags()
+    headless = '--headless' in flags
+    use_cache = '--no-cache' not in flags
+    use_store = '--no-store' not in flags
+    chart_options = {
+        'chart_backend': 'svg' if '--svg-charts' in flags else None,
+        'plotly_js': 'local' if '--local-plotly' in flags else 'cdn',
+    }
+    
+    if not headless:
+        print("\n" + "="*70)
+        print("CRICSHEET CSV REPLAY")
+        print("="*70 + "\n")
+    
+    # Get CSV paths
+    info_path, ballbyball_path = get_csv_paths(verbose=not headless)
+    
+    if use_cache:
+        result, from_cache = cached_replay_match(info_path, ballbyball_path, verbose=not headless)
+        if from_cache and not headless:
+            print("\nLoaded replay from cache (pass --no-cache to replay ball by ball)")
+            print_batting_scorecard(result.innings1)
+            print_bowling_scorecard(result.innings1)
+            if result.innings2 is not None:
+                print_batting_scorecard(result.innings2)
+                print_bowling_scorecard(result.innings2)
     else:
-        first_batting, first_bowling = team2, team1
-    
-    # Replay innings 1
-    innings1 = replay_innings(1, innings_data[1], first_batting, first_bowling, info)
-    print_batting_scorecard(innings1)
-    print_bowling_scorecard(innings1)
-    
-    # Replay innings 2 if exists
-    innings2 = None
-    if 2 in innings_data:
-        second_batting = first_bowling
-        second_bowling = first_batting
-        innings2 = replay_innings(2, innings_data[2], second_batting, second_bowling, info)
-        print_batting_scorecard(innings2)
-        print_bowling_scorecard(innings2)
+        result = replay_match(info_path, ballbyball_path, verbose=not headless)
+    team1, team2 = result.team1, result.team2
+    innings1, innings2 = result.innings1, result.innings2
     
     # Export results
-    print("\n" + "="*70)
-    print("EXPORTING MATCH DATA")
-    print("="*70 + "\n")
+    if not headless:
+        print("\n" + "="*70)
+        print("EXPORTING MATCH DATA")
+        print("="*70 + "\n")
     
-    match_result = info['match_result']
+    match_result = result.match_result
     # Use custom export that preserves Cricsheet data accuracy
-    export_cricsheet_data(team1, team2, innings1, innings2, match_result, info, innings_data)
+    export_paths = export_cricsheet_data(team1, team2, innings1, innings2, match_result, result.info,
+                                         result.ballbyball_path, per_match_dir='--per-match-dir' in flags,
+                                         verbose=not headless)
+    if use_store:
+        store_match(team1, team2, [innings1, innings2], match_result, info=result.info,
+                    format_name=format_name(result.info), source='cricsheet',
+                    source_id=str(result.info['match_id']))
+    
+    if headless:
+        score1 = innings1.get_score()
+        summary = f"{innings1.batting_team.name} {score1[0]}/{score1[1]}"
+        if innings2 is not None:
+            score2 = innings2.get_score()
+            summary += f", {innings2.batting_team.name} {score2[0]}/{score2[1]}"
+        print(f"{result.info['match_id']}: {summary} - {match_result}")
+        return
     
     print("\n✓ Replay complete! Check scorecard_generator/exports/ for CSV files.")
     
@@ -536,7 +790,9 @@ def main():
         'innings1': innings1,
         'innings2': innings2,
         'match_result': match_result,
-        'format_config': {'name': 'Cricsheet Replay', 'max_overs': None, 'max_bowler_overs': None}
+        'format_config': result.format_config,
+        'export_paths': export_paths,
+        'chart_options': chart_options
     }
     
     # Post-match menu
@@ -558,43 +814,19 @@ def main():
             )
             print(summary)
             
-            # Generate filenames
-            team1_clean = sanitize_filename(match_data['team1'].name)
-            team2_clean = sanitize_filename(match_data['team2'].name)
-            base_filename = f"{team1_clean}v{team2_clean}"
-            
-            html_filename = f"scorecard_generator/exports/{base_filename}_report.html"
-            md_filename = f"scorecard_generator/exports/{base_filename}_report.md"
-            
-            # Generate HTML report
-            try:
-                generate_html_report(
-                    match_data['team1'],
-                    match_data['team2'],
-                    match_data['innings1'],
-                    match_data['innings2'],
-                    match_data['match_result'],
-                    match_data['format_config'],
-                    html_filename
-                )
-                print(f"  📊 HTML Report: {html_filename}")
-            except Exception as e:
-                print(f"  ⚠️  HTML report generation failed: {e}")
-            
-            # Generate Markdown report
-            try:
-                generate_markdown_report(
-                    match_data['team1'],
-                    match_data['team2'],
-                    match_data['innings1'],
-                    match_data['innings2'],
-                    match_data['match_result'],
-                    match_data['format_config'],
-                    md_filename
-                )
-                print(f"  📝 Markdown Report: {md_filename}")
-            except Exception as e:
-                print(f"  ⚠️  Markdown report generation failed: {e}")
+            # Reports go alongside the match's CSV exports (already written)
+            pipeline = generate_reports(
+                match_data['team1'],
+                match_data['team2'],
+                match_data['innings1'],
+                match_data['innings2'],
+                match_data['match_result'],
+                match_data['format_config'],
+                match_data['export_paths'],
+                artefacts=('markdown', 'html'),
+                **match_data['chart_options']
+            )
+            print_pipeline_result(pipeline)
             
             print("\n" + "="*70)
         elif choice == "2":
@@ -0,0 +1,324 @@
+"""
+Multi-match aggregation for career, season and tournament tables.
+
+Each player's per-innings BattingStats/BowlingStats are folded into
+accumulators that only hold sums, counts and maxima, so two aggregates
+can be merged in any order and grouping: worker processes can each fold
+their share of a corpus and the parent merges the results. Leaderboards
+are taken with heapq rather than sorting every player.
+"""
+
+import heapq
+
+
+class BattingAccumulator:
+    """Career batting totals for one player."""
+    __slots__ = ('matches', 'innings', 'not_outs', 'runs', 'balls', 'fours', 'sixes',
+                 'high_score', 'high_score_not_out', 'fifties', 'hundreds', 'ducks')
+
+    def __init__(self):
+        self.matches = 0
+        self.innings = 0
+        self.not_outs = 0
+        self.runs = 0
+        self.balls = 0
+        self.fours = 0
+        self.sixes = 0
+        self.high_score = 0
+        self.high_score_not_out = False
+        self.fifties = 0
+        self.hundreds = 0
+        self.ducks = 0
+
+    def add_innings(self, batting):
+        """Fold in one innings' BattingStats."""
+        not_out = batting.dismissal == 'not out'
+        self.innings += 1
+        self.not_outs += not_out
+        self.runs += batting.runs
+        self.balls += batting.balls
+        self.fours += batting.fours
+        self.sixes += batting.sixes
+        self._update_high_score(batting.runs, not_out)
+        if batting.runs >= 100:
+            self.hundreds += 1
+        elif batting.runs >= 50:
+            self.fifties += 1
+        elif batting.runs == 0 and not not_out:
+            self.ducks += 1
+
+    def _update_high_score(self, runs, not_out):
+        if (runs, not_out) > (self.high_score, self.high_score_not_out):
+            self.high_score = runs
+            self.high_score_not_out = not_out
+
+    def merge(self, other):
+        """Add another accumulator's totals into this one; returns self."""
+        for field in ('matches', 'innings', 'not_outs', 'runs', 'balls', 'fours', 'sixes',
+                      'fifties', 'hundreds', 'ducks'):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self._update_high_score(other.high_score, other.high_score_not_out)
+        return self
+
+    @property
+    def dismissals(self):
+        return self.innings - self.not_outs
+
+    @property
+    def average(self):
+        """Runs per dismissal, or None if never dismissed."""
+        return self.runs / self.dismissals if self.dismissals else None
+
+    @property
+    def strike_rate(self):
+        return self.runs / self.balls * 100 if self.balls else 0.0
+
+    @property
+    def boundary_percentage(self):
+        """Share of runs scored in fours and sixes."""
+        return (4 * self.fours + 6 * self.sixes) / self.runs * 100 if self.runs else 0.0
+
+    @property
+    def high_score_label(self):
+        return f"{self.high_score}{'*' if self.high_score_not_out else ''}"
+
+
+class BowlingAccumulator:
+    """Career bowling totals for one player."""
+    __slots__ = ('matches', 'innings', 'balls', 'runs', 'wickets', 'maidens', 'dots',
+                 'fours', 'sixes', 'wides', 'noballs', 'best_wickets', 'best_runs', 'five_fors')
+
+    def __init__(self):
+        self.matches = 0
+        self.innings = 0
+        self.balls = 0
+        self.runs = 0
+        self.wickets = 0
+        self.maidens = 0
+        self.dots = 0
+        self.fours = 0
+        self.sixes = 0
+        self.wides = 0
+        self.noballs = 0
+        self.best_wickets = 0
+        self.best_runs = None
+        self.five_fors = 0
+
+    def add_innings(self, bowling):
+        """Fold in one innings' BowlingStats."""
+        self.innings += 1
+        self.balls += bowling.balls
+        self.runs += bowling.runs
+        self.wickets += bowling.wickets
+        self.maidens += bowling.maidens
+        self.dots += bowling.dots
+        self.fours += bowling.fours
+        self.sixes += bowling.sixes
+        self.wides += bowling.wides
+        self.noballs += bowling.noballs
+        self._update_best(bowling.wickets, bowling.runs)
+        if bowling.wickets >= 5:
+            self.five_fors += 1
+
+    def _update_best(self, wickets, runs):
+        if runs is None:
+            return
+        if self.best_runs is None or (wickets, -runs) > (self.best_wickets, -self.best_runs):
+            self.best_wickets = wickets
+            self.best_runs = runs
+
+    def merge(self, other):
+        """Add another accumulator's totals into this one; returns self."""
+        for field in ('matches', 'innings', 'balls', 'runs', 'wickets', 'maidens', 'dots',
+                      'fours', 'sixes', 'wides', 'noballs', 'five_fors'):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self._update_best(other.best_wickets, other.best_runs)
+        return self
+
+    @property
+    def economy(self):
+        """Runs per six-ball over."""
+        return self.runs / self.balls * 6 if self.balls else 0.0
+
+    @property
+    def average(self):
+        """Runs per wicket, or None without a wicket."""
+        return self.runs / self.wickets if self.wickets else None
+
+    @property
+    def strike_rate(self):
+        """Balls per wicket, or None without a wicket."""
+        return self.balls / self.wickets if self.wickets else None
+
+    @property
+    def dot_percentage(self):
+        return self.dots / self.balls * 100 if self.balls else 0.0
+
+    @property
+    def boundary_percentage(self):
+        """Share of runs conceded in fours and sixes."""
+        return (4 * self.fours + 6 * self.sixes) / self.runs * 100 if self.runs else 0.0
+
+    @property
+    def best_figures(self):
+        return f"{self.best_wickets}/{self.best_runs}" if self.best_runs is not None else "-"
+
+
+def _accumulator(accumulators, name, factory):
+    acc = accumulators.get(name)
+    if acc is None:
+        acc = accumulators[name] = factory()
+    return acc
+
+
+def _batted(player):
+    batting = player.batting
+    return player.batted or batting.balls > 0 or batting.dismissal != 'not out'
+
+
+def _bowled(player):
+    bowling = player.bowling
+    return player.bowled or bowling.balls > 0 or bowling.runs > 0
+
+
+class StatsAggregate:
+    """
+    Batting and bowling accumulators keyed by player name.
+
+    Aggregates merge associatively (a + b) + c == a + (b + c), so they can
+    be built per worker, per season or per match and combined afterwards.
+    """
+    __slots__ = ('batting', 'bowling', 'teams', 'matches')
+
+    def __init__(self):
+        self.batting = {}  # name -> BattingAccumulator
+        self.bowling = {}  # name -> BowlingAccumulator
+        self.teams = {}  # name -> set of team names
+        self.matches = 0
+
+    def add_match(self, innings_list):
+        """
+        Fold in every innings of one match.
+
+        Each Innings must carry only its own stats on its players, as the
+        Cricsheet replay and batch replay produce (teams are recreated for
+        the third and fourth innings of a multi-day match).
+        """
+        batted, bowled = set(), set()
+        for innings in innings_list:
+            for player in innings.batting_team.players.values():
+                if _batted(player):
+                    self._batting(player.name, innings.batting_team.name).add_innings(player.batting)
+                    batted.add(player.name)
+            for player in innings.bowling_team.players.values():
+                if _bowled(player):
+                    self._bowling(player.name, innings.bowling_team.name).add_innings(player.bowling)
+                    bowled.add(player.name)
+        for name in batted:
+            self.batting[name].matches += 1
+        for name in bowled:
+            self.bowling[name].matches += 1
+        self.matches += 1
+        return self
+
+    def _batting(self, name, team_name):
+        self.teams.setdefault(name, set()).add(team_name)
+        return _accumulator(self.batting, name, BattingAccumulator)
+
+    def _bowling(self, name, team_name):
+        self.teams.setdefault(name, set()).add(team_name)
+        return _accumulator(self.bowling, name, BowlingAccumulator)
+
+    def merge(self, other):
+        """Add another aggregate into this one; returns self."""
+        for name, acc in other.batting.items():
+            _accumulator(self.batting, name, BattingAccumulator).merge(acc)
+        for name, acc in other.bowling.items():
+            _accumulator(self.bowling, name, BowlingAccumulator).merge(acc)
+        for name, teams in other.teams.items():
+            self.teams.setdefault(name, set()).update(teams)
+        self.matches += other.matches
+        return self
+
+    def __add__(self, other):
+        return StatsAggregate().merge(self).merge(other)
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def top_batters(self, n=10, stat='runs', min_innings=0, min_balls=0):
+        """
+        Leaderboard of batters by an accumulator attribute (highest first).
+
+        Returns:
+            List of (name, BattingAccumulator)
+        """
+        return leaderboard(
+            self.batting, stat, n,
+            qualify=lambda acc: acc.innings >= min_innings and acc.balls >= min_balls
+        )
+
+    def top_bowlers(self, n=10, stat='wickets', lowest=False, min_balls=0):
+        """
+        Leaderboard of bowlers by an accumulator attribute.
+
+        Args:
+            lowest: Rank lowest first (economy, average, strike_rate)
+
+        Returns:
+            List of (name, BowlingAccumulator)
+        """
+        return leaderboard(self.bowling, stat, n, lowest=lowest, qualify=lambda acc: acc.balls >= min_balls)
+
+
+def leaderboard(accumulators, stat, n=10, lowest=False, qualify=None):
+    """
+    Top n (name, accumulator) pairs by stat without sorting every player.
+
+    Players whose stat is None (e.g. an average without a dismissal) or
+    who fail qualify(accumulator) are left out. Ties break on name, so the
+    result doesn't depend on the order aggregates were merged in.
+    """
+    sign = 1 if lowest else -1
+    entries = (
+        (name, acc) for name, acc in accumulators.items()
+        if (qualify is None or qualify(acc)) and getattr(acc, stat) is not None
+    )
+    return heapq.nsmallest(n, entries, key=lambda e: (sign * getattr(e[1], stat), e[0]))
+
+
+def aggregate_matches(matches):
+    """
+    Fold an iterable of matches into one StatsAggregate.
+
+    Args:
+        matches: Iterable of lists of Innings (one list per match)
+    """
+    aggregate = StatsAggregate()
+    for innings_list in matches:
+        aggregate.add_match(innings_list)
+    return aggregate
+
+
+def format_batting_table(rows):
+    """Terminal table of (name, BattingAccumulator) rows."""
+    lines = [f"{'Batter':<24} {'M':>3} {'Inn':>4} {'NO':>3} {'Runs':>6} {'HS':>5} {'Avg':>7} {'SR':>7} {'Bdry%':>6}"]
+    for name, acc in rows:
+        average = f"{acc.average:.2f}" if acc.average is not None else "-"
+        lines.append(
+            f"{name:<24} {acc.matches:>3} {acc.innings:>4} {acc.not_outs:>3} {acc.runs:>6} "
+            f"{acc.high_score_label:>5} {average:>7} {acc.strike_rate:>7.2f} {acc.boundary_percentage:>6.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_bowling_table(rows):
+    """Terminal table of (name, BowlingAccumulator) rows."""
+    lines = [f"{'Bowler':<24} {'M':>3} {'Balls':>6} {'Runs':>6} {'Wkts':>5} {'BBI':>6} {'Avg':>7} {'Econ':>6}"]
+    for name, acc in rows:
+        average = f"{acc.average:.2f}" if acc.average is not None else "-"
+        lines.append(
+            f"{name:<24} {acc.matches:>3} {acc.balls:>6} {acc.runs:>6} {acc.wickets:>5} "
+            f"{acc.best_figures:>6} {average:>7} {acc.economy:>6.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,573 @@
+"""
+Prompt-free scoring engine.
+
+process_ball_event applies one delivery to an Innings. MatchState wraps it
+as a state machine: build it with a strategy, feed it Delivery objects via
+apply(), and it handles overs, strike changes, wickets and the end of the
+innings. Every decision that used to be an input() prompt - openers, the
+next batter, the next bowler - comes from the strategy, so the interactive
+CLI, the Cricsheet replay and simulations can all drive the same engine.
+"""
+
+from .models import BallEvent, Innings, EventType, Partnership, get_current_phase
+
+
+def process_ball_event(
+    event_type, runs, fielders, swapped, innings, bowler, batter,
+    current_batters, wickets, over, ball_num, batting_team, over_runs,
+    legal_balls, ball_number, batters_yet, format_config,
+    choose_next_batter=None, verbose=True
+):
+    """
+    Apply one delivery's outcome to the innings, players and partnership.
+
+    Never prompts: when a wicket falls, the incoming batter is picked by
+    choose_next_batter(candidates), which gets the batting order numbers
+    still to bat and returns one of them (default: the first).
+
+    Args:
+        choose_next_batter: Callable picking the incoming batter's number
+        verbose: Print the wicket announcement
+
+    Returns:
+        tuple of (wickets, over_runs, legal_balls, ball_number,
+        current_batters, batters_yet, over_ended_early)
+    """
+    over_ended_early = False
+    event_type = EventType.parse(event_type)
+    
+    # Determine current phase for stats tracking
+    phase = get_current_phase(over, format_config)
+
+    def record_partnership_contribution(partnership, player, runs_to_add=0, ball_faced=False):
+        if not partnership or player is None:
+            return
+        if player == partnership.batter1:
+            partnership.batter1_runs += runs_to_add
+            if ball_faced:
+                partnership.batter1_balls += 1
+        elif player == partnership.batter2:
+            partnership.batter2_runs += runs_to_add
+            if ball_faced:
+                partnership.batter2_balls += 1
+    
+
+    def handle_wicket_fall(out_batter_idx=0, out_batter=None):
+        nonlocal wickets, current_batters, over_ended_early, batters_yet
+        runs_total, _, _, _ = innings.get_score()
+        if verbose:
+            print(f"\nWICKET! Score: {runs_total}-{wickets+1} | {out_batter.name} {out_batter.batting.runs}({out_batter.batting.balls})")
+        wickets += 1
+        innings.record_wicket(runs_total, out_batter.name, bowler.name, over + ball_number / 10)
+        
+        # Track wicket in phase stats
+        if phase:
+            innings.phase_stats[phase]['wickets'] += 1
+        
+        # Close current partnership
+        if innings.current_partnership:
+            innings.current_partnership.end_score = runs_total
+            innings.partnerships.append(innings.current_partnership)
+            innings.current_partnership = None
+        
+        if wickets == 10:
+            current_batters[0] = None
+            current_batters[1] = None
+            over_ended_early = True
+            return True
+
+        # Replace out batter with new one if available
+        non_out_idx = 1 - out_batter_idx
+        survivor = current_batters[non_out_idx]
+        batters_batted = [
+            b.number for b in batting_team.players.values()
+            if b.batting.balls > 0 or b.batting.dismissal != 'not out'
+        ]
+        batters_yet = [
+            num for num in batting_team.order
+            if num not in batters_batted and (survivor is None or num != survivor.number)
+        ]
+        if batters_yet:
+            next_batter_num = choose_next_batter(batters_yet) if choose_next_batter else batters_yet[0]
+            current_batters[out_batter_idx] = batting_team.players[next_batter_num]
+            # Start new partnership
+            new_batter = batting_team.players[next_batter_num]
+            new_batter.batted = True
+            survivor = current_batters[1 - out_batter_idx]
+            runs_total, _, _, _ = innings.get_score()
+            innings.current_partnership = Partnership(survivor, new_batter, wickets + 1, runs_total)
+        else:
+            current_batters[0] = None
+            current_batters[1] = None
+            over_ended_early = True
+            return True
+        return False
+
+    # Normal scoring ball
+    if event_type is EventType.NORMAL:
+        innings.record_delivery(over, runs, legal=True)
+        batter.batting.runs += runs
+        batter.batting.balls += 1
+        batter.batting.scoring_distribution[runs] += 1  # Track scoring distribution
+        if runs == 4:
+            batter.batting.fours += 1
+            bowler.bowling.fours += 1
+        if runs == 6:
+            batter.batting.sixes += 1
+            bowler.bowling.sixes += 1
+        if runs == 0:
+            bowler.bowling.dots += 1
+        bowler.bowling.balls += 1
+        bowler.bowling.runs += runs
+        over_runs += runs
+        
+        # Track phase stats
+        if phase:
+            innings.phase_stats[phase]['runs'] += runs
+            innings.phase_stats[phase]['balls'] += 1
+        
+        # Track partnership stats
+        if innings.current_partnership:
+            innings.current_partnership.runs += runs
+            innings.current_partnership.balls += 1
+            record_partnership_contribution(innings.current_partnership, batter, runs_to_add=runs, ball_faced=True)
+        
+        if runs % 2 == 1:
+            current_batters.reverse()
+        legal_balls += 1
+        ball_number += 1
+
+    # Wide ball variants
+    elif event_type.is_wide and not event_type.is_wicket:
+        innings.record_delivery(over, runs, legal=False)
+        # The bowler is charged all runs, or only the penalty on wide byes/leg byes
+        penalty = event_type.bowler_runs(runs)
+        innings.extras['wides'] += penalty
+        if event_type.runs_extras != 'wides':
+            innings.extras[event_type.runs_extras] += runs - penalty
+        bowler.bowling.wides += 1
+        bowler.bowling.runs += penalty
+        over_runs += runs
+        
+        # Track phase stats for wides
+        if phase:
+            innings.phase_stats[phase]['runs'] += runs
+        
+        # Track partnership stats for wides
+        if innings.current_partnership:
+            innings.current_partnership.runs += runs
+        
+        if swapped:
+            current_batters.reverse()
+
+    # No ball variants
+    elif event_type is EventType.NO_BALL:
+        innings.record_delivery(over, 1, legal=False)
+        innings.extras['no balls'] += 1
+        bowler.bowling.noballs += 1
+        bowler.bowling.runs += 1
+        batter.batting.balls += 1
+
+    elif event_type is EventType.NO_BALL_RUNS:
+        innings.record_delivery(over, runs, legal=False)
+        penalty = 1
+        bat_runs = runs - penalty
+        innings.extras['no balls'] += penalty
+        bowler.bowling.noballs += penalty
+        bowler.bowling.runs += runs
+        batter.batting.runs += bat_runs
+        batter.batting.balls += 1
+        batter.batting.scoring_distribution[bat_runs] += 1  # Track scoring
+        if bat_runs == 4:
+            batter.batting.fours += 1
+            bowler.bowling.fours += 1
+        if bat_runs == 6:
+            batter.batting.sixes += 1
+            bowler.bowling.sixes += 1
+        over_runs += runs
+        
+        # Track phase stats
+        if phase:
+            innings.phase_stats[phase]['runs'] += runs
+        
+        # Track partnership stats
+        if innings.current_partnership:
+            innings.current_partnership.runs += runs
+            record_partnership_contribution(innings.current_partnership, batter, runs_to_add=bat_runs, ball_faced=True)
+        
+        if bat_runs % 2 == 1:
+            current_batters.reverse()
+
+    elif event_type in (EventType.NO_BALL_BYE, EventType.NO_BALL_LEG_BYE):
+        innings.record_delivery(over, runs, legal=False)
+        penalty = 1
+        innings.extras['no balls'] += penalty
+        innings.extras[event_type.runs_extras] += runs - penalty
+        bowler.bowling.noballs += penalty
+        bowler.bowling.runs += penalty
+        batter.batting.balls += 1
+        over_runs += runs
+        
+        # Track phase stats
+        if phase:
+            innings.phase_stats[phase]['runs'] += runs
+        
+        # Track partnership stats
+        if innings.current_partnership:
+            innings.current_partnership.runs += runs
+        
+        if swapped:
+            current_batters.reverse()
+
+    elif event_type.is_bye:
+        innings.record_delivery(over, runs, legal=True)
+        innings.extras[event_type.extras] += runs
+        batter.batting.balls += 1
+        batter.batting.scoring_distribution[0] += 1  # Count as dot ball for batter
+        bowler.bowling.balls += 1
+        bowler.bowling.dots += 1  # Byes and leg byes are dots for bowlers (no runs off bat)
+        over_runs += runs
+        
+        # Track phase stats
+        if phase:
+            innings.phase_stats[phase]['runs'] += runs
+            innings.phase_stats[phase]['balls'] += 1
+        
+        # Track partnership stats
+        if innings.current_partnership:
+            innings.current_partnership.runs += runs
+            innings.current_partnership.balls += 1
+        
+        if swapped:
+            current_batters.reverse()
+        legal_balls += 1
+        ball_number += 1
+
+    elif event_type.is_run_out:
+        fielder = fielders[0]
+        out_batter_idx = fielders[1]
+        completed_runs = fielders[2]
+        out_batter = current_batters[out_batter_idx]
+        # Completed runs on a run out are not credited to the total
+        innings.record_delivery(over, 0, legal=event_type.is_legal)
+        handle_run_out(out_batter, fielder)
+        if handle_wicket_fall(out_batter_idx=out_batter_idx, out_batter=out_batter):
+            return wickets, over_runs, legal_balls, ball_number, current_batters, batters_yet, over_ended_early
+        out_batter.batting.balls += 1
+        bowler.bowling.balls += 1
+        over_runs += completed_runs
+        if swapped:
+            current_batters.reverse()
+        legal_balls += 1
+        ball_number += 1
+
+    elif event_type is EventType.WICKET:
+        innings.record_delivery(over, 0, legal=True)
+        batter.batting.balls += 1
+        batter.batting.scoring_distribution[0] += 1  # Wicket counts as dot for scoring distribution
+        bowler.bowling.balls += 1
+        bowler.bowling.wickets += 1
+        bowler.bowling.dots += 1  # Wickets are dots for bowlers
+        
+        # Track phase stats
+        if phase:
+            innings.phase_stats[phase]['balls'] += 1
+        
+        # Track partnership stats (balls only, runs already tracked)
+        if innings.current_partnership:
+            innings.current_partnership.balls += 1
+            record_partnership_contribution(innings.current_partnership, batter, runs_to_add=0, ball_faced=True)
+        
+        bowler_surname = bowler.name.split()[-1]
+        dismissal_set = False
+
+        if len(fielders) == 1:
+            f = fielders[0]
+            # Caught & Bowled or Caught
+            if isinstance(f, tuple):
+                fielder, _, is_c_and_b = f
+                fielder_surname = fielder.split()[-1]
+                if is_c_and_b:
+                    batter.batting.dismissal = f"c & b {bowler_surname}"
+                else:
+                    batter.batting.dismissal = f"c {fielder_surname} b {bowler_surname}"
+                dismissal_set = True
+            # Bowled
+            elif isinstance(f, str) and f == bowler.name:
+                batter.batting.dismissal = f"b {bowler_surname}"
+                dismissal_set = True
+            # Run out
+            elif isinstance(f, str):
+                fielder_surname = f.split()[-1]
+                batter.batting.dismissal = f"run out ({fielder_surname})"
+                dismissal_set = True
+
+        # LBW
+        elif len(fielders) == 2 and fielders[0] == "lbw":
+            batter.batting.dismissal = f"lbw b {bowler_surname}"
+            dismissal_set = True
+
+        # Stumped
+        elif len(fielders) == 2:
+            wicketkeeper, _ = fielders
+            keeper_surname = wicketkeeper.split()[-1]
+            batter.batting.dismissal = f"st †{keeper_surname} b {bowler_surname}"
+            dismissal_set = True
+
+        # Fallback
+        if not dismissal_set:
+            batter.batting.dismissal = f"b {bowler_surname}"
+
+        if handle_wicket_fall(out_batter_idx=0, out_batter=batter):
+            return wickets, over_runs, legal_balls, ball_number, current_batters, batters_yet, over_ended_early
+        legal_balls += 1
+        ball_number += 1
+
+    return wickets, over_runs, legal_balls, ball_number, current_batters, batters_yet, over_ended_early
+
+
+class Delivery:
+    """
+    One delivery's outcome, as input_ball() reports it.
+
+    Args:
+        runs: Runs on the delivery (including penalty runs for wides/no balls)
+        event: EventType, its int code or its label
+        fielders: Dismissal details (see input_ball)
+        swapped: Whether the batters crossed
+    """
+    __slots__ = ('runs', 'event', 'fielders', 'swapped')
+
+    def __init__(self, runs, event, fielders=None, swapped=False):
+        self.runs = runs
+        self.event = EventType.parse(event)
+        self.fielders = fielders if fielders is not None else []
+        self.swapped = swapped
+
+    @classmethod
+    def from_input(cls, result):
+        """Build a Delivery from input_ball()'s 3- or 4-tuple."""
+        if len(result) == 4:
+            runs, event_type, fielders, swapped = result
+        else:
+            runs, event_type, fielders = result
+            swapped = False
+        return cls(runs, event_type, fielders, swapped)
+
+
+def eligible_bowlers(bowling_team, over, bowler_overs, max_bowler_overs):
+    """Bowling order numbers allowed to bowl this over (under their limit, not bowling consecutive overs)."""
+    eligible = []
+    for num in bowling_team.order:
+        overs = bowler_overs.get(num, [])
+        under_limit = max_bowler_overs is None or len(overs) < max_bowler_overs
+        rested = not overs or overs[-1] < over - 1
+        if under_limit and rested:
+            eligible.append(num)
+    return eligible
+
+
+class BattingOrderStrategy:
+    """
+    Non-interactive decisions: bat in team order and rotate the bowlers.
+
+    Subclass and override any of the choose_* methods to plug in other
+    behaviour (the interactive CLI is input_handlers.InteractiveStrategy).
+
+    Args:
+        bowlers: How many players from the end of the bowling order share the overs
+    """
+    def __init__(self, bowlers=5):
+        self.bowlers = bowlers
+
+    def choose_openers(self, batting_team):
+        """Return the two opening batters' order numbers."""
+        return list(batting_team.order[:2])
+
+    def choose_next_batter(self, batting_team, candidates):
+        """Return the incoming batter's number from candidates (order numbers yet to bat)."""
+        return candidates[0]
+
+    def choose_bowler(self, bowling_team, over, prev_bowler, bowler_overs, max_bowler_overs):
+        """Return the number of the bowler for this over."""
+        eligible = eligible_bowlers(bowling_team, over, bowler_overs, max_bowler_overs)
+        if not eligible:
+            raise RuntimeError(f"No eligible bowler for over {over + 1}")
+        attack = bowling_team.order[-self.bowlers:]
+        pool = [num for num in eligible if num in attack] or eligible
+        # Fewest overs first; ties go to the bowler furthest down the order
+        return min(reversed(pool), key=lambda num: len(bowler_overs.get(num, [])))
+
+
+class MatchState:
+    """
+    One innings as a state machine driven by apply(delivery).
+
+    The bowler for each over is picked lazily (see current_bowler()) so
+    callers can report the end of an over before the next one begins.
+
+    Args:
+        batting_team: Team batting
+        bowling_team: Team bowling
+        format_config: Format dict (max_overs, max_bowler_overs, balls_per_over)
+        strategy: Object providing choose_openers/choose_next_batter/choose_bowler
+                  (default: BattingOrderStrategy)
+        target: Runs needed to win, or None
+        verbose: Print wicket announcements
+        columnar: Store deliveries in a BallColumns
+        track_win_probability: With a target, record the chase win probability
+                               after each delivery in innings.win_probabilities
+                               (skipped if the format's table hasn't been built)
+
+    Attributes:
+        finished: The innings is over (all out, overs up, target reached or ended)
+        over_finished: The last delivery completed an over
+        ended_early: The innings stopped part way through an over
+        target_reached: The batting side reached the target
+    """
+    def __init__(self, batting_team, bowling_team, format_config, strategy=None,
+                 target=None, verbose=False, columnar=False, track_win_probability=False):
+        self.batting_team = batting_team
+        self.bowling_team = bowling_team
+        self.format_config = format_config
+        self.strategy = strategy or BattingOrderStrategy()
+        self.target = target
+        self.verbose = verbose
+        self.track_win_probability = track_win_probability and target is not None
+        if self.track_win_probability:
+            # Tracked only when the format's table has been built; it's never built here
+            from .win_probability import table_available
+            self.track_win_probability = table_available(format_config)
+        self.max_overs = format_config['max_overs']
+        self.max_bowler_overs = format_config['max_bowler_overs']
+        self.balls_per_over = format_config['balls_per_over']
+
+        self.innings = Innings(batting_team, bowling_team, columnar=columnar)
+        openers = self.strategy.choose_openers(batting_team)
+        striker, non_striker = batting_team.players[openers[0]], batting_team.players[openers[1]]
+        striker.batted = True
+        non_striker.batted = True
+        self.current_batters = [striker, non_striker]
+        self.innings.current_batters = self.current_batters
+        self.innings.current_partnership = Partnership(striker, non_striker, 1, 0)
+
+        self.batters_yet = [num for num in batting_team.order if num not in openers]
+        self.bowler_overs = {}
+        self.wickets = 0
+        self.over = 0
+        self.prev_bowler = None
+        self.bowler_num = None
+        self.bowler = None
+        self.over_runs = 0
+        self.legal_balls = 0
+        self.ball_num = 1
+
+        self.finished = False
+        self.over_finished = False
+        self.ended_early = False
+        self.target_reached = False
+        if self.max_overs is not None and self.max_overs <= 0:
+            self._finish()
+
+    def _choose_next_batter(self, candidates):
+        return self.strategy.choose_next_batter(self.batting_team, candidates)
+
+    def current_bowler(self):
+        """The Player bowling the current over, asking the strategy at the start of an over."""
+        if self.bowler is None:
+            self.bowler_num = self.strategy.choose_bowler(
+                self.bowling_team, self.over, self.prev_bowler, self.bowler_overs, self.max_bowler_overs
+            )
+            self.bowler = self.bowling_team.players[self.bowler_num]
+            self.bowler_overs.setdefault(self.bowler_num, [])
+        return self.bowler
+
+    def apply(self, delivery):
+        """
+        Score one delivery.
+
+        Args:
+            delivery: Delivery to apply
+
+        Returns:
+            The BallEvent added to the innings
+        """
+        if self.finished:
+            raise RuntimeError("Innings is already finished")
+        self.over_finished = False
+        bowler = self.current_bowler()
+        batter = self.current_batters[0]
+        event = BallEvent(self.over, self.ball_num, bowler, batter, delivery.runs, delivery.event, delivery.fielders)
+        self.innings.add_ball(event)
+        batter.batted = True
+        bowler.bowled = True
+
+        (self.wickets, self.over_runs, self.legal_balls, self.ball_num,
+         self.current_batters, self.batters_yet, ended_early) = process_ball_event(
+            delivery.event, delivery.runs, delivery.fielders, delivery.swapped, self.innings,
+            bowler, batter, self.current_batters, self.wickets, self.over, self.ball_num,
+            self.batting_team, self.over_runs, self.legal_balls, self.ball_num, self.batters_yet,
+            self.format_config, choose_next_batter=self._choose_next_batter, verbose=self.verbose
+        )
+
+        if self.target is not None and self.innings.get_score()[0] >= self.target:
+            self.target_reached = True
+            ended_early = True
+        if self.track_win_probability:
+            self.innings.win_probabilities.append((self.innings.legal_ball_count(), self.win_probability()))
+        if ended_early:
+            self.ended_early = True
+            self._finish()
+        elif self.legal_balls >= self.balls_per_over:
+            self._end_over()
+        return event
+
+    def win_probability(self):
+        """Chase win probability for the batting side from the precomputed table (None without a target)."""
+        if self.target is None:
+            return None
+        from .win_probability import chase_probability
+        score = self.innings.get_score()[0]
+        return chase_probability(self.format_config, self.target, score, self.wickets, self.innings.legal_ball_count())
+
+    def end_innings(self):
+        """Stop the innings part way through an over (declaration or abandonment)."""
+        if not self.finished:
+            self.ended_early = True
+            self._finish()
+
+    def _end_over(self):
+        innings = self.innings
+        innings.over_totals.append(self.over_runs)
+        innings.cumulative_runs.append(innings.get_score()[0])
+        self.bowler_overs[self.bowler_num].append(self.over)
+        if self.over_runs == 0:
+            self.bowler.bowling.maidens += 1
+        self.prev_bowler = self.bowler_num
+        self.bowler_num = None
+        self.bowler = None
+        self.over += 1
+        self.over_runs = 0
+        self.legal_balls = 0
+        self.ball_num = 1
+        self.over_finished = True
+        if self.current_batters[0] and self.current_batters[1]:
+            self.current_batters.reverse()
+        if (self.max_overs is not None and self.over >= self.max_overs) or self.wickets >= 10:
+            self._finish()
+
+    def _finish(self):
+        innings = self.innings
+        if innings.current_partnership:
+            innings.current_partnership.end_score = innings.get_score()[0]
+            innings.partnerships.append(innings.current_partnership)
+            innings.current_partnership = None
+        self.finished = True
+
+
+def handle_run_out(batter, fielder_info):
+    """Helper function to consistently handle run out dismissals"""
+    fielder_name = fielder_info[0] if isinstance(fielder_info, tuple) else fielder_info
+    fielder_surname = fielder_name.split()[-1]
+    batter.batting.dismissal = f"run out ({fielder_surname})"
+    return True
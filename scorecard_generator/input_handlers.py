@@ -78,6 +78,34 @@ def select_bowler(bowling_team, over, prev_bowler, bowler_overs, max_bowler_over
         except Exception:
             print("you can't do that try again.")
 
+def select_next_batter(team, candidates):
+    print("Choose next batter in from:")
+    for idx, num in enumerate(candidates, 1):
+        print(f"{idx}: {num} {get_display_name(team, num)}")
+    while True:
+        try:
+            next_batter_idx = int(input("Enter order number of next batter: "))
+            if not (1 <= next_batter_idx <= len(candidates)):
+                print("you can't do that try again.")
+                continue
+            return candidates[next_batter_idx-1]
+        except Exception:
+            print("you can't do that try again.")
+
+class InteractiveStrategy:
+    """MatchState strategy that asks the scorer for openers, incoming batters and bowlers."""
+    def choose_openers(self, batting_team):
+        print(f"Players available to open the batting:")
+        for idx, num in enumerate(batting_team.order, 1):
+            print(f"{idx}: {num} {get_display_name(batting_team, num)}")
+        return select_openers(batting_team)
+
+    def choose_next_batter(self, batting_team, candidates):
+        return select_next_batter(batting_team, candidates)
+
+    def choose_bowler(self, bowling_team, over, prev_bowler, bowler_overs, max_bowler_overs):
+        return select_bowler(bowling_team, over, prev_bowler, bowler_overs, max_bowler_overs)
+
 def select_format():
     from .models import CRICKET_FORMATS
     print("\nChoose Match Format:")
@@ -135,49 +163,53 @@ def select_format():
 
 def handle_no_ball_outcome(outcome, batters, bowler, team, over_num, ball_num):
     runs = 1
-    event_type = "no ball"
     fielders = []
-    swapped = False
-
-    if outcome in ['0', '']:
-        return runs, event_type, fielders, swapped
-    elif outcome.isdigit() and int(outcome) in range(1, 7):
-        bat_runs = int(outcome)
-        return (runs + bat_runs), "no ball_runs", fielders, (bat_runs % 2 == 1)
-    elif outcome == 'bye':
-        print("How many byes?")
-        bye_runs = int(input("> "))
-        swapped = (bye_runs % 2 == 1)
-        return (runs + bye_runs), "no ball_bye", fielders, swapped
-    elif outcome in ['leg bye', 'leg byes']:
-        print("How many leg byes?")
-        lb_runs = int(input("> "))
-        swapped = (lb_runs % 2 == 1)
-        return (runs + lb_runs), "no ball_leg_bye", fielders, swapped
-    elif outcome == 'run out':
-        print("How many runs completed before run out?")
-        completed_runs = int(input("> "))
-        swapped = (completed_runs % 2 == 1)
-        print("Which batter was run out? (striker/non-striker)")
-        out_batter = input("> ").strip().lower()
-        if out_batter == 'striker':
-            fielders = [batters[0].name]
-        elif out_batter == 'non-striker':
-            fielders = [batters[1].name]
+    while True:
+        if outcome in ['0', '']:
+            return runs, "no ball", fielders, False
+        elif outcome.isdigit() and int(outcome) in range(1, 7):
+            bat_runs = int(outcome)
+            return (runs + bat_runs), "no ball_runs", fielders, (bat_runs % 2 == 1)
+        elif outcome == 'bye':
+            print("How many byes?")
+            bye_runs = safe_int("> ")
+            swapped = (bye_runs % 2 == 1)
+            return (runs + bye_runs), "no ball_bye", fielders, swapped
+        elif outcome in ['leg bye', 'leg byes']:
+            print("How many leg byes?")
+            lb_runs = safe_int("> ")
+            swapped = (lb_runs % 2 == 1)
+            return (runs + lb_runs), "no ball_leg_bye", fielders, swapped
+        elif outcome == 'run out':
+            print("How many runs completed before run out?")
+            completed_runs = safe_int("> ")
+            swapped = (completed_runs % 2 == 1)
+            print("Which batter was run out? (striker/non-striker)")
+            out_batter = input("> ").strip().lower()
+            if out_batter == 'striker':
+                fielders = [batters[0].name]
+            elif out_batter == 'non-striker':
+                fielders = [batters[1].name]
+            else:
+                print("Invalid input.")
+                continue
+            return (runs + completed_runs), "no ball_run_out", fielders, swapped
         else:
-            print("Invalid input.")
-            return handle_no_ball_outcome(outcome, batters, bowler, team, over_num, ball_num)
-        return (runs + completed_runs), "no ball_run_out", fielders, swapped
-    else:
-        print("Invalid input, please try again.")
-        print("Valid options: 0-6, bye, leg bye, run out")
-        new_outcome = input("> ").strip().lower()
-        return handle_no_ball_outcome(new_outcome, batters, bowler, team, over_num, ball_num)
+            print("Invalid input, please try again.")
+            print("Valid options: 0-6, bye, leg bye, run out")
+            outcome = input("> ").strip().lower()
 
 def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
     if batters[0] is None or batters[1] is None:
         print("No more batters available.")
         return 0, "end", [], False
+    while True:
+        result = _read_ball(batters, bowler, over_num, ball_num, team)
+        if result is not None:
+            return result
+
+def _read_ball(batters, bowler, over_num, ball_num, team):
+    """Prompt for one delivery; returns None when the input was invalid and must be asked again."""
     if over_num is not None and ball_num is not None:
         prompt_prefix = f"{over_num}.{ball_num} ov (0-6=runs scored, w=wicket, wd=wide, nb=no ball, b=bye, lb=leg bye): "
     else:
@@ -203,7 +235,7 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
                     is_c_and_b = (fielder_num == bowler.number)
                 except:
                     print("you can't do that try again.")
-                    return input_ball(batters, bowler, over_num, ball_num, team)
+                    return None
             event_type = "wicket"
             fielders = [(fielder, bowler.name, is_c_and_b)]
         elif wicket_type == "lbw":
@@ -211,7 +243,7 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
             fielders = ["lbw", bowler.name]
         elif wicket_type == "run out":
             print("How many runs completed before run out?")
-            completed_runs = int(input("> "))
+            completed_runs = safe_int("> ")
             swapped = (completed_runs % 2 == 1)
             print("Which batter was run out? (striker/non-striker)")
             out_batter = input("> ").strip().lower()
@@ -221,8 +253,8 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
                 out_batter_idx = 1
             else:
                 print("Invalid input.")
-                return input_ball(batters, bowler, over_num, ball_num, team)
-            fielder_num = int(input("Fielder shirt number: "))
+                return None
+            fielder_num = safe_int("Fielder shirt number: ")
             fielder = team.get_player(fielder_num).name if team and fielder_num in team.players else str(fielder_num)
             event_type = "run out"
             fielders = [fielder, out_batter_idx, completed_runs]
@@ -232,12 +264,12 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
                 wicketkeeper = team.get_player(team.wicketkeeper_number).name
             else:
                 print("No wicketkeeper set for this team.")
-                return input_ball(batters, bowler, over_num, ball_num, team)
+                return None
             event_type = "wicket"
             fielders = [wicketkeeper, bowler.name]
         else:
             print("you can't do that try again.")
-            return input_ball(batters, bowler, over_num, ball_num, team)
+            return None
     elif event == "wd":
         print("Wide! 1 penalty run awarded (extra).")
         print("Please input if any extra runs or outcomes (0, bye, leg bye, run out):")
@@ -250,19 +282,19 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
             return runs, event_type, fielders, swapped
         elif outcome == "bye":
             print("How many byes?")
-            bye_runs = int(input("> "))
+            bye_runs = safe_int("> ")
             runs += bye_runs
             swapped = (bye_runs % 2 == 1)
             return runs, "wide_bye", fielders, swapped
         elif outcome in ["leg bye", "leg byes"]:
             print("How many leg byes?")
-            lb_runs = int(input("> "))
+            lb_runs = safe_int("> ")
             runs += lb_runs
             swapped = (lb_runs % 2 == 1)
             return runs, "wide_leg_bye", fielders, swapped
         elif outcome == "run out":
             print("How many runs completed before run out?")
-            completed_runs = int(input("> "))
+            completed_runs = safe_int("> ")
             runs += completed_runs
             swapped = (completed_runs % 2 == 1)
             print("Which batter was run out? (striker/non-striker)")
@@ -273,8 +305,8 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
                 out_batter_idx = 1
             else:
                 print("Invalid input.")
-                return input_ball(batters, bowler, over_num, ball_num, team)
-            fielder_num = int(input("Fielder shirt number: "))
+                return None
+            fielder_num = safe_int("Fielder shirt number: ")
             fielder = team.get_player(fielder_num).name if team and fielder_num in team.players else str(fielder_num)
             return runs, "wide_run_out", [fielder, out_batter_idx, completed_runs], swapped
     elif event == "nb":
@@ -294,19 +326,19 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
             return runs, "no ball_runs", fielders, (extra_runs % 2 == 1)
         elif outcome == "bye":
             print("How many byes?")
-            bye_runs = int(input("> "))
+            bye_runs = safe_int("> ")
             runs += bye_runs
             swapped = (bye_runs % 2 == 1)
             return runs, "no ball_bye", fielders, swapped
         elif outcome in ["leg bye", "leg byes"]:
             print("How many leg byes?")
-            lb_runs = int(input("> "))
+            lb_runs = safe_int("> ")
             runs += lb_runs
             swapped = (lb_runs % 2 == 1)
             return runs, "no ball_leg_bye", fielders, swapped
         elif outcome == "run out":
             print("How many runs completed before run out?")
-            completed_runs = int(input("> "))
+            completed_runs = safe_int("> ")
             runs += completed_runs
             swapped = (completed_runs % 2 == 1)
             print("Which batter was run out? (striker/non-striker)")
@@ -317,13 +349,13 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
                 out_batter_idx = 1
             else:
                 print("Invalid input.")
-                return input_ball(batters, bowler, over_num, ball_num, team)
-            fielder_num = int(input("Fielder shirt number: "))
+                return None
+            fielder_num = safe_int("Fielder shirt number: ")
             fielder = team.get_player(fielder_num).name if team and fielder_num in team.players else str(fielder_num)
             return runs, "no ball_run_out", [fielder, out_batter_idx, completed_runs], swapped
         else:
             print("Invalid input, please try again.")
-            return input_ball(batters, bowler, over_num, ball_num, team)
+            return None
     elif event == "b":
         try:
             runs = int(input("Byes: "))
@@ -331,7 +363,7 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
             swapped = (runs % 2 == 1)
         except:
             print("you can't do that try again.")
-            return input_ball(batters, bowler, over_num, ball_num, team)
+            return None
     elif event == "lb":
         try:
             runs = int(input("Leg byes: "))
@@ -339,14 +371,14 @@ def input_ball(batters, bowler, over_num=None, ball_num=None, team=None):
             swapped = (runs % 2 == 1)
         except:
             print("you can't do that try again.")
-            return input_ball(batters, bowler, over_num, ball_num, team)
+            return None
     else:
         try:
             runs = int(event)
             if runs < 0 or runs > 6:
                 print("you can't do that try again.")
-                return input_ball(batters, bowler, over_num, ball_num, team)
+                return None
         except:
             print("you can't do that try again.")
-            return input_ball(batters, bowler, over_num, ball_num, team)
+            return None
     return runs, event_type, fielders, swapped
\ No newline at end of file
@@ -1,15 +1,18 @@
-from .team_utils import choose_team_xi
+import argparse
+
+from .team_utils import choose_team_xi, load_team
 from .game_logic import play_innings
 from .input_handlers import select_format
-from .scorecard_export import export_all, sanitize_filename
 from .teams_manager import run_team_manager
-from .match_stats import generate_terminal_summary
-from .match_report_html import generate_html_report
-from .match_report_md import generate_markdown_report
-import os
+from .match_script import load_script
+
+# The export, store, stats and report modules (and Plotly, through the HTML
+# report) are imported where they're first used, after the match has been
+# scored, so starting the scorer doesn't wait for them.
 
 ### just to not forget this info
 # python -m scorecard_generator.main
+# python -m scorecard_generator.main --script match.txt   (no prompts, see match_script.py)
 ###
 
 
@@ -117,7 +120,144 @@ def print_innings_summary(innings1, innings2):
     print("\n" + "="*70)
 
 
-def main():
+def print_format(format_config):
+    """Print the match format's overs limits."""
+    print(f"\nMatch format: {format_config['name']}")
+    if format_config['max_overs']:
+        print(f"  - {format_config['max_overs']} overs per innings")
+    else:
+        print(f"  - Unlimited overs")
+    if format_config['max_bowler_overs']:
+        print(f"  - {format_config['max_bowler_overs']} overs max per bowler")
+    else:
+        print(f"  - No bowler overs limit")
+
+
+def play_match(team1, team2, batting_first, bowling_first, format_config, script=None):
+    """Score both innings, export and store the match, and print its summary.
+
+    Args:
+        team1, team2: Teams in the order they were chosen
+        batting_first, bowling_first: The same Teams after the toss
+        format_config: Format dict
+        script: MatchScript supplying every decision and delivery (default: ask the scorer)
+
+    Returns:
+        match_data dict for the post-match menu
+    """
+    print(f"\nFirst Innings: {batting_first.name} Batting")
+    innings1 = play_innings(batting_first, bowling_first, format_config,
+                            script=script.innings[0] if script else None)
+    score1, wickets1, overs1, rr1 = innings1.get_score()
+    target = score1 + 1
+
+    print(f"\nSecond Innings: {bowling_first.name} Batting (Target: {target})")
+    innings2 = play_innings(bowling_first, batting_first, format_config, target=target,
+                            script=script.innings[1] if script else None)
+
+    # You may wish to add a basic winner logic here
+    score1, wickets1, overs1, rr1 = innings1.get_score()
+    score2, wickets2, overs2, rr2 = innings2.get_score()
+    if score2 >= target:
+        match_result = f"{bowling_first.name} win by {10 - wickets2} wicket(s)!"
+    elif score2 < target - 1:
+        match_result = f"{batting_first.name} win by {target - 1 - score2} runs!"
+    else:
+        match_result = "Match tied!"
+    
+    print(f"\nMatch Result: {match_result}")
+
+    # Export to CSV files
+    from .scorecard_export import export_all
+    from .match_store import store_match
+    export_paths = export_all(team1, team2, innings1, innings2, match_result)
+    store_match(team1, team2, [innings1, innings2], match_result, format_name=format_config['name'])
+    
+    # Print match summary
+    print_innings_summary(innings1, innings2)
+    
+    # Store data for match stats (needed later in menu)
+    return {
+        'team1': team1,
+        'team2': team2,
+        'innings1': innings1,
+        'innings2': innings2,
+        'match_result': match_result,
+        'format_config': format_config,
+        'export_paths': export_paths
+    }
+
+
+def print_match_stats(match_data):
+    """Print the terminal stats summary and write the Markdown and HTML reports."""
+    from .match_stats import generate_terminal_summary
+    from .report_pipeline import generate_reports, print_pipeline_result
+
+    # Generate match statistics and reports
+    print("\n" + "="*70)
+    print("GENERATING MATCH STATISTICS REPORT")
+    print("="*70)
+    
+    # Display terminal summary
+    summary = generate_terminal_summary(
+        match_data['innings1'],
+        match_data['innings2'],
+        match_data['match_result'],
+        match_data['format_config']
+    )
+    print(summary)
+    
+    # Reports go alongside the match's CSV exports (already written)
+    pipeline = generate_reports(
+        match_data['team1'],
+        match_data['team2'],
+        match_data['innings1'],
+        match_data['innings2'],
+        match_data['match_result'],
+        match_data['format_config'],
+        match_data['export_paths'],
+        artefacts=('markdown', 'html')
+    )
+    print_pipeline_result(pipeline)
+    
+    print("\n" + "="*70)
+
+
+def score_script(path):
+    """Score the match in a match script with no prompts, then print its stats and write its reports.
+
+    Args:
+        path: Match script file (see match_script.py)
+
+    Returns:
+        match_data dict, as play_match returns
+
+    Raises:
+        ValueError: If the script is malformed or doesn't fit the match
+    """
+    script = load_script(path)
+    team1 = load_team(script.team1)
+    team2 = load_team(script.team2)
+    print_format(script.format_config)
+    batting_first, bowling_first = script.batting_first(team1, team2)
+    print(f"\n{script.toss_winner} won the toss and chose to {script.toss_choice} first")
+    match_data = play_match(team1, team2, batting_first, bowling_first, script.format_config, script=script)
+    print_match_stats(match_data)
+    return match_data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a cricket match ball by ball.")
+    parser.add_argument('--script', metavar='FILE',
+                        help="Score the match in a match script file, with no prompts")
+    args = parser.parse_args(argv)
+    if args.script:
+        try:
+            score_script(args.script)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Cannot score {args.script}: {e}\n")
+        return
+
     print("Cricket T20 Scorecard Creator/Analyzer\n")
     
     # Check if teams are ready, launch team manager if not
@@ -138,15 +278,7 @@ def main():
 
         # Select match format
         format_config = select_format()
-        print(f"\nMatch format: {format_config['name']}")
-        if format_config['max_overs']:
-            print(f"  - {format_config['max_overs']} overs per innings")
-        else:
-            print(f"  - Unlimited overs")
-        if format_config['max_bowler_overs']:
-            print(f"  - {format_config['max_bowler_overs']} overs max per bowler")
-        else:
-            print(f"  - No bowler overs limit")
+        print_format(format_config)
 
         # Toss logic
         print("\nWho won the toss?")
@@ -181,41 +313,7 @@ def main():
             else:
                 print("Invalid selection.")
 
-        print(f"\nFirst Innings: {batting_first.name} Batting")
-        innings1 = play_innings(batting_first, bowling_first, format_config)
-        score1, wickets1, overs1, rr1 = innings1.get_score()
-        target = score1 + 1
-
-        print(f"\nSecond Innings: {bowling_first.name} Batting (Target: {target})")
-        innings2 = play_innings(bowling_first, batting_first, format_config, target=target)
-
-        # You may wish to add a basic winner logic here
-        score1, wickets1, overs1, rr1 = innings1.get_score()
-        score2, wickets2, overs2, rr2 = innings2.get_score()
-        if score2 >= target:
-            match_result = f"{bowling_first.name} win by {10 - wickets2} wicket(s)!"
-        elif score2 < target - 1:
-            match_result = f"{batting_first.name} win by {target - 1 - score2} runs!"
-        else:
-            match_result = "Match tied!"
-        
-        print(f"\nMatch Result: {match_result}")
-
-        # Export to CSV files
-        export_all(team1, team2, innings1, innings2, match_result)
-        
-        # Print match summary
-        print_innings_summary(innings1, innings2)
-        
-        # Store data for match stats (needed later in menu)
-        match_data = {
-            'team1': team1,
-            'team2': team2,
-            'innings1': innings1,
-            'innings2': innings2,
-            'match_result': match_result,
-            'format_config': format_config
-        }
+        match_data = play_match(team1, team2, batting_first, bowling_first, format_config)
         
         # Post-match menu
         print("\nScoring Finished!")
@@ -225,63 +323,7 @@ def main():
             print("3 - Quit")
             choice = input("Enter choice: ").strip()
             if choice == "1":
-                # Generate match statistics and reports
-                print("\n" + "="*70)
-                print("GENERATING MATCH STATISTICS REPORT")
-                print("="*70)
-                
-                # Display terminal summary
-                summary = generate_terminal_summary(
-                    match_data['innings1'],
-                    match_data['innings2'],
-                    match_data['match_result'],
-                    match_data['format_config']
-                )
-                print(summary)
-                
-                # Generate filenames
-                team1_clean = sanitize_filename(match_data['team1'].name)
-                team2_clean = sanitize_filename(match_data['team2'].name)
-                base_filename = f"{team1_clean}v{team2_clean}"
-                
-                # Ensure exports directory exists
-                os.makedirs("scorecard_generator/exports", exist_ok=True)
-                
-                html_filename = f"scorecard_generator/exports/{base_filename}_report.html"
-                md_filename = f"scorecard_generator/exports/{base_filename}_report.md"
-                
-                # Generate HTML report
-                try:
-                    generate_html_report(
-                        match_data['team1'],
-                        match_data['team2'],
-                        match_data['innings1'],
-                        match_data['innings2'],
-                        match_data['match_result'],
-                        match_data['format_config'],
-                        html_filename
-                    )
-                    print(f"  📊 HTML Report: {html_filename}")
-                except Exception as e:
-                    print(f"  ⚠️  HTML report generation failed: {e}")
-                    print("     (Tip: Install plotly with 'pip install plotly' for interactive charts)")
-                
-                # Generate Markdown report
-                try:
-                    generate_markdown_report(
-                        match_data['team1'],
-                        match_data['team2'],
-                        match_data['innings1'],
-                        match_data['innings2'],
-                        match_data['match_result'],
-                        match_data['format_config'],
-                        md_filename
-                    )
-                    print(f"  📝 Markdown Report: {md_filename}")
-                except Exception as e:
-                    print(f"  ⚠️  Markdown report generation failed: {e}")
-                
-                print("\n" + "="*70)
+                print_match_stats(match_data)
             elif choice == "2":
                 print("\n" + "="*70)
                 break
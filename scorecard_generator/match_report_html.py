@@ -1,41 +1,45 @@
-"""HTML match report generation with Plotly charts.
+"""HTML match report generation with Plotly or inline SVG charts.
 
-This module generates comprehensive HTML match reports with interactive charts
-for Manhattan (runs per over), Worm (cumulative runs), and Run Rate progression.
+This module generates comprehensive HTML match reports with charts for
+Manhattan (runs per over), Worm (cumulative runs), and Run Rate progression.
+Charts are interactive Plotly charts, loaded from the Plotly CDN or from one
+local copy of plotly.js shared by every report in an export directory, or
+dependency-free inline SVG (svg_charts) for fully self-contained reports.
 """
 
 import os
 from datetime import datetime
-from .match_stats import (
-    calculate_phase_breakdown, calculate_innings_summary,
-    get_top_batters, get_top_bowlers, format_batter_breakdown,
-    format_partnership, generate_manhattan_data, generate_worm_data,
-    generate_runrate_data
-)
-
-try:
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+from functools import partial
+from importlib.util import find_spec
+from .html_template import CompiledTemplate, Markup, join
+from .match_stats import format_batter_breakdown, innings_stats, MatchStats
+from .scorecard_export import atomic_write
+from .svg_charts import generate_manhattan_svg, generate_worm_svg, generate_runrate_svg
 
+# Plotly takes longer to import than the rest of the package together, so
+# it's only looked up here and imported by the chart functions when a
+# report first draws a Plotly chart.
+PLOTLY_AVAILABLE = find_spec('plotly') is not None
 
-def generate_manhattan_chart(innings1, innings2, team1_name, team2_name):
+
+def generate_manhattan_chart(innings1, innings2, team1_name, team2_name, include_plotlyjs='cdn'):
     """Generate Manhattan chart (runs per over) using Plotly.
     
     Args:
         innings1, innings2: Innings objects
         team1_name, team2_name: Team names
+        include_plotlyjs: How the chart loads plotly.js ('cdn', a path to
+            a local plotly.js, or False if the page already loads it)
     
     Returns:
         HTML div string with chart
     """
     if not PLOTLY_AVAILABLE:
         return "<p>Plotly not installed. Install with: pip install plotly</p>"
+    import plotly.graph_objects as go
     
-    data1 = generate_manhattan_data(innings1)
-    data2 = generate_manhattan_data(innings2)
+    data1 = innings_stats(innings1).manhattan
+    data2 = innings_stats(innings2).manhattan
     
     # Create figure
     fig = go.Figure()
@@ -65,25 +69,33 @@ def generate_manhattan_chart(innings1, innings2, team1_name, team2_name):
         height=400
     )
     
-    return fig.to_html(include_plotlyjs='cdn', div_id='manhattan_chart')
+    return fig.to_html(include_plotlyjs=include_plotlyjs, div_id='manhattan_chart')
 
 
-def generate_worm_chart(innings1, innings2, team1_name, team2_name):
+def generate_worm_chart(innings1, innings2, team1_name, team2_name, include_plotlyjs=False):
     """Generate Worm chart (cumulative runs) using Plotly.
     
+    When the second innings recorded chase win probabilities they are
+    drawn on a secondary axis.
+    
     Args:
         innings1, innings2: Innings objects
         team1_name, team2_name: Team names
+        include_plotlyjs: As for generate_manhattan_chart
     
     Returns:
         HTML div string with chart
     """
     if not PLOTLY_AVAILABLE:
         return "<p>Plotly not installed. Install with: pip install plotly</p>"
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
     
-    data1, data2 = generate_worm_data(innings1, innings2)
+    data1 = innings_stats(innings1).cumulative
+    data2 = innings_stats(innings2).cumulative
+    win_overs, win_percent = innings_stats(innings2).win_probability
     
-    fig = go.Figure()
+    fig = make_subplots(specs=[[{"secondary_y": True}]]) if win_overs else go.Figure()
     
     # Add line for first innings
     fig.add_trace(go.Scatter(
@@ -105,6 +117,16 @@ def generate_worm_chart(innings1, innings2, team1_name, team2_name):
         marker=dict(size=6)
     ))
     
+    if win_overs:
+        fig.add_trace(go.Scatter(
+            x=win_overs,
+            y=win_percent,
+            mode='lines',
+            name=f'{team2_name} win probability',
+            line=dict(color='#2ca02c', width=2, dash='dot')
+        ), secondary_y=True)
+        fig.update_yaxes(title_text='Win Probability (%)', range=[0, 100], secondary_y=True)
+    
     fig.update_layout(
         title='Worm Chart - Cumulative Runs',
         xaxis_title='Over',
@@ -113,24 +135,26 @@ def generate_worm_chart(innings1, innings2, team1_name, team2_name):
         height=400
     )
     
-    return fig.to_html(include_plotlyjs=False, div_id='worm_chart')
+    return fig.to_html(include_plotlyjs=include_plotlyjs, div_id='worm_chart')
 
 
-def generate_runrate_chart(innings1, innings2, team1_name, team2_name):
+def generate_runrate_chart(innings1, innings2, team1_name, team2_name, include_plotlyjs=False):
     """Generate run rate progression chart using Plotly.
     
     Args:
         innings1, innings2: Innings objects
         team1_name, team2_name: Team names
+        include_plotlyjs: As for generate_manhattan_chart
     
     Returns:
         HTML div string with chart
     """
     if not PLOTLY_AVAILABLE:
         return "<p>Plotly not installed. Install with: pip install plotly</p>"
+    import plotly.graph_objects as go
     
-    rr1 = generate_runrate_data(innings1)
-    rr2 = generate_runrate_data(innings2)
+    rr1 = innings_stats(innings1).run_rates
+    rr2 = innings_stats(innings2).run_rates
     
     fig = go.Figure()
     
@@ -162,36 +186,17 @@ def generate_runrate_chart(innings1, innings2, team1_name, team2_name):
         height=400
     )
     
-    return fig.to_html(include_plotlyjs=False, div_id='runrate_chart')
+    return fig.to_html(include_plotlyjs=include_plotlyjs, div_id='runrate_chart')
 
 
-def generate_html_report(team1, team2, innings1, innings2, match_result, format_config, filename):
-    """Generate comprehensive HTML match report.
-    
-    Args:
-        team1, team2: Team objects
-        innings1, innings2: Innings objects
-        match_result: String describing match outcome
-        format_config: Dict with format configuration
-        filename: Output filename
-    """
-    # Get team names
-    team1_name = innings1.batting_team.name
-    team2_name = innings2.batting_team.name
-    
-    # Calculate statistics
-    stats1 = calculate_innings_summary(innings1)
-    stats2 = calculate_innings_summary(innings2)
-    
-    # Build HTML
-    html = ['<!DOCTYPE html>']
-    html.append('<html lang="en">')
-    html.append('<head>')
-    html.append('    <meta charset="UTF-8">')
-    html.append('    <meta name="viewport" content="width=device-width, initial-scale=1.0">')
-    html.append(f'    <title>Match Report: {team1_name} vs {team2_name}</title>')
-    html.append('    <style>')
-    html.append('''
+PAGE = CompiledTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Match Report: $team1 vs $team2</title>
+    <style>
+
         body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1200px;
@@ -291,297 +296,398 @@ def generate_html_report(team1, team2, innings1, innings2, match_result, format_
                 page-break-inside: avoid;
             }
         }
-    ''')
-    html.append('    </style>')
-    html.append('</head>')
-    html.append('<body>')
-    
-    # Header
-    html.append('    <div class="header">')
-    html.append(f'        <h1>{team1_name} vs {team2_name}</h1>')
-    html.append(f'        <p class="result">{match_result}</p>')
-    html.append(f'        <p>Format: {format_config["name"]} | Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}</p>')
-    html.append('    </div>')
-    
-    # Match Summary Section
-    html.append('    <div class="section">')
-    html.append('        <h2>Match Summary</h2>')
-    html.append('        <div class="stats-grid">')
-    html.append(f'            <div class="stat-box"><div class="label">{team1_name}</div><div class="value">{stats1["total_runs"]}/{stats1["wickets"]}</div></div>')
-    html.append(f'            <div class="stat-box"><div class="label">Overs</div><div class="value">{stats1["overs"]:.1f}</div></div>')
-    html.append(f'            <div class="stat-box"><div class="label">Run Rate</div><div class="value">{stats1["run_rate"]:.2f}</div></div>')
-    html.append('        </div>')
-    html.append('        <div class="stats-grid">')
-    html.append(f'            <div class="stat-box"><div class="label">{team2_name}</div><div class="value">{stats2["total_runs"]}/{stats2["wickets"]}</div></div>')
-    html.append(f'            <div class="stat-box"><div class="label">Overs</div><div class="value">{stats2["overs"]:.1f}</div></div>')
-    html.append(f'            <div class="stat-box"><div class="label">Run Rate</div><div class="value">{stats2["run_rate"]:.2f}</div></div>')
-    html.append('        </div>')
-    html.append('    </div>')
-    
-    # Full Scorecards Section
-    from .match_stats import format_scorecard_data
-    
-    # First Innings Scorecard
-    scorecard1 = format_scorecard_data(innings1)
-    html.append('    <div class="section">')
-    html.append(f'        <h2>1st Innings: {scorecard1["team_name"]} Batting</h2>')
-    
-    # Batting table
-    html.append('        <table>')
-    html.append('            <tr><th>Player Name</th><th>Dismissal</th><th>Runs</th><th>Balls</th><th>4s</th><th>6s</th><th>SR</th></tr>')
-    for batter in scorecard1['batters']:
-        html.append(f'            <tr>')
-        html.append(f'                <td>{batter["name"]}</td>')
-        html.append(f'                <td>{batter["dismissal"]}</td>')
-        html.append(f'                <td><strong>{batter["runs"]}{batter["not_out"]}</strong></td>')
-        html.append(f'                <td>{batter["balls"]}</td>')
-        html.append(f'                <td>{batter["fours"]}</td>')
-        html.append(f'                <td>{batter["sixes"]}</td>')
-        html.append(f'                <td>{batter["sr"]:.2f}</td>')
-        html.append(f'            </tr>')
-    
-    # Extras row
-    extras_display = f'({scorecard1["extras_detail"]})' if scorecard1['extras_detail'] else ''
-    html.append(f'            <tr style="font-weight: bold; background-color: #f8f9fa;">')
-    html.append(f'                <td>Extras</td>')
-    html.append(f'                <td>{extras_display}</td>')
-    html.append(f'                <td><strong>{scorecard1["extras"]}</strong></td>')
-    html.append(f'                <td colspan="4"></td>')
-    html.append(f'            </tr>')
-    html.append('        </table>')
-    
-    # Total line
-    html.append(f'        <p style="font-size: 1.1em; margin: 10px 0;"><strong>Total: {scorecard1["overs"]} Ov (RR: {scorecard1["run_rate"]:.2f}) {scorecard1["total_runs"]}/{scorecard1["total_wickets"]}</strong></p>')
-    
-    # Did not bat
-    if scorecard1['did_not_bat']:
-        html.append(f'        <p><em>Did not bat: {", ".join(scorecard1["did_not_bat"])}</em></p>')
-    
-    # Fall of wickets
-    if scorecard1['fall_of_wickets']:
-        fow_list = []
-        for fw in scorecard1['fall_of_wickets']:
-            fow_list.append(f'{fw["number"]}-{fw["runs"]} ({fw["batsman"]}, {fw["over"]:.1f} ov)')
-        html.append(f'        <p><strong>Fall of wickets:</strong> {", ".join(fow_list)}</p>')
-    
-    # Bowling table
-    html.append(f'        <h3>Bowling: {scorecard1["bowling_team"]}</h3>')
-    html.append('        <table>')
-    html.append('            <tr><th>Bowler</th><th>Overs</th><th>M</th><th>Runs</th><th>Wkts</th><th>Econ</th><th>Dots</th><th>4s</th><th>6s</th><th>Wd</th><th>NB</th></tr>')
-    for bowler in scorecard1['bowlers']:
-        html.append(f'            <tr>')
-        html.append(f'                <td>{bowler["name"]}</td>')
-        html.append(f'                <td>{bowler["overs"]}</td>')
-        html.append(f'                <td>{bowler["maidens"]}</td>')
-        html.append(f'                <td>{bowler["runs"]}</td>')
-        html.append(f'                <td><strong>{bowler["wickets"]}</strong></td>')
-        html.append(f'                <td>{bowler["economy"]:.2f}</td>')
-        html.append(f'                <td>{bowler["dots"]}</td>')
-        html.append(f'                <td>{bowler["fours"]}</td>')
-        html.append(f'                <td>{bowler["sixes"]}</td>')
-        html.append(f'                <td>{bowler["wides"]}</td>')
-        html.append(f'                <td>{bowler["noballs"]}</td>')
-        html.append(f'            </tr>')
-    html.append('        </table>')
-    html.append('    </div>')
-    
-    # Second Innings Scorecard
-    scorecard2 = format_scorecard_data(innings2)
-    html.append('    <div class="section">')
-    html.append(f'        <h2>2nd Innings: {scorecard2["team_name"]} Batting</h2>')
-    
-    # Batting table
-    html.append('        <table>')
-    html.append('            <tr><th>Player Name</th><th>Dismissal</th><th>Runs</th><th>Balls</th><th>4s</th><th>6s</th><th>SR</th></tr>')
-    for batter in scorecard2['batters']:
-        html.append(f'            <tr>')
-        html.append(f'                <td>{batter["name"]}</td>')
-        html.append(f'                <td>{batter["dismissal"]}</td>')
-        html.append(f'                <td><strong>{batter["runs"]}{batter["not_out"]}</strong></td>')
-        html.append(f'                <td>{batter["balls"]}</td>')
-        html.append(f'                <td>{batter["fours"]}</td>')
-        html.append(f'                <td>{batter["sixes"]}</td>')
-        html.append(f'                <td>{batter["sr"]:.2f}</td>')
-        html.append(f'            </tr>')
-    
-    # Extras row
-    extras_display = f'({scorecard2["extras_detail"]})' if scorecard2['extras_detail'] else ''
-    html.append(f'            <tr style="font-weight: bold; background-color: #f8f9fa;">')
-    html.append(f'                <td>Extras</td>')
-    html.append(f'                <td>{extras_display}</td>')
-    html.append(f'                <td><strong>{scorecard2["extras"]}</strong></td>')
-    html.append(f'                <td colspan="4"></td>')
-    html.append(f'            </tr>')
-    html.append('        </table>')
-    
-    # Total line
-    html.append(f'        <p style="font-size: 1.1em; margin: 10px 0;"><strong>Total: {scorecard2["overs"]} Ov (RR: {scorecard2["run_rate"]:.2f}) {scorecard2["total_runs"]}/{scorecard2["total_wickets"]}</strong></p>')
-    
-    # Did not bat
-    if scorecard2['did_not_bat']:
-        html.append(f'        <p><em>Did not bat: {", ".join(scorecard2["did_not_bat"])}</em></p>')
-    
-    # Fall of wickets
-    if scorecard2['fall_of_wickets']:
-        fow_list = []
-        for fw in scorecard2['fall_of_wickets']:
-            fow_list.append(f'{fw["number"]}-{fw["runs"]} ({fw["batsman"]}, {fw["over"]:.1f} ov)')
-        html.append(f'        <p><strong>Fall of wickets:</strong> {", ".join(fow_list)}</p>')
-    
-    # Bowling table
-    html.append(f'        <h3>Bowling: {scorecard2["bowling_team"]}</h3>')
-    html.append('        <table>')
-    html.append('            <tr><th>Bowler</th><th>Overs</th><th>M</th><th>Runs</th><th>Wkts</th><th>Econ</th><th>Dots</th><th>4s</th><th>6s</th><th>Wd</th><th>NB</th></tr>')
-    for bowler in scorecard2['bowlers']:
-        html.append(f'            <tr>')
-        html.append(f'                <td>{bowler["name"]}</td>')
-        html.append(f'                <td>{bowler["overs"]}</td>')
-        html.append(f'                <td>{bowler["maidens"]}</td>')
-        html.append(f'                <td>{bowler["runs"]}</td>')
-        html.append(f'                <td><strong>{bowler["wickets"]}</strong></td>')
-        html.append(f'                <td>{bowler["economy"]:.2f}</td>')
-        html.append(f'                <td>{bowler["dots"]}</td>')
-        html.append(f'                <td>{bowler["fours"]}</td>')
-        html.append(f'                <td>{bowler["sixes"]}</td>')
-        html.append(f'                <td>{bowler["wides"]}</td>')
-        html.append(f'                <td>{bowler["noballs"]}</td>')
-        html.append(f'            </tr>')
-    html.append('        </table>')
-    html.append('    </div>')
-    
-    # Scoring Breakdown (if T20 or ODI)
-    if format_config['name'] in ['T20', 'One Day']:
-        phase1 = calculate_phase_breakdown(innings1, format_config)
-        phase2 = calculate_phase_breakdown(innings2, format_config)
-        
-        if phase1 or phase2:
-            html.append('    <div class="section">')
-            html.append('        <h2>Scoring Breakdown by Phase</h2>')
-            html.append('        <table>')
-            html.append('            <tr><th>Phase</th><th>' + team1_name + '</th><th>' + team2_name + '</th></tr>')
-            
-            phases = ['powerplay', 'middle', 'final']
-            phase_labels = {
-                'powerplay': 'Powerplay' + (' (1-6)' if format_config['name'] == 'T20' else ' (1-10)'),
-                'middle': 'Middle Overs' + (' (7-16)' if format_config['name'] == 'T20' else ' (11-40)'),
-                'final': 'Final Overs' + (' (17-20)' if format_config['name'] == 'T20' else ' (41-50)')
-            }
-            
-            for phase in phases:
-                p1 = phase1.get(phase) if phase1 else None
-                p2 = phase2.get(phase) if phase2 else None
-                
-                p1_str = f"{p1['runs']}/{p1['wickets']}" if p1 else "-"
-                p2_str = f"{p2['runs']}/{p2['wickets']}" if p2 else "-"
-                
-                html.append(f'            <tr><td>{phase_labels[phase]}</td><td>{p1_str}</td><td>{p2_str}</td></tr>')
-            
-            html.append('        </table>')
-            html.append('    </div>')
-    
-    # Innings Statistics Comparison
-    html.append('    <div class="section">')
-    html.append('        <h2>Innings Statistics</h2>')
-    html.append('        <table>')
-    html.append('            <tr><th>Statistic</th><th>' + team1_name + '</th><th>' + team2_name + '</th></tr>')
-    html.append(f'            <tr><td>Sixes</td><td>{stats1["sixes"]}</td><td>{stats2["sixes"]}</td></tr>')
-    html.append(f'            <tr><td>Fours</td><td>{stats1["fours"]}</td><td>{stats2["fours"]}</td></tr>')
-    html.append(f'            <tr><td>Runs in Boundaries</td><td>{stats1["runs_in_boundaries"]}</td><td>{stats2["runs_in_boundaries"]}</td></tr>')
-    html.append(f'            <tr><td>Dot Ball %</td><td>{stats1["dot_ball_percent"]:.1f}%</td><td>{stats2["dot_ball_percent"]:.1f}%</td></tr>')
-    html.append(f'            <tr><td>Extras</td><td>{stats1["extras"]}</td><td>{stats2["extras"]}</td></tr>')
-    html.append('        </table>')
-    html.append('    </div>')
-    
-    # Top Batters
-    html.append('    <div class="section">')
-    html.append('        <h2>Best Batting Performances</h2>')
-    top_batters = get_top_batters(innings1, innings2, n=2)
     
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>$team1 vs $team2</h1>
+        <p class="result">$result</p>
+        <p>Format: $format | Generated: $generated</p>
+    </div>
+${sections}    <div style="text-align: center; padding: 20px; color: #666;">
+        <p>Generated by Cricket Scorecard Generator</p>
+    </div>
+</body>
+</html>''')
+
+# Fragments below end with a newline so optional ones can be left out cleanly
+SECTION = CompiledTemplate('''    <div class="section">
+        <h2>$title</h2>
+${content}    </div>
+''')
+
+STATS_GRID = CompiledTemplate('''        <div class="stats-grid">
+${boxes}        </div>
+''')
+
+STAT_BOX = CompiledTemplate(
+    '''            <div class="stat-box"><div class="label">$label</div><div class="value">$value</div></div>
+''')
+
+BATTING_TABLE = CompiledTemplate('''        <table>
+            <tr><th>Player Name</th><th>Dismissal</th><th>Runs</th><th>Balls</th><th>4s</th><th>6s</th><th>SR</th></tr>
+${rows}            <tr style="font-weight: bold; background-color: #f8f9fa;">
+                <td>Extras</td>
+                <td>$extras_detail</td>
+                <td><strong>$extras</strong></td>
+                <td colspan="4"></td>
+            </tr>
+        </table>
+        <p style="font-size: 1.1em; margin: 10px 0;"><strong>Total: $overs Ov (RR: $run_rate) $runs/$wickets</strong></p>
+${did_not_bat}${fall_of_wickets}        <h3>Bowling: $bowling_team</h3>
+        <table>
+            <tr><th>Bowler</th><th>Overs</th><th>M</th><th>Runs</th><th>Wkts</th><th>Econ</th><th>Dots</th><th>4s</th><th>6s</th><th>Wd</th><th>NB</th></tr>
+${bowlers}        </table>
+''')
+
+BATTER_ROW = CompiledTemplate('''            <tr>
+                <td>$name</td>
+                <td>$dismissal</td>
+                <td><strong>$runs$not_out</strong></td>
+                <td>$balls</td>
+                <td>$fours</td>
+                <td>$sixes</td>
+                <td>$sr</td>
+            </tr>
+''')
+
+BOWLER_ROW = CompiledTemplate('''            <tr>
+                <td>$name</td>
+                <td>$overs</td>
+                <td>$maidens</td>
+                <td>$runs</td>
+                <td><strong>$wickets</strong></td>
+                <td>$economy</td>
+                <td>$dots</td>
+                <td>$fours</td>
+                <td>$sixes</td>
+                <td>$wides</td>
+                <td>$noballs</td>
+            </tr>
+''')
+
+DID_NOT_BAT = CompiledTemplate('''        <p><em>Did not bat: $names</em></p>
+''')
+
+FALL_OF_WICKETS = CompiledTemplate('''        <p><strong>Fall of wickets:</strong> $wickets</p>
+''')
+
+FALL_OF_WICKET = CompiledTemplate('$number-$runs ($batsman, $over ov)')
+
+COMPARISON_TABLE = CompiledTemplate('''        <table>
+            <tr><th>$heading</th><th>$team1</th><th>$team2</th></tr>
+${rows}        </table>
+''')
+
+COMPARISON_ROW = CompiledTemplate('''            <tr><td>$label</td><td>$value1</td><td>$value2</td></tr>
+''')
+
+TOP_BATTER = CompiledTemplate('''        <h3>$name | $team</h3>
+        <p style="font-size: 1.2em;"><strong>$runs$not_out runs ($balls balls) | SR: $sr</strong></p>
+''')
+
+TOP_BOWLER = CompiledTemplate('''        <h3>$name | $team</h3>
+        <table>
+            <tr><th>Overs</th><th>Maidens</th><th>Runs</th><th>Wickets</th><th>Economy</th><th>Dots</th><th>4s</th><th>6s</th><th>Wides</th><th>No Balls</th></tr>
+            <tr><td>$overs</td><td>$maidens</td><td>$runs</td><td>$wickets</td><td>$economy</td><td>$dots</td><td>$fours</td><td>$sixes</td><td>$wides</td><td>$noballs</td></tr>
+        </table>
+''')
+
+PARTNERSHIP = CompiledTemplate('''        <div class="partnership">
+            <strong>$label: $runs runs ($balls balls)</strong>
+            <p>$batter1: $batter1_runs($batter1_balls) | $batter2: $batter2_runs($batter2_balls)</p>
+        </div>
+''')
+
+CHART = CompiledTemplate('''        <div class="chart-container">
+$chart
+        </div>
+''')
+
+# Chart renderers by backend, in page order; each takes (innings1, innings2, team1_name, team2_name)
+CHART_BACKENDS = {
+    'plotly': {
+        'manhattan': generate_manhattan_chart,
+        'worm': generate_worm_chart,
+        'runrate': generate_runrate_chart,
+    },
+    'svg': {
+        'manhattan': generate_manhattan_svg,
+        'worm': generate_worm_svg,
+        'runrate': generate_runrate_svg,
+    },
+}
+DEFAULT_CHART_BACKEND = 'plotly' if PLOTLY_AVAILABLE else 'svg'
+PLOTLY_JS_MODES = ('cdn', 'local')
+
+BOUNDARY_BREAKDOWN = ('0s', '1s', '2s', '3s', '4s', '6s')
+
+
+def chart_renderers(backend=None, include_plotlyjs='cdn'):
+    """Return [(name, render)] for a chart backend, in page order.
+    
+    Args:
+        backend: 'plotly' or 'svg' (default: Plotly if it's installed)
+        include_plotlyjs: How the first Plotly chart loads plotly.js (see
+            generate_manhattan_chart); the others rely on it
+    
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or DEFAULT_CHART_BACKEND
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"Unknown chart backend: {backend}")
+    renderers = list(CHART_BACKENDS[backend].items())
+    if backend == 'plotly' and include_plotlyjs != 'cdn':
+        name, render = renderers[0]
+        renderers[0] = (name, partial(render, include_plotlyjs=include_plotlyjs))
+    return renderers
+
+
+def plotly_runtime(plotly_js, report_dir, runtime_dir=None):
+    """Return the include_plotlyjs value for a report's first Plotly chart.
+    
+    'cdn' loads plotly.js from the Plotly CDN. 'local' references a copy of
+    plotly.js in runtime_dir, shared by every report that uses it and
+    written the first time it's needed, so reports open without network
+    access and don't each carry the ~3MB library.
+    
+    Args:
+        plotly_js: 'cdn' or 'local'
+        report_dir: Directory the HTML report is written to
+        runtime_dir: Directory for the shared plotly.js (default: report_dir)
+    
+    Raises:
+        ValueError: If plotly_js is unknown
+    """
+    if plotly_js not in PLOTLY_JS_MODES:
+        raise ValueError(f"Unknown plotly_js mode: {plotly_js}")
+    if plotly_js == 'cdn' or not PLOTLY_AVAILABLE:
+        return 'cdn'
+    import plotly
+    from plotly.offline import get_plotlyjs
+    runtime_dir = runtime_dir or report_dir
+    path = os.path.join(runtime_dir, f"plotly-{plotly.__version__}.min.js")
+    if not os.path.exists(path):
+        os.makedirs(runtime_dir, exist_ok=True)
+        with atomic_write(path) as f:
+            f.write(get_plotlyjs())
+    return os.path.relpath(path, report_dir).replace(os.sep, '/')
+
+
+def _ordinal(number):
+    return f"{number}{'st' if number == 1 else 'nd' if number == 2 else 'rd' if number == 3 else 'th'}"
+
+
+def _overs(balls):
+    overs, remaining = divmod(balls, 6)
+    return f"{overs}.{remaining}" if remaining > 0 else str(overs)
+
+
+def _summary_grid(team_name, summary):
+    return STATS_GRID.render(boxes=join([
+        STAT_BOX.render(label=team_name, value=f"{summary['total_runs']}/{summary['wickets']}"),
+        STAT_BOX.render(label='Overs', value=f"{summary['overs']:.1f}"),
+        STAT_BOX.render(label='Run Rate', value=f"{summary['run_rate']:.2f}"),
+    ]))
+
+
+def _scorecard_section(number, scorecard):
+    fall_of_wickets = ''
+    if scorecard['fall_of_wickets']:
+        fall_of_wickets = FALL_OF_WICKETS.render(wickets=join((
+            FALL_OF_WICKET.render(number=fw['number'], runs=fw['runs'], batsman=fw['batsman'],
+                                  over=f"{fw['over']:.1f}")
+            for fw in scorecard['fall_of_wickets']
+        ), ', '))
+    did_not_bat = ''
+    if scorecard['did_not_bat']:
+        did_not_bat = DID_NOT_BAT.render(names=', '.join(scorecard['did_not_bat']))
+
+    table = BATTING_TABLE.render(
+        rows=join(BATTER_ROW.render(
+            name=b['name'], dismissal=b['dismissal'], runs=b['runs'], not_out=b['not_out'],
+            balls=b['balls'], fours=b['fours'], sixes=b['sixes'], sr=f"{b['sr']:.2f}"
+        ) for b in scorecard['batters']),
+        extras_detail=f"({scorecard['extras_detail']})" if scorecard['extras_detail'] else '',
+        extras=scorecard['extras'],
+        overs=scorecard['overs'],
+        run_rate=f"{scorecard['run_rate']:.2f}",
+        runs=scorecard['total_runs'],
+        wickets=scorecard['total_wickets'],
+        did_not_bat=did_not_bat,
+        fall_of_wickets=fall_of_wickets,
+        bowling_team=scorecard['bowling_team'],
+        bowlers=join(BOWLER_ROW.render(
+            name=b['name'], overs=b['overs'], maidens=b['maidens'], runs=b['runs'],
+            wickets=b['wickets'], economy=f"{b['economy']:.2f}", dots=b['dots'],
+            fours=b['fours'], sixes=b['sixes'], wides=b['wides'], noballs=b['noballs']
+        ) for b in scorecard['bowlers']),
+    )
+    return SECTION.render(title=f"{_ordinal(number)} Innings: {scorecard['team_name']} Batting", content=table)
+
+
+def _phase_section(stats, format_config, team1_name, team2_name):
+    t20 = format_config['name'] == 'T20'
+    phase_labels = {
+        'powerplay': 'Powerplay' + (' (1-6)' if t20 else ' (1-10)'),
+        'middle': 'Middle Overs' + (' (7-16)' if t20 else ' (11-40)'),
+        'final': 'Final Overs' + (' (17-20)' if t20 else ' (41-50)')
+    }
+    rows = []
+    for phase, label in phase_labels.items():
+        p1 = stats.phase1.get(phase) if stats.phase1 else None
+        p2 = stats.phase2.get(phase) if stats.phase2 else None
+        rows.append(COMPARISON_ROW.render(
+            label=label,
+            value1=f"{p1['runs']}/{p1['wickets']}" if p1 else "-",
+            value2=f"{p2['runs']}/{p2['wickets']}" if p2 else "-",
+        ))
+    table = COMPARISON_TABLE.render(heading='Phase', team1=team1_name, team2=team2_name, rows=join(rows))
+    return SECTION.render(title='Scoring Breakdown by Phase', content=table)
+
+
+def _innings_statistics_section(stats1, stats2, team1_name, team2_name):
+    rows = [
+        COMPARISON_ROW.render(label='Sixes', value1=stats1['sixes'], value2=stats2['sixes']),
+        COMPARISON_ROW.render(label='Fours', value1=stats1['fours'], value2=stats2['fours']),
+        COMPARISON_ROW.render(label='Runs in Boundaries', value1=stats1['runs_in_boundaries'],
+                              value2=stats2['runs_in_boundaries']),
+        COMPARISON_ROW.render(label='Dot Ball %', value1=f"{stats1['dot_ball_percent']:.1f}%",
+                              value2=f"{stats2['dot_ball_percent']:.1f}%"),
+        COMPARISON_ROW.render(label='Extras', value1=stats1['extras'], value2=stats2['extras']),
+    ]
+    table = COMPARISON_TABLE.render(heading='Statistic', team1=team1_name, team2=team2_name, rows=join(rows))
+    return SECTION.render(title='Innings Statistics', content=table)
+
+
+def _top_batters_section(top_batters):
+    content = []
     for player, team_name in top_batters:
         batting = player.batting
-        not_out = "*" if batting['dismissal'] == 'not out' else ""
         sr = (batting['runs'] / batting['balls'] * 100) if batting['balls'] > 0 else 0
-        
-        html.append(f'        <h3>{player.name} | {team_name}</h3>')
-        html.append(f'        <p style="font-size: 1.2em;"><strong>{batting["runs"]}{not_out} runs ({batting["balls"]} balls) | SR: {sr:.2f}</strong></p>')
-        
+        content.append(TOP_BATTER.render(
+            name=player.name, team=team_name, runs=batting['runs'],
+            not_out="*" if batting['dismissal'] == 'not out' else "",
+            balls=batting['balls'], sr=f"{sr:.2f}"
+        ))
         breakdown = format_batter_breakdown(player)
-        html.append('        <div class="stats-grid">')
-        for key in ['0s', '1s', '2s', '3s', '4s', '6s']:
-            html.append(f'            <div class="stat-box"><div class="label">{key}</div><div class="value">{breakdown[key]}</div></div>')
-        html.append('        </div>')
-    
-    html.append('    </div>')
-    
-    # Top Bowlers
-    html.append('    <div class="section">')
-    html.append('        <h2>Best Bowling Performances</h2>')
-    top_bowlers = get_top_bowlers(innings1, innings2, n=2)
-    
+        content.append(STATS_GRID.render(boxes=join(
+            STAT_BOX.render(label=key, value=breakdown[key]) for key in BOUNDARY_BREAKDOWN
+        )))
+    return SECTION.render(title='Best Batting Performances', content=join(content))
+
+
+def _top_bowlers_section(top_bowlers):
+    content = []
     for player, team_name in top_bowlers:
         bowling = player.bowling
         balls = bowling['balls']
-        overs = balls // 6
-        remaining = balls % 6
-        overs_str = f"{overs}.{remaining}" if remaining > 0 else str(overs)
         econ = (bowling['runs'] / (balls / 6)) if balls > 0 else 0
-        
-        html.append(f'        <h3>{player.name} | {team_name}</h3>')
-        html.append('        <table>')
-        html.append('            <tr><th>Overs</th><th>Maidens</th><th>Runs</th><th>Wickets</th><th>Economy</th><th>Dots</th><th>4s</th><th>6s</th><th>Wides</th><th>No Balls</th></tr>')
-        html.append(f'            <tr><td>{overs_str}</td><td>{bowling["maidens"]}</td><td>{bowling["runs"]}</td><td>{bowling["wickets"]}</td><td>{econ:.2f}</td><td>{bowling["dots"]}</td><td>{bowling["4s"]}</td><td>{bowling["6s"]}</td><td>{bowling["wides"]}</td><td>{bowling["noballs"]}</td></tr>')
-        html.append('        </table>')
-    
-    html.append('    </div>')
-    
-    # Partnerships
-    for innings_num, innings in enumerate([innings1, innings2], 1):
-        if innings.partnerships:
-            html.append('    <div class="section">')
-            html.append(f'        <h2>Partnerships - {innings.batting_team.name}</h2>')
-            
-            for partnership in innings.partnerships:
-                p = format_partnership(partnership, innings.batting_team)
-                wicket_label = f"{p['wicket_number']}{'st' if p['wicket_number'] == 1 else 'nd' if p['wicket_number'] == 2 else 'rd' if p['wicket_number'] == 3 else 'th'} wicket"
-                
-                html.append('        <div class="partnership">')
-                html.append(f'            <strong>{wicket_label}: {p["total_runs"]} runs ({p["total_balls"]} balls)</strong>')
-                html.append(f'            <p>{p["batter1_name"]}: {p["batter1_runs"]}({p["batter1_balls"]}) | {p["batter2_name"]}: {p["batter2_runs"]}({p["batter2_balls"]})</p>')
-                html.append('        </div>')
-            
-            html.append('    </div>')
-    
-    # Charts Section
-    html.append('    <div class="section">')
-    html.append('        <h2>Match Charts</h2>')
-    
-    # Manhattan Chart
-    html.append('        <div class="chart-container">')
-    html.append(generate_manhattan_chart(innings1, innings2, team1_name, team2_name))
-    html.append('        </div>')
-    
-    # Worm Chart
-    html.append('        <div class="chart-container">')
-    html.append(generate_worm_chart(innings1, innings2, team1_name, team2_name))
-    html.append('        </div>')
-    
-    # Run Rate Chart
-    html.append('        <div class="chart-container">')
-    html.append(generate_runrate_chart(innings1, innings2, team1_name, team2_name))
-    html.append('        </div>')
-    
-    html.append('    </div>')
-    
-    # Footer
-    html.append('    <div style="text-align: center; padding: 20px; color: #666;">')
-    html.append('        <p>Generated by Cricket Scorecard Generator</p>')
-    html.append('    </div>')
-    
-    html.append('</body>')
-    html.append('</html>')
+        content.append(TOP_BOWLER.render(
+            name=player.name, team=team_name, overs=_overs(balls), maidens=bowling['maidens'],
+            runs=bowling['runs'], wickets=bowling['wickets'], economy=f"{econ:.2f}",
+            dots=bowling['dots'], fours=bowling['4s'], sixes=bowling['6s'],
+            wides=bowling['wides'], noballs=bowling['noballs']
+        ))
+    return SECTION.render(title='Best Bowling Performances', content=join(content))
+
+
+def _partnership_section(team_name, partnerships):
+    content = join(PARTNERSHIP.render(
+        label=f"{_ordinal(p['wicket_number'])} wicket", runs=p['total_runs'], balls=p['total_balls'],
+        batter1=p['batter1_name'], batter1_runs=p['batter1_runs'], batter1_balls=p['batter1_balls'],
+        batter2=p['batter2_name'], batter2_runs=p['batter2_runs'], batter2_balls=p['batter2_balls']
+    ) for p in partnerships)
+    return SECTION.render(title=f"Partnerships - {team_name}", content=content)
+
+
+def render_html_report(innings1, innings2, match_result, format_config, stats=None, charts=None,
+                       generated=None, chart_backend=None, include_plotlyjs='cdn'):
+    """Render the HTML match report page.
+    
+    The page is assembled from templates compiled once at import, so
+    rendering many matches in one process only pays for filling them in.
+    Names and other text are HTML-escaped.
+    
+    Args:
+        innings1, innings2: Innings objects
+        match_result: String describing match outcome
+        format_config: Dict with format configuration
+        stats: Precomputed MatchStats (computed here if not given)
+        charts: Optional dict of already rendered chart divs by name
+            ('manhattan', 'worm', 'runrate'); missing charts are rendered here
+        generated: Timestamp shown in the header (default: now)
+        chart_backend: 'plotly' or 'svg' (default: Plotly if it's installed)
+        include_plotlyjs: How Plotly charts load plotly.js (see plotly_runtime)
+    
+    Returns:
+        The page as a string
+    """
+    charts = charts or {}
+    team1_name = innings1.batting_team.name
+    team2_name = innings2.batting_team.name
+    if stats is None:
+        stats = MatchStats(innings1, innings2, format_config)
+    stats1 = stats.summary1
+    stats2 = stats.summary2
+    
+    sections = [
+        SECTION.render(title='Match Summary', content=join([
+            _summary_grid(team1_name, stats1), _summary_grid(team2_name, stats2)
+        ])),
+        _scorecard_section(1, stats.scorecard1),
+        _scorecard_section(2, stats.scorecard2),
+    ]
+    if format_config['name'] in ['T20', 'One Day'] and (stats.phase1 or stats.phase2):
+        sections.append(_phase_section(stats, format_config, team1_name, team2_name))
+    sections.append(_innings_statistics_section(stats1, stats2, team1_name, team2_name))
+    sections.append(_top_batters_section(stats.top_batters))
+    sections.append(_top_bowlers_section(stats.top_bowlers))
+    for innings, snapshot in zip([innings1, innings2], stats.innings):
+        if snapshot.partnerships:
+            sections.append(_partnership_section(innings.batting_team.name, snapshot.partnerships))
+    sections.append(SECTION.render(title='Match Charts', content=join(
+        CHART.render(chart=Markup(charts.get(name) or render(innings1, innings2, team1_name, team2_name)))
+        for name, render in chart_renderers(chart_backend, include_plotlyjs)
+    )))
+    
+    return PAGE.render(
+        team1=team1_name,
+        team2=team2_name,
+        result=match_result,
+        format=format_config['name'],
+        generated=generated or datetime.now().strftime("%Y-%m-%d %H:%M"),
+        sections=join(sections),
+    )
+
+
+def generate_html_report(team1, team2, innings1, innings2, match_result, format_config, filename,
+                         stats=None, charts=None, chart_backend=None, plotly_js='cdn', runtime_dir=None):
+    """Generate comprehensive HTML match report.
+    
+    Args:
+        team1, team2: Team objects
+        innings1, innings2: Innings objects
+        match_result: String describing match outcome
+        format_config: Dict with format configuration
+        filename: Output filename
+        stats: Precomputed MatchStats (computed here if not given)
+        charts: Optional dict of already rendered chart divs by name
+            ('manhattan', 'worm', 'runrate'); missing charts are rendered here
+        chart_backend: 'plotly' or 'svg' (default: Plotly if it's installed)
+        plotly_js: 'cdn' or 'local' (one shared plotly.js, see plotly_runtime)
+        runtime_dir: Directory for the shared plotly.js (default: the report's)
+    """
+    include_plotlyjs = 'cdn'
+    if (chart_backend or DEFAULT_CHART_BACKEND) == 'plotly':
+        include_plotlyjs = plotly_runtime(plotly_js, os.path.dirname(filename) or '.', runtime_dir)
+    page = render_html_report(innings1, innings2, match_result, format_config, stats=stats, charts=charts,
+                              chart_backend=chart_backend, include_plotlyjs=include_plotlyjs)
     
     # Write to file
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(html))
+    with atomic_write(filename) as f:
+        f.write(page)
     
     print(f"HTML report generated: {filename}")
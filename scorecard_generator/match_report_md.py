@@ -6,14 +6,12 @@ documentation systems.
 """
 
 from datetime import datetime
-from .match_stats import (
-    calculate_phase_breakdown, calculate_innings_summary,
-    get_top_batters, get_top_bowlers, format_batter_breakdown,
-    format_partnership
-)
+from .match_stats import format_batter_breakdown, MatchStats
+from .scorecard_export import atomic_write
 
 
-def generate_markdown_report(team1, team2, innings1, innings2, match_result, format_config, filename):
+def generate_markdown_report(team1, team2, innings1, innings2, match_result, format_config, filename,
+                             stats=None):
     """Generate comprehensive Markdown match report.
     
     Args:
@@ -22,14 +20,17 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
         match_result: String describing match outcome
         format_config: Dict with format configuration
         filename: Output filename
+        stats: Precomputed MatchStats (computed here if not given)
     """
     # Get team names
     team1_name = innings1.batting_team.name
     team2_name = innings2.batting_team.name
     
     # Calculate statistics
-    stats1 = calculate_innings_summary(innings1)
-    stats2 = calculate_innings_summary(innings2)
+    if stats is None:
+        stats = MatchStats(innings1, innings2, format_config)
+    stats1 = stats.summary1
+    stats2 = stats.summary2
     
     # Build Markdown content
     md = []
@@ -54,10 +55,8 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     md.append("")
     
     # Full Scorecards Section
-    from .match_stats import format_scorecard_data
-    
     # First Innings Scorecard
-    scorecard1 = format_scorecard_data(innings1)
+    scorecard1 = stats.scorecard1
     md.append("## 1st Innings Scorecard")
     md.append("")
     md.append(f"### {scorecard1['team_name']} Batting")
@@ -100,7 +99,7 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     md.append("")
     
     # Second Innings Scorecard
-    scorecard2 = format_scorecard_data(innings2)
+    scorecard2 = stats.scorecard2
     md.append("## 2nd Innings Scorecard")
     md.append("")
     md.append(f"### {scorecard2['team_name']} Batting")
@@ -144,8 +143,8 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     
     # Scoring Breakdown (if T20 or ODI)
     if format_config['name'] in ['T20', 'One Day']:
-        phase1 = calculate_phase_breakdown(innings1, format_config)
-        phase2 = calculate_phase_breakdown(innings2, format_config)
+        phase1 = stats.phase1
+        phase2 = stats.phase2
         
         if phase1 or phase2:
             md.append("## Scoring Breakdown by Phase")
@@ -186,7 +185,7 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     # Top Batters
     md.append("## Best Batting Performances")
     md.append("")
-    top_batters = get_top_batters(innings1, innings2, n=2)
+    top_batters = stats.top_batters
     
     for i, (player, team_name) in enumerate(top_batters, 1):
         batting = player.batting
@@ -207,7 +206,7 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     # Top Bowlers
     md.append("## Best Bowling Performances")
     md.append("")
-    top_bowlers = get_top_bowlers(innings1, innings2, n=2)
+    top_bowlers = stats.top_bowlers
     
     for i, (player, team_name) in enumerate(top_bowlers, 1):
         bowling = player.bowling
@@ -225,15 +224,14 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
         md.append("")
     
     # Partnerships
-    for innings_num, innings in enumerate([innings1, innings2], 1):
-        if innings.partnerships:
+    for innings, snapshot in zip([innings1, innings2], stats.innings):
+        if snapshot.partnerships:
             md.append(f"## Partnerships - {innings.batting_team.name}")
             md.append("")
             md.append("| Wicket | Partnership | Batter 1 | Batter 2 |")
             md.append("|--------|-------------|----------|----------|")
             
-            for partnership in innings.partnerships:
-                p = format_partnership(partnership, innings.batting_team)
+            for p in snapshot.partnerships:
                 wicket_label = f"{p['wicket_number']}{'st' if p['wicket_number'] == 1 else 'nd' if p['wicket_number'] == 2 else 'rd' if p['wicket_number'] == 3 else 'th'}"
                 partnership_str = f"{p['total_runs']}({p['total_balls']})"
                 batter1_str = f"{p['batter1_name']}: {p['batter1_runs']}({p['batter1_balls']})"
@@ -254,11 +252,12 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     md.append("|------|" + "-" * (len(team1_name) + 2) + "|" + "-" * (len(team2_name) + 2) + "|")
     
     # Display up to 20 overs or max available
-    max_overs = max(len(innings1.over_totals), len(innings2.over_totals))
+    overs1, overs2 = (snapshot.manhattan for snapshot in stats.innings)
+    max_overs = max(len(overs1), len(overs2))
     for i in range(min(max_overs, 20)):
         over_num = i + 1
-        runs1 = innings1.over_totals[i] if i < len(innings1.over_totals) else "-"
-        runs2 = innings2.over_totals[i] if i < len(innings2.over_totals) else "-"
+        runs1 = overs1[i] if i < len(overs1) else "-"
+        runs2 = overs2[i] if i < len(overs2) else "-"
         md.append(f"| {over_num} | {runs1} | {runs2} |")
     
     if max_overs > 20:
@@ -274,7 +273,7 @@ def generate_markdown_report(team1, team2, innings1, innings2, match_result, for
     md.append("")
     
     # Write to file
-    with open(filename, 'w', encoding='utf-8') as f:
+    with atomic_write(filename) as f:
         f.write('\n'.join(md))
     
     print(f"Markdown report generated: {filename}")
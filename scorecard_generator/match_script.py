@@ -0,0 +1,312 @@
+"""
+Scripted, prompt-free match scoring.
+
+A match script is a text file that answers every question the interactive
+scorer would ask: the teams, the format, the toss, each innings' batting
+order, the bowler of every over and every delivery. main scores it with
+`python -m scorecard_generator.main --script FILE`, which is how recorded
+scoring sessions are replayed for load testing and regression timing.
+
+    # Comments run from '#' to the end of the line
+    team1: England
+    team2: Australia
+    format: T20                 # T20, ODI, TEST, or custom OVERS BOWLER_OVERS ('-' for no limit)
+    toss: Australia bowl        # toss winner, then bat or bowl
+
+    innings: 16 22 18           # batting order by shirt number (default: the XI's order)
+    38: 1 0 4 wd 2 w:caught:32  # bowler's shirt number, then that over's deliveries
+    63: 0 0 1 lb:1 6 nb:4 1
+    ...
+
+    innings:
+    ...
+
+The first two batters in an innings' order open and the rest come in as
+wickets fall, followed by anyone the order leaves out. Each over's line
+ends with its last delivery; only an innings' final over may stop short.
+Deliveries use input_ball's vocabulary, with the follow-up answers joined
+by colons:
+
+    0-6                           runs off the bat
+    b:N, lb:N                     N byes or leg byes
+    wd, wd:b:N, wd:lb:N           wide, plus any byes or leg byes
+    nb, nb:N, nb:b:N, nb:lb:N     no ball, plus runs off the bat, byes or leg byes
+    w:bowled, w:lbw, w:stumped
+    w:caught:FIELDER              fielder's shirt number, or 'bowler'
+    w:ro:N:WHO:FIELDER            run out after N runs; WHO is striker or non-striker
+    wd:ro:N:WHO:FIELDER, nb:ro:N:WHO:FIELDER
+    end                           end the innings (declaration)
+"""
+
+import re
+
+from .engine import eligible_bowlers
+from .models import CRICKET_FORMATS
+
+HEADERS = ('team1', 'team2', 'format', 'toss')
+TOSS_CHOICES = ('bat', 'bowl')
+_OVER_LINE = re.compile(r'(\d+)\s*:(.*)')
+
+
+def _count(text, token):
+    if not text.isdigit():
+        raise ValueError(f"Expected a number of runs in {token!r}")
+    return int(text)
+
+
+def _fielder(text, team, token):
+    if not text.isdigit():
+        raise ValueError(f"Expected a fielder's shirt number in {token!r}")
+    number = int(text)
+    return team.get_player(number).name if team and number in team.players else str(number)
+
+
+def _run_out(args, team, token):
+    """(completed runs, run out batter index, fielder) from [N, striker|non-striker, FIELDER]."""
+    completed, out_batter, fielder = args
+    if out_batter not in ('striker', 'non-striker'):
+        raise ValueError(f"Expected striker or non-striker in {token!r}")
+    return _count(completed, token), 0 if out_batter == 'striker' else 1, _fielder(fielder, team, token)
+
+
+def script_ball(token, bowler, team=None):
+    """
+    Translate one delivery token into input_ball()'s result.
+
+    Args:
+        token: Delivery token (see the module docstring)
+        bowler: Player bowling the delivery
+        team: Fielding Team, for fielders' names and the wicketkeeper
+
+    Returns:
+        (runs, event_type, fielders, swapped), exactly as input_ball returns
+        for the same answers; event_type is "end" for the end token
+
+    Raises:
+        ValueError: If the token isn't a valid delivery
+    """
+    parts = token.lower().split(':')
+    kind, args = parts[0], parts[1:]
+    if kind == 'end' and not args:
+        return 0, "end", [], False
+    if kind.isdigit() and not args:
+        runs = int(kind)
+        if runs <= 6:
+            return runs, "normal", [], False
+    elif kind in ('b', 'lb') and len(args) == 1:
+        runs = _count(args[0], token)
+        return runs, "bye" if kind == 'b' else "leg bye", [], runs % 2 == 1
+    elif kind == 'w' and args:
+        how, args = args[0], args[1:]
+        if how == 'bowled' and not args:
+            return 0, "wicket", [bowler.name], False
+        if how == 'lbw' and not args:
+            return 0, "wicket", ["lbw", bowler.name], False
+        if how == 'caught' and len(args) == 1:
+            if args[0] == 'bowler':
+                return 0, "wicket", [(bowler.name, bowler.name, True)], False
+            fielder = _fielder(args[0], team, token)
+            return 0, "wicket", [(fielder, bowler.name, int(args[0]) == bowler.number)], False
+        if how == 'stumped' and not args:
+            if not team or getattr(team, 'wicketkeeper_number', None) is None:
+                raise ValueError(f"No wicketkeeper set for {team.name if team else 'the fielding team'}")
+            return 0, "wicket", [team.get_player(team.wicketkeeper_number).name, bowler.name], False
+        if how == 'ro' and len(args) == 3:
+            completed, out_batter_idx, fielder = _run_out(args, team, token)
+            return completed, "run out", [fielder, out_batter_idx, completed], completed % 2 == 1
+    elif kind in ('wd', 'nb'):
+        label = "wide" if kind == 'wd' else "no ball"
+        if not args or args == ['0']:
+            return 1, label, [], False
+        extra, args = args[0], args[1:]
+        if kind == 'nb' and extra.isdigit() and not args and 1 <= int(extra) <= 6:
+            return 1 + int(extra), "no ball_runs", [], int(extra) % 2 == 1
+        if extra in ('b', 'lb') and len(args) == 1:
+            runs = _count(args[0], token)
+            return 1 + runs, f"{label}_{'bye' if extra == 'b' else 'leg_bye'}", [], runs % 2 == 1
+        if extra == 'ro' and len(args) == 3:
+            completed, out_batter_idx, fielder = _run_out(args, team, token)
+            return 1 + completed, f"{label}_run_out", [fielder, out_batter_idx, completed], completed % 2 == 1
+    raise ValueError(f"Unknown delivery {token!r}")
+
+
+class InningsScript:
+    """
+    One innings of a match script.
+
+    Serves as the MatchState strategy (openers, incoming batters and
+    bowlers) and, through read_ball(), as the source of deliveries in place
+    of input_ball.
+
+    Args:
+        source: Script name for error messages
+        line: Line number of the innings: line
+        batting_order: Shirt numbers in batting order, or None for the XI's order
+    """
+    def __init__(self, source, line, batting_order=None):
+        self.source = source
+        self.line = line
+        self.batting_order = batting_order
+        self.overs = []  # (line number, bowler's shirt number, [delivery tokens])
+        self._next_over = 0
+        self._line = line
+        self._balls = iter(())
+
+    def _error(self, message, line=None):
+        return ValueError(f"{self.source}:{line or self._line}: {message}")
+
+    def choose_openers(self, batting_team):
+        order = self.batting_order or batting_team.order
+        unknown = [num for num in order if num not in batting_team.players]
+        if unknown:
+            raise self._error(f"{batting_team.name} has no player with shirt number {unknown[0]}", self.line)
+        return list(order[:2])
+
+    def choose_next_batter(self, batting_team, candidates):
+        if self.batting_order:
+            for num in self.batting_order:
+                if num in candidates:
+                    return num
+        return candidates[0]
+
+    def choose_bowler(self, bowling_team, over, prev_bowler, bowler_overs, max_bowler_overs):
+        if next(self._balls, None) is not None:
+            raise self._error(f"Over {over} is complete but its line has more deliveries")
+        if self._next_over == len(self.overs):
+            raise self._error(f"The script ends before over {over + 1}")
+        self._line, bowler, balls = self.overs[self._next_over]
+        self._next_over += 1
+        self._balls = iter(balls)
+        if bowler not in bowling_team.players:
+            raise self._error(f"{bowling_team.name} has no player with shirt number {bowler}")
+        if bowler not in eligible_bowlers(bowling_team, over, bowler_overs, max_bowler_overs):
+            raise self._error(f"{bowling_team.get_player(bowler).name} can't bowl over {over + 1}")
+        return bowler
+
+    def read_ball(self, batters, bowler, over_num=None, ball_num=None, team=None):
+        """Next delivery as input_ball() would return it (same arguments)."""
+        if batters[0] is None or batters[1] is None:
+            return 0, "end", [], False
+        token = next(self._balls, None)
+        if token is None:
+            raise self._error(f"Over {over_num + 1} needs more deliveries")
+        try:
+            return script_ball(token, bowler, team)
+        except ValueError as e:
+            raise self._error(e) from None
+
+    def finish(self):
+        """Check the innings used the whole script section.
+
+        Raises:
+            ValueError: If deliveries or overs are left over
+        """
+        if next(self._balls, None) is not None or self._next_over < len(self.overs):
+            line = self._line if self._next_over == len(self.overs) else self.overs[self._next_over][0]
+            raise self._error("The innings is over but the script has more deliveries", line)
+
+
+class MatchScript:
+    """
+    A parsed match script (see the module docstring).
+
+    Attributes:
+        team1, team2: Team names (loaded from teams/<name>_XI.csv)
+        format_config: Format dict
+        toss_winner: Name of the team that won the toss
+        toss_choice: 'bat' or 'bowl'
+        innings: The two InningsScripts, in batting order
+    """
+    __slots__ = ('source', 'team1', 'team2', 'format_config', 'toss_winner', 'toss_choice', 'innings')
+
+    def __init__(self, source, team1, team2, format_config, toss_winner, toss_choice, innings):
+        self.source = source
+        self.team1 = team1
+        self.team2 = team2
+        self.format_config = format_config
+        self.toss_winner = toss_winner
+        self.toss_choice = toss_choice
+        self.innings = innings
+
+    def batting_first(self, team1, team2):
+        """Return (batting first, bowling first) given the two Teams."""
+        toss_team, toss_loser = (team1, team2) if team1.name == self.toss_winner else (team2, team1)
+        return (toss_team, toss_loser) if self.toss_choice == 'bat' else (toss_loser, toss_team)
+
+
+def _parse_format(value):
+    key = value.upper()
+    if key in CRICKET_FORMATS:
+        return CRICKET_FORMATS[key].copy()
+    parts = value.split()
+    if len(parts) == 3 and parts[0].lower() == 'custom':
+        limits = [None if part == '-' else int(part) for part in parts[1:] if part == '-' or part.isdigit()]
+        if len(limits) == 2 and all(limit is None or limit > 0 for limit in limits):
+            return {'name': 'Custom', 'max_overs': limits[0], 'max_bowler_overs': limits[1], 'balls_per_over': 6}
+    raise ValueError(f"Unknown format {value!r}")
+
+
+def parse_script(lines, source='<script>'):
+    """
+    Parse a match script.
+
+    Args:
+        lines: Iterable of script lines
+        source: Script name for error messages
+
+    Returns:
+        MatchScript
+
+    Raises:
+        ValueError: If the script is malformed, naming the line
+    """
+    headers = {}
+    innings = []
+    number = 0
+    for number, line in enumerate(lines, 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        over = _OVER_LINE.fullmatch(line)
+        key, _, value = line.partition(':')
+        key, value = key.strip().lower(), value.strip()
+        if over:
+            if not innings:
+                raise ValueError(f"{source}:{number}: Over before the first innings: line")
+            innings[-1].overs.append((number, int(over.group(1)), over.group(2).split()))
+        elif key == 'innings':
+            order = value.split()
+            if not all(num.isdigit() for num in order) or len(order) == 1 or len(set(order)) < len(order):
+                raise ValueError(f"{source}:{number}: Batting order must be two or more distinct shirt numbers")
+            innings.append(InningsScript(source, number, [int(num) for num in order] or None))
+        elif key in HEADERS and not innings:
+            if key in headers:
+                raise ValueError(f"{source}:{number}: {key} given twice")
+            headers[key] = (number, value)
+        else:
+            raise ValueError(f"{source}:{number}: Unexpected line {line!r}")
+
+    missing = [key for key in HEADERS if key not in headers]
+    if missing:
+        raise ValueError(f"{source}: Missing {', '.join(missing)}")
+    if len(innings) != 2:
+        raise ValueError(f"{source}: Expected 2 innings, found {len(innings)}")
+    team1, team2 = headers['team1'][1], headers['team2'][1]
+    if not team1 or team1 == team2:
+        raise ValueError(f"{source}:{headers['team2'][0]}: The teams need two different names")
+    line, value = headers['format']
+    try:
+        format_config = _parse_format(value)
+    except ValueError as e:
+        raise ValueError(f"{source}:{line}: {e}") from None
+    line, value = headers['toss']
+    toss_winner, _, toss_choice = value.rpartition(' ')
+    if toss_winner.strip() not in (team1, team2) or toss_choice.lower() not in TOSS_CHOICES:
+        raise ValueError(f"{source}:{line}: Expected 'toss: <{team1} or {team2}> <bat or bowl>'")
+    return MatchScript(source, team1, team2, format_config, toss_winner.strip(), toss_choice.lower(), innings)
+
+
+def load_script(path):
+    """Parse the match script at path (see parse_script)."""
+    with open(path, encoding='utf-8') as f:
+        return parse_script(f, source=path)
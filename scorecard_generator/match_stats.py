@@ -6,6 +6,9 @@ including phase breakdowns, partnerships, top performers, and chart data.
 
 from collections import defaultdict
 from .input_handlers import get_display_name
+from .models import BallColumns, BALLS_PER_OVER
+
+PHASED_FORMATS = ('T20', 'One Day')
 
 
 def calculate_phase_breakdown(innings, format_config):
@@ -18,9 +21,12 @@ def calculate_phase_breakdown(innings, format_config):
     Returns:
         Dict with phase names as keys and stats as values
     """
-    if format_config['name'] not in ['T20', 'One Day']:
+    if format_config['name'] not in PHASED_FORMATS:
         return None
-    
+    return _phase_breakdown(innings)
+
+
+def _phase_breakdown(innings):
     breakdown = {}
     for phase, stats in innings.phase_stats.items():
         if stats['balls'] > 0:  # Only include phases that were played
@@ -54,17 +60,18 @@ def calculate_innings_summary(innings):
     total_legal_balls = 0
     dot_balls = 0
     
-    for ball in innings.balls:
-        # Count legal deliveries (not wides or no-balls)
-        if ball.event not in ['wide', 'wide_boundary', 'wide_bye', 'wide_leg_bye']:
-            total_legal_balls += 1
-            # Check if it's a dot ball (0 runs off bat)
-            if ball.event in ['normal', 'wicket', 'bye', 'leg bye', 'run out'] and ball.runs == 0:
-                dot_balls += 1
-            elif ball.event == 'bye':  # Byes are dot balls for batters
-                dot_balls += 1
-            elif ball.event == 'leg bye':  # Leg byes are dot balls for batters
-                dot_balls += 1
+    if isinstance(innings.balls, BallColumns):
+        total_legal_balls, dot_balls = innings.balls.dot_ball_counts()
+    else:
+        for ball in innings.balls:
+            # Count deliveries faced (not wides)
+            if not ball.event.is_wide:
+                total_legal_balls += 1
+                # Dot ball: no runs off a delivery without extras, or any bye/leg bye
+                if ball.event.extras is None and ball.runs == 0:
+                    dot_balls += 1
+                elif ball.event.is_bye:  # Byes and leg byes are dot balls for batters
+                    dot_balls += 1
     
     dot_ball_percent = (dot_balls / total_legal_balls * 100) if total_legal_balls> 0 else 0
     
@@ -204,9 +211,11 @@ def generate_terminal_summary(innings1, innings2, match_result, format_config):
     summary.append("MATCH STATISTICS SUMMARY")
     summary.append("="*70)
     
+    match_stats = MatchStats(innings1, innings2, format_config)
+    
     # Innings summaries
     for i, innings in enumerate([innings1, innings2], 1):
-        stats = calculate_innings_summary(innings)
+        stats = match_stats.innings[i - 1].summary
         summary.append(f"\n{i}{'st' if i == 1 else 'nd'} Innings: {innings.batting_team.name}")
         summary.append(f"  Score: {stats['total_runs']}/{stats['wickets']} in {stats['overs']:.1f} overs")
         summary.append(f"  Boundaries: {stats['fours']} fours, {stats['sixes']} sixes")
@@ -217,7 +226,7 @@ def generate_terminal_summary(innings1, innings2, match_result, format_config):
     summary.append("TOP PERFORMERS")
     summary.append("-"*70)
     
-    top_batters = get_top_batters(innings1, innings2, n=2)
+    top_batters = match_stats.top_batters
     if top_batters:
         summary.append("\nBatting:")
         for player, team_name in top_batters:
@@ -227,7 +236,7 @@ def generate_terminal_summary(innings1, innings2, match_result, format_config):
             not_out = "*" if player.batting['dismissal'] == 'not out' else ""
             summary.append(f"  {player.name} ({team_name}): {runs}{not_out}({balls}) SR: {sr:.2f}")
     
-    top_bowlers = get_top_bowlers(innings1, innings2, n=2)
+    top_bowlers = match_stats.top_bowlers
     if top_bowlers:
         summary.append("\nBowling:")
         for player, team_name in top_bowlers:
@@ -273,6 +282,20 @@ def generate_worm_data(innings1, innings2):
     return innings1.cumulative_runs, innings2.cumulative_runs
 
 
+def generate_win_probability_data(innings):
+    """Generate chase win-probability data for a second innings.
+    
+    Args:
+        innings: Innings object (its win_probabilities are filled during a chase)
+    
+    Returns:
+        Tuple of (overs bowled after each delivery, win probability in percent)
+    """
+    overs = [legal_balls / BALLS_PER_OVER for legal_balls, _ in innings.win_probabilities]
+    percent = [probability * 100 for _, probability in innings.win_probabilities]
+    return overs, percent
+
+
 def generate_runrate_data(innings):
     """Generate run rate progression data for an innings.
     
@@ -347,10 +370,7 @@ def format_scorecard_data(innings):
     
     # Total
     runs, wickets, overs, rr = innings.get_score()
-    balls = sum(
-        1 for be in innings.balls
-        if not (be.event.startswith('wide') or be.event.startswith('no ball'))
-    )
+    balls = innings.legal_ball_count()
     full_overs = balls // 6
     rem_balls = balls % 6
     overs_str = f"{full_overs}.{rem_balls}" if rem_balls else str(full_overs)
@@ -407,3 +427,85 @@ def format_scorecard_data(innings):
         'bowlers': bowlers,
         'bowling_team': innings.bowling_team.name
     }
+
+
+class InningsStats:
+    """Snapshot of everything the reports show for one innings.
+
+    Built by innings_stats(), which memoizes it on the innings.
+
+    Args:
+        innings: Innings object
+    """
+    __slots__ = ('key', 'summary', 'scorecard', 'phases', 'partnerships', 'manhattan',
+                 'cumulative', 'run_rates', 'win_probability')
+
+    def __init__(self, innings):
+        self.key = _stats_key(innings)
+        self.summary = calculate_innings_summary(innings)
+        self.scorecard = format_scorecard_data(innings)
+        self.phases = _phase_breakdown(innings)
+        self.partnerships = [format_partnership(p, innings.batting_team) for p in innings.partnerships]
+        self.manhattan = list(generate_manhattan_data(innings))
+        self.cumulative = list(innings.cumulative_runs)
+        self.run_rates = generate_runrate_data(innings)
+        self.win_probability = generate_win_probability_data(innings)
+
+
+def _stats_key(innings):
+    # Deliveries are only ever appended, and a partnership can close without a delivery at
+    # the end of an innings, so these two counts tell whether a snapshot is still current
+    return len(innings.balls), len(innings.partnerships)
+
+
+def innings_stats(innings):
+    """Return the InningsStats for an innings, rebuilding it only when deliveries were added.
+
+    Args:
+        innings: Innings object
+
+    Returns:
+        InningsStats (shared; treat it as read-only)
+    """
+    stats = innings.stats_cache
+    if stats is None or stats.key != _stats_key(innings):
+        stats = innings.stats_cache = InningsStats(innings)
+    return stats
+
+
+class MatchStats:
+    """Statistics shared by the terminal summary and the HTML and Markdown reports.
+
+    Args:
+        innings1, innings2: Innings objects
+        format_config: Dict with format configuration
+    """
+    def __init__(self, innings1, innings2, format_config):
+        self.innings = (innings_stats(innings1), innings_stats(innings2))
+        self.phased = format_config['name'] in PHASED_FORMATS
+        self.top_batters = get_top_batters(innings1, innings2, n=2)
+        self.top_bowlers = get_top_bowlers(innings1, innings2, n=2)
+
+    @property
+    def summary1(self):
+        return self.innings[0].summary
+
+    @property
+    def summary2(self):
+        return self.innings[1].summary
+
+    @property
+    def scorecard1(self):
+        return self.innings[0].scorecard
+
+    @property
+    def scorecard2(self):
+        return self.innings[1].scorecard
+
+    @property
+    def phase1(self):
+        return self.innings[0].phases if self.phased else None
+
+    @property
+    def phase2(self):
+        return self.innings[1].phases if self.phased else None
@@ -0,0 +1,239 @@
+"""
+SQLite match store.
+
+Every scored or replayed match is kept in one database (stdlib sqlite3)
+with normalised matches, innings, players and deliveries tables, so
+questions like "every delivery bowled by X" are an indexed query rather
+than a rescan of exported CSVs. Each match is written in a single
+transaction and the database runs in WAL mode, so readers aren't blocked
+while a match is being saved.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+DEFAULT_DB_PATH = "scorecard_generator/exports/matches.db"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    source_id TEXT,
+    team1 TEXT NOT NULL,
+    team2 TEXT NOT NULL,
+    venue TEXT,
+    date TEXT,
+    season TEXT,
+    format TEXT,
+    result TEXT,
+    created_at TEXT NOT NULL,
+    UNIQUE (source, source_id)
+);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS innings (
+    id INTEGER PRIMARY KEY,
+    match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    batting_team TEXT NOT NULL,
+    bowling_team TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    wickets INTEGER NOT NULL,
+    legal_balls INTEGER NOT NULL,
+    UNIQUE (match_id, number)
+);
+CREATE TABLE IF NOT EXISTS deliveries (
+    id INTEGER PRIMARY KEY,
+    match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+    innings_id INTEGER NOT NULL REFERENCES innings(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    over INTEGER NOT NULL,
+    ball INTEGER NOT NULL,
+    batter_id INTEGER NOT NULL REFERENCES players(id),
+    bowler_id INTEGER NOT NULL REFERENCES players(id),
+    runs INTEGER NOT NULL,
+    event INTEGER NOT NULL,
+    legal INTEGER NOT NULL,
+    wicket INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deliveries_match ON deliveries (match_id, innings_id, seq);
+CREATE INDEX IF NOT EXISTS idx_deliveries_batter ON deliveries (batter_id);
+CREATE INDEX IF NOT EXISTS idx_deliveries_bowler ON deliveries (bowler_id);
+CREATE INDEX IF NOT EXISTS idx_innings_match ON innings (match_id);
+"""
+
+DELIVERY_COLUMNS = (
+    "m.id AS match_id, i.number AS innings, d.over, d.ball, bat.name AS batter, "
+    "bowl.name AS bowler, d.runs, d.event, d.legal, d.wicket"
+)
+DELIVERY_JOINS = (
+    "FROM deliveries d JOIN innings i ON i.id = d.innings_id JOIN matches m ON m.id = d.match_id "
+    "JOIN players bat ON bat.id = d.batter_id JOIN players bowl ON bowl.id = d.bowler_id"
+)
+
+
+def connect(path=DEFAULT_DB_PATH, **kwargs):
+    """
+    Open a connection with the store's pragmas (WAL, foreign keys) and schema.
+
+    Keyword arguments go to sqlite3.connect (e.g. check_same_thread, cached_statements).
+    """
+    if path != ':memory:':
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, **kwargs)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return conn
+
+
+class MatchStore:
+    """
+    Read/write access to the match database.
+
+    Args:
+        path: SQLite file (created with its directory if missing), or ':memory:'
+    """
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = connect(path)
+        self._player_ids = {}
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _ensure_players(self, names):
+        """Return ids for names, inserting unknown players in one batch."""
+        missing = [name for name in names if name not in self._player_ids]
+        if missing:
+            self.conn.executemany("INSERT OR IGNORE INTO players (name) VALUES (?)", [(n,) for n in missing])
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT id, name FROM players WHERE name IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for player_id, name in rows:
+                    self._player_ids[name] = player_id
+        return self._player_ids
+
+    def save_match(self, team1, team2, innings_list, match_result, info=None, format_name=None,
+                   source='scorer', source_id=None):
+        """
+        Store a match and all its deliveries in one transaction.
+
+        A match with the same (source, source_id) is replaced, so replaying
+        a Cricsheet match again doesn't duplicate it. Scored matches have
+        no source_id and are always stored as a new match.
+
+        Args:
+            innings_list: Innings objects in batting order (None entries are skipped)
+            info: Optional metadata dict (venue, date, season)
+            format_name: Format name, e.g. format_config['name']
+
+        Returns:
+            The new match id
+        """
+        info = info or {}
+        innings_list = [innings for innings in innings_list if innings is not None]
+        try:
+            with self.conn:
+                if source_id is not None:
+                    self.conn.execute("DELETE FROM matches WHERE source = ? AND source_id = ?", (source, source_id))
+                cursor = self.conn.execute(
+                    "INSERT INTO matches (source, source_id, team1, team2, venue, date, season, format, result, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (source, source_id, team1.name, team2.name, info.get('venue'), info.get('date'),
+                     info.get('season'), format_name, match_result, datetime.now().isoformat(timespec='seconds'))
+                )
+                match_id = cursor.lastrowid
+
+                names = {ball.batter.name for innings in innings_list for ball in innings.balls}
+                names.update(ball.bowler.name for innings in innings_list for ball in innings.balls)
+                player_ids = self._ensure_players(sorted(names))
+
+                for number, innings in enumerate(innings_list, 1):
+                    runs, wickets, _, _ = innings.get_score()
+                    cursor = self.conn.execute(
+                        "INSERT INTO innings (match_id, number, batting_team, bowling_team, runs, wickets, legal_balls) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (match_id, number, innings.batting_team.name, innings.bowling_team.name,
+                         runs, wickets, innings.legal_ball_count())
+                    )
+                    innings_id = cursor.lastrowid
+                    self.conn.executemany(
+                        "INSERT INTO deliveries (match_id, innings_id, seq, over, ball, batter_id, bowler_id, "
+                        "runs, event, legal, wicket) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            (match_id, innings_id, seq, ball.over, ball.ball, player_ids[ball.batter.name],
+                             player_ids[ball.bowler.name], ball.runs, int(ball.event),
+                             ball.event.is_legal, ball.event.is_wicket)
+                            for seq, ball in enumerate(innings.balls)
+                        )
+                    )
+        except BaseException:
+            # Ids cached during a rolled-back transaction may not exist
+            self._player_ids.clear()
+            raise
+        return match_id
+
+    def matches(self):
+        """All stored matches, newest first."""
+        return self.conn.execute("SELECT * FROM matches ORDER BY id DESC").fetchall()
+
+    def innings(self, match_id):
+        return self.conn.execute(
+            "SELECT * FROM innings WHERE match_id = ? ORDER BY number", (match_id,)
+        ).fetchall()
+
+    def deliveries(self, match_id):
+        """Every delivery of a match in order."""
+        return self.conn.execute(
+            f"SELECT {DELIVERY_COLUMNS} {DELIVERY_JOINS} WHERE d.match_id = ? ORDER BY i.number, d.seq",
+            (match_id,)
+        ).fetchall()
+
+    def deliveries_bowled_by(self, name):
+        """Every delivery bowled by a player, across all matches."""
+        return self.conn.execute(
+            f"SELECT {DELIVERY_COLUMNS} {DELIVERY_JOINS} WHERE bowl.name = ? ORDER BY m.id, i.number, d.seq",
+            (name,)
+        ).fetchall()
+
+    def deliveries_faced_by(self, name):
+        """Every delivery faced by a player, across all matches."""
+        return self.conn.execute(
+            f"SELECT {DELIVERY_COLUMNS} {DELIVERY_JOINS} WHERE bat.name = ? ORDER BY m.id, i.number, d.seq",
+            (name,)
+        ).fetchall()
+
+
+def store_match(team1, team2, innings_list, match_result, path=DEFAULT_DB_PATH, **kwargs):
+    """
+    Save a match to the store at path, printing a warning instead of raising on failure.
+
+    Keyword arguments go to MatchStore.save_match.
+
+    Returns:
+        The match id, or None if it couldn't be stored
+    """
+    try:
+        with MatchStore(path) as store:
+            return store.save_match(team1, team2, innings_list, match_result, **kwargs)
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Could not save match to {path}: {e}")
+        return None
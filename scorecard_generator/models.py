@@ -1,4 +1,7 @@
+import sys
+from array import array
 from collections import defaultdict
+from enum import IntEnum
 
 BALLS_PER_OVER = 6
 MAX_OVERS = 2  # Update later for 20
@@ -11,19 +14,123 @@ CRICKET_FORMATS = {
     'TEST': {'name': 'First Class', 'max_overs': None, 'max_bowler_overs': None, 'balls_per_over': 6},
 }
 
+class ScoringDistribution(list):
+    """Count of scoring shots indexed by runs (0-6).
+
+    Replaces the old defaultdict(int): unseen run values read as 0 and
+    writing past the end grows the list.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__((0, 0, 0, 0, 0, 0, 0))
+
+    def __getitem__(self, runs):
+        if isinstance(runs, int) and runs >= len(self):
+            return 0
+        return list.__getitem__(self, runs)
+
+    def __setitem__(self, runs, value):
+        if isinstance(runs, int) and runs >= len(self):
+            self.extend([0] * (runs + 1 - len(self)))
+        list.__setitem__(self, runs, value)
+
+    def get(self, runs, default=0):
+        return self[runs] if 0 <= runs < len(self) else default
+
+
+class StatRecord:
+    """Fixed-field stats record that still reads and writes like the old dicts.
+
+    Subclasses declare FIELDS as (key, attribute) pairs, so both
+    ``player.batting['4s']`` and ``player.batting.fours`` work.
+    """
+    __slots__ = ()
+    FIELDS = ()
+    KEYS = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, self.KEYS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def get(self, key, default=None):
+        attr = self.KEYS.get(key)
+        return getattr(self, attr) if attr is not None else default
+
+    def keys(self):
+        return [key for key, _ in self.FIELDS]
+
+    def values(self):
+        return [getattr(self, attr) for _, attr in self.FIELDS]
+
+    def items(self):
+        return [(key, getattr(self, attr)) for key, attr in self.FIELDS]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class BattingStats(StatRecord):
+    __slots__ = ('runs', 'balls', 'fours', 'sixes', 'strike_rate', 'dismissal', 'scoring_distribution')
+    FIELDS = (
+        ('runs', 'runs'), ('balls', 'balls'), ('4s', 'fours'), ('6s', 'sixes'),
+        ('SR', 'strike_rate'), ('dismissal', 'dismissal'),
+        ('scoring_distribution', 'scoring_distribution'),  # Track 0s, 1s, 2s, 3s, 4s, 6s
+    )
+    KEYS = dict(FIELDS)
+
+    def __init__(self):
+        self.runs = 0
+        self.balls = 0
+        self.fours = 0
+        self.sixes = 0
+        self.strike_rate = 0.0
+        self.dismissal = 'not out'
+        self.scoring_distribution = ScoringDistribution()
+
+
+class BowlingStats(StatRecord):
+    __slots__ = ('balls', 'runs', 'wickets', 'maidens', 'dots', 'fours', 'sixes', 'wides', 'noballs')
+    FIELDS = (
+        ('balls', 'balls'), ('runs', 'runs'), ('wickets', 'wickets'), ('maidens', 'maidens'),
+        ('dots', 'dots'), ('4s', 'fours'), ('6s', 'sixes'), ('wides', 'wides'), ('noballs', 'noballs'),
+    )
+    KEYS = dict(FIELDS)
+
+    def __init__(self):
+        self.balls = 0
+        self.runs = 0
+        self.wickets = 0
+        self.maidens = 0
+        self.dots = 0
+        self.fours = 0
+        self.sixes = 0
+        self.wides = 0
+        self.noballs = 0
+
+
 class Player:
+    __slots__ = ('number', 'name', 'batting', 'bowling', 'batted', 'bowled')
+
     def __init__(self, number, name):
         self.number = number
         self.name = name
-        self.batting = {
-            'runs': 0, 'balls': 0, '4s': 0, '6s': 0,
-            'SR': 0.0, 'dismissal': 'not out',
-            'scoring_distribution': defaultdict(int)  # Track 0s, 1s, 2s, 3s, 4s, 6s
-        }
-        self.bowling = {
-            'balls': 0, 'runs': 0, 'wickets': 0, 'maidens': 0,
-            'dots': 0, '4s': 0, '6s': 0, 'wides': 0, 'noballs': 0
-        }
+        self.batting = BattingStats()
+        self.bowling = BowlingStats()
         self.batted = False
         self.bowled = False
 
@@ -38,13 +145,44 @@ class Team:
         self.bowler_order = []
         self.wicketkeeper_number = None
         self.captain_number = None
+        self.players_by_name = {}  # exact and case-folded name -> Player
 
     def add_player(self, player):
+        previous = self.players.get(player.number)
+        if previous is not None:
+            self._unindex_player(previous)
         self.players[player.number] = player
+        self.players_by_name[player.name] = player
+        self.players_by_name[sys.intern(player.name.casefold())] = player
+
+    def _unindex_player(self, player):
+        for key in (player.name, player.name.casefold()):
+            if self.players_by_name.get(key) is player:
+                del self.players_by_name[key]
 
     def get_player(self, number):
         return self.players[number]
 
+    def get_player_by_name(self, name):
+        """Find a player by name (case-insensitive), or None.
+
+        Exact-case names hit the index directly. Players put straight into
+        self.players (bypassing add_player) are found by a scan and indexed.
+        """
+        player = self.players_by_name.get(name)
+        if player is not None:
+            return player
+        key = name.casefold()
+        player = self.players_by_name.get(key)
+        if player is not None:
+            return player
+        for candidate in self.players.values():
+            if candidate.name.casefold() == key:
+                self.players_by_name[candidate.name] = candidate
+                self.players_by_name[key] = candidate
+                return candidate
+        return None
+
     def all_players(self):
         return [self.players[num] for num in sorted(self.players)]
 
@@ -56,6 +194,11 @@ class Team:
 
 class Partnership:
     """Tracks partnership between two batters."""
+    __slots__ = (
+        'batter1', 'batter2', 'wicket_number', 'start_score', 'end_score', 'runs', 'balls',
+        'batter1_runs', 'batter1_balls', 'batter2_runs', 'batter2_balls'
+    )
+
     def __init__(self, batter1, batter2, wicket_number, start_score):
         self.batter1 = batter1  # Player object
         self.batter2 = batter2  # Player object
@@ -69,21 +212,251 @@ class Partnership:
         self.batter2_runs = 0
         self.batter2_balls = 0
 
+# How much of a delivery's runs are charged to the bowler
+CHARGE_NONE, CHARGE_PENALTY, CHARGE_ALL = 0, 1, 2
+
+
+class EventType(IntEnum):
+    """Delivery event types.
+
+    Each member carries its properties as precomputed attributes, so the
+    scoring code does table lookups instead of matching event strings:
+
+        label: String form used in CSVs and by older code ('no ball_bye')
+        is_legal: Counts towards the over (not a wide or no ball)
+        is_wicket: A batter is dismissed (bowler's wicket or run out)
+        extras: Innings extras category of the penalty or runs, or None
+        runs_extras: Extras category for runs beyond the penalty, or None
+            when they belong to the batter
+        bowler_charge: CHARGE_ALL, CHARGE_PENALTY or CHARGE_NONE
+
+    is_wide, is_no_ball, is_run_out, is_bye (plain bye or leg bye) and
+    counts_to_bowler are derived from those.
+    """
+    NORMAL = (0, 'normal', True, False, None, None, CHARGE_ALL)
+    WICKET = (1, 'wicket', True, True, None, None, CHARGE_ALL)
+    RUN_OUT = (2, 'run out', True, True, None, None, CHARGE_ALL)
+    BYE = (3, 'bye', True, False, 'byes', 'byes', CHARGE_NONE)
+    LEG_BYE = (4, 'leg bye', True, False, 'leg byes', 'leg byes', CHARGE_NONE)
+    WIDE = (5, 'wide', False, False, 'wides', 'wides', CHARGE_ALL)
+    WIDE_BOUNDARY = (6, 'wide_boundary', False, False, 'wides', 'wides', CHARGE_ALL)
+    WIDE_BYE = (7, 'wide_bye', False, False, 'wides', 'byes', CHARGE_PENALTY)
+    WIDE_LEG_BYE = (8, 'wide_leg_bye', False, False, 'wides', 'leg byes', CHARGE_PENALTY)
+    WIDE_RUN_OUT = (9, 'wide_run_out', False, True, 'wides', 'wides', CHARGE_ALL)
+    NO_BALL = (10, 'no ball', False, False, 'no balls', 'no balls', CHARGE_ALL)
+    NO_BALL_RUNS = (11, 'no ball_runs', False, False, 'no balls', None, CHARGE_ALL)
+    NO_BALL_BYE = (12, 'no ball_bye', False, False, 'no balls', 'byes', CHARGE_PENALTY)
+    NO_BALL_LEG_BYE = (13, 'no ball_leg_bye', False, False, 'no balls', 'leg byes', CHARGE_PENALTY)
+    NO_BALL_RUN_OUT = (14, 'no ball_run_out', False, True, 'no balls', None, CHARGE_ALL)
+    BYE_RUN_OUT = (15, 'bye_run_out', True, True, 'byes', 'byes', CHARGE_NONE)
+    LEG_BYE_RUN_OUT = (16, 'leg_bye_run_out', True, True, 'leg byes', 'leg byes', CHARGE_NONE)
+
+    def __new__(cls, code, label, is_legal, is_wicket, extras, runs_extras, bowler_charge):
+        member = int.__new__(cls, code)
+        member._value_ = code
+        member.label = label
+        member.is_legal = is_legal
+        member.is_wicket = is_wicket
+        member.extras = extras
+        member.runs_extras = runs_extras
+        member.bowler_charge = bowler_charge
+        member.is_wide = extras == 'wides'
+        member.is_no_ball = extras == 'no balls'
+        member.is_run_out = is_wicket and label != 'wicket'
+        member.is_bye = label in ('bye', 'leg bye')
+        member.counts_to_bowler = bowler_charge != CHARGE_NONE
+        return member
+
+    def __str__(self):
+        return self.label
+
+    def bowler_runs(self, runs):
+        """Runs off this delivery charged to the bowler."""
+        if self.bowler_charge == CHARGE_ALL:
+            return runs
+        if self.bowler_charge == CHARGE_PENALTY:
+            return 1
+        return 0
+
+    @classmethod
+    def parse(cls, value):
+        """Return the EventType for a member, code or string label.
+
+        Raises:
+            ValueError: If the value is not a known event type
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        try:
+            return EVENT_LABELS[value]
+        except KeyError:
+            raise ValueError(f"Unknown event type: {value!r}") from None
+
+    @classmethod
+    def codes(cls, predicate):
+        """Tuple of the integer codes of members matching predicate."""
+        return tuple(int(member) for member in cls if predicate(member))
+
+
+# Label -> EventType, including 'runs', the legacy name for a normal delivery
+EVENT_LABELS = {member.label: member for member in EventType}
+EVENT_LABELS['runs'] = EventType.NORMAL
+# Code -> EventType, faster than calling EventType(code)
+EVENT_TYPES = tuple(EventType)
+LEGAL_EVENT_CODES = EventType.codes(lambda e: e.is_legal)
+
+
 class BallEvent:
+    __slots__ = ('over', 'ball', 'bowler', 'batter', 'runs', 'event', 'fielders')
+
     def __init__(self, over, ball, bowler, batter, runs, event, fielders=None):
         self.over = over
         self.ball = ball
         self.bowler = bowler
         self.batter = batter
         self.runs = runs
-        self.event = event
-        self.fielders = fielders or []
+        self.event = EventType.parse(event)
+        self.fielders = fielders or NO_FIELDERS
+
+# Shared by every BallEvent without fielders, instead of a new empty list each
+NO_FIELDERS = ()
+
+_numpy_module = None
+
+
+def _numpy():
+    """Import numpy on first use; None if it isn't installed."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+    return _numpy_module or None
+
+
+class BallColumns:
+    """Columnar store for an innings' deliveries.
+
+    Holds parallel typed arrays (over, ball, bowler id, batter id, runs and
+    event code) instead of one BallEvent per delivery. It behaves like the
+    list it replaces: append() takes a BallEvent, and indexing or iterating
+    builds BallEvent views on demand. Aggregates are reductions over the
+    columns, vectorised with numpy when it is installed.
+    """
+    __slots__ = ('over', 'ball', 'bowler_id', 'batter_id', 'runs', 'event_code', 'fielders',
+                 'players', 'player_ids')
+
+    def __init__(self, ball_events=()):
+        self.over = array('H')
+        self.ball = array('H')
+        self.bowler_id = array('H')
+        self.batter_id = array('H')
+        self.runs = array('h')
+        self.event_code = array('B')
+        self.fielders = {}  # Sparse: delivery index -> fielders
+        self.players = []  # id -> Player (or name string in older data)
+        self.player_ids = {}
+        for ball_event in ball_events:
+            self.append(ball_event)
+
+    def _player_id(self, player):
+        player_id = self.player_ids.get(player)
+        if player_id is None:
+            player_id = len(self.players)
+            self.players.append(player)
+            self.player_ids[player] = player_id
+        return player_id
+
+    def append(self, ball_event):
+        if ball_event.fielders:
+            self.fielders[len(self.event_code)] = ball_event.fielders
+        self.over.append(ball_event.over)
+        self.ball.append(ball_event.ball)
+        self.bowler_id.append(self._player_id(ball_event.bowler))
+        self.batter_id.append(self._player_id(ball_event.batter))
+        self.runs.append(ball_event.runs)
+        self.event_code.append(ball_event.event)
+
+    def __len__(self):
+        return len(self.event_code)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return BallEvent(
+            self.over[index], self.ball[index],
+            self.players[self.bowler_id[index]], self.players[self.batter_id[index]],
+            self.runs[index], EVENT_TYPES[self.event_code[index]], self.fielders.get(index)
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def legal_count(self):
+        """Number of deliveries that count towards the over."""
+        # array.count runs in C, so this is fast with or without numpy
+        return sum(self.event_code.count(code) for code in LEGAL_EVENT_CODES)
+
+    def dot_ball_counts(self):
+        """Return (deliveries excluding wides, dot balls) as counted by calculate_innings_summary.
+
+        Dot balls are zero-run deliveries with no extras plus byes and leg byes.
+        """
+        wide_codes = EventType.codes(lambda e: e.is_wide)
+        zero_run_codes = EventType.codes(lambda e: e.extras is None)
+        extras_codes = EventType.codes(lambda e: e.is_bye)
+
+        np = _numpy()
+        if np is not None:
+            codes = np.frombuffer(self.event_code, dtype=np.uint8)
+            runs = np.frombuffer(self.runs, dtype=np.int16)
+            deliveries = len(codes) - int(np.isin(codes, wide_codes).sum())
+            dots = int((np.isin(codes, zero_run_codes) & (runs == 0)).sum()) + int(np.isin(codes, extras_codes).sum())
+            return deliveries, dots
+
+        deliveries = len(self) - sum(self.event_code.count(code) for code in wide_codes)
+        dots = sum(self.event_code.count(code) for code in extras_codes)
+        dots += sum(1 for code, runs in zip(self.event_code, self.runs) if runs == 0 and code in zero_run_codes)
+        return deliveries, dots
+
+    def runs_per_over(self):
+        """List of delivery runs summed per over number."""
+        if not len(self):
+            return []
+        np = _numpy()
+        if np is not None:
+            overs = np.frombuffer(self.over, dtype=np.uint16)
+            runs = np.frombuffer(self.runs, dtype=np.int16)
+            return np.bincount(overs, weights=runs).astype(int).tolist()
+        totals = [0] * (max(self.over) + 1)
+        for over, runs in zip(self.over, self.runs):
+            totals[over] += runs
+        return totals
+
 
 class Innings:
-    def __init__(self, batting_team, bowling_team):
+    __slots__ = (
+        'batting_team', 'bowling_team', 'balls', 'current_batters', 'dismissed', 'did_not_bat',
+        'fall_of_wickets', 'extras', 'bowler_overs', 'phase_stats', 'partnerships',
+        'current_partnership', 'over_totals', 'cumulative_runs', 'counters_live', 'total_runs',
+        'wickets', 'legal_balls', 'current_over', 'balls_in_over', 'win_probabilities', 'stats_cache'
+    )
+
+    # Set to True to cross-check the running counters on every get_score() call
+    verify_counters = False
+
+    def __init__(self, batting_team, bowling_team, columnar=False):
         self.batting_team = batting_team
         self.bowling_team = bowling_team
-        self.balls = []
+        # columnar=True stores deliveries in a BallColumns instead of a list of BallEvents
+        self.balls = BallColumns() if columnar else []
         self.current_batters = []
         self.dismissed = []
         self.did_not_bat = []
@@ -101,11 +474,83 @@ class Innings:
         self.current_partnership = None  # Active partnership
         self.over_totals = []  # Runs scored in each over [over_0_runs, over_1_runs, ...]
         self.cumulative_runs = []  # Total score after each over
+        self.win_probabilities = []  # (legal balls, chase win probability) after each delivery of a chase
+        self.stats_cache = None  # InningsStats snapshot, see match_stats.innings_stats()
+
+        # Running totals, kept up to date by record_delivery()/record_wicket()
+        self.counters_live = False
+        self.total_runs = 0
+        self.wickets = 0
+        self.legal_balls = 0
+        self.current_over = 0
+        self.balls_in_over = 0
 
     def add_ball(self, ball_event):
         self.balls.append(ball_event)
 
-    def get_score(self):
+    def record_delivery(self, over, runs, legal):
+        """Advance the running totals by one delivery.
+
+        Called by the scoring paths (game_logic.process_ball_event and the
+        Cricsheet replay) as each ball goes in, so get_score() can read the
+        counters instead of rescanning the whole innings.
+
+        Args:
+            over: 0-indexed over number of the delivery
+            runs: Runs credited to the team total (bat runs plus extras)
+            legal: True if the delivery counts towards the over
+        """
+        self.counters_live = True
+        self.total_runs += runs
+        if over != self.current_over:
+            self.current_over = over
+            self.balls_in_over = 0
+        if legal:
+            self.legal_balls += 1
+            self.balls_in_over += 1
+
+    def legal_ball_count(self):
+        """Number of legal deliveries (wides and no balls excluded)."""
+        if self.counters_live:
+            return self.legal_balls
+        if isinstance(self.balls, BallColumns):
+            return self.balls.legal_count()
+        return sum(1 for be in self.balls if be.event.is_legal)
+
+    def record_wicket(self, runs, batter_name, bowler_name, over):
+        """Append a fall of wicket entry and bump the running wicket count."""
+        self.fall_of_wickets.append((runs, batter_name, bowler_name, over))
+        self.wickets += 1
+
+    def get_score(self, verify=None):
+        """Return (runs, wickets, overs, run_rate) for the innings.
+
+        Reads the running counters when the innings is being scored through
+        record_delivery(), otherwise falls back to recompute_score().
+
+        Args:
+            verify: Check the counters against a full recompute and raise
+                RuntimeError on mismatch. Defaults to Innings.verify_counters.
+        """
+        if not self.counters_live:
+            return self.recompute_score()
+
+        overs = self.legal_balls // BALLS_PER_OVER + (self.legal_balls % BALLS_PER_OVER) / 10
+        rr = self.total_runs / overs if overs > 0 else 0
+        score = (self.total_runs, self.wickets, overs, rr)
+
+        if verify is None:
+            verify = self.verify_counters
+        if verify:
+            expected = self.recompute_score()
+            if score[:3] != expected[:3]:
+                raise RuntimeError(
+                    f"Innings counters out of sync: counters={score[:3]} recomputed={expected[:3]}"
+                )
+        return score
+
+    def recompute_score(self):
+        """Recompute (runs, wickets, overs, run_rate) from the full innings state."""
         total_runs = 0
         
         # Get all extras from the extras dictionary
@@ -133,11 +578,8 @@ class Innings:
                 # Count balls in the last (potentially incomplete) over
                 # Exclude all wide and no-ball variants (they don't count as legal deliveries)
                 balls_in_last_over = sum(
-                    1 for be in self.balls 
-                    if be.over == max_over and not (
-                        be.event.startswith('wide') or 
-                        be.event.startswith('no ball')
-                    )
+                    1 for be in self.balls
+                    if be.over == max_over and be.event.is_legal
                 )
                 
                 # Calculate overs: complete overs + fractional part from last over
@@ -148,10 +590,7 @@ class Innings:
         else:
             # Fallback: count from balls if no bowler_overs available
             # Count all deliveries except wides and no-balls (which don't count as legal)
-            balls = sum(1 for be in self.balls if not (
-                be.event.startswith('wide') or 
-                be.event.startswith('no ball')
-            ))
+            balls = sum(1 for be in self.balls if be.event.is_legal)
             overs = balls // BALLS_PER_OVER + (balls % BALLS_PER_OVER) / 10
         
         rr = total_runs / (overs * BALLS_PER_OVER / BALLS_PER_OVER) if overs > 0 else 0
@@ -0,0 +1,293 @@
+"""
+Queries over the SQLite match store.
+
+Typed helpers for the questions asked most often of stored matches:
+batter against bowler, powerplay/middle/final splits and venue averages.
+Statements are parameterised so sqlite3's per-connection statement cache
+reuses them, connections come from a thread-safe pool, and results are
+yielded row by row rather than collected into lists. Phases are worked
+out in SQL by models.get_current_phase, registered as a SQL function.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+
+from .match_store import DEFAULT_DB_PATH, connect
+from .models import CHARGE_ALL, CHARGE_PENALTY, EventType, get_current_phase
+
+DEFAULT_POOL_SIZE = 4
+CACHED_STATEMENTS = 256
+PHASES = ('powerplay', 'middle', 'final')
+
+
+def _codes(predicate):
+    return ', '.join(str(code) for code in EventType.codes(predicate))
+
+
+# Runs off the bat: all runs on deliveries without extras, less the penalty on a no ball
+BAT_RUNS = (
+    f"CASE WHEN d.event IN ({_codes(lambda e: e.runs_extras is None and not e.is_no_ball)}) THEN d.runs "
+    f"WHEN d.event IN ({_codes(lambda e: e.runs_extras is None and e.is_no_ball)}) THEN d.runs - 1 ELSE 0 END"
+)
+# Runs charged to the bowler (EventType.bowler_runs)
+BOWLER_RUNS = (
+    f"CASE WHEN d.event IN ({_codes(lambda e: e.bowler_charge == CHARGE_ALL)}) THEN d.runs "
+    f"WHEN d.event IN ({_codes(lambda e: e.bowler_charge == CHARGE_PENALTY)}) THEN 1 ELSE 0 END"
+)
+FACED = f"d.event NOT IN ({_codes(lambda e: e.is_wide)})"
+BOWLER_WICKET = f"d.event = {int(EventType.WICKET)}"
+
+
+def _phase(over, format_name):
+    if format_name is None:
+        return None
+    return get_current_phase(over, {'name': format_name})
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of connections to one match store.
+
+    Up to size connections are opened on demand; a thread asking for one
+    while all are in use waits for one to be returned.
+
+    Args:
+        path: Match store database file
+        size: Most connections open at once
+        cached_statements: Prepared statements kept per connection
+    """
+    def __init__(self, path=DEFAULT_DB_PATH, size=DEFAULT_POOL_SIZE, cached_statements=CACHED_STATEMENTS):
+        self.path = path
+        self.cached_statements = cached_statements
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._all = []
+
+    def _open(self):
+        conn = connect(self.path, check_same_thread=False, cached_statements=self.cached_statements)
+        conn.row_factory = None
+        conn.create_function('phase', 2, _phase, deterministic=True)
+        with self._lock:
+            self._all.append(conn)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a with block."""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every connection the pool opened."""
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        self._idle = queue.LifoQueue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path=DEFAULT_DB_PATH):
+    """Shared pool for a database, created on first use."""
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = ConnectionPool(path)
+        return pool
+
+
+def _rows(pool, sql, params, row_type):
+    """Yield row_type(*row) for each row, holding a pooled connection until exhausted or closed."""
+    with (pool or get_pool()).connection() as conn:
+        for row in conn.execute(sql, params):
+            yield row_type(*row)
+
+
+class HeadToHead:
+    """A batter's record against a bowler."""
+    __slots__ = ('batter', 'bowler', 'balls', 'runs', 'dismissals', 'dots', 'fours', 'sixes')
+
+    def __init__(self, batter, bowler, balls, runs, dismissals, dots, fours, sixes):
+        self.batter = batter
+        self.bowler = bowler
+        self.balls = balls
+        self.runs = runs
+        self.dismissals = dismissals
+        self.dots = dots
+        self.fours = fours
+        self.sixes = sixes
+
+    @property
+    def strike_rate(self):
+        return self.runs / self.balls * 100 if self.balls else 0.0
+
+    @property
+    def average(self):
+        """Runs per dismissal, or None if never dismissed."""
+        return self.runs / self.dismissals if self.dismissals else None
+
+
+class PhaseSplit:
+    """Runs, balls and wickets in one phase of an innings."""
+    __slots__ = ('phase', 'balls', 'runs', 'wickets', 'fours', 'sixes')
+
+    def __init__(self, phase, balls, runs, wickets, fours, sixes):
+        self.phase = phase
+        self.balls = balls
+        self.runs = runs
+        self.wickets = wickets
+        self.fours = fours
+        self.sixes = sixes
+
+    @property
+    def run_rate(self):
+        """Runs per six-ball over."""
+        return self.runs / self.balls * 6 if self.balls else 0.0
+
+
+class VenueAverage:
+    """Average innings score at a venue."""
+    __slots__ = ('venue', 'innings', 'average_runs', 'average_wickets', 'highest', 'lowest')
+
+    def __init__(self, venue, innings, average_runs, average_wickets, highest, lowest):
+        self.venue = venue
+        self.innings = innings
+        self.average_runs = average_runs
+        self.average_wickets = average_wickets
+        self.highest = highest
+        self.lowest = lowest
+
+
+HEAD_TO_HEAD_SELECT = f"""
+    SELECT bat.name, bowl.name,
+           SUM({FACED}),
+           COALESCE(SUM({BAT_RUNS}), 0),
+           SUM({BOWLER_WICKET}),
+           SUM({FACED} AND ({BAT_RUNS}) = 0),
+           SUM(({BAT_RUNS}) = 4),
+           SUM(({BAT_RUNS}) = 6)
+    FROM deliveries d
+    JOIN players bat ON bat.id = d.batter_id
+    JOIN players bowl ON bowl.id = d.bowler_id
+"""
+
+HEAD_TO_HEAD_SQL = HEAD_TO_HEAD_SELECT + """
+    WHERE bat.name = ? AND bowl.name = ?
+    GROUP BY bat.id, bowl.id
+"""
+
+BATTER_VS_BOWLERS_SQL = HEAD_TO_HEAD_SELECT + """
+    WHERE bat.name = ?
+    GROUP BY bowl.id
+    HAVING SUM({faced}) >= ?
+    ORDER BY 3 DESC, bowl.name
+""".format(faced=FACED)
+
+PHASE_SPLIT_SQL = """
+    SELECT phase(d.over, m.format) AS p,
+           SUM({balls}),
+           COALESCE(SUM({runs}), 0),
+           SUM(%s),
+           SUM((%s) = 4),
+           SUM((%s) = 6)
+    FROM deliveries d
+    JOIN matches m ON m.id = d.match_id
+    JOIN players {role} ON {role}.id = d.{role}_id
+    WHERE {role}.name = ? AND p IS NOT NULL
+    GROUP BY p
+""" % (BOWLER_WICKET, BAT_RUNS, BAT_RUNS)
+
+BATTER_PHASE_SQL = PHASE_SPLIT_SQL.format(balls=FACED, runs=BAT_RUNS, role='batter')
+BOWLER_PHASE_SQL = PHASE_SPLIT_SQL.format(balls='d.legal', runs=BOWLER_RUNS, role='bowler')
+
+VENUE_AVERAGE_SQL = """
+    SELECT m.venue, COUNT(*), AVG(i.runs), AVG(i.wickets), MAX(i.runs), MIN(i.runs)
+    FROM innings i
+    JOIN matches m ON m.id = i.match_id
+    WHERE i.number = ? AND m.venue IS NOT NULL
+    GROUP BY m.venue
+    HAVING COUNT(*) >= ?
+    ORDER BY AVG(i.runs) DESC, m.venue
+"""
+
+
+def head_to_head(batter, bowler, pool=None):
+    """
+    A batter's record against one bowler across every stored match.
+
+    Returns:
+        HeadToHead (all zeros if they never met)
+    """
+    for record in _rows(pool, HEAD_TO_HEAD_SQL, (batter, bowler), HeadToHead):
+        return record
+    return HeadToHead(batter, bowler, 0, 0, 0, 0, 0, 0)
+
+
+def batter_vs_bowlers(batter, min_balls=1, pool=None):
+    """
+    Yield a batter's HeadToHead against each bowler faced, most balls first.
+
+    Args:
+        min_balls: Leave out bowlers faced fewer times
+    """
+    return _rows(pool, BATTER_VS_BOWLERS_SQL, (batter, min_balls), HeadToHead)
+
+
+def _in_phase_order(splits):
+    by_phase = {split.phase: split for split in splits}
+    for phase in PHASES:
+        if phase in by_phase:
+            yield by_phase[phase]
+
+
+def batter_phase_splits(batter, pool=None):
+    """
+    Yield a batter's PhaseSplit per phase (powerplay, middle, final).
+
+    Balls are balls faced, runs are runs off the bat and wickets are
+    dismissals credited to a bowler (the store doesn't record which batter
+    was run out). Matches in formats without phases are left out.
+    """
+    return _in_phase_order(_rows(pool, BATTER_PHASE_SQL, (batter,), PhaseSplit))
+
+
+def bowler_phase_splits(bowler, pool=None):
+    """
+    Yield a bowler's PhaseSplit per phase (powerplay, middle, final).
+
+    Balls are legal deliveries, runs are runs charged to the bowler and
+    wickets are the bowler's own (run outs excluded).
+    """
+    return _in_phase_order(_rows(pool, BOWLER_PHASE_SQL, (bowler,), PhaseSplit))
+
+
+def venue_averages(innings_number=1, min_innings=1, pool=None):
+    """
+    Yield VenueAverage for each venue, highest average first.
+
+    Args:
+        innings_number: Which innings of the match to average (1 for first-innings scores)
+        min_innings: Leave out venues with fewer innings stored
+    """
+    return _rows(pool, VENUE_AVERAGE_SQL, (innings_number, min_innings), VenueAverage)
@@ -0,0 +1,182 @@
+"""
+Post-match report pipeline.
+
+Computes the statistics shared by every report once (MatchStats), then
+renders the CSV exports, the Markdown report and each HTML chart
+concurrently on a thread or process pool. The HTML page is assembled as
+soon as its charts are ready. Every artefact is timed, and a failure is
+recorded and reported rather than stopping the others: a chart that fails
+is replaced by a note in the HTML report.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .html_template import escape
+from .match_stats import MatchStats
+from .match_report_html import (
+    DEFAULT_CHART_BACKEND, PLOTLY_JS_MODES, chart_renderers, generate_html_report, plotly_runtime
+)
+from .match_report_md import generate_markdown_report
+from .scorecard_export import write_exports
+
+REPORT_ARTEFACTS = ('csv', 'markdown', 'html')
+CSV_EXPORTS = ('scorecard', 'info', 'ballbyball')
+
+
+class ArtefactResult:
+    """Outcome of rendering one artefact."""
+    __slots__ = ('name', 'path', 'elapsed', 'error')
+
+    def __init__(self, name, path=None, elapsed=0.0, error=None):
+        self.name = name
+        self.path = path
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class PipelineResult:
+    """All artefact results of a pipeline run, in submission order."""
+    def __init__(self, results, elapsed):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return all(result.ok for result in self.results)
+
+    @property
+    def failures(self):
+        return [result for result in self.results if not result.ok]
+
+    def timings(self):
+        """dict of artefact name -> seconds."""
+        return {result.name: result.elapsed for result in self.results}
+
+    def __getitem__(self, name):
+        for result in self.results:
+            if result.name == name:
+                return result
+        raise KeyError(name)
+
+
+def _timed(fn, *args, **kwargs):
+    """Run fn in a worker, returning (value, elapsed, error message) instead of raising."""
+    start = time.perf_counter()
+    try:
+        value = fn(*args, **kwargs)
+        return value, time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+def _write_csv(files, team1, team2, innings1, innings2, match_result):
+    write_exports(files, team1, team2, innings1, innings2, match_result)
+
+
+def generate_reports(team1, team2, innings1, innings2, match_result, format_config, paths,
+                     artefacts=REPORT_ARTEFACTS, workers=None, processes=False, chart_backend=None,
+                     plotly_js='cdn'):
+    """
+    Render match reports concurrently.
+
+    Args:
+        team1, team2: Team objects
+        innings1, innings2: Innings objects
+        match_result: String describing match outcome
+        format_config: Dict with format configuration
+        paths: ExportPaths the outputs are written to (see reserve_export_paths)
+        artefacts: Any of 'csv' (scorecard, info and ball-by-ball CSVs),
+            'markdown' and 'html'
+        workers: Pool size (default: one per task, at most 4)
+        processes: Use a process pool instead of threads (Plotly rendering
+            is CPU bound, so processes help on multi-core machines)
+        chart_backend: 'plotly' or 'svg' (default: Plotly if it's installed)
+        plotly_js: 'cdn' or 'local'; 'local' reports share one copy of
+            plotly.js in the export directory (see plotly_runtime), and
+            fall back to the CDN if it can't be written
+
+    Returns:
+        PipelineResult with an ArtefactResult for 'stats', each artefact and
+        each chart ('chart:manhattan', ...), plus 'plotly.js' if the local
+        copy couldn't be written; failures don't raise
+    """
+    unknown = set(artefacts) - set(REPORT_ARTEFACTS)
+    if unknown:
+        raise ValueError(f"Unknown report artefact(s): {', '.join(sorted(unknown))}")
+    if plotly_js not in PLOTLY_JS_MODES:
+        raise ValueError(f"Unknown plotly_js mode: {plotly_js}")
+    start = time.perf_counter()
+    results = []
+
+    stats, elapsed, error = _timed(MatchStats, innings1, innings2, format_config)
+    results.append(ArtefactResult('stats', elapsed=elapsed, error=error))
+
+    report_args = (team1, team2, innings1, innings2, match_result, format_config)
+    chart_args = (innings1, innings2, innings1.batting_team.name, innings2.batting_team.name)
+    tasks = []  # (ArtefactResult, future)
+    include_plotlyjs = 'cdn'
+    if 'html' in artefacts and (chart_backend or DEFAULT_CHART_BACKEND) == 'plotly':
+        report_dir = os.path.dirname(paths.path('report', 'html'))
+        runtime, elapsed, error = _timed(plotly_runtime, plotly_js, report_dir, paths.directory)
+        if error:
+            results.append(ArtefactResult('plotly.js', elapsed=elapsed, error=error))
+        else:
+            include_plotlyjs = runtime
+    charts_to_render = chart_renderers(chart_backend, include_plotlyjs) if 'html' in artefacts else []
+    task_count = ('csv' in artefacts) + ('markdown' in artefacts) + len(charts_to_render)
+    workers = workers or max(1, min(task_count, 4))
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+    with pool_class(max_workers=workers) as pool:
+        if 'csv' in artefacts:
+            files = {kind: paths.path(kind) for kind in CSV_EXPORTS}
+            result = ArtefactResult('csv', path=files['scorecard'])
+            tasks.append((result, pool.submit(_timed, _write_csv, files, team1, team2,
+                                              innings1, innings2, match_result)))
+        if 'markdown' in artefacts:
+            result = ArtefactResult('markdown', path=paths.path('report', 'md'))
+            tasks.append((result, pool.submit(_timed, generate_markdown_report, *report_args,
+                                              result.path, stats=stats)))
+        chart_tasks = []
+        if 'html' in artefacts:
+            for name, render in charts_to_render:
+                result = ArtefactResult(f'chart:{name}')
+                chart_tasks.append((name, result, pool.submit(_timed, render, *chart_args)))
+                tasks.append((result, chart_tasks[-1][2]))
+
+        # Assemble the HTML page once its charts are in
+        charts = {}
+        for name, result, future in chart_tasks:
+            div, result.elapsed, result.error = future.result()
+            charts[name] = div if result.ok else f"<p>{name.title()} chart unavailable ({escape(result.error)})</p>"
+        if 'html' in artefacts:
+            result = ArtefactResult('html', path=paths.path('report', 'html'))
+            tasks.append((result, pool.submit(_timed, generate_html_report, *report_args,
+                                              result.path, stats=stats, charts=charts)))
+
+        for result, future in tasks:
+            if not result.name.startswith('chart:'):
+                _, result.elapsed, result.error = future.result()
+            results.append(result)
+
+    return PipelineResult(results, time.perf_counter() - start)
+
+
+def print_pipeline_result(pipeline):
+    """Print each artefact's path or error and its time."""
+    labels = {'csv': '📄 CSV exports', 'markdown': '📝 Markdown Report', 'html': '📊 HTML Report'}
+    for result in pipeline.results:
+        label = labels.get(result.name, result.name)
+        if not result.ok:
+            print(f"  ⚠️  {label} failed: {result.error}")
+        elif result.path:
+            print(f"  {label}: {result.path} ({result.elapsed:.2f}s)")
+        else:
+            print(f"     {label}: {result.elapsed:.2f}s")
+    print(f"  Reports finished in {pipeline.elapsed:.2f}s")
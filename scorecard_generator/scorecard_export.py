@@ -1,6 +1,25 @@
 import csv
 import os
 import re
+import shutil
+import uuid
+from contextlib import ExitStack, contextmanager
+from datetime import date
+
+from .models import EventType
+
+EXPORT_DIR = "scorecard_generator/exports"
+EXPORT_ARTEFACTS = ('scorecard', 'info', 'ballbyball')
+# Write buffer per export file, so large ball-by-ball files go out in a few big writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+BATTING_HEADER = ["Player", "Dismissal", "Runs", "Balls", "4s", "6s", "SR"]
+BOWLING_HEADER = ["Player", "Overs", "Maidens", "Runs", "Wickets", "Dots", "4s", "6s", "Wides", "No Balls"]
+BALL_BY_BALL_HEADER = [
+    'match_id', 'season', 'start_date', 'venue', 'innings', 'ball', 'batting_team',
+    'bowling_team', 'striker', 'non_striker', 'bowler', 'runs_off_bat', 'extras',
+    'wides', 'noballs', 'byes', 'legbyes', 'penalty', 'wicket_type', 'player_dismissed', 'other_wicket_type', 'other_player_dismissed'
+]
 
 def extract_player_name(player_str):
     """Extract player name from format like '16 Jos Buttler' -> 'Jos Buttler'."""
@@ -19,310 +38,395 @@ def sanitize_filename(name):
     return sanitized
 
 def get_export_filename(team1, team2, export_type):
-    """Generate filename in format: Team1vTeam2_exporttype.csv"""
+    """Generate filename in format: Team1vTeam2_exporttype.csv
+
+    Every match with the same teams gets this name; export_all uses
+    reserve_export_paths() so matches don't overwrite each other.
+    """
     team1_clean = sanitize_filename(team1.name)
     team2_clean = sanitize_filename(team2.name)
-    return f"scorecard_generator/exports/{team1_clean}v{team2_clean}_{export_type}.csv"
+    return f"{EXPORT_DIR}/{team1_clean}v{team2_clean}_{export_type}.csv"
 
-def export_scorecard_csv(filename, team1, team2, first_innings, second_innings, match_result):
-    """Export traditional scorecard format to CSV."""
-    # Use innings.batting_team/bowling_team to get correct ordering
-    batting_team_1 = first_innings.batting_team
-    bowling_team_1 = first_innings.bowling_team
-    batting_team_2 = second_innings.batting_team
-    bowling_team_2 = second_innings.bowling_team
+
+class ExportPaths:
+    """
+    File paths for one match's exports, reserved by reserve_export_paths().
+
+    Flat layout: {directory}/{base}_{export_type}.{extension}
+    Per-match layout: {directory}/{base}/{export_type}.{extension}
+    """
+    def __init__(self, directory, base, per_match_dir=False):
+        self.directory = directory
+        self.base = base
+        self.per_match_dir = per_match_dir
+
+    def path(self, export_type, extension='csv'):
+        if self.per_match_dir:
+            return os.path.join(self.directory, self.base, f"{export_type}.{extension}")
+        return os.path.join(self.directory, f"{self.base}_{export_type}.{extension}")
+
+    def discard(self, export_types):
+        """Remove a failed export: its directory, or in the flat layout its files and placeholder."""
+        if self.per_match_dir:
+            shutil.rmtree(os.path.join(self.directory, self.base), ignore_errors=True)
+            return
+        for export_type in export_types:
+            try:
+                os.remove(self.path(export_type))
+            except FileNotFoundError:
+                pass
+
+
+def reserve_export_paths(team1, team2, match_id=None, match_date=None, per_match_dir=False,
+                         directory=EXPORT_DIR, claim='scorecard'):
+    """
+    Claim a unique name for a match's export files.
+
+    The name is Team1vTeam2_<date>[_<match id>]_<sequence>, with the
+    sequence number bumped until an unused one is claimed. Claims are
+    atomic (the per-match directory is created, or in the flat layout the
+    claim export's path is created exclusively as an empty placeholder
+    until it's written), so concurrent exporters never share or overwrite
+    files.
+
+    Args:
+        match_id: Optional match identifier, e.g. a Cricsheet match id
+        match_date: Date string or date (default: today); non-alphanumerics are dropped
+        per_match_dir: Put each match's files in their own directory
+        claim: Export type the caller writes first (its placeholder is replaced;
+            call ExportPaths.discard if writing fails)
+
+    Returns:
+        ExportPaths
+    """
+    os.makedirs(directory, exist_ok=True)
+    match_date = match_date or date.today().isoformat()
+    parts = [f"{sanitize_filename(team1.name)}v{sanitize_filename(team2.name)}",
+             re.sub(r'[^0-9A-Za-z]', '', str(match_date))]
+    if match_id is not None:
+        parts.append(sanitize_filename(str(match_id)))
+    prefix = '_'.join(part for part in parts if part)
+
+    sequence = 1
+    while True:
+        paths = ExportPaths(directory, f"{prefix}_{sequence:02d}", per_match_dir)
+        try:
+            if per_match_dir:
+                os.mkdir(os.path.join(directory, paths.base))
+            else:
+                os.close(os.open(paths.path(claim), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            return paths
+        except FileExistsError:
+            sequence += 1
+
+
+@contextmanager
+def atomic_write(filename, newline=None, buffering=-1):
+    """
+    Open a text file for writing that only appears under filename once complete.
+
+    Writes go to a temporary file in the same directory, which replaces
+    filename (os.replace) when the with block exits cleanly and is
+    removed if it raises, so readers never see a partly written file.
+    """
+    # Unlike tempfile.mkstemp (0600), this respects the umask like open() would
+    tmp_path = f"{filename}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, 'w', buffering=buffering, newline=newline, encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _batting_rows(innings):
+    """Batting block of the scorecard for one innings."""
+    team = innings.batting_team
+    yield [f"{team.name} Batting"]
+    yield BATTING_HEADER
+    for num in team.order:
+        p = team.players[num]
+        bat = p.batting
+        yield [
+            p.name, bat['dismissal'], bat['runs'], bat['balls'],
+            bat['4s'], bat['6s'],
+            f"{(bat['runs']/bat['balls']*100):.2f}" if bat['balls'] else "0.00"
+        ]
+    yield []
+
+
+def _bowling_rows(innings):
+    """Bowling block of the scorecard for one innings (bowlers who bowled a ball)."""
+    team = innings.bowling_team
+    yield [f"{team.name} Bowling"]
+    yield BOWLING_HEADER
+    for num in team.order:
+        p = team.players[num]
+        bowl = p.bowling
+        if bowl['balls'] > 0:
+            overs = f"{bowl['balls']//6}.{bowl['balls']%6}"
+            yield [
+                p.name, overs, bowl['maidens'], bowl['runs'], bowl['wickets'],
+                bowl['dots'], bowl['4s'], bowl['6s'], bowl['wides'], bowl['noballs']
+            ]
+    yield []
+
+
+def _summary_rows(innings_list, match_result):
+    """Score lines and result at the top of the scorecard."""
+    for innings in innings_list:
+        runs, wickets, _, _ = innings.get_score()
+        yield [f"{innings.batting_team.name}: {runs}/{wickets}"]
+    yield [match_result]
+    yield []
+
+
+def _info_rows(team1, team2, match_result):
+    """Match info rows in Cricsheet format."""
+    yield ['version', '2.2.0']
+    yield ['info', 'match_id', 'N/A']
+    yield ['info', 'season', 'N/A']
+    yield ['info', 'team_type', 'international']
+    yield ['info', 'match_type', 'T20']
+    yield ['info', 'gender', 'male']
+    yield ['info', 'date', 'N/A']
+    yield ['info', 'teams', team1.name, team2.name]
+    yield ['info', 'venue', 'N/A']
+    yield ['info', 'city', 'N/A']
+    yield ['info', 'toss_winner', 'N/A']
+    yield ['info', 'toss_decision', 'N/A']
     
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Match summary
-        writer.writerow([f"{batting_team_1.name}: {first_innings.get_score()[0]}/{first_innings.get_score()[1]}"])
-        writer.writerow([f"{batting_team_2.name}: {second_innings.get_score()[0]}/{second_innings.get_score()[1]}"])
-        writer.writerow([match_result])
-        writer.writerow([])
-        
-        # --- First Innings Batting ---
-        writer.writerow([f"{batting_team_1.name} Batting"])
-        writer.writerow(["Player", "Dismissal", "Runs", "Balls", "4s", "6s", "SR"])
-        for num in batting_team_1.order:
-            p = batting_team_1.players[num]
-            bat = p.batting
-            writer.writerow([
-                p.name, bat['dismissal'], bat['runs'], bat['balls'],
-                bat['4s'], bat['6s'],
-                f"{(bat['runs']/bat['balls']*100):.2f}" if bat['balls'] else "0.00"
-            ])
-        writer.writerow([])
-        
-        # --- First Innings Bowling ---
-        writer.writerow([f"{bowling_team_1.name} Bowling"])
-        writer.writerow(["Player", "Overs", "Maidens", "Runs", "Wickets", "Dots", "4s", "6s", "Wides", "No Balls"])
-        for num in bowling_team_1.order:
-            p = bowling_team_1.players[num]
-            bowl = p.bowling
-            # Only show bowlers who bowled at least one ball
-            if bowl['balls'] > 0:
-                overs = f"{bowl['balls']//6}.{bowl['balls']%6}"
-                writer.writerow([
-                    p.name, overs, bowl['maidens'], bowl['runs'], bowl['wickets'],
-                    bowl['dots'], bowl['4s'], bowl['6s'], bowl['wides'], bowl['noballs']
-                ])
-        writer.writerow([])
-        
-        # --- Second Innings Batting ---
-        writer.writerow([f"{batting_team_2.name} Batting"])
-        writer.writerow(["Player", "Dismissal", "Runs", "Balls", "4s", "6s", "SR"])
-        for num in batting_team_2.order:
-            p = batting_team_2.players[num]
-            bat = p.batting
-            writer.writerow([
-                p.name, bat['dismissal'], bat['runs'], bat['balls'],
-                bat['4s'], bat['6s'],
-                f"{(bat['runs']/bat['balls']*100):.2f}" if bat['balls'] else "0.00"
-            ])
-        writer.writerow([])
-        
-        # --- Second Innings Bowling ---
-        writer.writerow([f"{bowling_team_2.name} Bowling"])
-        writer.writerow(["Player", "Overs", "Maidens", "Runs", "Wickets", "Dots", "4s", "6s", "Wides", "No Balls"])
-        for num in bowling_team_2.order:
-            p = bowling_team_2.players[num]
-            bowl = p.bowling
-            if bowl['balls'] > 0:
-                overs = f"{bowl['balls']//6}.{bowl['balls']%6}"
-                writer.writerow([
-                    p.name, overs, bowl['maidens'], bowl['runs'], bowl['wickets'],
-                    bowl['dots'], bowl['4s'], bowl['6s'], bowl['wides'], bowl['noballs']
-                ])
-        writer.writerow([])
+    # Player registry
+    for team in (team1, team2):
+        for num in team.order:
+            yield ['info', 'player', team.players[num].name, team.name]
     
-    print(f"Scorecard exported to {filename}")
+    # Match outcome
+    yield ['info', 'outcome', match_result]
 
-def export_match_info_csv(filename, team1, team2, first_innings, second_innings, match_result):
-    """Export match info in Cricsheet format."""
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Cricsheet format header
-        writer.writerow(['version', '2.2.0'])
-        writer.writerow(['info', 'match_id', 'N/A'])
-        writer.writerow(['info', 'season', 'N/A'])
-        writer.writerow(['info', 'team_type', 'international'])
-        writer.writerow(['info', 'match_type', 'T20'])
-        writer.writerow(['info', 'gender', 'male'])
-        writer.writerow(['info', 'date', 'N/A'])
-        writer.writerow(['info', 'teams', team1.name, team2.name])
-        writer.writerow(['info', 'venue', 'N/A'])
-        writer.writerow(['info', 'city', 'N/A'])
-        writer.writerow(['info', 'toss_winner', 'N/A'])
-        writer.writerow(['info', 'toss_decision', 'N/A'])
-        
-        # Player registry
-        for num in team1.order:
-            p = team1.players[num]
-            writer.writerow(['info', 'player', p.name, team1.name])
-        for num in team2.order:
-            p = team2.players[num]
-            writer.writerow(['info', 'player', p.name, team2.name])
-        
-        # Match outcome
-        writer.writerow(['info', 'outcome', match_result])
+
+def classify_runs(event_type, runs):
+    """Classify runs into runs_off_bat and extra types based on event type.
+
+    Returns:
+        tuple of (runs_off_bat, extras, wides, noballs, byes, legbyes)
+    """
+    runs_off_bat = 0
+    extras = 0
+    wides = 0
+    noballs = 0
+    byes = 0
+    legbyes = 0
     
-    print(f"Match info exported to {filename}")
+    event_type = EventType.parse(event_type)
+    if event_type.is_wide:
+        wides = 1  # Mark as wide occurred
+        if event_type is EventType.WIDE_BOUNDARY:
+            runs_off_bat = 4
+            extras = 1
+        else:
+            extras = runs
+    elif event_type.is_no_ball:
+        noballs = 1
+        extras = 1
+        if event_type is EventType.NO_BALL_RUNS and runs > 1:
+            # No ball with runs off the bat
+            runs_off_bat = runs - 1
+    elif event_type.extras == 'byes':
+        byes = runs
+        extras = runs
+    elif event_type.extras == 'leg byes':
+        legbyes = max(runs, 0)
+        extras = max(runs, 0)
+    elif event_type is not EventType.WICKET:
+        # Normal deliveries and run outs; a wicket has no associated runs
+        runs_off_bat = runs
+    
+    return runs_off_bat, extras, wides, noballs, byes, legbyes
 
 
-def export_ball_by_ball_csv(filename, team1, team2, first_innings, second_innings):
-    """Export ball-by-ball data in Cricsheet format."""
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Cricsheet ball-by-ball header
-        writer.writerow([
-            'match_id', 'season', 'start_date', 'venue', 'innings', 'ball', 'batting_team',
-            'bowling_team', 'striker', 'non_striker', 'bowler', 'runs_off_bat', 'extras',
-            'wides', 'noballs', 'byes', 'legbyes', 'penalty', 'wicket_type', 'player_dismissed', 'other_wicket_type', 'other_player_dismissed'
-        ])
-        
-        # Helper function to classify runs from event type
-        def classify_runs(event_type, runs):
-            """Classify runs into runs_off_bat and extra types based on event type."""
-            runs_off_bat = 0
-            extras = 0
-            wides = 0
-            noballs = 0
-            byes = 0
-            legbyes = 0
-            
-            if event_type == 'normal':
-                runs_off_bat = runs
-            elif 'wide' in event_type:
-                wides = 1  # Mark as wide occurred
-                if 'boundary' in event_type:
-                    runs_off_bat = 4
-                    extras = 1
-                else:
-                    extras = runs
-            elif 'no ball' in event_type:
-                noballs = 1
-                if 'runs' in event_type:
-                    # No ball with runs
-                    if runs > 1:
-                        runs_off_bat = runs - 1
-                    extras = 1
-                else:
-                    extras = 1
-            elif event_type == 'bye':
-                byes = runs
-                extras = runs
-            elif 'leg bye' in event_type:
-                legbyes = runs if runs > 0 else 0
-                extras = runs if runs > 0 else 0
-            elif 'run out' in event_type:
-                # Run outs usually have runs
-                if 'bye' in event_type:
-                    byes = runs
-                    extras = runs
-                elif 'leg' in event_type:
-                    legbyes = runs
-                    extras = runs
-                else:
-                    runs_off_bat = runs
-            elif 'wicket' in event_type:
-                # Wicket with no associated runs
-                runs_off_bat = 0
-            
-            return runs_off_bat, extras, wides, noballs, byes, legbyes
-        
-        def write_ball_row(innings_num, inches, event, non_striker_name):
-            """Helper to write a ball row."""
-            # Calculate ball number (over.ball)
-            ball_num = f"{event.over}.{event.ball}"
-            
-            # Classify the runs
-            runs_off_bat, extras, wides, noballs, byes, legbyes = classify_runs(event.event, event.runs)
-            
-            # Wicket info extraction - fielders is a list with complex structure
-            wicket_type = ''
-            player_dismissed = ''  # Only populate if a wicket occurred
-            
-            if 'wicket' in event.event and event.fielders:
-                # The dismissed player is the batter when a wicket occurs
-                player_dismissed = extract_player_name(event.batter)
-                # Parse fielders list to determine dismissal type
-                if isinstance(event.fielders, list) and len(event.fielders) > 0:
-                    first_elem = event.fielders[0]
-                    
-                    # LBW case: fielders = ["lbw", ...]
-                    if first_elem == "lbw":
-                        wicket_type = "lbw"
-                    
-                    # Caught & Bowled or Caught or Run out: first element contains the info
-                    elif isinstance(first_elem, tuple):
-                        # Tuple format: (fielder_name, something, is_c_and_b)
-                        if len(first_elem) >= 3 and first_elem[2]:
-                            wicket_type = "caught and bowled"
-                        else:
-                            wicket_type = "caught"
-                    
-                    # String format - could be bowler name (bowled) or fielder name (run out)
-                    elif isinstance(first_elem, str):
-                        bowler_name = extract_player_name(event.bowler)
-                        fielder_name = extract_player_name(first_elem)
-                        
-                        if first_elem == event.bowler:
-                            wicket_type = "bowled"
-                        else:
-                            wicket_type = "run out"
-                    
-                    # Handle stumped case: fielders = [wicketkeeper_name, ...]
-                    elif len(event.fielders) >= 2:
-                        wicket_type = "stumped"
-            
-            # Handle "run out" event type (not stored as "wicket")
-            elif event.event in ["run out", "bye_run_out", "leg_bye_run_out", "wide_run_out", "no ball_run_out"]:
-                wicket_type = "run out"
-                player_dismissed = extract_player_name(event.batter)
+def wicket_details(event):
+    """Return (wicket_type, player_dismissed) for a BallEvent, or ('', '') without a wicket."""
+    wicket_type = ''
+    player_dismissed = ''  # Only populate if a wicket occurred
+    
+    if event.event is EventType.WICKET and event.fielders:
+        # The dismissed player is the batter when a wicket occurs
+        player_dismissed = extract_player_name(event.batter)
+        # Parse fielders list to determine dismissal type
+        if isinstance(event.fielders, list) and len(event.fielders) > 0:
+            first_elem = event.fielders[0]
             
-            # Extract clean player names
-            striker_name = extract_player_name(event.batter)
-            bowler_name = extract_player_name(event.bowler)
+            # LBW case: fielders = ["lbw", ...]
+            if first_elem == "lbw":
+                wicket_type = "lbw"
             
-            writer.writerow([
-                'N/A',  # match_id
-                'N/A',  # season
-                'N/A',  # start_date
-                'N/A',  # venue
-                innings_num,
-                ball_num,
-                inches.batting_team.name,
-                inches.bowling_team.name,
-                striker_name,
-                non_striker_name,
-                bowler_name,
-                runs_off_bat,
-                extras,
-                wides,
-                noballs,
-                byes,
-                legbyes,
-                0,      # penalty
-                wicket_type,
-                player_dismissed,
-                '',     # other_wicket_type
-                ''      # other_player_dismissed
-            ])
-        
-        # Process first innings with non_striker tracking
-        batting_order = list(first_innings.batting_team.order)
-        non_striker_idx = 1  # Track current non-striker index in batting order
-        
-        for event in first_innings.balls:
-            # Try to maintain non_striker tracking
-            # Get names of current batting pair
-            if non_striker_idx < len(batting_order):
-                non_striker_num = batting_order[non_striker_idx]
-                non_striker_name = extract_player_name(
-                    f"{non_striker_num} {first_innings.batting_team.players[non_striker_num].name}"
-                )
-            else:
-                non_striker_name = 'N/A'
+            # Caught & Bowled or Caught or Run out: first element contains the info
+            elif isinstance(first_elem, tuple):
+                # Tuple format: (fielder_name, something, is_c_and_b)
+                if len(first_elem) >= 3 and first_elem[2]:
+                    wicket_type = "caught and bowled"
+                else:
+                    wicket_type = "caught"
             
-            write_ball_row(1, first_innings, event, non_striker_name)
-        
-        # Process second innings
-        batting_order = list(second_innings.batting_team.order)
-        non_striker_idx = 1
-        
-        for event in second_innings.balls:
-            # Get non_striker
-            if non_striker_idx < len(batting_order):
-                non_striker_num = batting_order[non_striker_idx]
-                non_striker_name = extract_player_name(
-                    f"{non_striker_num} {second_innings.batting_team.players[non_striker_num].name}"
-                )
-            else:
-                non_striker_name = 'N/A'
+            # String format - could be bowler name (bowled) or fielder name (run out)
+            elif isinstance(first_elem, str):
+                if first_elem == event.bowler:
+                    wicket_type = "bowled"
+                else:
+                    wicket_type = "run out"
             
-            write_ball_row(2, second_innings, event, non_striker_name)
+            # Handle stumped case: fielders = [wicketkeeper_name, ...]
+            elif len(event.fielders) >= 2:
+                wicket_type = "stumped"
     
-    print(f"Ball-by-ball data exported to {filename}")
+    # Handle "run out" event type (not stored as "wicket")
+    elif event.event.is_run_out:
+        wicket_type = "run out"
+        player_dismissed = extract_player_name(event.batter)
+    
+    return wicket_type, player_dismissed
+
 
-def export_all(team1, team2, first_innings, second_innings, match_result):
-    """Export all three CSV formats: scorecard, info, and ball-by-ball."""
-    # Ensure exports directory exists
-    os.makedirs("scorecard_generator/exports", exist_ok=True)
+def _ball_rows(innings_num, innings):
+    """Ball-by-ball rows in Cricsheet format for one innings."""
+    batting_team_name = innings.batting_team.name
+    bowling_team_name = innings.bowling_team.name
     
-    # Generate filenames based on team names
-    scorecard_file = get_export_filename(team1, team2, "scorecard")
-    info_file = get_export_filename(team1, team2, "info")
-    ballbyball_file = get_export_filename(team1, team2, "ballbyball")
+    # The non-striker isn't recorded per ball; report the second batter in the order
+    batting_order = innings.batting_team.order
+    if len(batting_order) > 1:
+        non_striker_num = batting_order[1]
+        non_striker_name = extract_player_name(
+            f"{non_striker_num} {innings.batting_team.players[non_striker_num].name}"
+        )
+    else:
+        non_striker_name = 'N/A'
     
-    # Export all formats
-    export_scorecard_csv(scorecard_file, team1, team2, first_innings, second_innings, match_result)
-    export_match_info_csv(info_file, team1, team2, first_innings, second_innings, match_result)
-    export_ball_by_ball_csv(ballbyball_file, team1, team2, first_innings, second_innings)
+    for event in innings.balls:
+        runs_off_bat, extras, wides, noballs, byes, legbyes = classify_runs(event.event, event.runs)
+        wicket_type, player_dismissed = wicket_details(event)
+        yield [
+            'N/A',  # match_id
+            'N/A',  # season
+            'N/A',  # start_date
+            'N/A',  # venue
+            innings_num,
+            f"{event.over}.{event.ball}",
+            batting_team_name,
+            bowling_team_name,
+            extract_player_name(event.batter),
+            non_striker_name,
+            extract_player_name(event.bowler),
+            runs_off_bat,
+            extras,
+            wides,
+            noballs,
+            byes,
+            legbyes,
+            0,      # penalty
+            wicket_type,
+            player_dismissed,
+            '',     # other_wicket_type
+            ''      # other_player_dismissed
+        ]
+
+
+def _open_csv(stack, filename):
+    """Buffered, atomically replaced CSV writer registered on an ExitStack."""
+    return csv.writer(stack.enter_context(atomic_write(filename, newline='', buffering=EXPORT_BUFFER_SIZE)))
+
+
+def write_exports(files, team1, team2, first_innings, second_innings, match_result):
+    """
+    Write any of the three CSV exports in one pass over the innings.
+
+    Each innings is walked once; its scorecard blocks and ball-by-ball rows
+    are fanned out to whichever writers were asked for. Files are only
+    moved into place once every one has been written. A second_innings of
+    None (single-innings match) is skipped.
+
+    Args:
+        files: dict of export type ('scorecard', 'info', 'ballbyball') -> filename
+    """
+    unknown = set(files) - set(EXPORT_ARTEFACTS)
+    if unknown:
+        raise ValueError(f"Unknown export type(s): {', '.join(sorted(unknown))}")
+    innings_list = [innings for innings in (first_innings, second_innings) if innings is not None]
+    
+    with ExitStack() as stack:
+        writers = {kind: _open_csv(stack, filename) for kind, filename in files.items()}
+        scorecard = writers.get('scorecard')
+        ballbyball = writers.get('ballbyball')
+        
+        if 'info' in writers:
+            writers['info'].writerows(_info_rows(team1, team2, match_result))
+        if scorecard:
+            # Use innings.batting_team/bowling_team to get correct ordering
+            scorecard.writerows(_summary_rows(innings_list, match_result))
+        if ballbyball:
+            ballbyball.writerow(BALL_BY_BALL_HEADER)
+        
+        for innings_num, innings in enumerate(innings_list, 1):
+            if scorecard:
+                scorecard.writerows(_batting_rows(innings))
+                scorecard.writerows(_bowling_rows(innings))
+            if ballbyball:
+                ballbyball.writerows(_ball_rows(innings_num, innings))
+
+
+def export_scorecard_csv(filename, team1, team2, first_innings, second_innings, match_result):
+    """Export traditional scorecard format to CSV."""
+    write_exports({'scorecard': filename}, team1, team2, first_innings, second_innings, match_result)
+    print(f"Scorecard exported to {filename}")
+
+def export_match_info_csv(filename, team1, team2, first_innings, second_innings, match_result):
+    """Export match info in Cricsheet format."""
+    write_exports({'info': filename}, team1, team2, first_innings, second_innings, match_result)
+    print(f"Match info exported to {filename}")
+
+
+def export_ball_by_ball_csv(filename, team1, team2, first_innings, second_innings):
+    """Export ball-by-ball data in Cricsheet format."""
+    write_exports({'ballbyball': filename}, team1, team2, first_innings, second_innings, None)
+    print(f"Ball-by-ball data exported to {filename}")
+
+def export_all(team1, team2, first_innings, second_innings, match_result, match_id=None,
+               match_date=None, per_match_dir=False, directory=EXPORT_DIR, artefacts=EXPORT_ARTEFACTS):
+    """Export the scorecard, info and ball-by-ball CSVs in a single pass.
+
+    Files go under a newly reserved name (see reserve_export_paths), so
+    earlier exports of the same fixture are never overwritten.
+
+    Args:
+        artefacts: Export types to write, e.g. ('ballbyball',) for a batch
+            job that only needs ball-by-ball data
+
+    Returns:
+        ExportPaths for the match (reports can be written alongside)
+    """
+    unknown = set(artefacts) - set(EXPORT_ARTEFACTS)
+    if unknown:
+        raise ValueError(f"Unknown export type(s): {', '.join(sorted(unknown))}")
+    artefacts = [kind for kind in EXPORT_ARTEFACTS if kind in artefacts]
+    if not artefacts:
+        raise ValueError("No export types selected")
+    paths = reserve_export_paths(team1, team2, match_id, match_date, per_match_dir, directory,
+                                 claim=artefacts[0])
+    files = {kind: paths.path(kind) for kind in artefacts}
+    try:
+        write_exports(files, team1, team2, first_innings, second_innings, match_result)
+    except BaseException:
+        # Don't leave the placeholder behind to push later exports to the next sequence number
+        paths.discard(artefacts)
+        raise
     
+    labels = {'scorecard': 'Scorecard', 'info': 'Match Info', 'ballbyball': 'Ball-by-ball'}
     print(f"\nAll exports completed successfully!")
-    print(f"  - Scorecard: {scorecard_file}")
-    print(f"  - Match Info: {info_file}")
-    print(f"  - Ball-by-ball: {ballbyball_file}")
\ No newline at end of file
+    for kind, filename in files.items():
+        print(f"  - {labels[kind]}: {filename}")
+    return paths
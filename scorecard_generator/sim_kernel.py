@@ -0,0 +1,303 @@
+"""
+Vectorised innings simulation kernel (requires numpy).
+
+Simulates N innings in lockstep: score, wickets, legal balls and the
+striker/non-striker batting positions are arrays, and every step draws
+one uniform per innings still in progress. Outcomes are sampled from one
+OutcomeDistribution per batting position, exactly the way
+OutcomeDistribution.sample does it, so cross_check() can replay the same
+draws through MatchState and compare the results innings by innings.
+
+Bowlers don't change the outcome distribution here, so bowler rotation
+and max_bowler_overs don't affect the kernel.
+"""
+
+from .models import BALLS_PER_OVER, CRICKET_FORMATS
+from .engine import Delivery, MatchState
+from .simulator import OutcomeDistribution, PlayerProfiles, WICKET_KINDS, build_team, default_squad
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BATTERS = 11
+# Kinds the kernel can model; anything else in a distribution raises ValueError
+LEGAL_KINDS = ('normal', 'bye', 'leg bye', 'run out') + WICKET_KINDS
+ILLEGAL_KINDS = ('wide', 'no ball')
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("The vectorised kernel needs numpy. Install with: pip install numpy")
+
+
+def _positions(distributions):
+    """One OutcomeDistribution per batting position."""
+    if distributions is None:
+        return [OutcomeDistribution()] * BATTERS
+    if isinstance(distributions, OutcomeDistribution):
+        return [distributions] * BATTERS
+    distributions = list(distributions)
+    if len(distributions) != BATTERS:
+        raise ValueError(f"Need {BATTERS} outcome distributions, one per batting position")
+    return distributions
+
+
+def _innings_overs(format_config, overs):
+    max_overs = overs or format_config['max_overs']
+    if max_overs is None:
+        raise ValueError(f"{format_config['name']} has no over limit; pass overs=")
+    return max_overs
+
+
+class OutcomeTable:
+    """
+    Per-position cumulative weights and per-outcome effects as arrays.
+
+    Args:
+        distributions: List of OutcomeDistribution, one per batting position
+    """
+    def __init__(self, distributions):
+        outcomes = []
+        for dist in distributions:
+            for outcome in dist.outcomes:
+                if outcome not in outcomes:
+                    outcomes.append(outcome)
+        self.outcomes = outcomes
+
+        width = max(len(dist.outcomes) for dist in distributions)
+        # Padding with inf keeps it out of the "cum <= x" count
+        self.cum = np.full((len(distributions), width), np.inf)
+        self.ids = np.zeros((len(distributions), width), dtype=np.intp)
+        self.totals = np.empty(len(distributions))
+        for pos, dist in enumerate(distributions):
+            count = len(dist.outcomes)
+            self.cum[pos, :count] = dist.cum_weights
+            self.ids[pos, :count] = [outcomes.index(outcome) for outcome in dist.outcomes]
+            self.totals[pos] = dist.total
+
+        self.runs = np.zeros(len(outcomes), dtype=np.int32)
+        self.legal = np.zeros(len(outcomes), dtype=np.int32)
+        self.wicket = np.zeros(len(outcomes), dtype=bool)
+        self.swap = np.zeros(len(outcomes), dtype=bool)
+        for i, (kind, runs) in enumerate(outcomes):
+            if kind not in LEGAL_KINDS and kind not in ILLEGAL_KINDS:
+                raise ValueError(f"The kernel can't simulate '{kind}' outcomes")
+            self.legal[i] = kind in LEGAL_KINDS
+            self.wicket[i] = kind in WICKET_KINDS or kind == 'run out'
+            # Completed runs on a run out aren't credited to the total
+            self.runs[i] = 0 if self.wicket[i] else runs
+            self.swap[i] = kind in ('normal', 'bye', 'leg bye', 'run out') and runs % 2 == 1
+
+    def sample(self, positions, u):
+        """Outcome ids for innings whose strikers bat at positions, given uniforms u."""
+        x = u * self.totals[positions]
+        k = (self.cum[positions] <= x[:, None]).sum(axis=1)
+        return self.ids[positions, k]
+
+
+class KernelResult:
+    """
+    Final and per-over results of a batch of simulated innings.
+
+    over_scores/over_wickets are (N, overs) arrays of the score and wickets
+    at the end of each over; innings that finished early carry their final
+    figures forward.
+    """
+    def __init__(self, scores, wickets, balls, over_scores, over_wickets, elapsed=0.0, draws=None):
+        self.scores = scores
+        self.wickets = wickets
+        self.balls = balls
+        self.over_scores = over_scores
+        self.over_wickets = over_wickets
+        self.elapsed = elapsed
+        self.draws = draws
+
+    @property
+    def simulations(self):
+        return len(self.scores)
+
+    @property
+    def sims_per_sec(self):
+        return self.simulations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def mean_by_over(self):
+        """Mean score after each over."""
+        return self.over_scores.mean(axis=0)
+
+    def quantiles_by_over(self, quantiles=(0.1, 0.5, 0.9)):
+        """(len(quantiles), overs) array of score quantiles after each over."""
+        return np.quantile(self.over_scores, quantiles, axis=0)
+
+    def score_distribution(self, over=None):
+        """Counts of each final score (or the score after over, 0-based)."""
+        scores = self.scores if over is None else self.over_scores[:, over]
+        return np.bincount(scores)
+
+    def wicket_distribution(self, over=None):
+        """Counts of 0-10 wickets at the end (or after over, 0-based)."""
+        wickets = self.wickets if over is None else self.over_wickets[:, over]
+        return np.bincount(wickets, minlength=BATTERS)
+
+
+def simulate_batch(n, format_key='T20', distributions=None, seed=0, target=None, overs=None,
+                   format_config=None, record_draws=False):
+    """
+    Simulate n innings in lockstep.
+
+    Args:
+        n: Number of innings
+        format_key: Key of CRICKET_FORMATS (ignored if format_config is given)
+        distributions: OutcomeDistribution for everyone, or a list of 11 (one per batting position)
+        seed: Seed for numpy's default_rng
+        target: Runs to chase, or None
+        overs: Overs per innings (required for formats without a limit)
+        record_draws: Keep each innings' uniforms in result.draws (for cross_check)
+
+    Returns:
+        KernelResult
+    """
+    _require_numpy()
+    import time
+
+    format_config = format_config or CRICKET_FORMATS[format_key]
+    max_overs = _innings_overs(format_config, overs)
+    balls_per_over = format_config.get('balls_per_over', BALLS_PER_OVER)
+    table = OutcomeTable(_positions(distributions))
+    rng = np.random.default_rng(seed)
+
+    start = time.perf_counter()
+    score = np.zeros(n, dtype=np.int32)
+    wickets = np.zeros(n, dtype=np.int32)
+    balls = np.zeros(n, dtype=np.int32)
+    over = np.zeros(n, dtype=np.int32)
+    over_balls = np.zeros(n, dtype=np.int32)
+    striker = np.zeros(n, dtype=np.intp)
+    non_striker = np.ones(n, dtype=np.intp)
+    over_scores = np.zeros((n, max_overs), dtype=np.int32)
+    over_wickets = np.zeros((n, max_overs), dtype=np.int32)
+    deliveries = np.zeros(n, dtype=np.intp)
+    steps = []
+    active = np.arange(n)
+
+    while active.size:
+        u = rng.random(active.size)
+        if record_draws:
+            steps.append((active, u))
+        outcome = table.sample(striker[active], u)
+        deliveries[active] += 1
+
+        score[active] += table.runs[outcome]
+        legal = table.legal[outcome]
+        balls[active] += legal
+        over_balls[active] += legal
+
+        out = active[table.wicket[outcome]]
+        wickets[out] += 1
+        # Next in the order comes in at the striker's end
+        striker[out] = np.minimum(wickets[out] + 1, BATTERS - 1)
+        swap = active[table.swap[outcome]]
+        striker[swap], non_striker[swap] = non_striker[swap], striker[swap].copy()
+
+        ended = wickets[active] >= BATTERS - 1
+        if target is not None:
+            ended |= score[active] >= target
+        over_done = ~ended & (over_balls[active] >= balls_per_over)
+        done = active[over_done]
+        over_scores[done, over[done]] = score[done]
+        over_wickets[done, over[done]] = wickets[done]
+        striker[done], non_striker[done] = non_striker[done], striker[done].copy()
+        over[done] += 1
+        over_balls[done] = 0
+        ended[over_done] = over[done] >= max_overs
+        active = active[~ended]
+
+    # Innings that finished early keep their final figures for later overs
+    unplayed = np.arange(max_overs) >= over[:, None]
+    over_scores[unplayed] = np.broadcast_to(score[:, None], unplayed.shape)[unplayed]
+    over_wickets[unplayed] = np.broadcast_to(wickets[:, None], unplayed.shape)[unplayed]
+    elapsed = time.perf_counter() - start
+
+    draws = None
+    if record_draws:
+        draws = [np.empty(count) for count in deliveries]
+        cursor = np.zeros(n, dtype=np.intp)
+        for rows, u in steps:
+            for row, value in zip(rows, u):
+                draws[row][cursor[row]] = value
+            cursor[rows] += 1
+    return KernelResult(score, wickets, balls, over_scores, over_wickets, elapsed, draws)
+
+
+class _FixedDraw:
+    """Stands in for an RNG that returns one given uniform."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def random(self):
+        return self.value
+
+
+def _kernel_delivery(kind, runs, bowler):
+    """The delivery the kernel models for a sampled outcome (run outs dismiss the striker)."""
+    if kind == 'bowled':
+        return Delivery(0, 'wicket', [bowler.name])
+    if kind == 'lbw':
+        return Delivery(0, 'wicket', ['lbw', bowler.name])
+    if kind == 'caught':
+        return Delivery(0, 'wicket', [(bowler.name, bowler.name, True)])
+    if kind == 'run out':
+        return Delivery(runs, 'run out', [bowler.name, 0, runs], runs % 2 == 1)
+    return Delivery(runs, kind, [], kind in ('bye', 'leg bye') and runs % 2 == 1)
+
+
+def replay_draws(draws, format_key='T20', distributions=None, target=None, overs=None, format_config=None):
+    """
+    Score one innings through MatchState using the kernel's uniforms.
+
+    Returns:
+        The finished MatchState
+    """
+    format_config = dict(format_config or CRICKET_FORMATS[format_key])
+    format_config['max_overs'] = _innings_overs(format_config, overs)
+    names = default_squad('Batter')
+    distributions = _positions(distributions)
+    profiles = PlayerProfiles(batters=dict(zip(names, distributions)))
+    state = MatchState(
+        build_team('Batting XI', names), build_team('Bowling XI', default_squad('Bowler')),
+        format_config, target=target
+    )
+    for u in draws:
+        bowler = state.current_bowler()
+        kind, runs = profiles.outcome_for(state.current_batters[0], bowler).sample(_FixedDraw(u))
+        state.apply(_kernel_delivery(kind, runs, bowler))
+    if not state.finished:
+        raise RuntimeError("Scalar innings didn't finish on the kernel's draws")
+    return state
+
+
+def cross_check(n=50, format_key='T20', distributions=None, seed=0, target=None, overs=None):
+    """
+    Run the kernel on a small batch and replay every innings through MatchState.
+
+    Returns:
+        List of (innings index, kernel figures, scalar figures) for each
+        mismatch, where figures are (score, wickets, legal balls, over scores);
+        empty when they agree
+    """
+    result = simulate_batch(n, format_key, distributions, seed, target, overs, record_draws=True)
+    mismatches = []
+    for i in range(n):
+        state = replay_draws(result.draws[i], format_key, distributions, target, overs)
+        innings = state.innings
+        completed = len(innings.cumulative_runs)
+        kernel = (int(result.scores[i]), int(result.wickets[i]), int(result.balls[i]),
+                  [int(s) for s in result.over_scores[i, :completed]])
+        scalar = (innings.get_score()[0], state.wickets, innings.legal_ball_count(), list(innings.cumulative_runs))
+        if kernel != scalar:
+            mismatches.append((i, kernel, scalar))
+    return mismatches
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo innings simulator built on the scoring engine.
+
+Each delivery's outcome is drawn from the striker's and bowler's outcome
+distributions and scored through MatchState, so simulated innings go
+through exactly the same rules as scored ones. Simulations are split into
+chunks with seeds derived from the master seed, which makes the results
+identical however many worker processes run them.
+
+Usage:
+    python -m scorecard_generator.simulator [--format T20] [-n 10000] [--workers N] [--seed 0] [--target RUNS]
+    python -m scorecard_generator.simulator --vectorised -n 1000000   # numpy kernel, see sim_kernel.py
+"""
+
+import argparse
+import os
+import random
+import time
+from array import array
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+from .models import Player, Team, CRICKET_FORMATS
+from .engine import Delivery, MatchState
+
+# (kind, runs, weight) for an average delivery
+DEFAULT_OUTCOMES = (
+    ('normal', 0, 34), ('normal', 1, 30), ('normal', 2, 8), ('normal', 3, 1),
+    ('normal', 4, 11), ('normal', 6, 4),
+    ('wide', 1, 3), ('no ball', 1, 1), ('bye', 1, 1), ('leg bye', 1, 2),
+    ('bowled', 0, 1), ('caught', 0, 2), ('lbw', 0, 1), ('run out', 1, 0.5),
+)
+WICKET_KINDS = ('bowled', 'caught', 'lbw')
+DEFAULT_CHUNK_SIZE = 500
+
+
+class OutcomeDistribution:
+    """
+    Weighted delivery outcomes, sampled by bisecting cumulative weights.
+
+    Args:
+        outcomes: Iterable of (kind, runs, weight). kind is 'normal', 'wide',
+                  'no ball', 'bye', 'leg bye', 'run out' or a wicket kind
+                  ('bowled', 'caught', 'lbw')
+    """
+    def __init__(self, outcomes=DEFAULT_OUTCOMES):
+        outcomes = [(kind, runs, weight) for kind, runs, weight in outcomes if weight > 0]
+        if not outcomes:
+            raise ValueError("Outcome distribution needs at least one positive weight")
+        self.outcomes = [(kind, runs) for kind, runs, _ in outcomes]
+        self.weights = [weight for _, _, weight in outcomes]
+        self.cum_weights = list(accumulate(self.weights))
+        self.total = self.cum_weights[-1]
+
+    def sample(self, rng):
+        """Draw one (kind, runs); rng is a random.Random or numpy Generator."""
+        return self.outcomes[bisect(self.cum_weights, rng.random() * self.total)]
+
+    def probabilities(self):
+        """Dict of (kind, runs) -> probability."""
+        probs = {}
+        for outcome, weight in zip(self.outcomes, self.weights):
+            probs[outcome] = probs.get(outcome, 0.0) + weight / self.total
+        return probs
+
+    def blend(self, other):
+        """Equal mix of this distribution and another, each normalised first."""
+        mixed = {}
+        for dist in (self, other):
+            for outcome, p in dist.probabilities().items():
+                mixed[outcome] = mixed.get(outcome, 0.0) + p / 2
+        return OutcomeDistribution((kind, runs, p) for (kind, runs), p in mixed.items())
+
+
+class PlayerProfiles:
+    """
+    Outcome distributions per player.
+
+    A delivery uses the striker's distribution blended with the bowler's;
+    players without a profile fall back to the default.
+
+    Args:
+        default: OutcomeDistribution for players without a profile
+        batters: Dict of batter name -> OutcomeDistribution
+        bowlers: Dict of bowler name -> OutcomeDistribution
+    """
+    def __init__(self, default=None, batters=None, bowlers=None):
+        self.default = default or OutcomeDistribution()
+        self.batters = batters or {}
+        self.bowlers = bowlers or {}
+        self._pairs = {}
+
+    def outcome_for(self, batter, bowler):
+        """OutcomeDistribution for a batter facing a bowler (cached per pair)."""
+        key = (batter.name, bowler.name)
+        dist = self._pairs.get(key)
+        if dist is None:
+            bat = self.batters.get(batter.name)
+            bowl = self.bowlers.get(bowler.name)
+            if bat and bowl:
+                dist = bat.blend(bowl)
+            else:
+                dist = bat or bowl or self.default
+            self._pairs[key] = dist
+        return dist
+
+    def __getstate__(self):
+        # The pair cache is rebuilt in each worker
+        state = self.__dict__.copy()
+        state['_pairs'] = {}
+        return state
+
+
+def make_delivery(kind, runs, bowler, bowling_team, rng):
+    """Turn a sampled (kind, runs) into the Delivery MatchState expects."""
+    if kind == 'bowled':
+        return Delivery(0, 'wicket', [bowler.name])
+    if kind == 'lbw':
+        return Delivery(0, 'wicket', ['lbw', bowler.name])
+    if kind == 'caught':
+        fielder = bowling_team.players[bowling_team.order[int(rng.random() * len(bowling_team.order))]]
+        return Delivery(0, 'wicket', [(fielder.name, bowler.name, fielder is bowler)])
+    if kind == 'run out':
+        fielder = bowling_team.players[bowling_team.order[int(rng.random() * len(bowling_team.order))]]
+        out_batter_idx = int(rng.random() * 2)
+        return Delivery(runs, 'run out', [fielder.name, out_batter_idx, runs], runs % 2 == 1)
+    return Delivery(runs, kind, [], kind in ('bye', 'leg bye') and runs % 2 == 1)
+
+
+def build_team(name, player_names):
+    """A Team with players numbered 1..n in batting order."""
+    team = Team(name)
+    for number, player_name in enumerate(player_names, 1):
+        team.add_player(Player(number, player_name))
+    team.order = list(range(1, len(player_names) + 1))
+    return team
+
+
+def default_squad(team_name):
+    return [f"{team_name} {i}" for i in range(1, 12)]
+
+
+def simulate_innings(batting_team, bowling_team, format_config, profiles, rng, target=None, strategy=None):
+    """
+    Simulate one innings through MatchState without printing.
+
+    Returns:
+        The finished MatchState
+    """
+    state = MatchState(batting_team, bowling_team, format_config, strategy=strategy, target=target)
+    while not state.finished:
+        bowler = state.current_bowler()
+        kind, runs = profiles.outcome_for(state.current_batters[0], bowler).sample(rng)
+        state.apply(make_delivery(kind, runs, bowler, bowling_team, rng))
+    return state
+
+
+def chunk_seeds(seed, chunks):
+    """Deterministic, well-spread seeds for each chunk of simulations."""
+    seeder = random.Random(seed)
+    return [seeder.getrandbits(64) for _ in range(chunks)]
+
+
+def _run_chunk(args):
+    """Run one chunk of simulations (top-level so worker processes can pickle it)."""
+    count, seed, batting, bowling, format_config, profiles, target = args
+    rng = random.Random(seed)
+    scores, wickets, balls = array('H'), array('B'), array('H')
+    for _ in range(count):
+        # Stats accumulate on Player objects, so every innings gets fresh teams
+        state = simulate_innings(
+            build_team(batting[0], batting[1]), build_team(bowling[0], bowling[1]),
+            format_config, profiles, rng, target=target
+        )
+        scores.append(state.innings.get_score()[0])
+        wickets.append(state.wickets)
+        balls.append(state.innings.legal_ball_count())
+    return scores, wickets, balls
+
+
+class SimulationResult:
+    """Scores, wickets and legal balls of every simulated innings."""
+    def __init__(self, scores, wickets, balls, elapsed, workers):
+        self.scores = scores
+        self.wickets = wickets
+        self.balls = balls
+        self.elapsed = elapsed
+        self.workers = workers
+
+    @property
+    def simulations(self):
+        return len(self.scores)
+
+    @property
+    def sims_per_sec(self):
+        return self.simulations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def mean_score(self):
+        return sum(self.scores) / len(self.scores) if self.scores else 0.0
+
+    def percentile(self, p):
+        """Score at percentile p (0-100), nearest rank."""
+        if not self.scores:
+            return 0
+        ordered = sorted(self.scores)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    def chase_probability(self, target):
+        """Fraction of innings reaching target runs."""
+        if not self.scores:
+            return 0.0
+        return sum(1 for score in self.scores if score >= target) / len(self.scores)
+
+
+def simulate(n, format_key='T20', seed=0, workers=1, profiles=None, batting=None, bowling=None,
+             target=None, chunk_size=DEFAULT_CHUNK_SIZE, format_config=None):
+    """
+    Simulate n innings, optionally across a process pool.
+
+    Args:
+        n: Number of innings to simulate
+        format_key: Key of CRICKET_FORMATS (ignored if format_config is given)
+        seed: Master seed; results depend only on it and chunk_size, not on workers
+        workers: Worker processes (1 runs in this process, None uses every CPU)
+        profiles: PlayerProfiles (default: DEFAULT_OUTCOMES for everyone)
+        batting: (team name, list of player names) for the batting side
+        bowling: (team name, list of player names) for the bowling side
+        target: Runs to chase, or None for a first innings
+        chunk_size: Innings per task sent to a worker
+
+    Returns:
+        SimulationResult
+    """
+    format_config = format_config or CRICKET_FORMATS[format_key]
+    profiles = profiles or PlayerProfiles()
+    batting = batting or ('Batting XI', default_squad('Batter'))
+    bowling = bowling or ('Bowling XI', default_squad('Bowler'))
+    counts = [chunk_size] * (n // chunk_size)
+    if n % chunk_size:
+        counts.append(n % chunk_size)
+    tasks = [
+        (count, chunk_seed, batting, bowling, format_config, profiles, target)
+        for count, chunk_seed in zip(counts, chunk_seeds(seed, len(counts)))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    scores, wickets, balls = array('H'), array('B'), array('H')
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        chunks = map(_run_chunk, tasks)
+        used = 1
+    else:
+        used = min(workers, len(tasks))
+        executor = ProcessPoolExecutor(max_workers=used)
+        chunks = executor.map(_run_chunk, tasks)
+    try:
+        for chunk_scores, chunk_wickets, chunk_balls in chunks:
+            scores.extend(chunk_scores)
+            wickets.extend(chunk_wickets)
+            balls.extend(chunk_balls)
+    finally:
+        if used > 1:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+    return SimulationResult(scores, wickets, balls, elapsed, used)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo innings simulator')
+    parser.add_argument('--format', default='T20', choices=sorted(CRICKET_FORMATS), help='Match format')
+    parser.add_argument('-n', '--simulations', type=int, default=10000, help='Innings to simulate')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all CPUs)')
+    parser.add_argument('--seed', type=int, default=0, help='Master RNG seed')
+    parser.add_argument('--target', type=int, default=None, help='Runs to chase')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Innings per worker task')
+    parser.add_argument('--vectorised', action='store_true', help='Use the numpy batch kernel')
+    parser.add_argument('--overs', type=int, default=None, help='Overs per innings (needed for TEST with --vectorised)')
+    args = parser.parse_args()
+    if args.vectorised and args.overs is None and CRICKET_FORMATS[args.format]['max_overs'] is None:
+        parser.error(f"--vectorised needs --overs for {args.format}, which has no over limit")
+
+    if args.vectorised:
+        from .sim_kernel import simulate_batch
+        result = simulate_batch(args.simulations, args.format, seed=args.seed, target=args.target, overs=args.overs)
+        print(f"Simulated {result.simulations} {args.format} innings in {result.elapsed:.2f}s "
+              f"with the numpy kernel: {result.sims_per_sec:,.0f} sims/sec")
+        low, median, high = result.quantiles_by_over()[:, -1]
+        print(f"Mean score: {result.scores.mean():.1f}  (10th/50th/90th percentile: {low:.0f}/{median:.0f}/{high:.0f})")
+        if args.target is not None:
+            print(f"Chase of {args.target} succeeded in {(result.scores >= args.target).mean():.1%} of innings")
+        return
+
+    result = simulate(
+        args.simulations, args.format, seed=args.seed, workers=args.workers,
+        target=args.target, chunk_size=args.chunk_size
+    )
+    print(f"Simulated {result.simulations} {args.format} innings in {result.elapsed:.2f}s "
+          f"on {result.workers} worker(s): {result.sims_per_sec:,.0f} sims/sec")
+    print(f"Mean score: {result.mean_score():.1f}  "
+          f"(10th/50th/90th percentile: {result.percentile(10)}/{result.percentile(50)}/{result.percentile(90)})")
+    if args.target is not None:
+        print(f"Chase of {args.target} succeeded in {result.chase_probability(args.target):.1%} of innings")
+
+
+if __name__ == '__main__':
+    main()
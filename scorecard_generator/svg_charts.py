@@ -0,0 +1,196 @@
+"""Inline SVG match charts.
+
+Lightweight stand-ins for the Plotly charts in match_report_html: the
+Manhattan, worm and run-rate charts drawn as plain SVG from the same
+series (generate_manhattan_data, generate_worm_data,
+generate_runrate_data and generate_win_probability_data, read from the
+innings' memoized stats snapshot). They need no third-party package and no
+JavaScript, so reports using them render anywhere, including offline.
+"""
+
+import math
+
+from .html_template import escape
+from .match_stats import innings_stats
+
+WIDTH = 800
+HEIGHT = 400
+MARGIN_LEFT = 56
+MARGIN_RIGHT = 24
+MARGIN_RIGHT_SECONDARY = 56  # Room for a right-hand axis
+MARGIN_TOP = 48
+MARGIN_BOTTOM = 72
+COLOURS = ('#1f77b4', '#ff7f0e')
+WIN_PROBABILITY_COLOUR = '#2ca02c'
+MAX_X_LABELS = 20
+
+
+def _ticks(maximum, count=5):
+    """Evenly spaced round tick values from 0 to at least maximum."""
+    if maximum <= 0:
+        return [0, 1]
+    raw = maximum / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    return [i * step for i in range(math.ceil(maximum / step - 1e-9) + 1)]
+
+
+def _number(value):
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+
+class _Frame:
+    """Plot area, axes, title and legend shared by every chart."""
+
+    def __init__(self, chart_id, title, x_title, y_title, x_max, y_max, secondary=None):
+        self.right = WIDTH - (MARGIN_RIGHT_SECONDARY if secondary else MARGIN_RIGHT)
+        self.bottom = HEIGHT - MARGIN_BOTTOM
+        self.x_max = max(x_max, 1)
+        self.y_ticks = _ticks(y_max)
+        self.y_top = self.y_ticks[-1]
+        self.parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" id="{chart_id}" viewBox="0 0 {WIDTH} {HEIGHT}" '
+            f'width="100%" role="img" font-family="sans-serif" font-size="12" fill="#444">',
+            f'<title>{title}</title>',
+            f'<text x="{WIDTH // 2}" y="24" text-anchor="middle" font-size="16">{title}</text>',
+        ]
+        for tick in self.y_ticks:
+            y = self.y(tick)
+            self.parts.append(f'<line x1="{MARGIN_LEFT}" y1="{y:.1f}" x2="{self.right}" y2="{y:.1f}" stroke="#e5e5e5"/>')
+            self.parts.append(f'<text x="{MARGIN_LEFT - 6}" y="{y + 4:.1f}" text-anchor="end">{_number(tick)}</text>')
+        if secondary:
+            for percent in range(0, 101, 20):
+                y = self.bottom - percent / 100 * (self.bottom - MARGIN_TOP)
+                self.parts.append(f'<text x="{self.right + 6}" y="{y + 4:.1f}">{percent}</text>')
+            self.parts.append(
+                f'<text transform="translate({WIDTH - 12},{(MARGIN_TOP + self.bottom) // 2}) rotate(90)" '
+                f'text-anchor="middle">{secondary}</text>')
+        self.parts.append(
+            f'<line x1="{MARGIN_LEFT}" y1="{self.bottom}" x2="{self.right}" y2="{self.bottom}" stroke="#888"/>')
+        self.parts.append(
+            f'<text x="{(MARGIN_LEFT + self.right) // 2}" y="{self.bottom + 36}" text-anchor="middle">{x_title}</text>')
+        self.parts.append(
+            f'<text transform="translate(16,{(MARGIN_TOP + self.bottom) // 2}) rotate(-90)" '
+            f'text-anchor="middle">{y_title}</text>')
+
+    def y(self, value):
+        return self.bottom - value / self.y_top * (self.bottom - MARGIN_TOP)
+
+    def x_labels(self, positions):
+        """Label overs 1..x_max at the x positions given by positions(over)."""
+        step = math.ceil(self.x_max / MAX_X_LABELS)
+        for over in range(step, self.x_max + 1, step):
+            self.parts.append(f'<text x="{positions(over):.1f}" y="{self.bottom + 16}" text-anchor="middle">{over}</text>')
+
+    def legend(self, entries):
+        """entries: (label, colour, dashed) tuples, laid out left to right under the x axis."""
+        x = MARGIN_LEFT
+        y = HEIGHT - 12
+        for label, colour, dashed in entries:
+            dash = ' stroke-dasharray="4 3"' if dashed else ''
+            self.parts.append(f'<line x1="{x}" y1="{y - 4}" x2="{x + 20}" y2="{y - 4}" stroke="{colour}" '
+                              f'stroke-width="3"{dash}/>')
+            self.parts.append(f'<text x="{x + 26}" y="{y}">{label}</text>')
+            x += 40 + 7 * len(label)
+
+    def line(self, points, colour, width=3, dashed=False, markers=True):
+        if not points:
+            return
+        dash = ' stroke-dasharray="4 3"' if dashed else ''
+        coordinates = ' '.join(f'{x:.1f},{y:.1f}' for x, y in points)
+        self.parts.append(f'<polyline fill="none" stroke="{colour}" stroke-width="{width}"{dash} points="{coordinates}"/>')
+        if markers:
+            self.parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{colour}"/>' for x, y in points)
+
+    def svg(self):
+        self.parts.append('</svg>')
+        return '\n'.join(self.parts)
+
+
+def generate_manhattan_svg(innings1, innings2, team1_name, team2_name):
+    """Manhattan chart (runs per over) as inline SVG.
+
+    Args:
+        innings1, innings2: Innings objects
+        team1_name, team2_name: Team names
+
+    Returns:
+        SVG markup string
+    """
+    series = (innings_stats(innings1).manhattan, innings_stats(innings2).manhattan)
+    names = (escape(team1_name), escape(team2_name))
+    overs = max(len(series[0]), len(series[1]))
+    frame = _Frame('manhattan_chart', 'Manhattan Chart - Runs Per Over', 'Over', 'Runs',
+                   overs, max(max(series[0], default=0), max(series[1], default=0)))
+    band = (frame.right - MARGIN_LEFT) / frame.x_max
+    bar = band * 0.4
+    for index, (runs_per_over, name, colour) in enumerate(zip(series, names, COLOURS)):
+        for over, runs in enumerate(runs_per_over):
+            x = MARGIN_LEFT + over * band + band * 0.1 + index * bar
+            y = frame.y(runs)
+            frame.parts.append(
+                f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar:.1f}" height="{frame.bottom - y:.1f}" fill="{colour}">'
+                f'<title>{name}: over {over + 1}, {runs} runs</title></rect>')
+    frame.x_labels(lambda over: MARGIN_LEFT + (over - 0.5) * band)
+    frame.legend([(names[0], COLOURS[0], False), (names[1], COLOURS[1], False)])
+    return frame.svg()
+
+
+def _over_lines(chart_id, title, y_title, series, names, win_probability=None):
+    overs = max(len(series[0]), len(series[1]))
+    win_overs, win_percent = win_probability or ((), ())
+    if win_overs:
+        overs = max(overs, math.ceil(win_overs[-1]))
+    frame = _Frame(chart_id, title, 'Over', y_title, overs,
+                   max(max(series[0], default=0), max(series[1], default=0)),
+                   secondary='Win Probability (%)' if win_overs else None)
+    width = frame.right - MARGIN_LEFT
+
+    def x_of(over):
+        return MARGIN_LEFT + over / frame.x_max * width
+
+    for values, colour in zip(series, COLOURS):
+        frame.line([(x_of(over), frame.y(value)) for over, value in enumerate(values, 1)], colour)
+    legend = [(names[0], COLOURS[0], False), (names[1], COLOURS[1], False)]
+    if win_overs:
+        top = frame.bottom - MARGIN_TOP
+        frame.line([(x_of(over), frame.bottom - percent / 100 * top) for over, percent in zip(win_overs, win_percent)],
+                   WIN_PROBABILITY_COLOUR, width=2, dashed=True, markers=False)
+        legend.append((f'{names[1]} win probability', WIN_PROBABILITY_COLOUR, True))
+    frame.x_labels(x_of)
+    frame.legend(legend)
+    return frame.svg()
+
+
+def generate_worm_svg(innings1, innings2, team1_name, team2_name):
+    """Worm chart (cumulative runs) as inline SVG.
+
+    Chase win probabilities recorded for the second innings are drawn
+    against a right-hand axis, as in the Plotly chart.
+
+    Args:
+        innings1, innings2: Innings objects
+        team1_name, team2_name: Team names
+
+    Returns:
+        SVG markup string
+    """
+    stats2 = innings_stats(innings2)
+    return _over_lines('worm_chart', 'Worm Chart - Cumulative Runs', 'Total Runs',
+                       (innings_stats(innings1).cumulative, stats2.cumulative),
+                       (escape(team1_name), escape(team2_name)), stats2.win_probability)
+
+
+def generate_runrate_svg(innings1, innings2, team1_name, team2_name):
+    """Run rate progression chart as inline SVG.
+
+    Args:
+        innings1, innings2: Innings objects
+        team1_name, team2_name: Team names
+
+    Returns:
+        SVG markup string
+    """
+    return _over_lines('runrate_chart', 'Run Rate Progression', 'Run Rate',
+                       (innings_stats(innings1).run_rates, innings_stats(innings2).run_rates),
+                       (escape(team1_name), escape(team2_name)))
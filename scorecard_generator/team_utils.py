@@ -38,8 +38,11 @@ def choose_team_xi(label):
             xi_file = xi_files[int(sel)-1]
             break
         print("Invalid selection.")
-    team_name = xi_file[:-7]
-    xi_path = os.path.join(os.path.dirname(__file__), "../teams", xi_file)
+    return load_team(xi_file[:-7])
+
+def load_team(team_name):
+    """Build a Team, with its batting order, captain and wicketkeeper, from teams/<team_name>_XI.csv."""
+    xi_path = os.path.join(os.path.dirname(__file__), "../teams", f"{team_name}_XI.csv")
     players, wicketkeeper_number, captain_number = load_xi(xi_path)
     team = Team(team_name)
     order = []
@@ -49,4 +52,4 @@ def choose_team_xi(label):
     team.order = order
     team.wicketkeeper_number = wicketkeeper_number
     team.captain_number = captain_number
-    return team
\ No newline at end of file
+    return team
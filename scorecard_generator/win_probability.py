@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Chase win-probability tables.
+
+For each format in CRICKET_FORMATS a table holds the probability that the
+chasing side wins from every (runs required, balls remaining, wickets in
+hand) state, assuming every delivery is drawn from the simulator's outcome
+distribution. Tables are solved exactly by dynamic programming over balls
+remaining, saved as a small binary file (16-bit fixed point) and looked up
+in O(1) during live scoring, replay and report generation.
+
+Solving a table takes seconds (more without numpy), so it is never done
+while scoring: build them once with the command below. Until a format's
+table has been built, chases in that format aren't given win probabilities.
+
+Usage:
+    python -m scorecard_generator.win_probability build [--formats T20 ODI TEST]
+    python -m scorecard_generator.win_probability lookup T20 RUNS BALLS WICKETS
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import sys
+import uuid
+from array import array
+
+from .models import CRICKET_FORMATS, BALLS_PER_OVER, _numpy
+from .simulator import DEFAULT_OUTCOMES, OutcomeDistribution, WICKET_KINDS
+
+TABLE_DIR = "scorecard_generator/exports/.cache"
+# Format key -> (largest runs required, largest balls remaining) stored
+TABLE_SHAPES = {
+    'T20': (300, 120),
+    'ODI': (500, 300),
+    'TEST': (600, 540),  # Unlimited overs: the table covers a 90-over day
+}
+WICKETS = 10
+SCALE = 65535
+MAGIC = b'WPT1'
+# magic, max runs, max balls, wickets, distribution digest
+HEADER = struct.Struct('<4sHHH16s')
+ILLEGAL_KINDS = ('wide', 'no ball')
+
+_tables = {}
+
+
+def distribution_digest(distribution):
+    """Digest identifying the outcome distribution a table was solved for."""
+    text = repr([(kind, runs, weight) for (kind, runs), weight in zip(distribution.outcomes, distribution.weights)])
+    return hashlib.sha256(text.encode()).digest()[:16]
+
+
+def ball_kernel(distribution, max_runs):
+    """
+    Distribution of (runs, wicket) over one legal ball, including any wides
+    and no balls bowled before it.
+
+    Returns:
+        dict of (runs, wicket) -> probability, runs capped at max_runs
+    """
+    illegal = [0.0] * (max_runs + 1)
+    legal = {}
+    total = distribution.total
+    for (kind, runs), weight in zip(distribution.outcomes, distribution.weights):
+        p = weight / total
+        if kind in ILLEGAL_KINDS:
+            illegal[min(runs, max_runs)] += p
+        else:
+            wicket = kind in WICKET_KINDS or kind == 'run out'
+            # Completed runs on a run out aren't credited to the total
+            credited = 0 if wicket else min(runs, max_runs)
+            legal[(credited, wicket)] = legal.get((credited, wicket), 0.0) + p
+    if illegal[0] >= 1.0 or not legal:
+        raise ValueError("Outcome distribution never completes a legal ball")
+
+    # before[k]: weight of the illegal deliveries before a legal ball adding k runs
+    before = [0.0] * (max_runs + 1)
+    for k in range(max_runs + 1):
+        carried = sum(illegal[j] * before[k - j] for j in range(1, k + 1))
+        before[k] = ((1.0 if k == 0 else 0.0) + carried) / (1.0 - illegal[0])
+
+    kernel = {}
+    for k, p_before in enumerate(before):
+        if p_before < 1e-12:
+            continue
+        for (runs, wicket), p in legal.items():
+            key = (min(k + runs, max_runs), wicket)
+            kernel[key] = kernel.get(key, 0.0) + p_before * p
+    return kernel
+
+
+def _solve_numpy(np, kernel, max_runs, max_balls):
+    table = np.zeros((max_balls + 1, max_runs + 1, WICKETS + 1))
+    table[:, 0, :] = 1.0
+    required = np.arange(1, max_runs + 1)
+    rows = {runs: np.maximum(required - runs, 0) for runs, _ in kernel}
+    for balls in range(1, max_balls + 1):
+        prev = table[balls - 1]
+        current = table[balls, 1:, 1:]
+        for (runs, wicket), p in kernel.items():
+            current += p * prev[rows[runs], 1 - wicket:WICKETS + 1 - wicket]
+    return table.ravel()
+
+
+def _solve_python(kernel, max_runs, max_balls):
+    width = WICKETS + 1
+    plane = (max_runs + 1) * width
+    table = [0.0] * ((max_balls + 1) * plane)
+    for balls in range(max_balls + 1):
+        for wickets in range(width):
+            table[balls * plane + wickets] = 1.0
+    terms = list(kernel.items())
+    for balls in range(1, max_balls + 1):
+        prev = (balls - 1) * plane
+        base = balls * plane
+        for required in range(1, max_runs + 1):
+            for wickets in range(1, width):
+                value = 0.0
+                for (runs, wicket), p in terms:
+                    value += p * table[prev + max(required - runs, 0) * width + wickets - wicket]
+                table[base + required * width + wickets] = value
+    return table
+
+
+class WinProbabilityTable:
+    """
+    Probability of a successful chase by (runs required, balls remaining, wickets in hand).
+
+    Args:
+        max_runs: Largest runs required stored
+        max_balls: Largest balls remaining stored
+        data: array('H') of probabilities scaled by 65535, indexed
+              [balls][runs][wickets]
+        digest: distribution_digest() of the outcomes the table was solved for
+    """
+    def __init__(self, max_runs, max_balls, data, digest=b'\0' * 16):
+        self.max_runs = max_runs
+        self.max_balls = max_balls
+        self.data = data
+        self.digest = digest
+        self._plane = (max_runs + 1) * (WICKETS + 1)
+
+    @classmethod
+    def build(cls, format_key='T20', distribution=None, max_runs=None, max_balls=None):
+        """Solve the table for a format (uses numpy when installed)."""
+        distribution = distribution or OutcomeDistribution(DEFAULT_OUTCOMES)
+        default_runs, default_balls = TABLE_SHAPES[format_key]
+        max_runs = max_runs or default_runs
+        max_balls = max_balls or default_balls
+        kernel = ball_kernel(distribution, max_runs)
+        np = _numpy()
+        if np is not None:
+            values = _solve_numpy(np, kernel, max_runs, max_balls)
+            data = array('H', np.rint(np.clip(values, 0.0, 1.0) * SCALE).astype(np.uint16).tobytes())
+        else:
+            values = _solve_python(kernel, max_runs, max_balls)
+            data = array('H', (round(min(max(v, 0.0), 1.0) * SCALE) for v in values))
+        return cls(max_runs, max_balls, data, distribution_digest(distribution))
+
+    def lookup(self, runs_required, balls_remaining, wickets_in_hand):
+        """
+        Win probability for the chasing side.
+
+        States beyond the table are clamped to its edge (more runs or balls
+        than stored read as the largest stored value).
+        """
+        if runs_required <= 0:
+            return 1.0
+        if balls_remaining <= 0 or wickets_in_hand <= 0:
+            return 0.0
+        runs = min(runs_required, self.max_runs)
+        balls = min(balls_remaining, self.max_balls)
+        wickets = min(wickets_in_hand, WICKETS)
+        return self.data[balls * self._plane + runs * (WICKETS + 1) + wickets] / SCALE
+
+    def save(self, path):
+        """Write the table atomically as a header plus little-endian uint16s."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = self.data
+        if sys.byteorder != 'little':
+            data = array('H', data)
+            data.byteswap()
+        # Unique per writer, so processes saving the same table don't collide
+        tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, self.max_runs, self.max_balls, WICKETS, self.digest))
+                data.tofile(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """Read a table written by save(); raises ValueError if the file isn't one."""
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"{path} is not a win-probability table")
+            magic, max_runs, max_balls, wickets, digest = HEADER.unpack(header)
+            if magic != MAGIC or wickets != WICKETS:
+                raise ValueError(f"{path} is not a win-probability table")
+            data = array('H')
+            count = (max_balls + 1) * (max_runs + 1) * (WICKETS + 1)
+            try:
+                data.fromfile(f, count)
+            except EOFError:
+                raise ValueError(f"{path} is truncated")
+        if sys.byteorder != 'little':
+            data.byteswap()
+        return cls(max_runs, max_balls, data, digest)
+
+
+def table_path(format_key, directory=None):
+    return os.path.join(directory or TABLE_DIR, f"win_probability_{format_key}.bin")
+
+
+def get_table(format_key, directory=None):
+    """
+    The saved default-distribution table for a format, loaded once per process.
+
+    Never builds one (see build_table), so it's cheap to call while scoring.
+
+    Returns:
+        WinProbabilityTable, or None if the file is missing, stale or unreadable
+    """
+    if format_key in _tables:
+        return _tables[format_key]
+    path = table_path(format_key, directory)
+    digest = distribution_digest(OutcomeDistribution(DEFAULT_OUTCOMES))
+    try:
+        table = WinProbabilityTable.load(path)
+        if table.digest != digest:
+            table = None
+    except (OSError, ValueError):
+        table = None
+    _tables[format_key] = table
+    return table
+
+
+def build_table(format_key, directory=None):
+    """Solve and save the default-distribution table for a format; returns it."""
+    table = WinProbabilityTable.build(format_key)
+    table.save(table_path(format_key, directory))
+    _tables[format_key] = table
+    return table
+
+
+def format_key_for(format_config):
+    """CRICKET_FORMATS key whose table suits a format config (custom formats go by length)."""
+    for key, config in CRICKET_FORMATS.items():
+        if config['name'] == format_config.get('name'):
+            return key
+    max_overs = format_config.get('max_overs')
+    if max_overs is None:
+        return 'TEST'
+    return 'T20' if max_overs <= 20 else 'ODI' if max_overs <= 50 else 'TEST'
+
+
+def balls_remaining(format_config, legal_balls):
+    """Legal balls left in the innings, or None for unlimited overs."""
+    if format_config.get('max_overs') is None:
+        return None
+    return format_config['max_overs'] * format_config.get('balls_per_over', BALLS_PER_OVER) - legal_balls
+
+
+def table_available(format_config):
+    """Whether chases in this format can be given win probabilities (its table has been built)."""
+    return get_table(format_key_for(format_config)) is not None
+
+
+def chase_probability(format_config, target, score, wickets, legal_balls):
+    """Win probability for a side chasing target, at score/wickets after legal_balls balls.
+
+    None if the format's table hasn't been built.
+    """
+    table = get_table(format_key_for(format_config))
+    if table is None:
+        return None
+    remaining = balls_remaining(format_config, legal_balls)
+    if remaining is None:
+        remaining = table.max_balls
+    return table.lookup(target - score, remaining, WICKETS - wickets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Chase win-probability tables')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='Solve and save the tables')
+    build.add_argument('--formats', nargs='+', default=list(TABLE_SHAPES), choices=list(TABLE_SHAPES))
+    build.add_argument('--directory', default=None, help=f'Default: {TABLE_DIR}')
+    lookup = subparsers.add_parser('lookup', help='Look up one state')
+    lookup.add_argument('format', choices=list(TABLE_SHAPES))
+    lookup.add_argument('runs', type=int, help='Runs required')
+    lookup.add_argument('balls', type=int, help='Balls remaining')
+    lookup.add_argument('wickets', type=int, help='Wickets in hand')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        for format_key in args.formats:
+            build_table(format_key, args.directory)
+            path = table_path(format_key, args.directory)
+            print(f"{format_key}: {os.path.getsize(path) / 1024:.0f} KB -> {path}")
+    else:
+        table = get_table(args.format)
+        if table is None:
+            parser.error(f"No {args.format} table in {TABLE_DIR}; run the build command first")
+        p = table.lookup(args.runs, args.balls, args.wickets)
+        print(f"{args.runs} needed from {args.balls} balls with {args.wickets} wickets in hand: {p:.1%}")
+
+
+if __name__ == '__main__':
+    main()
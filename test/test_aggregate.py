@@ -0,0 +1,104 @@
+"""Tests for multi-match stat aggregation and leaderboards."""
+
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.aggregate import StatsAggregate, aggregate_matches
+from benchmarks.synthetic import write_cricsheet_match
+from cricsheet_replay.batch import replay_all_innings, aggregate_corpus
+
+
+def snapshot(aggregate):
+    """Comparable view of every accumulator in an aggregate."""
+    def fields(acc):
+        return tuple(getattr(acc, name) for name in acc.__slots__)
+    return (
+        aggregate.matches,
+        {name: fields(acc) for name, acc in aggregate.batting.items()},
+        {name: fields(acc) for name, acc in aggregate.bowling.items()},
+    )
+
+
+def write_corpus(directory, count=5):
+    for seed in range(count):
+        write_cricsheet_match(directory, 'T20', overs=6, seed=seed, match_id=str(910000 + seed))
+    return [replay_all_innings(os.path.join(directory, f"{910000 + seed}_info.csv"),
+                               os.path.join(directory, f"{910000 + seed}.csv"))[0] for seed in range(count)]
+
+
+def test_merge_is_associative():
+    """Any grouping of matches merges to the same totals."""
+    print("Testing associative merges...")
+    with tempfile.TemporaryDirectory() as tmp:
+        matches = write_corpus(tmp)
+    whole = aggregate_matches(matches)
+    parts = [aggregate_matches([m]) for m in matches]
+    left = ((parts[0] + parts[1]) + parts[2]) + (parts[3] + parts[4])
+    right = parts[4] + (parts[3] + (parts[2] + (parts[1] + parts[0])))
+    assert snapshot(whole) == snapshot(left) == snapshot(right)
+
+    runs = sum(innings.get_score()[0] - sum(innings.extras.values()) for m in matches for innings in m)
+    assert sum(acc.runs for acc in whole.batting.values()) == runs
+    assert all(acc.matches == 5 for acc in whole.batting.values() if acc.innings == 5)
+    print("  ✓ Merges agree")
+
+
+def test_super_overs_not_replayed():
+    """Innings after the second of a limited-overs match are super overs and are skipped."""
+    print("Testing super overs...")
+    with tempfile.TemporaryDirectory() as tmp:
+        info_path, ballbyball_path = write_cricsheet_match(tmp, 'T20', overs=2, seed=0, match_id='910100')
+        innings, _ = replay_all_innings(info_path, ballbyball_path)
+        with open(ballbyball_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        super_over = [row[:4] + [str(int(row[4]) + 2)] + row[5:] for row in rows[1:] if row[5].startswith('0.')]
+        with open(ballbyball_path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(super_over)
+        with_super_over, _ = replay_all_innings(info_path, ballbyball_path)
+    assert len(super_over) >= 12
+    assert len(with_super_over) == 2
+    assert [i.get_score() for i in with_super_over] == [i.get_score() for i in innings]
+    print("  ✓ Super overs skipped")
+
+
+def test_leaderboards():
+    """Heap leaderboards match a full sort, honour qualifiers and skip undefined stats."""
+    print("Testing leaderboards...")
+    with tempfile.TemporaryDirectory() as tmp:
+        aggregate = aggregate_matches(write_corpus(tmp))
+
+    expected = sorted(aggregate.batting.items(), key=lambda e: (-e[1].runs, e[0]))[:5]
+    assert aggregate.top_batters(5) == expected
+    economy = aggregate.top_bowlers(3, 'economy', lowest=True, min_balls=30)
+    assert all(acc.balls >= 30 for _, acc in economy)
+    assert [acc.economy for _, acc in economy] == sorted(acc.economy for _, acc in economy)
+    averages = aggregate.top_batters(50, 'average')
+    assert all(acc.dismissals > 0 for _, acc in averages)
+    assert StatsAggregate().top_bowlers(5) == []
+    print("  ✓ Leaderboards")
+
+
+def test_corpus_aggregation_in_workers():
+    """Worker-side folding gives the same tables as folding in one process."""
+    print("Testing corpus aggregation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        matches = write_corpus(tmp)
+        serial, failures = aggregate_corpus(tmp, workers=1)
+        pooled, _ = aggregate_corpus(tmp, workers=2, chunk_size=2)
+        seasons, _ = aggregate_corpus(tmp, workers=1, group_by='season')
+    assert failures == []
+    assert snapshot(serial) == snapshot(pooled) == snapshot(aggregate_matches(matches))
+    assert list(seasons) == ['2024'] and seasons['2024'].matches == 5
+    print("  ✓ Corpus aggregation")
+
+
+if __name__ == "__main__":
+    test_merge_is_associative()
+    test_super_overs_not_replayed()
+    test_leaderboards()
+    test_corpus_aggregation_in_workers()
+    print("\n✓ All aggregation tests passed")
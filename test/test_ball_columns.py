@@ -0,0 +1,85 @@
+"""Tests for the columnar BallColumns store behind Innings(columnar=True)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import models
+from scorecard_generator.models import Player, BallEvent, BallColumns, EventType
+from scorecard_generator.match_stats import calculate_innings_summary, format_scorecard_data
+from cricsheet_replay.replay import replay_match
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet'))
+INFO_PATH = os.path.join(FIXTURES, '1000001_info.csv')
+BBB_PATH = os.path.join(FIXTURES, '1000001.csv')
+
+
+def test_columns_round_trip_ball_events():
+    """Appended BallEvents come back unchanged as views."""
+    print("Testing BallColumns round trip...")
+    bowler, batter = Player(1, "Bowler"), Player(2, "Batter")
+    events = [
+        BallEvent(0, 1, bowler, batter, 4, "normal"),
+        BallEvent(0, 2, bowler, batter, 1, "wide"),
+        BallEvent(0, 2, bowler, batter, 1, "run out", ["Fielder", 0, 1]),
+        BallEvent(1, 1, bowler, "Old Name", 0, "runs"),
+    ]
+    columns = BallColumns(events)
+    assert len(columns) == 4
+    for original, view in zip(events, columns):
+        assert (view.over, view.ball, view.runs, view.event) == (original.over, original.ball, original.runs, original.event)
+        assert view.bowler is original.bowler and view.batter is original.batter
+    assert columns[2].fielders == ["Fielder", 0, 1]
+    assert columns[-1].batter == "Old Name"
+    assert [be.runs for be in columns[1:3]] == [1, 1]
+
+    assert columns[-1].event is EventType.NORMAL  # 'runs' is read as a normal delivery
+    print("  ✓ Views match the appended events")
+
+
+def test_reductions_with_and_without_numpy():
+    """Legal balls, dot balls and per-over runs agree on both code paths."""
+    print("Testing BallColumns reductions...")
+    bowler, batter = Player(1, "Bowler"), Player(2, "Batter")
+    deliveries = [
+        (0, 0, "normal"), (0, 2, "bye"), (0, 1, "wide"), (0, 0, "wicket"),
+        (0, 3, "no ball_runs"), (0, 0, "run out"), (0, 1, "leg bye"), (0, 2, "normal"),
+        (1, 0, "normal"), (1, 2, "wide_bye"), (1, 6, "normal"),
+    ]
+    columns = BallColumns(BallEvent(over, 1, bowler, batter, runs, event) for over, runs, event in deliveries)
+
+    expected = ((9, 6), 8, [9, 8])
+    original = models._numpy_module
+    try:
+        for module in (None, False):  # None: numpy if installed, False: pure Python
+            models._numpy_module = module
+            assert columns.dot_ball_counts() == expected[0]
+            assert columns.legal_count() == expected[1]
+            assert columns.runs_per_over() == expected[2]
+    finally:
+        models._numpy_module = original
+    print("  ✓ Reductions agree")
+
+
+def test_columnar_replay_matches_list_replay():
+    """A columnar replay gives the same scorecard and summary as the list store."""
+    print("Testing columnar Cricsheet replay...")
+    listed = replay_match(INFO_PATH, BBB_PATH)
+    columnar = replay_match(INFO_PATH, BBB_PATH, columnar=True)
+
+    for plain, packed in [(listed.innings1, columnar.innings1), (listed.innings2, columnar.innings2)]:
+        assert isinstance(packed.balls, BallColumns)
+        assert len(plain.balls) == len(packed.balls)
+        assert packed.legal_ball_count() == packed.balls.legal_count() == plain.legal_ball_count()
+        assert calculate_innings_summary(packed) == calculate_innings_summary(plain)
+        assert format_scorecard_data(packed)['overs'] == format_scorecard_data(plain)['overs']
+        assert packed.recompute_score()[:2] == plain.recompute_score()[:2]
+    print("  ✓ Columnar and list replays agree")
+
+
+if __name__ == "__main__":
+    test_columns_round_trip_ball_events()
+    test_reductions_with_and_without_numpy()
+    test_columnar_replay_matches_list_replay()
+    print("\n✓ All ball column tests passed")
@@ -0,0 +1,113 @@
+"""Tests for the parallel Cricsheet corpus replay in cricsheet_replay/batch.py."""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay import batch
+from cricsheet_replay.batch import find_match_files, replay_corpus
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet')
+
+
+def make_corpus(directory):
+    """Copy the fixture match twice, add a malformed pair and an orphan file."""
+    for match_id in ['1000001', '1000002']:
+        shutil.copy(os.path.join(FIXTURES, '1000001_info.csv'), os.path.join(directory, f'{match_id}_info.csv'))
+        shutil.copy(os.path.join(FIXTURES, '1000001.csv'), os.path.join(directory, f'{match_id}.csv'))
+    with open(os.path.join(directory, '1000003_info.csv'), 'w', encoding='utf-8') as f:
+        f.write("version,2.2.0\ninfo,team,England\n")
+    with open(os.path.join(directory, '1000003.csv'), 'w', encoding='utf-8') as f:
+        f.write("match_id,innings\n1000003,not-a-number\n")
+    with open(os.path.join(directory, '1000004_info.csv'), 'w', encoding='utf-8') as f:
+        f.write("version,2.2.0\n")
+    with open(os.path.join(directory, 'README.txt'), 'w', encoding='utf-8') as f:
+        f.write("not a match\n")
+
+
+def test_find_match_files_pairs_by_match_id():
+    """Info and ball-by-ball files are paired on the match id."""
+    print("Testing corpus file pairing...")
+    with tempfile.TemporaryDirectory() as tmp:
+        make_corpus(tmp)
+        match_files, unpaired = find_match_files(tmp)
+    assert [mf.match_id for mf in match_files] == ['1000001', '1000002', '1000003']
+    assert len(unpaired) == 1 and unpaired[0].endswith('1000004_info.csv')
+    print("  ✓ Files paired correctly")
+
+
+def test_replay_corpus_isolates_bad_matches():
+    """A malformed match is reported without stopping the others."""
+    print("Testing batch replay from a directory...")
+    with tempfile.TemporaryDirectory() as tmp:
+        make_corpus(tmp)
+        summary = replay_corpus(tmp, workers=2, progress_every=1, out=io.StringIO())
+
+    assert sorted(r.match_id for r in summary['results']) == ['1000001', '1000002']
+    assert [f.match_id for f in summary['failures']] == ['1000003']
+    assert summary['matches_per_second'] > 0
+
+    result = summary['results'][0]
+    assert len(result.innings) == 2
+    assert result.innings[0].batting_team.name == 'England'
+    assert result.innings[1].batting_team.name == 'India'
+    assert result.innings[0].get_score(verify=True)[1] == 3
+    print("  ✓ Bad match isolated, good matches replayed")
+
+
+def test_replay_corpus_from_zip():
+    """Matches are read straight from a zip archive."""
+    print("Testing batch replay from a zip archive...")
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus')
+        os.mkdir(corpus)
+        make_corpus(corpus)
+        archive_path = os.path.join(tmp, 'ashwin.zip')
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            for fname in os.listdir(corpus):
+                archive.write(os.path.join(corpus, fname), fname)
+        summary = replay_corpus(archive_path, workers=2, progress_every=0, out=None)
+
+    assert len(summary['results']) == 2
+    assert len(summary['failures']) == 1
+    print("  ✓ Zip archive replayed")
+
+
+def test_aggregate_exit_status():
+    """--aggregate exits 1 when every match failed, with or without --group-by."""
+    print("Testing --aggregate exit status...")
+
+    def exit_code(*args):
+        original_argv = sys.argv
+        sys.argv = ['batch.py', *args, '--aggregate', '--workers', '1']
+        try:
+            with redirect_stdout(io.StringIO()):
+                batch.main()
+        except SystemExit as e:
+            return e.code
+        finally:
+            sys.argv = original_argv
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_corpus(tmp)
+        assert exit_code(tmp) == 0
+        for match_id in ['1000001', '1000002']:
+            for suffix in ('_info.csv', '.csv'):
+                os.remove(os.path.join(tmp, match_id + suffix))
+        assert exit_code(tmp) == 1
+        assert exit_code(tmp, '--group-by', 'season') == 1
+    print("  ✓ All-failed corpus exits 1")
+
+
+if __name__ == "__main__":
+    test_find_match_files_pairs_by_match_id()
+    test_replay_corpus_isolates_bad_matches()
+    test_replay_corpus_from_zip()
+    test_aggregate_exit_status()
+    print("\n✓ All batch replay tests passed")
@@ -0,0 +1,64 @@
+"""Smoke tests for the benchmark suite in benchmarks/suite.py."""
+
+import copy
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import generate_match
+from benchmarks.suite import run_suite, compare
+
+EXPECTED_BENCHMARKS = {
+    'process_ball_event', 'get_score', 'replay_innings',
+    'export_all', 'generate_html_report', 'generate_markdown_report',
+}
+
+
+def test_synthetic_matches_are_deterministic():
+    """The same format, length and seed always give the same deliveries."""
+    print("Testing synthetic match generation...")
+    first = generate_match('TEST', overs=3, seed=7)
+    second = generate_match('TEST', overs=3, seed=7)
+    assert len(first) == 4
+    assert [(d.kind, d.runs) for _, _, ds in first for d in ds] == [(d.kind, d.runs) for _, _, ds in second for d in ds]
+    legal = [d for d in first[0][2] if d.kind not in ('wide', 'no ball')]
+    assert len(legal) == 18
+    print("  ✓ Synthetic matches deterministic")
+
+
+def test_run_suite_reports_every_benchmark():
+    """A short run times every hot path and records the machine."""
+    print("Testing benchmark suite run...")
+    report = run_suite(formats=['T20', 'TEST'], overs=2, repeat=1, out=io.StringIO())
+    names = {key.split('/', 1)[1] for key in report['results']}
+    assert names == EXPECTED_BENCHMARKS
+    assert {key.split('/', 1)[0] for key in report['results']} == {'T20', 'TEST'}
+    assert report['machine']['python']
+    assert all(result['best'] > 0 and result['ops'] > 0 for result in report['results'].values())
+    print("  ✓ All benchmarks reported")
+
+
+def test_compare_flags_regressions():
+    """compare marks slower benchmarks as regressions and new ones as new."""
+    print("Testing baseline comparison...")
+    baseline = {'results': {
+        'T20/get_score': {'best': 1.0, 'ops': 100},
+        'T20/export_all': {'best': 1.0, 'ops': 100},
+    }}
+    current = copy.deepcopy(baseline)
+    current['results']['T20/get_score']['best'] = 1.5
+    current['results']['T20/export_all']['best'] = 0.5
+    current['results']['ODI/get_score'] = {'best': 1.0, 'ops': 100}
+
+    statuses = {row[0]: row[4] for row in compare(baseline, current, threshold=0.1)}
+    assert statuses == {'T20/get_score': 'regression', 'T20/export_all': 'improved', 'ODI/get_score': 'new'}
+    print("  ✓ Regressions flagged")
+
+
+if __name__ == "__main__":
+    test_synthetic_matches_are_deterministic()
+    test_run_suite_reports_every_benchmark()
+    test_compare_flags_regressions()
+    print("\n✓ All benchmark suite tests passed")
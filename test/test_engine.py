@@ -0,0 +1,134 @@
+"""Tests for the prompt-free MatchState engine and its strategies."""
+
+import builtins
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import Player, Team, CRICKET_FORMATS
+from scorecard_generator.engine import BattingOrderStrategy, Delivery, MatchState
+from scorecard_generator.game_logic import play_innings
+from scorecard_generator.input_handlers import input_ball
+
+
+def make_teams():
+    batting = Team("Bat")
+    bowling = Team("Bowl")
+    for i in range(1, 12):
+        batting.add_player(Player(i, f"Batter {i}"))
+        bowling.add_player(Player(i, f"Bowler {i}"))
+    batting.order = list(range(1, 12))
+    bowling.order = list(range(1, 12))
+    return batting, bowling
+
+
+def no_input(prompt=''):
+    raise AssertionError(f"Engine prompted for input: {prompt!r}")
+
+
+def test_apply_runs_without_prompts():
+    """A full T20 innings scores with input() disabled."""
+    print("Testing MatchState without input()...")
+    batting, bowling = make_teams()
+    original_input = builtins.input
+    builtins.input = no_input
+    try:
+        state = MatchState(batting, bowling, CRICKET_FORMATS['T20'])
+        pattern = [Delivery(1, 'normal'), Delivery(0, 'normal'), Delivery(4, 'normal'),
+                   Delivery(1, 'wide'), Delivery(2, 'bye', swapped=False), Delivery(6, 'normal')]
+        while not state.finished:
+            state.apply(pattern[len(state.innings.balls) % len(pattern)])
+    finally:
+        builtins.input = original_input
+
+    innings = state.innings
+    assert state.over == 20 and not state.ended_early
+    assert innings.legal_ball_count() == 120
+    assert len(innings.over_totals) == 20
+    assert innings.cumulative_runs[-1] == innings.get_score()[0]
+    assert innings.current_partnership is None and len(innings.partnerships) == 1
+    assert all(len(overs) <= 4 for overs in state.bowler_overs.values())
+    print("  ✓ 20 overs scored without prompting")
+
+
+def test_wickets_use_strategy():
+    """Incoming batters come from the strategy and all out ends the innings early."""
+    print("Testing next batter strategy...")
+    batting, bowling = make_teams()
+
+    class LastFirst(BattingOrderStrategy):
+        def choose_next_batter(self, batting_team, candidates):
+            return candidates[-1]
+
+    state = MatchState(batting, bowling, CRICKET_FORMATS['T20'], strategy=LastFirst())
+    state.apply(Delivery(0, 'wicket', [state.current_bowler().name]))
+    assert state.current_batters[0].number == 11
+
+    while not state.finished:
+        state.apply(Delivery(0, 'wicket', [state.current_bowler().name]))
+    assert state.wickets == 10 and state.ended_early
+    assert len(state.innings.partnerships) == 10
+    print("  ✓ Strategy picks batters, all out ends early")
+
+
+def test_target_and_bowler_rotation():
+    """Reaching the target stops the innings; no bowler bowls consecutive overs."""
+    print("Testing target and bowler rotation...")
+    batting, bowling = make_teams()
+    state = MatchState(batting, bowling, CRICKET_FORMATS['ODI'], target=40)
+    bowlers = []
+    while not state.finished:
+        if state.legal_balls == 0:
+            bowlers.append(state.current_bowler().number)
+        state.apply(Delivery(1, 'normal', swapped=True))
+    assert state.target_reached and state.innings.get_score()[0] == 40
+    assert all(a != b for a, b in zip(bowlers, bowlers[1:]))
+    print("  ✓ Target reached, bowlers rotate")
+
+
+def test_input_ball_retries_without_recursion():
+    """Bad input is asked again in a loop, including non-numeric counts."""
+    print("Testing input_ball retry loop...")
+    batting, bowling = make_teams()
+    answers = iter(['x'] * 2000 + ['b', 'two', 'b', '2'])
+    original_input = builtins.input
+    builtins.input = lambda prompt='': next(answers)
+    try:
+        with redirect_stdout(io.StringIO()):
+            result = input_ball([batting.players[1], batting.players[2]], bowling.players[1], 0, 1, bowling)
+    finally:
+        builtins.input = original_input
+    assert result == (2, 'bye', [], False)
+    print("  ✓ 2000 bad inputs retried without RecursionError")
+
+
+def test_play_innings_interactive():
+    """play_innings drives MatchState with the interactive strategy."""
+    print("Testing play_innings...")
+    batting, bowling = make_teams()
+    config = {'name': 'Custom', 'max_overs': 1, 'max_bowler_overs': 1, 'balls_per_over': 6}
+    answers = iter(['1 2', '11', '1', '4', 'w', 'bowled', '1', '0', '0', '2'])
+    original_input = builtins.input
+    builtins.input = lambda prompt='': next(answers)
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            innings = play_innings(batting, bowling, config)
+    finally:
+        builtins.input = original_input
+    assert innings.get_score()[:2] == (7, 1)
+    assert batting.players[3].batted
+    assert "OVER FINISHED." in out.getvalue()
+    print("  ✓ Interactive innings scored")
+
+
+if __name__ == "__main__":
+    test_apply_runs_without_prompts()
+    test_wickets_use_strategy()
+    test_target_and_bowler_rotation()
+    test_input_ball_retries_without_recursion()
+    test_play_innings_interactive()
+    print("\n✓ All engine tests passed")
@@ -0,0 +1,62 @@
+"""Tests for the EventType taxonomy that replaced event string matching."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import BallEvent, EventType, Player
+
+
+def test_labels_round_trip():
+    """Every CSV label parses back to its member; unknown labels are rejected."""
+    print("Testing event labels...")
+    for event in EventType:
+        assert EventType.parse(event.label) is event
+        assert EventType.parse(int(event)) is event
+        assert str(event) == event.label
+    assert EventType.parse('runs') is EventType.NORMAL
+    try:
+        EventType.parse('dead ball')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown event labels should raise ValueError")
+    print("  ✓ Labels round trip")
+
+
+def test_properties_match_old_string_rules():
+    """The precomputed properties agree with the string matching they replaced."""
+    print("Testing event properties...")
+    for event in EventType:
+        label = event.label
+        assert event.is_legal == (not (label.startswith('wide') or label.startswith('no ball')))
+        assert event.is_wide == label.startswith('wide')
+        assert event.is_no_ball == label.startswith('no ball')
+        assert event.is_run_out == (label in ["run out", "bye_run_out", "leg_bye_run_out", "wide_run_out", "no ball_run_out"])
+        assert event.is_wicket == (event.is_run_out or label == 'wicket')
+
+    assert EventType.WIDE_BYE.extras == 'wides' and EventType.WIDE_BYE.runs_extras == 'byes'
+    assert EventType.NO_BALL_LEG_BYE.runs_extras == 'leg byes'
+    assert EventType.NO_BALL_RUNS.runs_extras is None
+    assert not EventType.LEG_BYE.counts_to_bowler
+    assert EventType.WIDE.bowler_runs(3) == 3
+    assert EventType.WIDE_BYE.bowler_runs(3) == 1
+    assert EventType.BYE.bowler_runs(2) == 0
+    print("  ✓ Properties match")
+
+
+def test_ball_event_stores_enum():
+    """BallEvent accepts string labels and keeps the EventType."""
+    print("Testing BallEvent event parsing...")
+    ball = BallEvent(0, 1, Player(1, "Bowler"), Player(2, "Batter"), 2, "no ball_bye")
+    assert ball.event is EventType.NO_BALL_BYE
+    assert not ball.event.is_legal
+    print("  ✓ BallEvent stores EventType")
+
+
+if __name__ == "__main__":
+    test_labels_round_trip()
+    test_properties_match_old_string_rules()
+    test_ball_event_stores_enum()
+    print("\n✓ All event type tests passed")
@@ -4,19 +4,25 @@ Test the export functionality to ensure correct formatting and innings ordering.
 import os
 import sys
 import csv
+import tempfile
+import threading
 from collections import defaultdict
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from scorecard_generator import scorecard_export
 from scorecard_generator.models import Player, Team, Innings, BallEvent
 from scorecard_generator.scorecard_export import (
+    EXPORT_ARTEFACTS,
     export_scorecard_csv,
     export_match_info_csv,
     export_ball_by_ball_csv,
     export_all,
     sanitize_filename,
-    get_export_filename
+    get_export_filename,
+    reserve_export_paths,
+    atomic_write
 )
 
 
@@ -82,8 +88,8 @@ def create_test_innings(batting_team, bowling_team):
     
     # Track bowler overs for accurate overs calculation
     innings.bowler_overs = {
-        "Bowler A": 6,
-        "Bowler B": 6
+        "Bowler A": [0],
+        "Bowler B": [1]
     }
     
     return innings
@@ -316,30 +322,143 @@ def test_export_all():
     innings1 = create_test_innings(team1, team2)
     innings2 = create_test_innings(team2, team1)
     
-    # Run export_all
-    export_all(team1, team2, innings1, innings2, "New Zealand wins by 6 wickets")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Run export_all twice: the second export must not overwrite the first
+        paths = export_all(team1, team2, innings1, innings2, "New Zealand wins by 6 wickets",
+                           match_date="2024-03-01", directory=tmp)
+        again = export_all(team1, team2, innings1, innings2, "New Zealand wins by 6 wickets",
+                           match_date="2024-03-01", directory=tmp)
+        assert paths.base == "New_ZealandvSouth_Africa_20240301_01"
+        assert again.base == "New_ZealandvSouth_Africa_20240301_02"
+        
+        # Check all 3 files were created for both exports
+        expected_files = [
+            export.path(kind) for export in (paths, again) for kind in ("scorecard", "info", "ballbyball")
+        ]
+        assert sorted(os.listdir(tmp)) == sorted(os.path.basename(path) for path in expected_files)
+        
+        for file_path in expected_files:
+            # Verify file has content
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                assert len(content) > 0, f"File {file_path} should not be empty"
     
-    # Check all 3 files were created
-    expected_files = [
-        "scorecard_generator/exports/New_ZealandvSouth_Africa_scorecard.csv",
-        "scorecard_generator/exports/New_ZealandvSouth_Africa_info.csv",
-        "scorecard_generator/exports/New_ZealandvSouth_Africa_ballbyball.csv"
-    ]
+    print("✓ export_all creates all 3 CSV files successfully")
+
+
+def test_export_selected_artefacts():
+    """export_all writes only the artefacts asked for, with the same rows as the single exporters."""
+    print("\nTesting export_all artefact selection...")
     
-    for file_path in expected_files:
-        assert os.path.exists(file_path), f"Expected file {file_path} was not created"
+    team1 = create_test_team("New Zealand")
+    team2 = create_test_team("South Africa")
+    innings1 = create_test_innings(team1, team2)
+    innings2 = create_test_innings(team2, team1)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = export_all(team1, team2, innings1, innings2, "Result", directory=tmp, artefacts=('ballbyball',))
+        assert os.listdir(tmp) == [os.path.basename(paths.path("ballbyball"))]
+        
+        single_file = os.path.join(tmp, "single.csv")
+        export_ball_by_ball_csv(single_file, team1, team2, innings1, innings2)
+        with open(paths.path("ballbyball"), encoding='utf-8') as f, open(single_file, encoding='utf-8') as g:
+            assert f.read() == g.read()
         
-        # Verify file has content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) > 0, f"File {file_path} should not be empty"
+        try:
+            export_all(team1, team2, innings1, innings2, "Result", directory=tmp, artefacts=('pdf',))
+            assert False, "Expected ValueError for an unknown artefact"
+        except ValueError:
+            pass
     
-    # Clean up
-    for file_path in expected_files:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    print("✓ Only the selected artefacts are written")
+
+
+def test_failed_export_releases_its_name():
+    """A failed export removes its placeholder, so the next export reuses the sequence number."""
+    print("\nTesting failed exports...")
     
-    print("✓ export_all creates all 3 CSV files successfully")
+    team1 = create_test_team("New Zealand")
+    team2 = create_test_team("South Africa")
+    innings1 = create_test_innings(team1, team2)
+    innings2 = create_test_innings(team2, team1)
+    
+    def fail(*args):
+        raise RuntimeError("disk full")
+    
+    original = scorecard_export.write_exports
+    with tempfile.TemporaryDirectory() as tmp:
+        # Placeholders are ordinary (non-executable) files
+        claimed = reserve_export_paths(team1, team2, directory=tmp).path("scorecard")
+        assert os.stat(claimed).st_mode & 0o111 == 0
+        os.remove(claimed)
+        
+        for per_match_dir in (False, True):
+            scorecard_export.write_exports = fail
+            try:
+                export_all(team1, team2, innings1, innings2, "Result", match_date="2024-03-01",
+                           per_match_dir=per_match_dir, directory=tmp)
+                assert False, "Expected the export to fail"
+            except RuntimeError:
+                pass
+            finally:
+                scorecard_export.write_exports = original
+            assert os.listdir(tmp) == []
+            paths = export_all(team1, team2, innings1, innings2, "Result", match_date="2024-03-01",
+                               per_match_dir=per_match_dir, directory=tmp)
+            assert paths.base.endswith("_01")
+            paths.discard(EXPORT_ARTEFACTS)
+            assert os.listdir(tmp) == []
+    
+    print("✓ Failed exports leave nothing behind")
+
+
+def test_reserve_export_paths():
+    """Concurrent reservations never share a name, in either layout."""
+    print("\nTesting export path reservation...")
+    
+    team1 = Team("England")
+    team2 = Team("India")
+    with tempfile.TemporaryDirectory() as tmp:
+        for per_match_dir in (False, True):
+            reserved = []
+            
+            def reserve():
+                for _ in range(10):
+                    reserved.append(reserve_export_paths(team1, team2, match_id=1432444, match_date="2024/01/01",
+                                                         per_match_dir=per_match_dir, directory=tmp))
+            
+            threads = [threading.Thread(target=reserve) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len({paths.path("scorecard") for paths in reserved}) == 40
+        
+        assert os.path.exists(os.path.join(tmp, "EnglandvIndia_20240101_1432444_01_scorecard.csv"))
+        assert os.path.isdir(os.path.join(tmp, "EnglandvIndia_20240101_1432444_40"))
+    
+    print("✓ Reserved export paths are unique")
+
+
+def test_atomic_write():
+    """A write that fails part way leaves the previous file untouched."""
+    print("\nTesting atomic writes...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scorecard.csv")
+        with atomic_write(path, newline='') as f:
+            f.write("complete\n")
+        try:
+            with atomic_write(path, newline='') as f:
+                f.write("partial")
+                raise RuntimeError("crash mid-write")
+        except RuntimeError:
+            pass
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == "complete\n"
+        assert os.listdir(tmp) == ["scorecard.csv"]
+    
+    print("✓ Failed writes leave no partial file")
 
 
 def run_all_tests():
@@ -355,6 +474,10 @@ def run_all_tests():
     test_match_info_csv_format()
     test_ball_by_ball_csv_format()
     test_export_all()
+    test_export_selected_artefacts()
+    test_failed_export_releases_its_name()
+    test_reserve_export_paths()
+    test_atomic_write()
     
     print("\n" + "="*70)
     print("ALL EXPORT TESTS PASSED ✓")
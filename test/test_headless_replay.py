@@ -0,0 +1,87 @@
+"""Tests for the non-interactive replay_match API and --headless CLI flag."""
+
+import builtins
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay import replay
+from cricsheet_replay.replay import replay_match, MatchResult
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet'))
+INFO_PATH = os.path.join(FIXTURES, '1000001_info.csv')
+BBB_PATH = os.path.join(FIXTURES, '1000001.csv')
+
+
+def test_replay_match_is_silent():
+    """verbose=False prints nothing and returns both innings plus metadata."""
+    print("Testing silent replay_match...")
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = replay_match(INFO_PATH, BBB_PATH)
+    assert buffer.getvalue() == "", f"Expected no output, got:\n{buffer.getvalue()}"
+
+    assert isinstance(result, MatchResult)
+    assert result.innings1.batting_team.name == "England"
+    assert result.innings2.batting_team.name == "India"
+    assert result.info['venue'] == "Kennington Oval"
+    assert result.match_result == "England won"
+    assert result.innings1.get_score(verify=True)[:2] == result.innings1.recompute_score()[:2]
+    print("  ✓ No output, MatchResult populated")
+
+
+def test_replay_match_verbose_prints_commentary():
+    """verbose=True keeps the original commentary and scorecards."""
+    print("Testing verbose replay_match...")
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        replay_match(INFO_PATH, BBB_PATH, verbose=True)
+    output = buffer.getvalue()
+    assert "Innings 1: England batting" in output
+    assert "FOUR!" in output
+    assert "Batting: India" in output
+    print("  ✓ Commentary printed")
+
+
+def test_headless_cli_never_prompts():
+    """--headless exports without per-ball output or the post-match menu."""
+    print("Testing --headless CLI...")
+
+    def no_input(prompt=''):
+        raise AssertionError(f"Headless replay prompted for input: {prompt!r}")
+
+    original_argv, original_input, original_cwd = sys.argv, builtins.input, os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'scorecard_generator', 'exports'))
+        sys.argv = ['replay.py', INFO_PATH, BBB_PATH, '--headless']
+        builtins.input = no_input
+        buffer = io.StringIO()
+        try:
+            os.chdir(tmp)
+            with redirect_stdout(buffer):
+                replay.main()
+        finally:
+            os.chdir(original_cwd)
+            sys.argv, builtins.input = original_argv, original_input
+
+        exports_dir = os.path.join(tmp, 'scorecard_generator', 'exports')
+        exported = [name for name in os.listdir(exports_dir) if name.endswith('.csv')]
+
+    output = buffer.getvalue()
+    assert " - dot ball" not in output and "Innings 1:" not in output
+    assert "Using CSV files" not in output and "exported to" not in output
+    lines = output.splitlines()
+    assert len(lines) == 1 and lines[0].startswith("1000001: England"), output
+    assert len(exported) == 3
+    print("  ✓ Headless CLI exported without prompting")
+
+
+if __name__ == "__main__":
+    test_replay_match_is_silent()
+    test_replay_match_verbose_prints_commentary()
+    test_headless_cli_never_prompts()
+    print("\n✓ All headless replay tests passed")
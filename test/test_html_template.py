@@ -0,0 +1,82 @@
+"""Tests for the precompiled HTML templates and the HTML report renderer."""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.html_template import CompiledTemplate, Markup, escape, join
+from scorecard_generator.match_report_html import render_html_report
+from scorecard_generator.models import CRICKET_FORMATS
+from benchmarks.synthetic import write_cricsheet_match
+from benchmarks import bench_html
+from cricsheet_replay.replay import replay_match
+
+
+def test_compiled_template():
+    """Placeholders are filled in and escaped; Markup, braces and $$ are kept."""
+    print("Testing compiled templates...")
+    row = CompiledTemplate('<td style="a {b}">$name</td><td>${runs}$$</td>$cell')
+    assert row.names == ('name', 'runs', 'cell')
+    html = row.render(name='O\'Neil & <Sons>', runs=12, cell=Markup('<td>ok</td>'))
+    assert html == '<td style="a {b}">O&#x27;Neil &amp; &lt;Sons&gt;</td><td>12$</td><td>ok</td>'
+    assert isinstance(html, Markup)
+
+    # Rendered fragments nest without being escaped twice
+    assert join([row.render(name='&', runs=1, cell=''), '&']) == (
+        '<td style="a {b}">&amp;</td><td>1$</td>&amp;')
+    assert escape(escape('<')) == '&lt;'
+
+    for values in ({'name': 'x', 'runs': 1}, {'name': 'x', 'runs': 1, 'cell': '', 'extra': 2}):
+        try:
+            row.render(**values)
+            assert False, "Expected TypeError"
+        except TypeError:
+            pass
+    static = CompiledTemplate('<p class="{x}">$$5 static</p>')
+    assert static.names == ()
+    assert static.render() == '<p class="{x}">$5 static</p>' and isinstance(static.render(), Markup)
+    try:
+        static.render(name='x')
+        assert False, "Expected TypeError"
+    except TypeError:
+        pass
+
+    try:
+        CompiledTemplate('cost: $5')
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Compiled templates")
+
+
+def test_report_escapes_names():
+    """Team and player names are escaped in the rendered report."""
+    print("Testing report escaping...")
+    with tempfile.TemporaryDirectory() as tmp:
+        result = replay_match(*write_cricsheet_match(tmp, 'T20', overs=4))
+    result.innings1.batting_team.name = 'Hearts & <Minds>'
+    result.innings1.batting_team.players[1].name = "D'Arcy <b>"
+    page = render_html_report(result.innings1, result.innings2, result.match_result, CRICKET_FORMATS['T20'],
+                              generated='DATE')
+    assert '<title>Match Report: Hearts &amp; &lt;Minds&gt; vs ' in page
+    assert 'D&#x27;Arcy &lt;b&gt;' in page
+    assert '<Minds>' not in page and "D'Arcy" not in page
+    assert page.startswith('<!DOCTYPE html>') and page.endswith('</html>')
+    print("  ✓ Names escaped")
+
+
+def test_benchmark_renders_pages():
+    """The benchmark renders pages from several matches and reports throughput."""
+    print("Testing HTML benchmark...")
+    results = bench_html.run(pages=4, matches=2)
+    assert results['render'] > 0 and results['write'] > 0
+    print("  ✓ Pages per second reported")
+
+
+if __name__ == "__main__":
+    test_compiled_template()
+    test_report_escapes_names()
+    test_benchmark_renders_pages()
+    print("\n✓ All HTML template tests passed")
@@ -0,0 +1,100 @@
+"""Tests for the on-disk replay cache in cricsheet_replay/cache.py."""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay import replay
+from cricsheet_replay.cache import MatchCache, match_key, cached_replay_match
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet'))
+INFO_PATH = os.path.join(FIXTURES, '1000001_info.csv')
+BBB_PATH = os.path.join(FIXTURES, '1000001.csv')
+
+
+def test_cached_replay_round_trip():
+    """A second replay of the same files comes from the cache, unchanged."""
+    print("Testing cached replay round trip...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = MatchCache(os.path.join(tmp, '.cache'))
+        first, hit = cached_replay_match(INFO_PATH, BBB_PATH, cache)
+        assert not hit
+        second, hit = cached_replay_match(INFO_PATH, BBB_PATH, cache)
+        assert hit
+        assert second.innings1.get_score(verify=True) == first.innings1.get_score()
+        assert second.innings2.batting_team.name == 'India'
+        assert second.match_result == first.match_result
+        # Players stay shared between the teams and the innings after unpickling
+        assert second.innings1.batting_team is second.team1
+    print("  ✓ Cache hit returns the same match")
+
+
+def test_key_tracks_file_contents():
+    """Changing either file changes the key; copying it doesn't."""
+    print("Testing cache keys...")
+    with tempfile.TemporaryDirectory() as tmp:
+        info_copy = shutil.copy(INFO_PATH, os.path.join(tmp, 'a_info.csv'))
+        bbb_copy = shutil.copy(BBB_PATH, os.path.join(tmp, 'a.csv'))
+        key = match_key(INFO_PATH, BBB_PATH)
+        assert match_key(info_copy, bbb_copy) == key
+        with open(bbb_copy, 'a', encoding='utf-8') as f:
+            f.write("\n")
+        assert match_key(info_copy, bbb_copy) != key
+    print("  ✓ Keys follow file contents")
+
+
+def test_lru_eviction_and_corrupt_entries():
+    """Oldest entries are evicted past max_bytes; unreadable entries are misses."""
+    print("Testing LRU eviction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = MatchCache(tmp, max_bytes=10 ** 9)
+        for i, key in enumerate(['a', 'b', 'c']):
+            cache.put(key, {'payload': 'x' * 1000})
+            os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        assert cache.get('a') is not None  # 'a' is now the most recently used
+
+        cache.max_bytes = 2500
+        assert cache.evict() == 1
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+
+        with open(cache._path('c'), 'wb') as f:
+            f.write(b'not a pickle')
+        assert cache.get('c') is None
+        assert not os.path.exists(cache._path('c'))
+    print("  ✓ LRU eviction and corrupt entries handled")
+
+
+def test_no_cache_flag():
+    """--no-cache replays without creating the cache directory."""
+    print("Testing --no-cache...")
+    original_argv, original_cwd = sys.argv, os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'scorecard_generator', 'exports'))
+        try:
+            os.chdir(tmp)
+            with redirect_stdout(io.StringIO()):
+                sys.argv = ['replay.py', INFO_PATH, BBB_PATH, '--headless', '--no-cache']
+                replay.main()
+                assert not os.path.exists(os.path.join('scorecard_generator', 'exports', '.cache'))
+                sys.argv = ['replay.py', INFO_PATH, BBB_PATH, '--headless']
+                replay.main()
+                assert len(MatchCache().entries()) == 1
+        finally:
+            os.chdir(original_cwd)
+            sys.argv = original_argv
+    print("  ✓ --no-cache bypasses the cache")
+
+
+if __name__ == "__main__":
+    test_cached_replay_round_trip()
+    test_key_tracks_file_contents()
+    test_lru_eviction_and_corrupt_entries()
+    test_no_cache_flag()
+    print("\n✓ All match cache tests passed")
@@ -0,0 +1,182 @@
+"""Tests for scripted, prompt-free match scoring (main --script)."""
+
+import builtins
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import main
+from scorecard_generator.input_handlers import input_ball
+from scorecard_generator.match_script import parse_script, script_ball
+from scorecard_generator.team_utils import load_team
+
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'scripts', 'england_australia.txt')
+
+HEADER = ["team1: England", "team2: Australia", "format: T20", "toss: England bat"]
+
+# Delivery token -> the answers a scorer types at input_ball's prompts
+TOKENS = {
+    '4': ['4'],
+    'b:2': ['b', '2'],
+    'lb:1': ['lb', '1'],
+    'wd': ['wd', '0'],
+    'wd:lb:3': ['wd', 'leg bye', '3'],
+    'wd:ro:1:striker:56': ['wd', 'run out', '1', 'striker', '56'],
+    'nb': ['nb', ''],
+    'nb:6': ['nb', '6'],
+    'nb:b:1': ['nb', 'bye', '1'],
+    'nb:ro:2:non-striker:4': ['nb', 'run out', '2', 'non-striker', '4'],
+    'w:bowled': ['w', 'bowled'],
+    'w:lbw': ['w', 'lbw'],
+    'w:caught:32': ['w', 'caught', '32'],
+    'w:caught:38': ['w', 'caught', '38'],
+    'w:caught:bowler': ['w', 'caught', 'bowler'],
+    'w:stumped': ['w', 'stumped'],
+    'w:ro:3:non-striker:99': ['w', 'run out', '3', 'non-striker', '99'],
+}
+
+
+def no_input(prompt=''):
+    raise AssertionError(f"Scripted match prompted for input: {prompt!r}")
+
+
+def test_tokens_match_input_ball():
+    """Each token scores exactly what input_ball returns for the same answers."""
+    print("Testing delivery tokens...")
+    england, australia = load_team("England"), load_team("Australia")
+    batters = [england.players[16], england.players[22]]
+    bowler = australia.players[38]
+    original_input = builtins.input
+    try:
+        for token, answers in TOKENS.items():
+            replies = iter(answers)
+            builtins.input = lambda prompt='': next(replies)
+            with redirect_stdout(io.StringIO()):
+                expected = input_ball(batters, bowler, 0, 1, australia)
+            assert script_ball(token, bowler, australia) == expected, token
+    finally:
+        builtins.input = original_input
+
+    assert script_ball('END', bowler, australia)[1] == "end"
+    for token in ('7', 'w', 'w:caught', 'b:x', 'wd:4', 'nb:7', 'w:ro:1:keeper:4', 'x'):
+        try:
+            script_ball(token, bowler, australia)
+            assert False, f"Expected ValueError for {token!r}"
+        except ValueError:
+            pass
+    print("  ✓ Tokens match input_ball")
+
+
+def test_parse_errors_name_the_line():
+    """Malformed scripts are rejected with the offending line."""
+    print("Testing script errors...")
+    script = parse_script(HEADER + ["innings: 16 22", "38: 1 0", "innings:", "16: 4"])
+    assert script.format_config['max_overs'] == 20
+    assert script.innings[0].batting_order == [16, 22] and script.innings[1].batting_order is None
+    assert script.innings[0].overs == [(6, 38, ['1', '0'])]
+
+    bad_scripts = {
+        "toss": (HEADER[:3] + ["toss: Wales bat", "innings:", "innings:"], ":4:"),
+        "format": (HEADER[:2] + ["format: T10"] + HEADER[3:] + ["innings:", "innings:"], ":3:"),
+        "over before innings": (HEADER + ["38: 1"], ":5:"),
+        "one innings": (HEADER + ["innings:"], "Expected 2 innings"),
+        "missing header": (HEADER[1:] + ["innings:", "innings:"], "Missing team1"),
+        "opener only": (HEADER + ["innings: 16", "innings:"], ":5:"),
+    }
+    for name, (lines, where) in bad_scripts.items():
+        try:
+            parse_script(lines)
+            assert False, f"Expected ValueError for {name}"
+        except ValueError as e:
+            assert where in str(e), (name, str(e))
+    print("  ✓ Errors name the line")
+
+
+def score(lines):
+    """Score script lines through main --script in a scratch directory; returns (exit code, stdout, stderr)."""
+    original_input, original_cwd = builtins.input, os.getcwd()
+    buffer, errors = io.StringIO(), io.StringIO()
+    code = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'match.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+        os.makedirs(os.path.join(tmp, 'scorecard_generator', 'exports'))
+        builtins.input = no_input
+        try:
+            os.chdir(tmp)
+            with redirect_stdout(buffer), redirect_stderr(errors):
+                main.main(['--script', path])
+        except SystemExit as e:
+            code = e.code
+        finally:
+            os.chdir(original_cwd)
+            builtins.input = original_input
+    return code, buffer.getvalue(), errors.getvalue()
+
+
+def test_scripted_match():
+    """main --script scores a whole match, exports and reports with no prompts."""
+    print("Testing scripted match...")
+    original_input, original_cwd = builtins.input, os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'scorecard_generator', 'exports'))
+        builtins.input = no_input
+        buffer = io.StringIO()
+        try:
+            os.chdir(tmp)
+            with redirect_stdout(buffer):
+                match_data = main.score_script(SCRIPT_PATH)
+        finally:
+            os.chdir(original_cwd)
+            builtins.input = original_input
+        exported = os.listdir(os.path.join(tmp, 'scorecard_generator', 'exports'))
+
+    innings1, innings2 = match_data['innings1'], match_data['innings2']
+    assert innings1.batting_team.name == "England"
+    assert innings1.get_score()[:2] == (33, 6)  # Runs completed before a run out aren't credited
+    assert innings2.get_score()[:2] == (2, 2)
+    assert match_data['match_result'] == "England win by 31 runs!"
+    first, second = innings1.partnerships[:2]
+    assert (first.batter1.name, first.batter2.name) == ("Jonny Bairstow", "Jos Buttler")
+    assert "Ben Stokes" in (second.batter1.name, second.batter2.name)
+    dismissals = {p.name: p.batting['dismissal'] for p in innings1.batting_team.players.values()}
+    assert dismissals["Jonny Bairstow"] == "c Smith b Hazlewood"
+    assert dismissals["Ben Stokes"] == "st †Inglis b Cummins"
+    assert dismissals["Sam Curran"] == "c & b Starc"
+    assert any(name.endswith('.html') for name in exported)
+    output = buffer.getvalue()
+    assert "Australia won the toss and chose to bowl first" in output
+    assert "Match Result: England win by 31 runs!" in output
+    print("  ✓ Match scored from the script")
+
+
+def test_script_must_fit_the_match():
+    """Scripts whose overs don't fit the innings stop with an error instead of prompting."""
+    print("Testing mismatched scripts...")
+    header = HEADER[:2] + ["format: custom 1 1", "toss: England bat"]
+    cases = {
+        "short over": (["innings:", "38: 1 1", "innings:", "16: 0"], ":6: Over 1 needs more deliveries"),
+        "long over": (["innings:", "38: 1 1 1 1 1 1 1", "innings:", "16: 0"], ":6: The innings is over"),
+        "extra over": (["innings:", "38: 1 1 1 1 1 1", "46: 1", "innings:", "16: 0"], ":7: The innings is over"),
+        "unknown bowler": (["innings:", "7: 1", "innings:", "16: 0"], ":6: Australia has no player"),
+        "bad token": (["innings:", "38: 1 1 7", "innings:", "16: 0"], ":6: Unknown delivery '7'"),
+    }
+    for name, (lines, message) in cases.items():
+        code, output, errors = score(header + lines)
+        assert code == 1, name
+        assert "Match Result" not in output, name
+        assert message in errors, (name, errors)
+    print("  ✓ Mismatched scripts rejected")
+
+
+if __name__ == "__main__":
+    test_tokens_match_input_ball()
+    test_parse_errors_name_the_line()
+    test_scripted_match()
+    test_script_must_fit_the_match()
+    print("\n✓ All match script tests passed")
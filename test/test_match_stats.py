@@ -9,11 +9,13 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from collections import defaultdict
-from scorecard_generator.models import Player, Team, Innings, Partnership, get_current_phase, CRICKET_FORMATS
+from scorecard_generator.models import (
+    Player, Team, Innings, Partnership, BallEvent, EventType, get_current_phase, CRICKET_FORMATS
+)
 from scorecard_generator.match_stats import (
     calculate_phase_breakdown, calculate_innings_summary,
     get_top_batters, get_top_bowlers, format_batter_breakdown,
-    format_partnership
+    format_partnership, innings_stats, MatchStats
 )
 
 
@@ -305,6 +307,49 @@ def test_format_partnership():
     print("  ✓ Partnership formatting tests passed")
 
 
+def test_match_stats_snapshot():
+    """Test that innings stats are memoized until a delivery is added."""
+    print("Testing match stats snapshot...")
+    
+    team1 = Team("Team A")
+    team2 = Team("Team B")
+    for i in range(1, 12):
+        team1.add_player(Player(i, f"Batter {i}"))
+        team1.order.append(i)
+        team2.add_player(Player(i, f"Bowler {i}"))
+        team2.order.append(i)
+    innings1 = Innings(team1, team2)
+    innings2 = Innings(team2, team1)
+    batter, bowler = team1.players[1], team2.players[1]
+    
+    innings1.add_ball(BallEvent(0, 1, bowler, batter, 0, EventType.NORMAL))
+    innings1.over_totals.append(0)
+    first = innings_stats(innings1)
+    assert innings_stats(innings1) is first
+    assert first.summary['dot_ball_percent'] == 100
+    
+    # A new delivery invalidates the snapshot
+    innings1.add_ball(BallEvent(0, 2, bowler, batter, 4, EventType.NORMAL))
+    innings1.over_totals[0] += 4
+    second = innings_stats(innings1)
+    assert second is not first
+    assert second.summary['dot_ball_percent'] == 50
+    assert second.manhattan == [4] and first.manhattan == [0]
+    
+    # So does a partnership closed at the end of an innings
+    innings1.partnerships.append(Partnership(batter, team1.players[2], wicket_number=1, start_score=0))
+    third = innings_stats(innings1)
+    assert third is not second and len(third.partnerships) == 1
+    
+    # Match stats share the innings snapshots; phases only for phased formats
+    stats = MatchStats(innings1, innings2, CRICKET_FORMATS['T20'])
+    assert stats.innings[0] is third and stats.summary1 is third.summary
+    assert stats.phase1 == third.phases
+    assert MatchStats(innings1, innings2, CRICKET_FORMATS['TEST']).phase1 is None
+    
+    print("  ✓ Match stats snapshot tests passed")
+
+
 def run_all_tests():
     """Run all match stats tests."""
     print("\n" + "="*70)
@@ -320,6 +365,7 @@ def run_all_tests():
         test_innings_summary()
         test_top_performers()
         test_format_partnership()
+        test_match_stats_snapshot()
         
         print("\n" + "="*70)
         print("✅ ALL TESTS PASSED")
@@ -0,0 +1,93 @@
+"""Tests for the SQLite match store."""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.match_store import MatchStore
+from benchmarks.synthetic import write_cricsheet_match
+from cricsheet_replay.replay import replay_match
+from cricsheet_replay.batch import replay_corpus, store_results
+
+
+def test_save_and_query():
+    """A replayed match round-trips through the store and player queries use every innings."""
+    print("Testing match store round trip...")
+    with tempfile.TemporaryDirectory() as tmp:
+        info_path, ballbyball_path = write_cricsheet_match(tmp, 'T20', overs=5)
+        result = replay_match(info_path, ballbyball_path)
+        innings = [result.innings1, result.innings2]
+
+        with MatchStore(os.path.join(tmp, 'matches.db')) as store:
+            assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            match_id = store.save_match(result.team1, result.team2, innings, result.match_result,
+                                        info=result.info, source='cricsheet', source_id='1')
+            # Saving the same Cricsheet match again replaces it
+            match_id = store.save_match(result.team1, result.team2, innings, result.match_result,
+                                        info=result.info, source='cricsheet', source_id='1')
+            assert len(store.matches()) == 1
+
+            rows = store.innings(match_id)
+            assert [(r['runs'], r['wickets']) for r in rows] == [tuple(i.get_score()[:2]) for i in innings]
+            deliveries = store.deliveries(match_id)
+            assert len(deliveries) == sum(len(i.balls) for i in innings)
+            assert [r['runs'] for r in deliveries] == [ball.runs for i in innings for ball in i.balls]
+
+            bowler = result.innings1.balls[0].bowler.name
+            expected = sum(1 for i in innings for ball in i.balls if ball.bowler.name == bowler)
+            assert len(store.deliveries_bowled_by(bowler)) == expected
+            assert all(r['bowler'] == bowler for r in store.deliveries_bowled_by(bowler))
+            batter = result.innings1.balls[0].batter.name
+            assert all(r['batter'] == batter for r in store.deliveries_faced_by(batter))
+
+            # Scored matches have no source id, so each one is kept
+            store.save_match(result.team1, result.team2, innings, result.match_result)
+            store.save_match(result.team1, result.team2, innings, result.match_result)
+            assert len(store.matches()) == 3
+            assert len(store.deliveries_bowled_by(bowler)) == 3 * expected
+    print("  ✓ Round trip and player queries")
+
+
+def test_failed_save_rolls_back():
+    """A match that fails part way leaves nothing behind."""
+    print("Testing rollback...")
+    with tempfile.TemporaryDirectory() as tmp:
+        info_path, ballbyball_path = write_cricsheet_match(tmp, 'T20', overs=2)
+        result = replay_match(info_path, ballbyball_path)
+        with MatchStore(os.path.join(tmp, 'matches.db')) as store:
+            try:
+                store.save_match(result.team1, result.team2, [result.innings1, 'not an innings'],
+                                 result.match_result)
+                assert False, "Expected the save to fail"
+            except AttributeError:
+                pass
+            counts = [store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in ('matches', 'innings', 'players', 'deliveries')]
+            assert counts == [0, 0, 0, 0]
+            store.save_match(result.team1, result.team2, [result.innings1], result.match_result)
+            assert len(store.deliveries(store.matches()[0]['id'])) == len(result.innings1.balls)
+    print("  ✓ Rollback")
+
+
+def test_store_batch_results():
+    """Batch replay results are stored once per Cricsheet match."""
+    print("Testing batch storage...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in range(3):
+            write_cricsheet_match(tmp, 'T20', overs=3, seed=seed, match_id=str(920000 + seed))
+        summary = replay_corpus(tmp, workers=1, out=None)
+        path = os.path.join(tmp, 'matches.db')
+        store_results(summary['results'], path)
+        store_results(summary['results'], path)
+        with MatchStore(path) as store:
+            assert sorted(row['source_id'] for row in store.matches()) == ['920000', '920001', '920002']
+    print("  ✓ Batch storage")
+
+
+if __name__ == "__main__":
+    test_save_and_query()
+    test_failed_save_rolls_back()
+    test_store_batch_results()
+    print("\n✓ All match store tests passed")
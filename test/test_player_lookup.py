@@ -0,0 +1,61 @@
+"""Tests for the Team name index used by the Cricsheet replay."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import Player, Team
+from cricsheet_replay.replay import parse_info_csv, create_teams_from_info, get_player_by_name
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet')
+
+
+def test_name_index_follows_add_player():
+    """Lookups are case-insensitive and track replaced players."""
+    print("Testing Team name index...")
+    team = Team("England")
+    root = Player(66, "J Root")
+    team.add_player(root)
+    assert team.get_player_by_name("J Root") is root
+    assert team.get_player_by_name("j root") is root
+    assert team.get_player_by_name("J ROOT") is root
+    assert team.get_player_by_name("B Stokes") is None
+
+    # Re-adding a shirt number replaces the old player in the index
+    stokes = Player(66, "B Stokes")
+    team.add_player(stokes)
+    assert team.get_player_by_name("B Stokes") is stokes
+    assert team.get_player_by_name("J Root") is None
+    print("  ✓ Index stays in sync with add_player")
+
+
+def test_name_index_finds_players_added_directly():
+    """Players assigned straight into team.players are still found."""
+    print("Testing lookup fallback for directly assigned players...")
+    team = Team("India")
+    kohli = Player(18, "V Kohli")
+    team.players[18] = kohli
+    assert team.get_player_by_name("v kohli") is kohli
+    assert get_player_by_name(team, "V Kohli") is kohli
+    print("  ✓ Direct assignments found and indexed")
+
+
+def test_replay_names_are_interned_across_matches():
+    """The same player name parsed from two files is one shared string."""
+    print("Testing name interning across matches...")
+    info_path = os.path.join(FIXTURES, '1000001_info.csv')
+    team_a, _ = create_teams_from_info(parse_info_csv(info_path))
+    team_b, _ = create_teams_from_info(parse_info_csv(info_path))
+    player_a = team_a.get_player_by_name("J Root")
+    player_b = team_b.get_player_by_name("J Root")
+    assert player_a is not player_b  # per-match stats stay separate
+    assert player_a.name is player_b.name
+    print("  ✓ Names shared, players per match")
+
+
+if __name__ == "__main__":
+    test_name_index_follows_add_player()
+    test_name_index_finds_players_added_directly()
+    test_replay_names_are_interned_across_matches()
+    print("\n✓ All player lookup tests passed")
@@ -0,0 +1,116 @@
+"""Tests for the match store query API."""
+
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import query
+from scorecard_generator.models import EventType
+from scorecard_generator.query import ConnectionPool
+from benchmarks.synthetic import write_cricsheet_match
+from cricsheet_replay.batch import replay_corpus, store_results
+
+
+def build_store(directory, count=3):
+    """Store count synthetic eight-over T20s; returns the replayed BatchResults."""
+    for seed in range(count):
+        write_cricsheet_match(directory, 'T20', overs=8, seed=seed, match_id=str(930000 + seed))
+    results = replay_corpus(directory, workers=1, out=None)['results']
+    store_results(results, os.path.join(directory, 'matches.db'))
+    return results
+
+
+def ball_totals(results, role):
+    """Per-player (balls, runs, wickets) summed ball by ball from the replayed innings."""
+    totals = {}
+    for result in results:
+        for innings in result.innings:
+            for ball in innings.balls:
+                event = ball.event
+                if role == 'batter':
+                    name = ball.batter.name
+                    balls = not event.is_wide
+                    runs = ball.runs - event.is_no_ball if event.runs_extras is None else 0
+                else:
+                    name = ball.bowler.name
+                    balls = event.is_legal
+                    runs = event.bowler_runs(ball.runs)
+                entry = totals.setdefault(name, [0, 0, 0])
+                entry[0] += balls
+                entry[1] += runs
+                entry[2] += event is EventType.WICKET
+    return totals
+
+
+def test_queries_match_deliveries():
+    """Head-to-head and phase queries agree with totals taken ball by ball."""
+    print("Testing queries against replayed deliveries...")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = build_store(tmp)
+        with ConnectionPool(os.path.join(tmp, 'matches.db'), size=2) as pool:
+            batting = ball_totals(results, 'batter')
+            for name, totals in batting.items():
+                records = list(query.batter_vs_bowlers(name, pool=pool))
+                assert [sum(r.balls for r in records), sum(r.runs for r in records),
+                        sum(r.dismissals for r in records)] == totals
+                splits = list(query.batter_phase_splits(name, pool=pool))
+                assert sum(s.runs for s in splits) == totals[1]
+            for name, (balls, runs, wickets) in ball_totals(results, 'bowler').items():
+                splits = list(query.bowler_phase_splits(name, pool=pool))
+                assert [s.phase for s in splits] == ['powerplay', 'middle'][:len(splits)]
+                assert (sum(s.balls for s in splits), sum(s.runs for s in splits),
+                        sum(s.wickets for s in splits)) == (balls, runs, wickets)
+
+            name = max(batting, key=lambda n: batting[n][0])
+            top = next(query.batter_vs_bowlers(name, pool=pool))
+            record = query.head_to_head(name, top.bowler, pool=pool)
+            assert (record.balls, record.runs, record.dismissals) == (top.balls, top.runs, top.dismissals)
+            assert query.head_to_head(name, 'Nobody', pool=pool).balls == 0
+
+            venues = list(query.venue_averages(pool=pool))
+            first_innings = [r.innings[0].get_score()[0] for r in results]
+            assert len(venues) == 1 and venues[0].innings == len(results)
+            assert abs(venues[0].average_runs - sum(first_innings) / len(results)) < 1e-9
+            assert venues[0].highest == max(first_innings)
+    print("  ✓ Queries match deliveries")
+
+
+def test_pool_is_thread_safe():
+    """Threads share a small pool, and abandoned iterators hand their connection back."""
+    print("Testing connection pool...")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = build_store(tmp, count=2)
+        bowler = results[0].innings[0].balls[0].bowler.name
+        with ConnectionPool(os.path.join(tmp, 'matches.db'), size=2) as pool:
+            expected = [(s.phase, s.runs) for s in query.bowler_phase_splits(bowler, pool=pool)]
+            rows = iter(query.venue_averages(pool=pool))
+            next(rows, None)
+            rows.close()
+
+            answers, errors = [], []
+
+            def worker():
+                try:
+                    for _ in range(20):
+                        answers.append([(s.phase, s.runs) for s in query.bowler_phase_splits(bowler, pool=pool)])
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == [] and len(answers) == 80
+            assert all(answer == expected for answer in answers)
+            assert len(pool._all) <= 2
+    print("  ✓ Pool shared across threads")
+
+
+if __name__ == "__main__":
+    test_queries_match_deliveries()
+    test_pool_is_thread_safe()
+    print("\n✓ All query tests passed")
@@ -0,0 +1,131 @@
+"""Tests for the concurrent report pipeline."""
+
+import io
+import os
+import re
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import match_report_html, report_pipeline
+from scorecard_generator.models import CRICKET_FORMATS
+from scorecard_generator.report_pipeline import generate_reports
+from scorecard_generator.match_report_html import generate_html_report
+from scorecard_generator.match_report_md import generate_markdown_report
+from scorecard_generator.scorecard_export import reserve_export_paths
+from benchmarks.synthetic import write_cricsheet_match
+from cricsheet_replay.replay import replay_match
+
+T20 = CRICKET_FORMATS['T20']
+
+
+def replayed_match(directory):
+    info_path, ballbyball_path = write_cricsheet_match(directory, 'T20', overs=8)
+    result = replay_match(info_path, ballbyball_path)
+    return (result.team1, result.team2, result.innings1, result.innings2, result.match_result, T20)
+
+
+def read(path):
+    """File contents with the generated-at timestamp blanked out."""
+    with open(path, encoding='utf-8') as f:
+        return re.sub(r'\d{4}-\d\d-\d\d \d\d:\d\d', 'DATE', f.read())
+
+
+def test_pipeline_matches_sequential_reports():
+    """Every artefact is written, timed, and identical to rendering one at a time."""
+    print("Testing report pipeline output...")
+    with tempfile.TemporaryDirectory() as tmp:
+        match = replayed_match(tmp)
+        paths = reserve_export_paths(match[0], match[1], directory=os.path.join(tmp, 'out'), claim='report')
+        with redirect_stdout(io.StringIO()):
+            pipeline = generate_reports(*match, paths)
+            generate_html_report(*match, os.path.join(tmp, 'sequential.html'))
+            generate_markdown_report(*match, os.path.join(tmp, 'sequential.md'))
+
+        assert pipeline.ok, [r.error for r in pipeline.failures]
+        assert [r.name for r in pipeline.results] == [
+            'stats', 'csv', 'markdown', 'chart:manhattan', 'chart:worm', 'chart:runrate', 'html'
+        ]
+        assert all(elapsed >= 0 for elapsed in pipeline.timings().values())
+        for kind in ('scorecard', 'info', 'ballbyball'):
+            assert os.path.getsize(paths.path(kind)) > 0
+        assert read(paths.path('report', 'md')) == read(os.path.join(tmp, 'sequential.md'))
+        assert read(paths.path('report', 'html')) == read(os.path.join(tmp, 'sequential.html'))
+    print("  ✓ Pipeline output matches sequential rendering")
+
+
+def test_failures_do_not_abort():
+    """A failing chart is reported while the other artefacts still render."""
+    print("Testing failure policy...")
+
+    def broken_chart(*args):
+        raise RuntimeError("renderer crashed")
+
+    renderers = match_report_html.CHART_BACKENDS[match_report_html.DEFAULT_CHART_BACKEND]
+    original = renderers['worm']
+    renderers['worm'] = broken_chart
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            match = replayed_match(tmp)
+            paths = reserve_export_paths(match[0], match[1], directory=tmp, per_match_dir=True)
+            with redirect_stdout(io.StringIO()):
+                pipeline = generate_reports(*match, paths, artefacts=('markdown', 'html'))
+            assert [r.name for r in pipeline.failures] == ['chart:worm']
+            assert "renderer crashed" in pipeline['chart:worm'].error
+            assert pipeline['html'].ok and pipeline['markdown'].ok
+            assert "Worm chart unavailable" in read(paths.path('report', 'html'))
+            assert not os.path.exists(paths.path('scorecard'))
+    finally:
+        renderers['worm'] = original
+    print("  ✓ Failures recorded without aborting")
+
+
+def test_plotly_runtime_failure_falls_back_to_cdn():
+    """A plotly.js copy that can't be written is reported, and the reports load it from the CDN."""
+    print("Testing plotly.js fallback...")
+
+    def unwritable_runtime(*args):
+        raise OSError("Read-only file system")
+
+    # SVG renderers stand in for Plotly; they'd fail if given a local plotly.js
+    original_runtime = report_pipeline.plotly_runtime
+    original_plotly = match_report_html.CHART_BACKENDS['plotly']
+    report_pipeline.plotly_runtime = unwritable_runtime
+    match_report_html.CHART_BACKENDS['plotly'] = match_report_html.CHART_BACKENDS['svg']
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            match = replayed_match(tmp)
+            paths = reserve_export_paths(match[0], match[1], directory=tmp, per_match_dir=True)
+            with redirect_stdout(io.StringIO()):
+                pipeline = generate_reports(*match, paths, chart_backend='plotly', plotly_js='local')
+            assert [r.name for r in pipeline.failures] == ['plotly.js']
+            assert "OSError: Read-only file system" in pipeline['plotly.js'].error
+            assert pipeline['csv'].ok and pipeline['markdown'].ok and pipeline['html'].ok
+            assert os.path.getsize(paths.path('scorecard')) > 0
+    finally:
+        report_pipeline.plotly_runtime = original_runtime
+        match_report_html.CHART_BACKENDS['plotly'] = original_plotly
+    print("  ✓ plotly.js failure recorded, CDN used")
+
+
+def test_process_pool():
+    """The pipeline also runs on a process pool."""
+    print("Testing process pool...")
+    with tempfile.TemporaryDirectory() as tmp:
+        match = replayed_match(tmp)
+        paths = reserve_export_paths(match[0], match[1], directory=tmp, per_match_dir=True)
+        with redirect_stdout(io.StringIO()):
+            pipeline = generate_reports(*match, paths, workers=2, processes=True)
+        assert pipeline.ok, [r.error for r in pipeline.failures]
+        assert os.path.getsize(paths.path('report', 'html')) > 0
+    print("  ✓ Process pool")
+
+
+if __name__ == "__main__":
+    test_pipeline_matches_sequential_reports()
+    test_failures_do_not_abort()
+    test_plotly_runtime_failure_falls_back_to_cdn()
+    test_process_pool()
+    print("\n✓ All report pipeline tests passed")
@@ -0,0 +1,140 @@
+"""Tests for the Innings running totals used by get_score().
+
+The counters updated by process_ball_event and the Cricsheet replay must
+agree with the full recompute of the innings after every delivery.
+"""
+
+import builtins
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import Player, Team, Innings, BallEvent, Partnership, CRICKET_FORMATS
+from scorecard_generator.game_logic import process_ball_event
+from cricsheet_replay.replay import (
+    parse_info_csv, create_teams_from_info, parse_ball_by_ball_csv, replay_innings
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet')
+
+
+def make_teams():
+    batting = Team("Bat")
+    bowling = Team("Bowl")
+    for i in range(1, 12):
+        batting.add_player(Player(i, f"Batter {i}"))
+        bowling.add_player(Player(i, f"Bowler {i}"))
+    batting.order = list(range(1, 12))
+    bowling.order = list(range(1, 12))
+    return batting, bowling
+
+
+def test_counters_match_recompute_through_process_ball_event():
+    """Counters track every event branch of process_ball_event."""
+    print("Testing running totals through process_ball_event...")
+    batting, bowling = make_teams()
+    innings = Innings(batting, bowling)
+    bowler = bowling.players[1]
+    current_batters = [batting.players[1], batting.players[2]]
+    innings.current_partnership = Partnership(current_batters[0], current_batters[1], 1, 0)
+    batters_yet = list(range(3, 12))
+
+    deliveries = [
+        ("normal", 4, [], False),
+        ("wide", 1, [], False),
+        ("no ball_runs", 3, [], False),
+        ("bye", 2, [], False),
+        ("wicket", 0, [bowler.name], False),
+        ("leg bye", 1, [], True),
+        ("no ball", 1, [], False),
+        ("wide_bye", 3, [], False),
+        ("run out", 1, ["Bowler 5", 1, 1], True),
+        ("normal", 6, [], False),
+    ]
+
+    wickets, over_runs, legal_balls, ball_num = 0, 0, 0, 1
+    original_input = builtins.input
+    builtins.input = lambda prompt='': "1"
+    try:
+        with redirect_stdout(io.StringIO()):
+            for event_type, runs, fielders, swapped in deliveries:
+                batter = current_batters[0]
+                innings.add_ball(BallEvent(0, ball_num, bowler, batter, runs, event_type, fielders))
+                wickets, over_runs, legal_balls, ball_num, current_batters, batters_yet, _ = process_ball_event(
+                    event_type, runs, fielders, swapped, innings, bowler, batter,
+                    current_batters, wickets, 0, ball_num, batting, over_runs,
+                    legal_balls, ball_num, batters_yet, CRICKET_FORMATS['T20']
+                )
+                # verify=True raises if the counters drift from the recompute
+                innings.get_score(verify=True)
+    finally:
+        builtins.input = original_input
+
+    runs, wkts, overs, _ = innings.get_score()
+    assert innings.counters_live
+    assert (runs, wkts) == innings.recompute_score()[:2]
+    assert wkts == 2
+    assert innings.legal_balls == 6
+    assert overs == 1.0
+    print("  ✓ Counters agree with full recompute")
+
+
+def test_verify_mode_detects_drift():
+    """Verify mode raises when the counters disagree with the recompute."""
+    print("Testing verify mode...")
+    batting, bowling = make_teams()
+    innings = Innings(batting, bowling)
+    innings.record_delivery(0, 4, legal=True)
+    batting.players[1].batting['runs'] = 4
+    innings.add_ball(BallEvent(0, 1, bowling.players[1], batting.players[1], 4, "normal"))
+    assert innings.get_score(verify=True)[0] == 4
+
+    # Runs credited outside the scoring path are invisible to the counters
+    batting.players[1].batting['runs'] += 2
+    try:
+        innings.get_score(verify=True)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("verify mode should flag out-of-sync counters")
+
+    Innings.verify_counters = True
+    try:
+        try:
+            innings.get_score()
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("class-level verify_counters should apply by default")
+    finally:
+        Innings.verify_counters = False
+    print("  ✓ Verify mode flags drift")
+
+
+def test_replay_counters_match_recompute():
+    """Replayed Cricsheet innings keep counters in sync with the recompute."""
+    print("Testing running totals through the Cricsheet replay...")
+    info = parse_info_csv(os.path.join(FIXTURES, '1000001_info.csv'))
+    team1, team2 = create_teams_from_info(info)
+    innings_data = parse_ball_by_ball_csv(os.path.join(FIXTURES, '1000001.csv'))
+
+    with redirect_stdout(io.StringIO()):
+        innings = replay_innings(1, innings_data[1], team1, team2, info)
+
+    assert innings.counters_live
+    runs, wickets, overs, _ = innings.get_score(verify=True)
+    assert wickets == len(innings.fall_of_wickets) == 3
+    assert overs == 3.0
+    # Fall of wicket totals are read from the counters mid-innings
+    assert [fw[0] for fw in innings.fall_of_wickets] == sorted(fw[0] for fw in innings.fall_of_wickets)
+    print("  ✓ Replay counters agree with full recompute")
+
+
+if __name__ == "__main__":
+    test_counters_match_recompute_through_process_ball_event()
+    test_verify_mode_detects_drift()
+    test_replay_counters_match_recompute()
+    print("\n✓ All running total tests passed")
@@ -0,0 +1,75 @@
+"""Tests for the vectorised simulation kernel.
+
+Every test is skipped (with a note) when numpy isn't installed.
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import sim_kernel
+from scorecard_generator.simulator import OutcomeDistribution
+
+
+def numpy_missing():
+    if not sim_kernel.NUMPY_AVAILABLE:
+        print("numpy not installed, skipping kernel test")
+        return True
+    return False
+
+
+def test_kernel_matches_scalar_engine():
+    """The kernel and MatchState agree innings by innings on the same draws."""
+    if numpy_missing():
+        return
+    print("Testing kernel against MatchState...")
+    assert sim_kernel.cross_check(40, 'T20', seed=1) == []
+    assert sim_kernel.cross_check(15, 'ODI', seed=2, target=220) == []
+
+    aggressive = OutcomeDistribution([('normal', 4, 3), ('normal', 1, 3), ('caught', 0, 1), ('run out', 3, 1)])
+    positions = [aggressive] * 6 + [OutcomeDistribution()] * 5
+    assert sim_kernel.cross_check(15, 'TEST', positions, seed=3, overs=30) == []
+    print("  ✓ Kernel matches the scalar engine")
+
+
+def test_format_limits_and_distributions():
+    """Over limits come from the format; per-over figures carry forward after the innings ends."""
+    if numpy_missing():
+        return
+    print("Testing kernel limits and per-over distributions...")
+    result = sim_kernel.simulate_batch(2000, 'T20', seed=5)
+    assert result.over_scores.shape == (2000, 20)
+    assert (result.balls <= 120).all()
+    assert (result.balls[result.wickets < 10] == 120).all()
+    assert (result.over_scores[:, -1] == result.scores).all()
+    assert (result.over_scores[:, 1:] >= result.over_scores[:, :-1]).all()
+    assert result.score_distribution().sum() == 2000
+    assert result.wicket_distribution(over=9).sum() == 2000
+    assert result.quantiles_by_over().shape == (3, 20)
+
+    try:
+        sim_kernel.simulate_batch(10, 'TEST')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unlimited formats need an explicit over count")
+    print("  ✓ Limits and distributions")
+
+
+def test_cli_needs_overs_for_unlimited_formats():
+    """--vectorised with an unlimited format and no --overs is a usage error, not a traceback."""
+    print("Testing simulator CLI with unlimited overs...")
+    result = subprocess.run([sys.executable, '-m', 'scorecard_generator.simulator', '--format', 'TEST', '--vectorised'],
+                            cwd=os.path.join(os.path.dirname(__file__), '..'), capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--vectorised needs --overs for TEST" in result.stderr and "Traceback" not in result.stderr
+    print("  ✓ Usage error reported")
+
+
+if __name__ == "__main__":
+    test_kernel_matches_scalar_engine()
+    test_format_limits_and_distributions()
+    test_cli_needs_overs_for_unlimited_formats()
+    print("\n✓ All kernel tests passed")
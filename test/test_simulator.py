@@ -0,0 +1,80 @@
+"""Tests for the Monte Carlo innings simulator."""
+
+import io
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import CRICKET_FORMATS
+from scorecard_generator.simulator import (
+    OutcomeDistribution, PlayerProfiles, build_team, default_squad, simulate, simulate_innings
+)
+
+
+def test_innings_are_silent_and_valid():
+    """Simulated innings print nothing and stay within the format's limits."""
+    print("Testing simulated innings...")
+    out = io.StringIO()
+    with redirect_stdout(out):
+        result = simulate(40, 'T20', seed=3, chunk_size=10)
+    assert out.getvalue() == ""
+    assert result.simulations == 40
+    assert all(0 <= w <= 10 for w in result.wickets)
+    assert all(b <= 120 for b in result.balls)
+    assert all(b == 120 for b, w in zip(result.balls, result.wickets) if w < 10)
+    assert result.mean_score() > 0 and result.sims_per_sec > 0
+    print(f"  ✓ 40 innings, mean {result.mean_score():.1f}")
+
+
+def test_results_independent_of_workers():
+    """The same seed gives the same innings in-process and across a pool."""
+    print("Testing deterministic seeding...")
+    serial = simulate(12, 'T20', seed=7, workers=1, chunk_size=4)
+    pooled = simulate(12, 'T20', seed=7, workers=2, chunk_size=4)
+    assert list(serial.scores) == list(pooled.scores)
+    assert list(serial.wickets) == list(pooled.wickets)
+    other = simulate(12, 'T20', seed=8, workers=1, chunk_size=4)
+    assert list(other.scores) != list(serial.scores)
+    print("  ✓ Worker count doesn't change results")
+
+
+def test_player_profiles():
+    """Per-player distributions drive outcomes; a target ends the chase."""
+    print("Testing player profiles...")
+    sixes = OutcomeDistribution([('normal', 6, 1)])
+    profiles = PlayerProfiles(batters={name: sixes for name in default_squad('Batter')})
+    batting = build_team('Bat', default_squad('Batter'))
+    bowling = build_team('Bowl', default_squad('Bowler'))
+    state = simulate_innings(batting, bowling, CRICKET_FORMATS['T20'], profiles, random.Random(0), target=100)
+    assert state.target_reached
+    assert state.innings.get_score()[0] == 102
+
+    blended = sixes.blend(OutcomeDistribution([('normal', 0, 3)]))
+    assert blended.probabilities() == {('normal', 6): 0.5, ('normal', 0): 0.5}
+    print("  ✓ Profiles and blending")
+
+
+def test_numpy_generator():
+    """A numpy Generator can stand in for random.Random."""
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy not installed, skipping Generator test")
+        return
+    print("Testing numpy Generator sampling...")
+    dist = OutcomeDistribution()
+    rng = np.random.default_rng(1)
+    draws = [dist.sample(rng) for _ in range(200)]
+    assert set(draws) <= set(dist.outcomes)
+    print("  ✓ Generator samples")
+
+
+if __name__ == "__main__":
+    test_innings_are_silent_and_valid()
+    test_results_independent_of_workers()
+    test_player_profiles()
+    test_numpy_generator()
+    print("\n✓ All simulator tests passed")
@@ -0,0 +1,91 @@
+"""Tests for the __slots__ data model and its dict-compatible stat records."""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator.models import Player, Team, Innings, BallEvent, Partnership
+from scorecard_generator.match_stats import format_batter_breakdown
+from benchmarks.bench_memory import run as run_memory_benchmark
+
+
+def test_models_have_no_instance_dict():
+    """Per-ball and per-player objects carry no __dict__."""
+    print("Testing slotted models...")
+    player = Player(1, "A")
+    team = Team("T")
+    objects = [
+        player, player.batting, player.bowling,
+        BallEvent(0, 1, player, player, 0, "normal"),
+        Partnership(player, player, 1, 0),
+        Innings(team, team),
+    ]
+    for obj in objects:
+        assert not hasattr(obj, '__dict__'), f"{type(obj).__name__} has a __dict__"
+    print("  ✓ No per-instance __dict__")
+
+
+def test_stat_records_behave_like_the_old_dicts():
+    """String keys, .get() and attribute access all hit the same field."""
+    print("Testing stat record compatibility...")
+    player = Player(7, "MS Dhoni")
+    player.batting['runs'] += 4
+    player.batting['4s'] += 1
+    assert player.batting.runs == 4 and player.batting.fours == 1
+    player.bowling.sixes += 2
+    assert player.bowling['6s'] == 2
+    assert player.bowling.get('4s', 0) == 0
+    assert player.batting.get('missing', 'default') == 'default'
+    assert player.batting['dismissal'] == 'not out'
+    assert 'SR' in player.batting
+    assert dict(player.bowling.items())['wides'] == 0
+    try:
+        player.batting['strike'] = 1
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("unknown keys should raise KeyError")
+
+    dist = player.batting['scoring_distribution']
+    dist[4] += 1
+    dist[8] += 1  # overthrows beyond a six still count
+    assert dist[4] == 1 and dist[8] == 1 and dist[7] == 0
+    assert format_batter_breakdown(player)['4s'] == 1
+    print("  ✓ Records are dict-compatible")
+
+
+def test_slotted_models_pickle():
+    """Slotted innings survive pickling (used by the batch replay pool)."""
+    print("Testing pickling...")
+    bat, bowl = Team("Bat"), Team("Bowl")
+    bat.add_player(Player(1, "A"))
+    bowl.add_player(Player(1, "B"))
+    innings = Innings(bat, bowl)
+    innings.add_ball(BallEvent(0, 1, bowl.players[1], bat.players[1], 4, "normal"))
+    innings.record_delivery(0, 4, legal=True)
+    bat.players[1].batting['runs'] = 4
+
+    restored = pickle.loads(pickle.dumps(innings))
+    assert restored.get_score(verify=True)[0] == 4
+    assert restored.balls[0].batter is restored.batting_team.players[1]
+    assert restored.batting_team.get_player_by_name("a") is restored.batting_team.players[1]
+    print("  ✓ Pickle round-trip preserved")
+
+
+def test_memory_benchmark_shows_per_ball_saving():
+    """The slotted BallEvent and Player are smaller than the dict versions."""
+    print("Testing memory benchmark...")
+    results = run_memory_benchmark(balls=5_000, players=200)
+    assert results['ball_slots'] < results['ball_dict']
+    assert results['player_slots'] < results['player_dict']
+    print(f"  ✓ {results['ball_dict'] - results['ball_slots']:.0f} bytes saved per ball")
+
+
+if __name__ == "__main__":
+    test_models_have_no_instance_dict()
+    test_stat_records_behave_like_the_old_dicts()
+    test_slotted_models_pickle()
+    test_memory_benchmark_shows_per_ball_saving()
+    print("\n✓ All slotted model tests passed")
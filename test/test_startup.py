@@ -0,0 +1,78 @@
+"""Tests that starting the scorer doesn't import the report, stats and Plotly modules."""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cumulative import time of scorecard_generator.main, as reported by
+# python -X importtime (best of STARTUP_RUNS). It measures about 40ms here,
+# down from about 90ms when the report modules were imported up front.
+STARTUP_BUDGET_MS = 80
+STARTUP_RUNS = 3
+
+# Only needed once a match has been scored
+DEFERRED_MODULES = (
+    'scorecard_generator.scorecard_export',
+    'scorecard_generator.match_store',
+    'scorecard_generator.match_stats',
+    'scorecard_generator.report_pipeline',
+    'scorecard_generator.match_report_html',
+    'scorecard_generator.match_report_md',
+    'scorecard_generator.svg_charts',
+    'plotly',
+    'numpy',
+    'sqlite3',
+    'concurrent.futures',
+)
+
+
+def import_times(module):
+    """Import module in a fresh interpreter; returns {module name: cumulative microseconds}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_startup_defers_heavy_imports():
+    """Importing main doesn't import anything only used after the match."""
+    print("Testing startup imports...")
+    imported = import_times('scorecard_generator.main')
+    assert 'scorecard_generator.main' in imported
+    loaded = [name for name in DEFERRED_MODULES if name in imported]
+    assert not loaded, f"Imported at startup: {loaded}"
+    print("  ✓ Report, stats and Plotly imports deferred")
+
+
+def test_reports_defer_plotly():
+    """The report modules only import Plotly when a Plotly chart is drawn."""
+    print("Testing report imports...")
+    imported = import_times('scorecard_generator.report_pipeline')
+    assert 'scorecard_generator.match_report_html' in imported
+    assert 'plotly' not in imported
+    print("  ✓ Plotly import deferred")
+
+
+def test_startup_budget():
+    """main imports within the startup budget."""
+    print("Testing startup budget...")
+    best = min(import_times('scorecard_generator.main')['scorecard_generator.main']
+               for _ in range(STARTUP_RUNS)) / 1000
+    assert best < STARTUP_BUDGET_MS, f"main took {best:.1f}ms to import (budget {STARTUP_BUDGET_MS}ms)"
+    print(f"  ✓ main imported in {best:.1f}ms (budget {STARTUP_BUDGET_MS}ms)")
+
+
+if __name__ == "__main__":
+    test_startup_defers_heavy_imports()
+    test_reports_defer_plotly()
+    test_startup_budget()
+    print("\n✓ All startup tests passed")
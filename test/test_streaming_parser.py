@@ -0,0 +1,78 @@
+"""Tests for the streaming Cricsheet ball-by-ball parser in cricsheet_replay/replay.py."""
+
+import os
+import sys
+import tempfile
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cricsheet_replay.replay import (
+    BallRecord, iter_ball_records, iter_innings, parse_ball_by_ball_csv,
+    cricsheet_to_event_type, replay_match
+)
+from scorecard_generator.models import EventType
+
+FIXTURES = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'cricsheet'))
+INFO_PATH = os.path.join(FIXTURES, '1000001_info.csv')
+BBB_PATH = os.path.join(FIXTURES, '1000001.csv')
+
+
+def test_records_are_typed():
+    """Numeric columns are parsed once and the ball column is split."""
+    print("Testing typed ball records...")
+    records = iter_ball_records(BBB_PATH)
+    assert isinstance(records, types.GeneratorType)
+    first = next(records)
+    assert isinstance(first, BallRecord)
+    assert first.innings == 1 and first.runs_off_bat == 0 and first.wides == 0
+    assert (first.ball, first.over, first.ball_in_over) == ('0.1', 0, 1)
+    assert first['striker'] == 'Z Crawley'
+    assert first.get('no_such_column') is None
+    assert cricsheet_to_event_type(first)[0] is EventType.NORMAL
+    print("  ✓ Records typed")
+
+
+def test_iter_innings_groups_deliveries():
+    """iter_innings yields each innings once, matching the materialised parse."""
+    print("Testing innings grouping...")
+    grouped = [(num, len(list(records))) for num, records in iter_innings(BBB_PATH)]
+    materialised = parse_ball_by_ball_csv(BBB_PATH)
+    assert grouped == [(1, 21), (2, 20)]
+    assert {num: len(rows) for num, rows in materialised.items()} == dict(grouped)
+    print("  ✓ Innings grouped")
+
+
+def test_missing_columns_rejected():
+    """A file without the required columns fails with ValueError."""
+    print("Testing missing column detection...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'broken.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("match_id,innings\n1,1\n")
+        try:
+            list(iter_ball_records(path))
+        except ValueError as e:
+            assert 'ball' in str(e)
+        else:
+            raise AssertionError("Missing columns should raise ValueError")
+    print("  ✓ Missing columns rejected")
+
+
+def test_replay_match_streams_file():
+    """replay_match keeps the file path instead of the parsed rows."""
+    print("Testing streamed replay_match...")
+    result = replay_match(INFO_PATH, BBB_PATH)
+    assert result.ballbyball_path == BBB_PATH
+    assert result.innings1.get_score()[:2] == (36, 3)
+    assert result.innings2.batting_team.name == 'India'
+    assert len(result.innings2.balls) == 20
+    print("  ✓ Match replayed from the stream")
+
+
+if __name__ == "__main__":
+    test_records_are_typed()
+    test_iter_innings_groups_deliveries()
+    test_missing_columns_rejected()
+    test_replay_match_streams_file()
+    print("\n✓ All streaming parser tests passed")
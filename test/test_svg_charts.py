@@ -0,0 +1,102 @@
+"""Tests for the inline SVG charts and offline HTML report options."""
+
+import io
+import os
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import match_report_html
+from scorecard_generator.match_report_html import chart_renderers, generate_html_report, plotly_runtime
+from scorecard_generator.models import Innings, Player, Team, CRICKET_FORMATS
+from scorecard_generator.svg_charts import generate_manhattan_svg, generate_worm_svg, generate_runrate_svg
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def make_match():
+    """Two short innings with their per-over series filled in."""
+    team1, team2 = Team("Ants & Bees"), Team("<Wasps>")
+    for i in range(1, 12):
+        team1.add_player(Player(i, f"A{i}"))
+        team1.order.append(i)
+        team2.add_player(Player(i, f"W{i}"))
+        team2.order.append(i)
+    innings1, innings2 = Innings(team1, team2), Innings(team2, team1)
+    innings1.over_totals = [4, 12, 0, 7]
+    innings1.cumulative_runs = [4, 16, 16, 23]
+    innings2.over_totals = [9, 1, 15]
+    innings2.cumulative_runs = [9, 10, 25]
+    innings2.win_probabilities = [(legal, 0.1 * (legal % 10)) for legal in range(1, 19)]
+    return team1, team2, innings1, innings2
+
+
+def test_svg_charts():
+    """Each chart is well-formed SVG drawn from the innings' series."""
+    print("Testing SVG charts...")
+    team1, team2, innings1, innings2 = make_match()
+    names = (team1.name, team2.name)
+
+    manhattan = ET.fromstring(generate_manhattan_svg(innings1, innings2, *names))
+    assert manhattan.get('id') == 'manhattan_chart'
+    bars = manhattan.findall(f'{SVG}rect')
+    assert len(bars) == 7
+    assert max(float(bar.get('height')) for bar in bars) > 0
+    assert [bar.find(f'{SVG}title').text for bar in bars][1] == "Ants & Bees: over 2, 12 runs"
+
+    worm = ET.fromstring(generate_worm_svg(innings1, innings2, *names))
+    lines = worm.findall(f'{SVG}polyline')
+    assert [len(line.get('points').split()) for line in lines] == [4, 3, 18]  # two innings, win probability
+    assert lines[2].get('stroke-dasharray')
+    runrate = ET.fromstring(generate_runrate_svg(innings1, innings2, *names))
+    assert len(runrate.findall(f'{SVG}polyline')) == 2
+
+    # Names are escaped, and empty innings still draw a frame
+    assert '&lt;Wasps&gt;' in generate_runrate_svg(innings1, innings2, *names)
+    ET.fromstring(generate_worm_svg(Innings(team1, team2), Innings(team2, team1), *names))
+    print("  ✓ SVG charts")
+
+
+def test_offline_reports():
+    """SVG reports are self-contained; the Plotly runtime is shared per export directory."""
+    print("Testing offline report options...")
+    team1, team2, innings1, innings2 = make_match()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'report.html')
+        with redirect_stdout(io.StringIO()):
+            generate_html_report(team1, team2, innings1, innings2, "Ants & Bees won", CRICKET_FORMATS['T20'],
+                                 filename, chart_backend='svg', plotly_js='local')
+        with open(filename, encoding='utf-8') as f:
+            page = f.read()
+        assert page.count('<svg ') == 3 and '<script' not in page
+        assert os.listdir(tmp) == ['report.html']
+
+        for bad in (lambda: chart_renderers('png'), lambda: plotly_runtime('inline', tmp)):
+            try:
+                bad()
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+        assert plotly_runtime('cdn', tmp) == 'cdn'
+
+        if not match_report_html.PLOTLY_AVAILABLE:
+            assert match_report_html.DEFAULT_CHART_BACKEND == 'svg'
+            print("  ✓ Offline options (plotly not installed, shared runtime skipped)")
+            return
+        match_dir = os.path.join(tmp, 'match_01')
+        reference = plotly_runtime('local', match_dir, runtime_dir=tmp)
+        assert reference.startswith('../plotly-') and reference.endswith('.min.js')
+        runtime = os.path.join(tmp, reference[3:])
+        written = os.path.getmtime(runtime)
+        assert plotly_runtime('local', tmp) == reference[3:]
+        assert os.path.getmtime(runtime) == written
+    print("  ✓ Offline options")
+
+
+if __name__ == "__main__":
+    test_svg_charts()
+    test_offline_reports()
+    print("\n✓ All SVG chart tests passed")
@@ -0,0 +1,155 @@
+"""Tests for the chase win-probability tables."""
+
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scorecard_generator import models, win_probability
+from scorecard_generator.engine import Delivery, MatchState
+from scorecard_generator.simulator import build_team, default_squad, simulate
+from scorecard_generator.win_probability import (
+    WinProbabilityTable, build_table, chase_probability, format_key_for, get_table,
+)
+from benchmarks.synthetic import write_cricsheet_match
+from cricsheet_replay.replay import replay_match
+
+SHORT_FORMAT = {'name': 'Custom', 'max_overs': 5, 'max_bowler_overs': None, 'balls_per_over': 6}
+
+
+@contextmanager
+def table_dir():
+    """Point the win-probability tables at an empty temporary directory."""
+    original_dir, original_tables = win_probability.TABLE_DIR, dict(win_probability._tables)
+    with tempfile.TemporaryDirectory() as tmp:
+        win_probability.TABLE_DIR = tmp
+        win_probability._tables.clear()
+        try:
+            yield tmp
+        finally:
+            win_probability.TABLE_DIR = original_dir
+            win_probability._tables.clear()
+            win_probability._tables.update(original_tables)
+
+
+def test_table_shape_and_save_load():
+    """Lookups are monotonic, clamp at the edges and survive a save/load round trip."""
+    print("Testing table lookups and file round trip...")
+    table = WinProbabilityTable.build('T20', max_runs=80, max_balls=36)
+    assert table.lookup(0, 10, 3) == 1.0
+    assert table.lookup(5, 0, 3) == 0.0 and table.lookup(5, 10, 0) == 0.0
+    assert table.lookup(20, 12, 5) > table.lookup(30, 12, 5)
+    assert table.lookup(20, 18, 5) > table.lookup(20, 12, 5)
+    assert table.lookup(20, 12, 8) > table.lookup(20, 12, 2)
+    assert table.lookup(500, 500, 10) == table.lookup(80, 36, 10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'table.bin')
+        table.save(path)
+        loaded = WinProbabilityTable.load(path)
+        assert loaded.data == table.data and loaded.digest == table.digest
+        assert os.path.getsize(path) < 81 * 37 * 11 * 2 + 64
+
+        # Concurrent savers each write their own temporary file
+        errors = []
+
+        def save_repeatedly():
+            try:
+                for _ in range(20):
+                    table.save(path)
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save_repeatedly) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors, errors
+        assert os.listdir(tmp) == ['table.bin']
+        assert WinProbabilityTable.load(path).data == table.data
+    print("  ✓ Lookups and round trip")
+
+
+def test_python_solver_matches_numpy():
+    """The pure-Python solver gives the same table as the numpy one."""
+    if models._numpy() is None:
+        print("numpy not installed, skipping solver comparison")
+        return
+    print("Testing pure-Python solver...")
+    fast = WinProbabilityTable.build('T20', max_runs=40, max_balls=18)
+    original = models._numpy_module
+    models._numpy_module = False
+    try:
+        slow = WinProbabilityTable.build('T20', max_runs=40, max_balls=18)
+    finally:
+        models._numpy_module = original
+    assert max(abs(a - b) for a, b in zip(fast.data, slow.data)) <= 1
+    print("  ✓ Solvers agree")
+
+
+def test_table_matches_simulation():
+    """The table agrees with chases simulated through the engine."""
+    print("Testing table against simulated chases...")
+    result = simulate(3000, format_config=SHORT_FORMAT, target=40, seed=11)
+    table = WinProbabilityTable.build('T20', max_runs=60, max_balls=30)
+    assert abs(result.chase_probability(40) - table.lookup(40, 30, 10)) < 0.04
+    print(f"  ✓ Simulated {result.chase_probability(40):.3f} vs table {table.lookup(40, 30, 10):.3f}")
+
+
+def test_live_and_replay_tracking():
+    """MatchState and the Cricsheet replay record per-ball chase probabilities."""
+    print("Testing live and replay win probabilities...")
+    assert format_key_for(models.CRICKET_FORMATS['ODI']) == 'ODI'
+    assert format_key_for(SHORT_FORMAT) == 'T20'
+
+    with table_dir():
+        build_table('T20')
+        state = MatchState(build_team('Bat', default_squad('Batter')), build_team('Bowl', default_squad('Bowler')),
+                           models.CRICKET_FORMATS['T20'], target=220, track_win_probability=True)
+        before = state.win_probability()
+        while not state.finished:
+            state.apply(Delivery(4, 'normal'))
+        probabilities = [p for _, p in state.innings.win_probabilities]
+        assert probabilities[-1] == 1.0 and probabilities[0] > before
+        assert before == chase_probability(models.CRICKET_FORMATS['T20'], 220, 0, 0, 0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            info_path, ballbyball_path = write_cricsheet_match(tmp, 'T20', overs=5)
+            result = replay_match(info_path, ballbyball_path)
+    assert len(result.innings2.win_probabilities) == len(result.innings2.balls)
+    assert result.innings1.win_probabilities == []
+    assert all(0.0 <= p <= 1.0 for _, p in result.innings2.win_probabilities)
+    print("  ✓ Live and replay tracking")
+
+
+def test_missing_table_is_not_built():
+    """Without a built table, chases are scored without win probabilities and nothing is written."""
+    print("Testing missing tables...")
+    with table_dir() as tmp:
+        assert get_table('T20') is None
+        assert chase_probability(models.CRICKET_FORMATS['T20'], 220, 0, 0, 0) is None
+        state = MatchState(build_team('Bat', default_squad('Batter')), build_team('Bowl', default_squad('Bowler')),
+                           models.CRICKET_FORMATS['T20'], target=30, track_win_probability=True)
+        assert not state.track_win_probability
+        while not state.finished:
+            state.apply(Delivery(4, 'normal'))
+        assert state.innings.win_probabilities == []
+
+        with tempfile.TemporaryDirectory() as matches:
+            result = replay_match(*write_cricsheet_match(matches, 'T20', overs=5))
+        assert result.innings2.win_probabilities == []
+        assert os.listdir(tmp) == []
+    print("  ✓ Missing tables skipped, not built")
+
+
+if __name__ == "__main__":
+    test_table_shape_and_save_load()
+    test_python_solver_matches_numpy()
+    test_table_matches_simulation()
+    test_live_and_replay_tracking()
+    test_missing_table_is_not_built()
+    print("\n✓ All win probability tests passed")